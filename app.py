@@ -18,11 +18,23 @@ import multiprocessing
 auth.init_auth()
 
 import core
+import data_service
+import async_loader
+import prefetch
 import pages
 import pages.my_tasks
 import pages.methodist_admin
 import pages.refactor_planning
 import navigation_utils
+import navigation_regenerator
+import navigation_tree
+import rerun_profiler
+
+try:
+    # Пакет streamlit-navigation-component (pip install -e navigation_component)
+    from navigation_component import navigation_menu
+except ImportError:
+    navigation_menu = None
 
 # Определяем оптимальное количество потоков для системы
 # Используем максимальное доступное количество CPU или 8, что меньше
@@ -37,6 +49,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Профиль перезапуска (APP_PROFILE=1 или ?profile=1): фазы отмечаются rerun_profiler.mark
+rerun_profiler.start(st.query_params)
+rerun_profiler.mark("css")
+
 # Применяем CSS для улучшения внешнего вида и скрытия элементов
 st.markdown("""
 <style>
@@ -350,18 +366,16 @@ def set_filters_from_params(params):
         if filter_name in params:
             st.session_state[f"filter_{filter_name}"] = params[filter_name]
 
-# Новая функция для параллельной загрузки данных
-@st.cache_data(ttl=3600)
-def load_app_data(_engine, current_page):
+# Уровень навигации и параметры фильтрации текущей страницы
+def get_level_params(current_page):
     """
-    Загружает данные в зависимости от текущей страницы с использованием параллельной загрузки
+    Возвращает уровень навигации и параметры фильтрации из сессии.
     
     Args:
-        _engine: SQLAlchemy engine для подключения к БД
         current_page: Текущая страница приложения
         
     Returns:
-        dict: Словарь с разными наборами данных для текущей страницы
+        tuple: (уровень, {"program": ..., "module": ..., "lesson": ..., "gz": ..., "card_id": ...})
     """
     # Преобразуем название страницы в уровень навигации
     level_mapping = {
@@ -375,13 +389,41 @@ def load_app_data(_engine, current_page):
     level = level_mapping.get(current_page, "overview")
     
     # Получаем параметры фильтрации из сессии
-    program = st.session_state.get("filter_program")
-    module = st.session_state.get("filter_module")
-    lesson = st.session_state.get("filter_lesson")
-    gz = st.session_state.get("filter_gz")
-    card_id = st.session_state.get("selected_card_id")
+    params = {
+        "program": st.session_state.get("filter_program"),
+        "module": st.session_state.get("filter_module"),
+        "lesson": st.session_state.get("filter_lesson"),
+        "gz": st.session_state.get("filter_gz"),
+        "card_id": st.session_state.get("selected_card_id") if level == "card" else None,
+    }
+    return level, params
+
+# Ключ набора данных уровня навигации в DataService
+def level_data_key(level, params):
+    """Возвращает ключ DataService для уровня навигации и параметров фильтрации."""
+    card_id = params.get("card_id")
+    return ("level", level, params.get("program"), params.get("module"), params.get("lesson"),
+            params.get("gz"), str(card_id) if card_id is not None else None)
+
+# Загрузка данных одного уровня навигации (используется и страницей, и прогревом)
+def load_level_data(_engine, level, program=None, module=None, lesson=None, gz=None, card_id=None):
+    """
+    Загружает данные уровня навигации.
+    
+    Загрузчики без st.cache_data: результат кэширует DataService (одинаково для
+    страницы и фонового прогрева), а в фоновых потоках без контекста сессии
+    st.cache_data пишет предупреждения в лог.
     
-    # Создаем словарь с параметрами для передачи в load_all_data_for_level
+    Args:
+        _engine: SQLAlchemy engine для подключения к БД
+        level: Уровень навигации
+        program, module, lesson, gz: Параметры фильтрации
+        card_id: Идентификатор карточки (для уровня "card")
+        
+    Returns:
+        dict: Словарь с наборами данных уровня
+    """
+    # Создаем словарь с параметрами для передачи в fetch_all_data_for_level
     params = {
         "level": level,
         "program": program,
@@ -391,36 +433,90 @@ def load_app_data(_engine, current_page):
         "_engine": _engine,
         "max_workers": MAX_WORKERS  # Передаем максимальное количество воркеров
     }
-    
-    # Если это страница карточки, добавляем card_id в результат,
-    # но не передаем его в load_all_data_for_level
-    result = core.load_all_data_for_level(**params)
+    result = core.fetch_all_data_for_level(**params)
     
     # Добавляем card_id в результат, если он есть
     if level == "card" and card_id:
         result["card_id"] = card_id
         # Загружаем данные для конкретной карточки
-        card_data = core.load_card_data(program=program, module=module, lesson=lesson, gz=gz, _engine=_engine)
+        card_data = core.fetch_card_data(program=program, module=module, lesson=lesson, gz=gz, _engine=_engine)
         if not card_data.empty:
             result["card_data"] = card_data[card_data["card_id"] == int(card_id)]
+    return result
+
+# Фоновый прогрев наиболее вероятных дочерних уровней
+def prefetch_children(_engine, level, params, data):
+    """
+    Ставит в очередь прогрев дочерних уровней текущей страницы.
     
-    # Всегда загружаем и обрабатываем данные для навигации и фильтров
-    # Это нужно для корректной работы sidebar_filters
-    navigation_raw_data = core.load_raw_data(_engine)
+    Args:
+        _engine: SQLAlchemy engine для подключения к БД
+        level: Текущий уровень навигации
+        params: Текущие параметры фильтрации
+        data: Данные текущего уровня
+    """
+    if prefetch.PREFETCH_DISABLED:
+        return
+    service = data_service.get_data_service()
+    prefetcher = prefetch.get_prefetcher()
+    prefetcher.record_visit(level, params)
+    
+    for child in prefetch.child_candidates(level, params, data, clicks=prefetcher.clicks()):
+        child_level = child.pop("level")
+        key = level_data_key(child_level, child)
+        if service.contains(key):
+            continue
+        prefetcher.submit(
+            key,
+            lambda key=key, child_level=child_level, child=child: service.get(
+                key, lambda: load_level_data(_engine, child_level, **child)
+            ),
+        )
+
+# Функция загрузки данных страницы через общий для всех сессий DataService
+def load_app_data(_engine, current_page):
+    """
+    Загружает данные в зависимости от текущей страницы с использованием параллельной загрузки
+    
+    Данные хранятся в процессном DataService один раз для всех сессий; страница
+    получает неглубокие представления DataFrame'ов без копирования массивов.
+    
+    Args:
+        _engine: SQLAlchemy engine для подключения к БД
+        current_page: Текущая страница приложения
+        
+    Returns:
+        dict: Словарь с разными наборами данных для текущей страницы
+    """
+    level, level_params = get_level_params(current_page)
     
-    # Используем параллельную обработку для больших объемов данных навигации
-    navigation_data = core.process_data(
-        navigation_raw_data, 
-        use_parallel=True, 
-        max_workers=MAX_WORKERS
+    service = data_service.get_data_service()
+    # Версия общего набора данных меняется вместе с версией хранилища карточек
+    service.sync(lambda: core.load_card_store(_engine).version)
+    
+    # DataService — единственный кэш данных уровня (load_level_data без st.cache_data),
+    # иначе sync() и invalidate() получали бы из st.cache_data прежний фрейм
+    level_handle = service.get(
+        level_data_key(level, level_params), lambda: load_level_data(_engine, level, **level_params)
+    )
+    
+    # Всегда загружаем данные для навигации и фильтров - один общий фрейм на версию данных.
+    # Это нужно для корректной работы sidebar_filters
+    navigation_handle = service.get(
+        ("navigation",),
+        lambda: {"navigation_data": core.load_card_store(_engine).to_frame()}
     )
     
-    result["navigation_data"] = navigation_data
+    result = level_handle.view()
+    result.update(navigation_handle.view())
     
     # Для обратной совместимости - если страница ожидает полный датасет
     if current_page in ["⚙️ Настройки", "Мои задачи", "Панель администратора методистов", "Планирование рефакторинга"]:
         # Переиспользуем уже обработанные данные
-        result["full_data"] = navigation_data
+        result["full_data"] = result["navigation_data"]
+    
+    # В сессии храним только версию данных, а не сами данные
+    st.session_state["data_version"] = service.version
     
     return result
 
@@ -501,15 +597,22 @@ def init_internal_navigation():
         # Если параметров URL нет, добавляем overview как первую страницу
         navigation_utils.add_to_history({"page": "overview"})
 
+rerun_profiler.mark("auth")
+
 # Создаем engine вне кэширования
 engine = core.get_engine()
 
+# Навигация пересобирается в фоновом потоке при смене версии данных, а не в запросах пользователей
+if not navigation_regenerator.NAVIGATION_REGEN_DISABLED:
+    navigation_regenerator.get_regenerator(engine)
+
 # Проверяем активность сессии и авторизацию пользователя
 if not auth.check_authentication():
     auth.login_page(engine)
     st.stop()
 
 # ---------------------- Обработка URL-параметров ---------------------- #
+rerun_profiler.mark("navigation")
 params = st.query_params
 
 # Инициализация системы навигации
@@ -569,15 +672,19 @@ if "card_id" in params and current_page == "Карточки":
     card_id = params["card_id"]
     st.session_state["selected_card_id"] = card_id
     
-# Проверяем, есть ли у нас кэшированные данные для этой страницы
-data_key = f"data_cache_{current_page}"
-data_dict = st.session_state.get(data_key)
-
-# Если данных нет или они устарели, загружаем заново
-if data_dict is None:
+# Получаем данные страницы из общего хранилища (без копии на каждую сессию)
+rerun_profiler.set_page(current_page)
+rerun_profiler.mark("load_app_data")
+try:
     data_dict = load_app_data(engine, current_page)
-    # Кэшируем данные в session_state
-    st.session_state[data_key] = data_dict
+except async_loader.LevelLoadError as e:
+    st.error("Не удалось загрузить данные страницы. Попробуйте обновить страницу позже.")
+    with st.expander("Подробности ошибки"):
+        for name, error in e.errors.items():
+            st.write(f"**{name}**: {error}")
+        if e.cancelled:
+            st.write("Отменены запросы: " + ", ".join(e.cancelled))
+    st.stop()
 
 # Если это страница карточки, настраиваем фильтры на основе данных карточки
 if "card_id" in params and current_page == "Карточки":
@@ -621,6 +728,7 @@ def use_navigation_utils_forward():
     return False
 
 # ---------------------- sidebar & navigation ------------------------------ #
+rerun_profiler.mark("sidebar")
 # Добавляем навигационную панель с кнопками назад/вперед/домой
 col1, col2, col3 = st.sidebar.columns([1, 1, 1])
 
@@ -666,6 +774,21 @@ with col3:
         navigation_utils.add_to_history({"page": "overview"})
         st.rerun()
 
+# Ленивое меню навигации: компоненту передается корень дерева, узлы догружаются по запросу
+if navigation_menu is not None and not data_dict.get("navigation_data", pd.DataFrame()).empty:
+    rerun_profiler.mark("navigation_menu")
+    cards = data_dict["navigation_data"]
+    with st.sidebar:
+        selection = navigation_menu(
+            current_page=params.get("page", "overview"),
+            current_params=params.to_dict(),
+            tree=navigation_tree.tree_for(cards, core.get_data_version(cards)),
+        )
+    if selection and selection.get("action") == "navigate":
+        # Параметры URL уже обновлены компонентом; страница выбирается по ним заново
+        navigation_utils.add_to_history(st.query_params.to_dict())
+        st.rerun()
+
 # Получаем данные для фильтров
 filter_data = data_dict.get("full_data", None)
 if filter_data is None:
@@ -716,7 +839,15 @@ print(f"Текущая страница в URL: {params.get('page')}")
 
 if current_page in PAGES:
     print(f"Запускаем страницу: {current_page}")
+    # Параметры уровня фиксируем до отрисовки: страница может изменить фильтры
+    current_level, current_level_params = get_level_params(current_page)
+    rerun_profiler.mark("page")
     PAGES[current_page](data_dict)
+    # После отрисовки прогреваем в фоне наиболее вероятные следующие уровни
+    rerun_profiler.mark("prefetch")
+    prefetch_children(engine, current_level, current_level_params, data_dict)
 else:
     print(f"Ошибка: страница {current_page} не найдена в PAGES")
-    st.error(f"Страница {current_page} не найдена")
\ No newline at end of file
+    st.error(f"Страница {current_page} не найдена")
+
+rerun_profiler.finish()
\ No newline at end of file
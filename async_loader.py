@@ -0,0 +1,326 @@
+# async_loader.py
+"""
+Асинхронная параллельная загрузка наборов данных уровня навигации.
+
+Запросы одного уровня (программы/модули/уроки/ГЗ/карточки/топ карточек)
+отправляются в Postgres одновременно через пул соединений asyncpg, поэтому
+время открытия страницы определяется самым медленным запросом, а не суммой.
+У каждого запроса есть собственный таймаут; при ошибке одного запроса
+остальные отменяются, а вызывающий код получает LevelLoadError с описанием
+каждой ошибки вместо строк "Error: ...".
+
+Если asyncpg не установлен или БД не Postgres, те же запросы выполняются
+в потоках через общий SQLAlchemy engine с тем же API и теми же ошибками.
+"""
+
+import os
+import re
+import asyncio
+import threading
+import concurrent.futures
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+from sqlalchemy import text
+
+import db_pool
+from db_stream import DEFAULT_CHUNK_SIZE, concat_frames, records_to_frame, read_result_chunked
+
+try:
+    import asyncpg
+except ImportError:  # asyncpg не установлен — используем потоки и SQLAlchemy
+    asyncpg = None
+
+# Таймаут одного запроса в секундах
+QUERY_TIMEOUT = float(os.getenv("DB_QUERY_TIMEOUT", "30"))
+
+# Отключение asyncpg (например, для отладки) переменной окружения
+ASYNC_DISABLED = os.getenv("DB_ASYNC_DISABLED", "0") == "1"
+
+
+class QueryError(Exception):
+    """
+    Ошибка выполнения одного запроса уровня.
+
+    Attributes:
+        name: Имя набора данных (например, "modules")
+        sql: Текст запроса
+        params: Параметры запроса
+        timed_out: True, если запрос прерван по таймауту
+        cause: Исходное исключение
+    """
+
+    def __init__(self, name: str, sql: str, params: Dict[str, Any], cause: BaseException, timed_out: bool = False):
+        self.name = name
+        self.sql = sql
+        self.params = params
+        self.cause = cause
+        self.timed_out = timed_out
+        reason = "превышен таймаут" if timed_out else f"{type(cause).__name__}: {cause}"
+        super().__init__(f"Запрос '{name}' не выполнен ({reason})")
+
+
+class LevelLoadError(Exception):
+    """
+    Ошибка загрузки данных уровня: один или несколько запросов не выполнены.
+
+    Attributes:
+        errors: Словарь {имя набора данных: QueryError}
+        cancelled: Имена запросов, отмененных из-за ошибки другого запроса
+    """
+
+    def __init__(self, errors: Dict[str, QueryError], cancelled: Optional[List[str]] = None):
+        self.errors = errors
+        self.cancelled = cancelled or []
+        details = "; ".join(str(error) for error in errors.values())
+        super().__init__(f"Не удалось загрузить данные уровня: {details}")
+
+
+class LevelQuery:
+    """
+    Описание одного запроса уровня.
+
+    Attributes:
+        name: Имя набора данных в результате
+        sql: Текст запроса с параметрами вида :name
+        params: Параметры запроса
+        compact: Приводить ли результат к компактным типам (как read_sql_chunked)
+    """
+
+    def __init__(self, name: str, sql: str, params: Optional[Dict[str, Any]] = None, compact: bool = False):
+        self.name = name
+        self.sql = sql
+        self.params = params or {}
+        self.compact = compact
+
+
+_PARAM_RE = re.compile(r"(?<![:\w]):([A-Za-z_]\w*)")
+
+
+def to_asyncpg(sql: str, params: Dict[str, Any]) -> Tuple[str, List[Any]]:
+    """
+    Переводит запрос с параметрами :name в формат asyncpg ($1, $2, ...).
+
+    Повторяющиеся параметры получают один и тот же номер; приведения типов
+    вида ::text не затрагиваются.
+
+    Args:
+        sql: Текст запроса
+        params: Параметры запроса
+
+    Returns:
+        tuple: (текст запроса, список аргументов)
+    """
+    order: Dict[str, int] = {}
+    args: List[Any] = []
+
+    def replace(match):
+        name = match.group(1)
+        if name not in order:
+            if name not in params:
+                raise KeyError(f"Не передан параметр запроса: {name}")
+            args.append(params[name])
+            order[name] = len(args)
+        return f"${order[name]}"
+
+    return _PARAM_RE.sub(replace, sql), args
+
+
+class _LoopThread:
+    """
+    Фоновый поток с собственным event loop.
+
+    Скрипты Streamlit выполняются в обычных потоках без event loop, а пул
+    asyncpg привязан к циклу, в котором создан. Поэтому все корутины
+    выполняются в одном долгоживущем цикле, и пул переиспользуется между
+    перезапусками скрипта и сессиями.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="async-loader", daemon=True)
+        self._thread.start()
+
+    def run(self, coro, timeout: Optional[float] = None):
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+
+_loop_lock = threading.Lock()
+_loop_thread: Optional[_LoopThread] = None
+_pools: Dict[str, Any] = {}
+
+
+def _get_loop_thread() -> _LoopThread:
+    global _loop_thread
+    with _loop_lock:
+        if _loop_thread is None:
+            _loop_thread = _LoopThread()
+        return _loop_thread
+
+
+def use_asyncpg(engine) -> bool:
+    """Возвращает True, если запросы можно выполнять через asyncpg."""
+    return asyncpg is not None and not ASYNC_DISABLED and engine.dialect.name == "postgresql"
+
+
+def _asyncpg_dsn(engine) -> str:
+    # asyncpg принимает обычный postgresql:// DSN без указания драйвера
+    return engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+async def _get_pool(dsn: str):
+    # Храним задачу создания пула, чтобы одновременные запросы не создали несколько пулов
+    pool_task = _pools.get(dsn)
+    if pool_task is None or (pool_task.done() and pool_task.exception() is not None):
+        settings = db_pool.get_pool_settings()
+        pool_task = asyncio.ensure_future(asyncpg.create_pool(
+            dsn,
+            min_size=1,
+            max_size=settings["pool_size"] + settings["max_overflow"],
+            max_inactive_connection_lifetime=settings["pool_recycle"],
+        ))
+        _pools[dsn] = pool_task
+    return await asyncio.shield(pool_task)
+
+
+async def _fetch_asyncpg(pool, query: LevelQuery, chunk_size: int) -> pd.DataFrame:
+    sql, args = to_asyncpg(query.sql, query.params)
+    async with pool.acquire() as conn:
+        stmt = await conn.prepare(sql)
+        columns = [attr.name for attr in stmt.get_attributes()]
+        if not query.compact:
+            rows = await stmt.fetch(*args)
+            return pd.DataFrame.from_records([tuple(row) for row in rows], columns=columns, coerce_float=True)
+
+        # Большие выборки читаем серверным курсором порциями, как read_sql_chunked
+        chunks = []
+        async with conn.transaction():
+            cursor = await stmt.cursor(*args)
+            while True:
+                rows = await cursor.fetch(chunk_size)
+                if not rows:
+                    break
+                chunks.append(records_to_frame([tuple(row) for row in rows], columns))
+        if not chunks:
+            return pd.DataFrame(columns=columns)
+        return concat_frames(chunks)
+
+
+def _fetch_sync(engine, query: LevelQuery, timeout: float, chunk_size: int) -> pd.DataFrame:
+    with engine.connect() as conn:
+        if engine.dialect.name == "postgresql":
+            # Сервер сам прервет запрос, даже если поток уже никто не ждет
+            conn.execute(text(f"SET LOCAL statement_timeout = {int(timeout * 1000)}"))
+        if query.compact:
+            result = conn.execution_options(
+                stream_results=True, max_row_buffer=chunk_size
+            ).execute(text(query.sql), query.params)
+            return read_result_chunked(result, chunk_size)
+        result = conn.execute(text(query.sql), query.params)
+        return pd.DataFrame.from_records(result.fetchall(), columns=list(result.keys()), coerce_float=True)
+
+
+async def _run_one(query: LevelQuery, fetch, timeout: float, semaphore: asyncio.Semaphore) -> pd.DataFrame:
+    async with semaphore:
+        try:
+            return await asyncio.wait_for(fetch(query), timeout)
+        except asyncio.TimeoutError as e:
+            raise QueryError(query.name, query.sql, query.params, e, timed_out=True) from e
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            raise QueryError(query.name, query.sql, query.params, e) from e
+
+
+async def run_queries_async(queries: List[LevelQuery], fetch, timeout: float = QUERY_TIMEOUT,
+                            max_concurrency: int = 8) -> Dict[str, pd.DataFrame]:
+    """
+    Выполняет запросы одновременно и возвращает результаты по именам.
+
+    При первой ошибке оставшиеся запросы отменяются.
+
+    Args:
+        queries: Список запросов
+        fetch: Корутина fetch(query) -> DataFrame
+        timeout: Таймаут одного запроса в секундах
+        max_concurrency: Максимальное количество одновременных запросов
+
+    Returns:
+        dict: {имя набора данных: DataFrame}
+
+    Raises:
+        LevelLoadError: Если хотя бы один запрос не выполнен
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    tasks = {
+        asyncio.ensure_future(_run_one(query, fetch, timeout, semaphore)): query.name
+        for query in queries
+    }
+    if not tasks:
+        return {}
+    done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+
+    cancelled = []
+    for task in pending:
+        task.cancel()
+        cancelled.append(tasks[task])
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    results, errors = {}, {}
+    for task in done:
+        name = tasks[task]
+        error = task.exception()
+        if error is None:
+            results[name] = task.result()
+        elif isinstance(error, QueryError):
+            errors[name] = error
+        else:
+            errors[name] = QueryError(name, "", {}, error)
+    if errors:
+        raise LevelLoadError(errors, cancelled)
+    return results
+
+
+def run_queries(queries: List[LevelQuery], engine, timeout: float = QUERY_TIMEOUT,
+                max_concurrency: int = 8, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, pd.DataFrame]:
+    """
+    Синхронная обертка: выполняет запросы уровня параллельно.
+
+    Через asyncpg, если он доступен, иначе в потоках через SQLAlchemy engine.
+
+    Args:
+        queries: Список запросов
+        engine: SQLAlchemy engine (источник DSN и запасной путь выполнения)
+        timeout: Таймаут одного запроса в секундах
+        max_concurrency: Максимальное количество одновременных запросов
+        chunk_size: Размер порции для запросов с compact=True
+
+    Returns:
+        dict: {имя набора данных: DataFrame}
+
+    Raises:
+        LevelLoadError: Если хотя бы один запрос не выполнен
+    """
+    runner = _get_loop_thread()
+
+    if use_asyncpg(engine):
+        dsn = _asyncpg_dsn(engine)
+
+        async def fetch(query):
+            pool = await _get_pool(dsn)
+            return await _fetch_asyncpg(pool, query, chunk_size)
+    else:
+        async def fetch(query):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, _fetch_sync, engine, query, timeout, chunk_size)
+
+    # Общий таймаут с запасом: каждый запрос ограничен своим таймаутом,
+    # но ожидание семафора может добавить время при большом числе запросов
+    waves = -(-len(queries) // max(1, max_concurrency)) or 1
+    return runner.run(run_queries_async(queries, fetch, timeout, max_concurrency), timeout * waves + 5)
@@ -0,0 +1,382 @@
+# card_store.py
+"""
+Нормализованное хранилище карточек в памяти.
+
+Иерархические колонки (program, module, lesson, gz, card_type, status) хранятся
+как целочисленные коды плюс словари значений, числовые метрики — как
+непрерывные numpy-массивы. Длинные текстовые колонки (complaints_text) в
+хранилище не держатся и подгружаются по требованию для конкретных карточек.
+"""
+
+import itertools
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import CategoricalDtype, is_numeric_dtype
+
+# Колонки, хранимые как коды + словарь
+CODED_COLUMNS: List[str] = ["program", "module", "lesson", "gz", "card_type", "status"]
+
+# Текстовые колонки, которые загружаются лениво
+LAZY_TEXT_COLUMNS: List[str] = ["complaints_text"]
+
+# Уровни иерархии в порядке детализации (совпадает с core.FILTERS)
+HIERARCHY_LEVELS: List[str] = ["program", "module", "lesson", "gz"]
+
+# Ключ в DataFrame.attrs, которым помечаются фреймы, собранные из хранилища
+VERSION_ATTR = "card_store_version"
+
+# Монотонный счетчик версий хранилища
+_versions = itertools.count(1)
+
+
+class CardStore:
+    """
+    Компактное представление данных карточек.
+
+    Attributes:
+        codes: {колонка: массив int32-кодов}, -1 означает пропуск
+        dictionaries: {колонка: pd.Index значений}, код — позиция в словаре
+        arrays: {колонка: numpy-массив} для остальных колонок
+    """
+
+    def __init__(self, codes: Dict[str, np.ndarray], dictionaries: Dict[str, pd.Index],
+                 arrays: Dict[str, np.ndarray], columns: List[str],
+                 text_loader: Optional[Callable[[List[int]], Dict[int, Dict[str, str]]]] = None):
+        self.codes = codes
+        self.dictionaries = dictionaries
+        self.arrays = arrays
+        self.columns = columns
+        self._text_loader = text_loader
+        self._text_cache: Dict[int, Dict[str, str]] = {}
+        self._text_lock = threading.Lock()
+        self.version = next(_versions)
+        self._hierarchy_index: Optional["HierarchyIndex"] = None
+
+    # ---------------- Построение ---------------------------------------- #
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, text_loader=None) -> "CardStore":
+        """
+        Строит хранилище из DataFrame.
+
+        Args:
+            df: DataFrame с данными карточек
+            text_loader: Функция (список card_id) -> {card_id: {колонка: текст}}
+                для ленивой загрузки текстовых колонок
+
+        Returns:
+            CardStore
+        """
+        codes, dictionaries, arrays = {}, {}, {}
+        columns = [col for col in df.columns if col not in LAZY_TEXT_COLUMNS]
+        for col in columns:
+            series = df[col]
+            if col in CODED_COLUMNS:
+                if isinstance(series.dtype, CategoricalDtype):
+                    cat = series.cat.remove_unused_categories()
+                    codes[col] = cat.cat.codes.to_numpy(dtype=np.int32)
+                    dictionaries[col] = cat.cat.categories
+                else:
+                    col_codes, uniques = pd.factorize(series, sort=True)
+                    codes[col] = col_codes.astype(np.int32)
+                    dictionaries[col] = pd.Index(uniques)
+            else:
+                arrays[col] = np.ascontiguousarray(series.to_numpy())
+        return cls(codes, dictionaries, arrays, columns, text_loader)
+
+    def __len__(self) -> int:
+        if self.codes:
+            return len(next(iter(self.codes.values())))
+        if self.arrays:
+            return len(next(iter(self.arrays.values())))
+        return 0
+
+    @property
+    def nbytes(self) -> int:
+        """Приблизительный объем памяти, занимаемый хранилищем."""
+        total = sum(arr.nbytes for arr in self.codes.values())
+        total += sum(arr.nbytes for arr in self.arrays.values())
+        total += sum(index.memory_usage(deep=True) for index in self.dictionaries.values())
+        return total
+
+    # ---------------- Доступ к кодам ------------------------------------ #
+
+    def code_of(self, column: str, value) -> int:
+        """Возвращает код значения в колонке или -1, если значения нет в словаре."""
+        position = self.dictionaries[column].get_indexer([value])[0]
+        return int(position)
+
+    def column(self, column: str):
+        """Возвращает колонку как pd.Categorical (для кодированных) или numpy-массив."""
+        if column in self.codes:
+            return pd.Categorical.from_codes(self.codes[column], categories=self.dictionaries[column])
+        return self.arrays[column]
+
+    def to_frame(self, rows: Optional[np.ndarray] = None, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """
+        Собирает DataFrame из хранилища.
+
+        Кодированные колонки возвращаются как category поверх тех же кодов,
+        поэтому строковые значения не материализуются.
+
+        Args:
+            rows: Позиции строк (None — все строки)
+            columns: Колонки (None — все, кроме ленивых текстовых)
+
+        Returns:
+            DataFrame
+        """
+        columns = self.columns if columns is None else list(columns)
+        data = {}
+        for col in columns:
+            if col in self.codes:
+                col_codes = self.codes[col] if rows is None else self.codes[col][rows]
+                data[col] = pd.Categorical.from_codes(col_codes, categories=self.dictionaries[col])
+            else:
+                data[col] = self.arrays[col] if rows is None else self.arrays[col][rows]
+        df = pd.DataFrame(data, copy=False)
+        if rows is None:
+            # Полный фрейм можно фильтровать через иерархический индекс этой версии
+            df.attrs[VERSION_ATTR] = self.version
+        return df
+
+    @property
+    def hierarchy_index(self) -> "HierarchyIndex":
+        """Иерархический индекс, строится один раз на версию данных."""
+        if self._hierarchy_index is None:
+            self._hierarchy_index = HierarchyIndex.build(self)
+        return self._hierarchy_index
+
+    # ---------------- Агрегация ----------------------------------------- #
+
+    def aggregate(self, level: str, rows: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """
+        Аналог core.agg_by, выполняемый на кодах через np.bincount.
+
+        Args:
+            level: Кодированная колонка для группировки
+            rows: Позиции строк (None — все строки)
+
+        Returns:
+            DataFrame с колонками level, success, complaints, risk, cards
+        """
+        level_codes = self.codes[level] if rows is None else self.codes[level][rows]
+        values = {
+            name: (self.arrays[col] if rows is None else self.arrays[col][rows])
+            for name, col in (("success", "success_rate"), ("complaints", "complaint_rate"), ("risk", "risk"))
+        }
+        card_ids = self.arrays["card_id"] if rows is None else self.arrays["card_id"][rows]
+        return aggregate_codes(level_codes, self.dictionaries[level], values, card_ids, level)
+
+    # ---------------- Ленивые тексты ------------------------------------ #
+
+    def texts(self, card_ids: Iterable[int]) -> Dict[int, Dict[str, str]]:
+        """
+        Возвращает текстовые колонки для указанных карточек, загружая их по требованию.
+
+        Args:
+            card_ids: Идентификаторы карточек
+
+        Returns:
+            dict: {card_id: {колонка: текст}}
+        """
+        card_ids = [int(card_id) for card_id in card_ids]
+        with self._text_lock:
+            missing = [card_id for card_id in card_ids if card_id not in self._text_cache]
+        if missing and self._text_loader is not None:
+            loaded = self._text_loader(missing)
+            with self._text_lock:
+                for card_id in missing:
+                    self._text_cache[card_id] = loaded.get(card_id, {})
+        with self._text_lock:
+            return {card_id: self._text_cache.get(card_id, {}) for card_id in card_ids}
+
+
+class HierarchyIndex:
+    """
+    Индекс позиций строк для каждого префикса иерархии.
+
+    Для каждого уровня k хранится словарь {(program, ..., level_k): позиции},
+    поэтому фильтрация по программе/модулю/уроку/ГЗ сводится к одному поиску
+    в словаре и выборке строк по позициям вместо сканирования всех строк.
+    Позиции в каждом списке возрастают, то есть порядок строк совпадает с
+    результатом булевой фильтрации.
+    """
+
+    def __init__(self, levels: List[str], lookups: List[Dict[Tuple, np.ndarray]], card_ids: np.ndarray):
+        self.levels = levels
+        self.lookups = lookups
+        self.card_ids = card_ids
+
+    @classmethod
+    def build(cls, store: CardStore, levels: Optional[List[str]] = None) -> "HierarchyIndex":
+        levels = HIERARCHY_LEVELS if levels is None else levels
+        frame = store.to_frame(columns=levels)
+        lookups = []
+        for depth in range(1, len(levels) + 1):
+            groups = frame.groupby(levels[:depth], observed=True, sort=False).indices
+            # Для одного уровня pandas возвращает скалярные ключи - приводим к кортежам
+            lookups.append({
+                (key if isinstance(key, tuple) else (key,)): positions
+                for key, positions in groups.items()
+            })
+        return cls(levels, lookups, store.arrays.get("card_id"))
+
+    def __len__(self) -> int:
+        return len(self.card_ids) if self.card_ids is not None else 0
+
+    def positions(self, values: List) -> Optional[np.ndarray]:
+        """
+        Возвращает позиции строк для префикса значений иерархии.
+
+        Args:
+            values: Значения уровней по порядку, начиная с program
+
+        Returns:
+            Массив позиций или None, если глубина префикса не поддерживается
+        """
+        if not values or len(values) > len(self.lookups):
+            return None
+        return self.lookups[len(values) - 1].get(tuple(values), np.empty(0, dtype=np.intp))
+
+    def matches(self, df: pd.DataFrame) -> bool:
+        """
+        Проверяет, что df — полный фрейм хранилища (или его неглубокая копия).
+
+        Сравнивается не содержимое card_id (это стоило бы столько же, сколько
+        сама фильтрация), а буфер колонки: to_frame отдает массив хранилища без
+        копирования, а фильтрация, сортировка и выборка строк создают новый
+        массив, даже если df.attrs с версией хранилища скопированы вместе с ним.
+        Массив хранилища жив, пока жив индекс, поэтому его адрес не может
+        достаться другому массиву.
+        """
+        if self.card_ids is None or len(df) != len(self.card_ids) or "card_id" not in df.columns:
+            return False
+        card_ids = df["card_id"].to_numpy()
+        return (card_ids.__array_interface__["data"][0] == self.card_ids.__array_interface__["data"][0]
+                and card_ids.strides == self.card_ids.strides)
+
+
+def aggregate_codes(level_codes: np.ndarray, categories: pd.Index, values: Dict[str, np.ndarray],
+                    card_ids: np.ndarray, level: str) -> pd.DataFrame:
+    """
+    Групповые средние и число уникальных карточек по целочисленным кодам.
+
+    Пропуски (NaN) не учитываются в средних, как в pandas groupby().mean();
+    строки с кодом -1 (пропуск в колонке группировки) отбрасываются.
+
+    Args:
+        level_codes: Коды группы для каждой строки
+        categories: Словарь значений группы
+        values: {имя результата: массив значений}
+        card_ids: Идентификаторы карточек
+        level: Имя колонки группировки в результате
+
+    Returns:
+        DataFrame, отсортированный по значению группы
+    """
+    valid = level_codes >= 0
+    level_codes = level_codes[valid]
+    n_groups = len(categories)
+    counts_present = np.bincount(level_codes, minlength=n_groups) > 0
+
+    result = {level: categories[counts_present]}
+    for name, arr in values.items():
+        arr = np.asarray(arr, dtype=np.float64)[valid]
+        not_nan = ~np.isnan(arr)
+        sums = np.bincount(level_codes[not_nan], weights=arr[not_nan], minlength=n_groups)
+        counts = np.bincount(level_codes[not_nan], minlength=n_groups)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = sums / counts
+        result[name] = means[counts_present]
+
+    # Уникальные карточки в группе: уникальные пары (код, card_id)
+    pairs = pd.DataFrame({"code": level_codes, "card_id": np.asarray(card_ids)[valid]}).drop_duplicates()
+    pairs = pairs[pairs["card_id"].notna()]
+    result["cards"] = np.bincount(pairs["code"].to_numpy(), minlength=n_groups)[counts_present]
+
+    return pd.DataFrame(result)
+
+
+def agg_by_codes(df: pd.DataFrame, level: str) -> Optional[pd.DataFrame]:
+    """
+    Быстрый путь core.agg_by для DataFrame с категориальной колонкой группировки.
+
+    Returns:
+        DataFrame или None, если колонка не категориальная
+    """
+    if not isinstance(df[level].dtype, CategoricalDtype):
+        return None
+    if not all(is_numeric_dtype(df[col]) for col in ("success_rate", "complaint_rate", "risk")):
+        return None
+    cat = df[level].cat
+    values = {
+        "success": df["success_rate"].to_numpy(dtype=np.float64, na_value=np.nan),
+        "complaints": df["complaint_rate"].to_numpy(dtype=np.float64, na_value=np.nan),
+        "risk": df["risk"].to_numpy(dtype=np.float64, na_value=np.nan),
+    }
+    return aggregate_codes(cat.codes.to_numpy(dtype=np.int32), cat.categories, values,
+                           df["card_id"].to_numpy(), level)
+
+
+# Последнее построенное хранилище и DataFrame, из которого оно построено
+_store_lock = threading.Lock()
+_store_state: Dict[str, object] = {"source": None, "store": None}
+
+# Несколько последних версий хранилища: сессии могут держать фреймы предыдущей версии
+_MAX_TRACKED_VERSIONS = 4
+_stores_by_version: "OrderedDict[int, CardStore]" = OrderedDict()
+
+
+def store_for(df: pd.DataFrame, text_loader=None) -> CardStore:
+    """
+    Возвращает хранилище для DataFrame, перестраивая его только при смене источника.
+
+    Источник сравнивается по идентичности объекта: загрузчики данных возвращают
+    тот же DataFrame, пока данные не изменились.
+
+    Args:
+        df: DataFrame с данными карточек
+        text_loader: Функция ленивой загрузки текстовых колонок
+
+    Returns:
+        CardStore
+    """
+    with _store_lock:
+        if _store_state["source"] is df and _store_state["store"] is not None:
+            return _store_state["store"]
+        store = CardStore.from_frame(df, text_loader=text_loader)
+        _store_state.update(source=df, store=store)
+        _stores_by_version[store.version] = store
+        while len(_stores_by_version) > _MAX_TRACKED_VERSIONS:
+            _stores_by_version.popitem(last=False)
+        return store
+
+
+def index_for(df: pd.DataFrame) -> Optional[HierarchyIndex]:
+    """
+    Возвращает иерархический индекс для полного фрейма, собранного из хранилища.
+
+    Индекс используется только если df помечен версией хранилища и его строки
+    совпадают со строками хранилища (не отфильтрованы и не пересортированы —
+    проверяется без сканирования строк, см. HierarchyIndex.matches).
+
+    Args:
+        df: DataFrame
+
+    Returns:
+        HierarchyIndex или None
+    """
+    version = df.attrs.get(VERSION_ATTR)
+    if version is None:
+        return None
+    with _store_lock:
+        store = _stores_by_version.get(version)
+    if store is None:
+        return None
+    index = store.hierarchy_index
+    return index if index.matches(df) else None
@@ -545,7 +545,7 @@ def display_trickiness_chart(df, x_col="card_id", limit=50, title="Уровен
     """
     # Проверяем наличие колонки trickiness_level
     if "trickiness_level" not in df.columns:
-        df["trickiness_level"] = df.apply(core.get_trickiness_level, axis=1)
+        df["trickiness_level"] = core.calculate_risk_batch(df, columns=["trickiness_level"])["trickiness_level"]
     
     # Сортируем по уровню подлости (от высокого к низкому)
     sorted_df = df.sort_values(by="trickiness_level", ascending=False).head(limit)
@@ -631,7 +631,7 @@ def display_trickiness_success_chart(df, limit=50, title="Зависимость
     import core
     # Проверяем наличие колонки trickiness_level
     if "trickiness_level" not in df.columns:
-        df["trickiness_level"] = df.apply(core.get_trickiness_level, axis=1)
+        df["trickiness_level"] = core.calculate_risk_batch(df, columns=["trickiness_level"])["trickiness_level"]
     
     # Отбираем только карточки с некоторым уровнем подлости
     tricky_df = df[df["trickiness_level"] > 0].copy()
@@ -805,7 +805,7 @@ def update_metrics_comparison(df, category_col, value_cols, limit=10, title=None
     """
     # Проверяем наличие колонки trickiness_level
     if "trickiness_level" not in df.columns and "trickiness_level" in value_cols:
-        df["trickiness_level"] = df.apply(core.get_trickiness_level, axis=1)
+        df["trickiness_level"] = core.calculate_risk_batch(df, columns=["trickiness_level"])["trickiness_level"]
     
     # Заменяем first_try_success_rate на trickiness_level, если такая замена требуется
     value_cols_updated = []
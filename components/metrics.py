@@ -20,7 +20,7 @@ def display_trickiness_distribution(df, group_by_col=None):
     """
     # Проверяем наличие колонки trickiness_level
     if "trickiness_level" not in df.columns:
-        df["trickiness_level"] = df.apply(core.get_trickiness_level, axis=1)
+        df["trickiness_level"] = core.calculate_risk_batch(df, columns=["trickiness_level"])["trickiness_level"]
     
     # Определяем категории подлости
     trickiness_categories = {
@@ -120,7 +120,7 @@ def update_display_metrics_row(df, group_by_col=None, compare_with=None):
     """
     # Проверяем наличие колонки trickiness_level
     if "trickiness_level" not in df.columns:
-        df["trickiness_level"] = df.apply(core.get_trickiness_level, axis=1)
+        df["trickiness_level"] = core.calculate_risk_batch(df, columns=["trickiness_level"])["trickiness_level"]
     
     # Вычисляем средний уровень подлости
     if group_by_col is not None:
@@ -196,7 +196,7 @@ def get_trickiness_distribution(df):
     """
     # Проверяем наличие колонки trickiness_level
     if "trickiness_level" not in df.columns:
-        df["trickiness_level"] = df.apply(core.get_trickiness_level, axis=1)
+        df["trickiness_level"] = core.calculate_risk_batch(df, columns=["trickiness_level"])["trickiness_level"]
     
     # Считаем количество карточек по уровням подлости
     trickiness_distribution = df["trickiness_level"].value_counts().to_dict()
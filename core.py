@@ -9,28 +9,66 @@ from typing import List, Optional, Dict, Any, Callable
 import urllib.parse as ul
 import numpy as np
 import concurrent.futures
+import hashlib
+import threading
 from functools import partial
+from collections import OrderedDict
 
 import pandas as pd
 import streamlit as st
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from db_config import get_cloud_dsn
 
-from core_config import get_config
+import db_pool
+import async_loader
+import risk_kernel
+import data_snapshot
+import card_store
+from db_stream import read_sql_chunked
+
+from core_config import get_config, get_config_version
 # ---------------- DB ------------------------------------------------------- #
 
+# Единственный на процесс engine создается лениво при первом вызове get_engine()
+_engine_lock = threading.Lock()
+_engine_instance = None
+
 def get_engine():
-    # Строка подключения к удаленной базе данных в Яндекс.Облаке
-    cloud_dsn = get_cloud_dsn()
-    # Используем переменную окружения, если она задана, иначе используем строку подключения к облаку
-    dsn = os.getenv("DB_DSN", cloud_dsn)
-    return create_engine(dsn, future=True)
+    """
+    Возвращает общий для процесса engine с пулом соединений.
+    
+    Engine создается один раз при первом вызове; все модули и сессии
+    используют один пул, параметры которого задаются переменными окружения
+    DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE, DB_POOL_PRE_PING.
+    """
+    global _engine_instance
+    if _engine_instance is not None:
+        return _engine_instance
+    with _engine_lock:
+        if _engine_instance is None:
+            # Используем переменную окружения, если она задана, иначе строку подключения
+            # к удаленной базе данных в Яндекс.Облаке
+            dsn = os.getenv("DB_DSN") or get_cloud_dsn()
+            _engine_instance = db_pool.create_pooled_engine(dsn)
+    return _engine_instance
 
-@st.cache_data(ttl=3600)  # Кэширование на 1 час (3600 секунд)
+def get_pool_stats():
+    """
+    Возвращает статистику пула соединений общего engine.
+    
+    Returns:
+        dict: Размер пула, занятые/свободные соединения, число выдач, среднее и
+        максимальное время ожидания соединения, число таймаутов
+    """
+    return db_pool.get_pool_stats(get_engine())
+
+@st.cache_data(ttl=300)  # Кэширование на 5 минут: повторная загрузка дешевая благодаря снапшоту
 def load_raw_data(_engine):
     """
     Загружает сырые данные из базы данных.
-    Функция кэшируется с большим TTL для оптимизации обращений к БД.
+    Данные берутся из локального снапшота (см. data_snapshot), если водяной знак
+    БД (MAX(updated_at) и количество строк) не изменился, иначе выполняется
+    полная выборка и снапшот обновляется.
     
     Args:
         _engine: SQLAlchemy engine для подключения к БД (не хешируемый параметр)
@@ -38,24 +76,45 @@ def load_raw_data(_engine):
     Returns:
         DataFrame с данными из таблицы cards_mv
     """
-    sql = text(
-        """
-        SELECT c.program, c.module, c.module_order, c.lesson, c.lesson_order,
-               c.gz, c.gz_id, c.card_id, c.card_type, c.card_url,
-               c.total_attempts, c.attempted_share, c.success_rate, c.first_try_success_rate,
-               c.complaint_rate, c.complaints_total, c.discrimination_avg, c.success_attempts_rate,
-               c.time_median, c.complaints_text,
-               c.status, c.updated_at
-        FROM cards_mv c
-        """
-    )
-    return pd.read_sql(sql, _engine)
+    return data_snapshot.load_cards(_engine)
+
+# Кэш рассчитанного риска: (версия данных, версия конфигурации) -> массив риска.
+# Ключ не требует хэширования всего DataFrame, а смена конфигурации (save_config)
+# меняет версию конфигурации и автоматически делает старые записи неактуальными.
+RISK_CACHE_MAX_ENTRIES = 4
+_risk_cache_lock = threading.Lock()
+_risk_cache = OrderedDict()
+
+def get_data_version(df):
+    """
+    Возвращает версию данных, которой помечен DataFrame, или None.
+    
+    Версию проставляют data_snapshot (по водяному знаку БД) и card_store.
+    """
+    version = df.attrs.get(data_snapshot.DATA_VERSION_ATTR)
+    if version is None and card_store.VERSION_ATTR in df.attrs:
+        version = f"store:{df.attrs[card_store.VERSION_ATTR]}"
+    return version
+
+def row_fingerprint(df):
+    """Отпечаток набора и порядка строк по card_id (риск в кэше хранится по позициям)."""
+    hashes = pd.util.hash_pandas_object(df["card_id"], index=False).to_numpy()
+    return hashlib.sha1(hashes.tobytes()).hexdigest()
+
+def clear_risk_cache():
+    """Очищает кэш рассчитанного риска."""
+    with _risk_cache_lock:
+        _risk_cache.clear()
 
-@st.cache_data(ttl=300)  # Кэширование на 5 минут (300 секунд)
 def process_data(raw_data, use_parallel=False, max_workers=4):
     """
     Обрабатывает сырые данные, добавляя вычисляемые метрики.
-    Функция кэшируется с коротким TTL для обновления обработанных данных.
+    
+    Риск кэшируется по ключу (версия данных, версия конфигурации риска, набор и
+    порядок строк), поэтому повторный вызов для тех же данных не пересчитывает
+    риск, а изменение конфигурации сразу приводит к пересчету. Версия данных
+    копируется в df.attrs и при фильтрации, поэтому строки определяются
+    отпечатком колонки card_id: подмножества одной версии не совпадают по ключу.
     
     Args:
         raw_data: DataFrame с сырыми данными из load_raw_data
@@ -68,6 +127,18 @@ def process_data(raw_data, use_parallel=False, max_workers=4):
     # Копируем данные, чтобы не модифицировать оригинал
     df = raw_data.copy()
     
+    data_version = get_data_version(raw_data)
+    key = None
+    if data_version is not None and "card_id" in df.columns:
+        key = (data_version, get_config_version(), len(df), row_fingerprint(df))
+    if key is not None:
+        with _risk_cache_lock:
+            risk = _risk_cache.get(key)
+            if risk is not None:
+                _risk_cache.move_to_end(key)
+                df['risk'] = risk.copy()
+                return df
+    
     if use_parallel and len(df) > 100:  # Используем параллельную обработку только для больших датасетов
         # Вычисляем риск с использованием параллельной обработки
         df['risk'] = parallel_process_data(df, calculate_risk_score, max_workers)
@@ -75,8 +146,63 @@ def process_data(raw_data, use_parallel=False, max_workers=4):
         # Вычисляем риск для всего DataFrame векторизованно
         df['risk'] = calculate_risk_score(df)
     
+    if key is not None:
+        with _risk_cache_lock:
+            _risk_cache[key] = df['risk'].to_numpy(dtype=float, copy=True)
+            while len(_risk_cache) > RISK_CACHE_MAX_ENTRIES:
+                _risk_cache.popitem(last=False)
+    
     return df
 
+def load_processed_data(_engine):
+    """
+    Загружает данные карточек с рассчитанным риском с инкрементальной синхронизацией.
+    
+    В отличие от связки load_raw_data + process_data, при изменении части карточек
+    из БД выбираются только измененные строки (updated_at выше последнего
+    водяного знака), и риск пересчитывается только для них.
+    
+    Args:
+        _engine: SQLAlchemy engine для подключения к БД
+        
+    Returns:
+        DataFrame с данными карточек и колонкой risk
+    """
+    # Версия конфигурации меняется при save_config, и риск пересчитывается полностью
+    return data_snapshot.load_processed_cards(_engine, calculate_risk_score, risk_version=get_config_version())
+
+def load_card_texts(_engine, card_ids):
+    """
+    Загружает тексты жалоб для указанных карточек.
+    Тексты не хранятся в общем наборе данных и подгружаются по требованию.
+    
+    Args:
+        _engine: SQLAlchemy engine для подключения к БД
+        card_ids: Идентификаторы карточек
+        
+    Returns:
+        dict: {card_id: {"complaints_text": текст}}
+    """
+    return data_snapshot.fetch_card_texts(_engine, card_ids)
+
+def load_card_store(_engine):
+    """
+    Возвращает нормализованное хранилище карточек (коды иерархии + числовые массивы).
+    Хранилище перестраивается только при изменении данных.
+    
+    Args:
+        _engine: SQLAlchemy engine для подключения к БД
+        
+    Returns:
+        CardStore
+    """
+    data = load_processed_data(_engine)
+    return card_store.store_for(data, text_loader=partial(load_card_texts, _engine))
+
+def get_card_texts(_engine, card_ids):
+    """Возвращает тексты жалоб карточек с кэшированием в хранилище карточек."""
+    return load_card_store(_engine).texts(card_ids)
+
 def parallel_process_data(df, process_func, max_workers=4, chunk_size=None):
     """
     Обрабатывает большие объемы данных параллельно по чанкам.
@@ -299,10 +425,9 @@ def get_trickiness_level(row):
     Returns:
         int: Уровень "подлости" (0 - нет, 1 - низкий, 2 - средний, 3 - высокий)
     """
-    # Создаем временный DataFrame из одной строки
+    # Для наборов карточек используйте calculate_risk_batch(df, ["trickiness_level"])
     temp_df = pd.DataFrame([row])
-    # Используем векторизованную функцию
-    return calculate_trickiness_level(temp_df)[0]
+    return calculate_risk_batch(temp_df, columns=["trickiness_level"])["trickiness_level"].iloc[0]
 
 # Векторизованная версия функции trickiness_risk_score
 def calculate_trickiness_risk(df):
@@ -316,7 +441,19 @@ def calculate_trickiness_risk(df):
         Series: Значения риска от 0 до 1 для каждой карточки
     """
     # Сначала рассчитываем уровень подлости
-    trickiness_level = calculate_trickiness_level(df)
+    return trickiness_level_to_risk(calculate_trickiness_level(df))
+
+def trickiness_level_to_risk(trickiness_level):
+    """
+    Преобразует уровни "подлости" (0-3) в значения риска.
+    
+    Args:
+        trickiness_level: Массив уровней "подлости"
+        
+    Returns:
+        ndarray: Значения риска от 0 до 1
+    """
+    trickiness_level = np.asarray(trickiness_level)
     
     # Используем np.select для векторизованного выбора значений риска
     conditions = [
@@ -341,10 +478,9 @@ def trickiness_risk_score(row):
     Returns:
         float: Значение риска от 0 до 1
     """
-    # Создаем временный DataFrame из одной строки
+    # Для наборов карточек используйте calculate_risk_batch(df, ["risk_trickiness"])
     temp_df = pd.DataFrame([row])
-    # Используем векторизованную функцию
-    return calculate_trickiness_risk(temp_df)[0]
+    return calculate_risk_batch(temp_df, columns=["risk_trickiness"])["risk_trickiness"].iloc[0]
 
 # ------------------ Векторизованные функции расчета риска ------------------
 def calculate_discrimination_risk(df):
@@ -566,75 +702,88 @@ def calculate_risk_score(df):
     Returns:
         Series: Значения риска от 0 до 1 для каждой карточки
     """
-    # Получаем параметры из конфигурации
-    config = get_config()
-    WEIGHT_DISCRIMINATION = config["weights"]["discrimination"]
-    WEIGHT_SUCCESS_RATE = config["weights"]["success_rate"]
-    WEIGHT_TRICKINESS = config["weights"].get("trickiness", 0.15)
-    WEIGHT_COMPLAINT_RATE = config["weights"]["complaint_rate"]
-    WEIGHT_ATTEMPTED = config["weights"]["attempted"]
-    
-    RISK_CRITICAL_THRESHOLD = config["risk_thresholds"]["critical"]
-    RISK_HIGH_THRESHOLD = config["risk_thresholds"]["high"]
-    MIN_RISK_FOR_CRITICAL = config["risk_thresholds"]["min_for_critical"]
-    MIN_RISK_FOR_HIGH = config["risk_thresholds"]["min_for_high"]
-    ALPHA_WEIGHT_AVG = config["risk_thresholds"]["alpha_weight_avg"]
-    
-    # Получаем параметр, отвечающий за использование минимального порога
-    USE_MIN_THRESHOLD = config["risk_thresholds"].get("use_min_threshold", True)
-    
-    STATS_SIGNIFICANCE_THRESHOLD = config["stats"]["significance_threshold"]
-    NEUTRAL_RISK_VALUE = config["stats"]["neutral_risk_value"]
-    
-    # Рассчитываем риск для каждой метрики (0-1)
-    risk_discr = calculate_discrimination_risk(df)
-    risk_success = calculate_success_rate_risk(df)
-    risk_trickiness = calculate_trickiness_risk(df)
-    risk_complaints = calculate_complaint_risk(df)
-    risk_attempted = calculate_attempted_share_risk(df)
-    
-    # Определяем максимальный риск для каждой строки
-    max_risk = np.maximum.reduce([risk_discr, risk_success, risk_trickiness, risk_complaints, risk_attempted])
-    
-    # Рассчитываем взвешенное среднее
-    weighted_avg_risk = (
-        WEIGHT_DISCRIMINATION * risk_discr +
-        WEIGHT_SUCCESS_RATE * risk_success +
-        WEIGHT_TRICKINESS * risk_trickiness +
-        WEIGHT_COMPLAINT_RATE * risk_complaints +
-        WEIGHT_ATTEMPTED * risk_attempted
-    )
-    
-    # Определяем минимальный порог риска на основе максимального риска
-    if USE_MIN_THRESHOLD:
-        min_threshold = np.where(
-            max_risk > RISK_CRITICAL_THRESHOLD, 
-            MIN_RISK_FOR_CRITICAL,
-            np.where(max_risk > RISK_HIGH_THRESHOLD, MIN_RISK_FOR_HIGH, 0)
-        )
-    else:
-        # Если не используем минимальный порог, создаем массив нулей той же длины
-        min_threshold = np.zeros_like(weighted_avg_risk)
-    
-    # Применяем комбинированную формулу
-    combined_risk = ALPHA_WEIGHT_AVG * weighted_avg_risk + (1 - ALPHA_WEIGHT_AVG) * max_risk
+    return calculate_risk_batch(df, columns=["risk"])["risk"]
+
+# Компоненты риска, которые возвращает calculate_risk_batch
+RISK_COMPONENTS = risk_kernel.RISK_COMPONENTS
+
+RISK_BATCH_COLUMNS = risk_kernel.KERNEL_COLUMNS
+
+def calculate_risk_batch(df, columns=None):
+    """
+    Рассчитывает за один проход компоненты риска, уровень "подлости" и итоговый риск.
     
-    # Используем попарный максимум вместо reduce для большей устойчивости
-    raw_risk = np.maximum(weighted_avg_risk, combined_risk)
-    raw_risk = np.maximum(raw_risk, min_threshold)
+    Расчет выполняет ядро risk_kernel.RiskKernel, построенное из текущей
+    конфигурации: она читается один раз, а ядро пересобирается только при
+    смене версии конфигурации. Используется вместо построчных оберток
+    (risk_score, get_trickiness_level, trickiness_risk_score,
+    complaint_risk_score) с df.apply(..., axis=1).
     
-    # Корректировка на статистическую значимость
-    confidence_factor = np.minimum(df.total_attempts / STATS_SIGNIFICANCE_THRESHOLD, 1.0)
-    adjusted_risk = raw_risk * confidence_factor + NEUTRAL_RISK_VALUE * (1 - confidence_factor)
+    Args:
+        df: DataFrame с данными карточек
+        columns: Нужные колонки результата из RISK_BATCH_COLUMNS (по умолчанию все).
+            Например, для ["trickiness_level"] достаточно колонок
+            success_rate и first_try_success_rate.
+        
+    Returns:
+        DataFrame: Колонки trickiness_level, risk_* и risk с индексом df
+    """
+    result = risk_kernel.get_kernel().evaluate(df, columns)
+    return pd.DataFrame(result, index=df.index)
+
+def combine_risk_components(components, total_attempts, config=None):
+    """
+    Сводит компоненты риска в итоговый риск по формуле из конфигурации.
     
-    return adjusted_risk
+    Args:
+        components: Массивы риска в порядке RISK_COMPONENTS
+        total_attempts: Массив количества попыток
+        config: Конфигурация (по умолчанию текущая)
+        
+    Returns:
+        ndarray: Значения риска от 0 до 1
+    """
+    kernel = risk_kernel.get_kernel() if config is None else risk_kernel.RiskKernel(config)
+    components = [np.asarray(component, dtype=np.float64) for component in components]
+    return kernel.combine(components, np.asarray(total_attempts, dtype=np.float64))
 
 def apply_filters(df: pd.DataFrame, upto: Optional[List[str]] = None) -> pd.DataFrame:
     cols = FILTERS if upto is None else upto
+    
+    # Быстрый путь: выбранные фильтры образуют префикс иерархии и для df есть индекс
+    active = [col for col in cols if st.session_state.get(f"filter_{col}")]
+    if active and active == FILTERS[:len(active)]:
+        index = card_store.index_for(df)
+        if index is not None:
+            positions = index.positions([st.session_state.get(f"filter_{col}") for col in active])
+            if positions is not None:
+                return drop_unused_categories(df.iloc[positions])
+    
+    filtered = False
     for col in cols:
         v = st.session_state.get(f"filter_{col}")
         if v:
             df = df[df[col] == v]
+            filtered = True
+    if filtered:
+        df = drop_unused_categories(df)
+    return df
+
+
+def drop_unused_categories(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Убирает неиспользуемые категории в категориальных колонках.
+    
+    Иерархические колонки загружаются как category; без этого groupby по
+    отфильтрованному DataFrame вернул бы пустые группы для всех остальных
+    программ/модулей/уроков.
+    """
+    cat_cols = [col for col in df.columns if isinstance(df[col].dtype, pd.CategoricalDtype)]
+    if not cat_cols:
+        return df
+    df = df.copy(deep=False)
+    for col in cat_cols:
+        df[col] = df[col].cat.remove_unused_categories()
     return df
 
 
@@ -650,6 +799,10 @@ def reset_child(level: str):
 # ---------------- Aggregation --------------------------------------------- #
 
 def agg_by(df: pd.DataFrame, level: str) -> pd.DataFrame:
+    # Для категориальной колонки агрегируем прямо по кодам
+    result = card_store.agg_by_codes(df, level)
+    if result is not None:
+        return result
     return (df.groupby(level)
               .agg(success=("success_rate","mean"),
                    complaints=("complaint_rate","mean"),
@@ -772,21 +925,153 @@ def risk_score(row):
     Returns:
         float: Значение риска от 0 до 1
     """
-    # Создаем временный DataFrame из одной строки
+    # Для наборов карточек используйте calculate_risk_batch(df, ["risk"])
     temp_df = pd.DataFrame([row])
-    
-    # Используем векторизованную функцию для расчета риска
-    # Используем .iloc[0] вместо [0], чтобы избежать проблем с индексацией
-    result = calculate_risk_score(temp_df)
-    return result.iloc[0] if isinstance(result, pd.Series) else result[0]
+    return calculate_risk_batch(temp_df, columns=["risk"])["risk"].iloc[0]
 
 # Добавляем функции для загрузки данных для конкретного уровня навигации
+#
+# Тексты запросов строятся отдельными функциями *_query, чтобы одни и те же
+# запросы выполнялись и синхронными загрузчиками load_*, и асинхронным
+# параллельным загрузчиком (async_loader).
+
+def _where(query, clauses):
+    """Добавляет к запросу условие WHERE, если есть ограничения."""
+    if clauses:
+        query += " WHERE " + " AND ".join(clauses)
+    return query
+
+# Статистика уровней иерархии: одно представление mv_hierarchy_stats (см. optimize_db)
+# с колонкой level. Для каждого уровня выбираются его ключи, общая статистика и
+# счетчики вложенных элементов — в том же порядке колонок, что и раньше.
+HIERARCHY_KEYS = {
+    "program": ["program"],
+    "module": ["program", "module", "module_order"],
+    "lesson": ["program", "module", "module_order", "lesson", "lesson_order"],
+    "gz": ["program", "module", "module_order", "lesson", "lesson_order", "gz", "gz_id"],
+}
+
+HIERARCHY_STATS = [
+    "card_count", "avg_success_rate", "avg_complaint_rate", "avg_attempted_share",
+    "avg_discrimination", "total_attempts_sum", "avg_time_median", "total_time_median",
+]
+
+HIERARCHY_COUNTS = {
+    "program": ["module_count", "lesson_count", "gz_count"],
+    "module": ["lesson_count", "gz_count"],
+    "lesson": ["gz_count"],
+    "gz": ["card_type_count"],
+}
+
+def hierarchy_query(level, filters=None, order=()):
+    """
+    Запрос статистики и среднего риска одного уровня иерархии.
+    
+    Args:
+        level: Уровень ("program", "module", "lesson", "gz")
+        filters: Словарь {колонка: значение}; пустые значения не фильтруют
+        order: Колонки сортировки
+        
+    Returns:
+        tuple: (sql, params)
+    """
+    columns = HIERARCHY_KEYS[level] + HIERARCHY_STATS + HIERARCHY_COUNTS[level] + ["last_updated", "avg_risk"]
+    query = f"SELECT {', '.join(columns)} FROM mv_hierarchy_stats"
+    
+    params = {"level": level}
+    where_clauses = ["level = :level"]
+    for column, value in (filters or {}).items():
+        if value:
+            where_clauses.append(f"{column} = :{column}")
+            params[column] = value
+    
+    query = _where(query, where_clauses)
+    if order:
+        query += " ORDER BY " + ", ".join(order)
+    return query, params
+
+def program_query():
+    """Запрос агрегированных данных программ. Возвращает (sql, params)."""
+    return hierarchy_query("program", order=["program"])
+
+def module_query(program=None):
+    """Запрос агрегированных данных модулей. Возвращает (sql, params)."""
+    return hierarchy_query("module", {"program": program}, order=["program", "module_order"])
+
+def lesson_query(program=None, module=None):
+    """Запрос агрегированных данных уроков. Возвращает (sql, params)."""
+    return hierarchy_query(
+        "lesson", {"program": program, "module": module},
+        order=["program", "module_order", "lesson_order"],
+    )
+
+def gz_query(program=None, module=None, lesson=None):
+    """Запрос агрегированных данных групп заданий. Возвращает (sql, params)."""
+    return hierarchy_query(
+        "gz", {"program": program, "module": module, "lesson": lesson},
+        order=["program", "module_order", "lesson_order", "gz"],
+    )
+
+def card_query(program=None, module=None, lesson=None, gz=None):
+    """Запрос данных карточек с риском. Возвращает (sql, params)."""
+    query = """
+        SELECT 
+            c.*,
+            r.risk
+        FROM mv_cards_mv c
+        LEFT JOIN card_risk_cache r ON c.card_id = r.card_id
+    """
+    
+    params = {}
+    where_clauses = []
+    
+    if program:
+        where_clauses.append("c.program = :program")
+        params["program"] = program
+        
+    if module:
+        where_clauses.append("c.module = :module")
+        params["module"] = module
+        
+    if lesson:
+        where_clauses.append("c.lesson = :lesson")
+        params["lesson"] = lesson
+        
+    if gz:
+        where_clauses.append("c.gz = :gz")
+        params["gz"] = gz
+    
+    query = _where(query, where_clauses) + " ORDER BY c.program, c.module_order, c.lesson_order, c.gz"
+    return query, params
+
+def top_cards_query(gz=None, limit=10):
+    """Запрос карточек с наивысшим риском. Возвращает (sql, params)."""
+    query = """
+        SELECT 
+            t.gz, t.card_id, t.risk, t.rn,
+            c.program, c.module, c.lesson, c.card_type, c.card_url
+        FROM top10_by_group t
+        JOIN mv_cards_mv c ON t.card_id = c.card_id
+    """
+    
+    params = {}
+    where_clauses = []
+    if gz:
+        where_clauses.append("t.gz = :gz")
+        params["gz"] = gz
+    
+    if limit:
+        where_clauses.append("t.rn <= :limit")
+        params["limit"] = limit
+        
+    query = _where(query, where_clauses) + " ORDER BY t.gz, t.rn"
+    return query, params
 
 @st.cache_data(ttl=1800)  # Кэширование на 30 минут
 def load_program_data(_engine=None):
     """
     Загружает агрегированные данные на уровне программ.
-    Использует материализованное представление mv_program_risk.
+    Использует сводное представление mv_hierarchy_stats (level = 'program').
     
     Args:
         _engine: SQLAlchemy engine для подключения к БД (не хешируемый параметр)
@@ -797,23 +1082,14 @@ def load_program_data(_engine=None):
     if _engine is None:
         _engine = get_engine()
         
-    sql = text(
-        """
-        SELECT 
-            p.*,
-            r.avg_risk
-        FROM mv_program_stats p
-        LEFT JOIN mv_program_risk r USING(program)
-        ORDER BY program
-        """
-    )
-    return pd.read_sql(sql, _engine)
+    query, params = program_query()
+    return pd.read_sql(text(query), _engine, params=params)
 
 @st.cache_data(ttl=1800)  # Кэширование на 30 минут
 def load_module_data(program=None, _engine=None):
     """
     Загружает агрегированные данные на уровне модулей для указанной программы.
-    Использует материализованное представление mv_module_risk.
+    Использует сводное представление mv_hierarchy_stats (level = 'module').
     
     Args:
         program: Название программы для фильтрации (None для всех программ)
@@ -825,28 +1101,14 @@ def load_module_data(program=None, _engine=None):
     if _engine is None:
         _engine = get_engine()
     
-    query = """
-        SELECT 
-            m.*,
-            r.avg_risk
-        FROM mv_module_stats m
-        LEFT JOIN mv_module_risk r USING(program, module, module_order)
-    """
-    
-    params = {}
-    if program:
-        query += " WHERE m.program = :program"
-        params["program"] = program
-        
-    query += " ORDER BY m.program, m.module_order"
-    
+    query, params = module_query(program)
     return pd.read_sql(text(query), _engine, params=params)
 
 @st.cache_data(ttl=1800)  # Кэширование на 30 минут
 def load_lesson_data(program=None, module=None, _engine=None):
     """
     Загружает агрегированные данные на уровне уроков для указанной программы и модуля.
-    Использует материализованное представление mv_lesson_risk.
+    Использует сводное представление mv_hierarchy_stats (level = 'lesson').
     
     Args:
         program: Название программы для фильтрации (None для всех программ)
@@ -859,37 +1121,14 @@ def load_lesson_data(program=None, module=None, _engine=None):
     if _engine is None:
         _engine = get_engine()
     
-    query = """
-        SELECT 
-            l.*,
-            r.avg_risk
-        FROM mv_lesson_stats l
-        LEFT JOIN mv_lesson_risk r USING(program, module, module_order, lesson, lesson_order)
-    """
-    
-    params = {}
-    where_clauses = []
-    
-    if program:
-        where_clauses.append("l.program = :program")
-        params["program"] = program
-        
-    if module:
-        where_clauses.append("l.module = :module")
-        params["module"] = module
-    
-    if where_clauses:
-        query += " WHERE " + " AND ".join(where_clauses)
-        
-    query += " ORDER BY l.program, l.module_order, l.lesson_order"
-    
+    query, params = lesson_query(program, module)
     return pd.read_sql(text(query), _engine, params=params)
 
 @st.cache_data(ttl=1800)  # Кэширование на 30 минут
 def load_gz_data(program=None, module=None, lesson=None, _engine=None):
     """
     Загружает агрегированные данные на уровне групп заданий (ГЗ) для указанных параметров.
-    Использует материализованное представление mv_gz_risk.
+    Использует сводное представление mv_hierarchy_stats (level = 'gz').
     
     Args:
         program: Название программы для фильтрации (None для всех программ)
@@ -903,34 +1142,7 @@ def load_gz_data(program=None, module=None, lesson=None, _engine=None):
     if _engine is None:
         _engine = get_engine()
     
-    query = """
-        SELECT 
-            g.*,
-            r.avg_risk
-        FROM mv_gz_stats g
-        LEFT JOIN mv_gz_risk r USING(program, module, module_order, lesson, lesson_order, gz, gz_id)
-    """
-    
-    params = {}
-    where_clauses = []
-    
-    if program:
-        where_clauses.append("g.program = :program")
-        params["program"] = program
-        
-    if module:
-        where_clauses.append("g.module = :module")
-        params["module"] = module
-        
-    if lesson:
-        where_clauses.append("g.lesson = :lesson")
-        params["lesson"] = lesson
-    
-    if where_clauses:
-        query += " WHERE " + " AND ".join(where_clauses)
-        
-    query += " ORDER BY g.program, g.module_order, g.lesson_order, g.gz"
-    
+    query, params = gz_query(program, module, lesson)
     return pd.read_sql(text(query), _engine, params=params)
 
 @st.cache_data(ttl=1800)  # Кэширование на 30 минут
@@ -949,42 +1161,21 @@ def load_card_data(program=None, module=None, lesson=None, gz=None, _engine=None
     Returns:
         DataFrame с данными карточек, включая все метрики и риск
     """
-    if _engine is None:
-        _engine = get_engine()
-    
-    query = """
-        SELECT 
-            c.*,
-            r.risk
-        FROM mv_cards_mv c
-        LEFT JOIN card_risk_cache r ON c.card_id = r.card_id
+    return fetch_card_data(program, module, lesson, gz, _engine=_engine)
+
+def fetch_card_data(program=None, module=None, lesson=None, gz=None, _engine=None):
     """
+    То же, что load_card_data, но без st.cache_data.
     
-    params = {}
-    where_clauses = []
-    
-    if program:
-        where_clauses.append("c.program = :program")
-        params["program"] = program
-        
-    if module:
-        where_clauses.append("c.module = :module")
-        params["module"] = module
-        
-    if lesson:
-        where_clauses.append("c.lesson = :lesson")
-        params["lesson"] = lesson
-        
-    if gz:
-        where_clauses.append("c.gz = :gz")
-        params["gz"] = gz
-    
-    if where_clauses:
-        query += " WHERE " + " AND ".join(where_clauses)
-        
-    query += " ORDER BY c.program, c.module_order, c.lesson_order, c.gz"
+    Для фоновых потоков (прогрев): у них нет контекста сессии Streamlit, а
+    результат хранит DataService.
+    """
+    if _engine is None:
+        _engine = get_engine()
     
-    return pd.read_sql(text(query), _engine, params=params)
+    query, params = card_query(program, module, lesson, gz)
+    # Потоковая загрузка через серверный курсор с приведением к компактным типам
+    return read_sql_chunked(text(query), _engine, params=params)
 
 @st.cache_data(ttl=1800)  # Кэширование на 30 минут
 def load_top_cards_by_risk(gz=None, limit=10, _engine=None):
@@ -1002,112 +1193,85 @@ def load_top_cards_by_risk(gz=None, limit=10, _engine=None):
     if _engine is None:
         _engine = get_engine()
     
-    query = """
-        SELECT 
-            t.gz, t.card_id, t.risk, t.rn,
-            c.program, c.module, c.lesson, c.card_type, c.card_url
-        FROM top10_by_group t
-        JOIN mv_cards_mv c ON t.card_id = c.card_id
-    """
-    
-    params = {}
-    if gz:
-        query += " WHERE t.gz = :gz"
-        params["gz"] = gz
-    
-    if limit:
-        query += " AND t.rn <= :limit"
-        params["limit"] = limit
-        
-    query += " ORDER BY t.gz, t.rn"
-    
+    query, params = top_cards_query(gz, limit)
     return pd.read_sql(text(query), _engine, params=params)
 
 # ------------------ Параллельная загрузка данных --------------------- #
 
-def execute_in_parallel(functions_with_args, max_workers=4):
+def level_queries(level="overview", program=None, module=None, lesson=None, gz=None):
     """
-    Выполняет несколько функций параллельно и возвращает их результаты.
+    Возвращает список запросов, необходимых для уровня навигации.
     
     Args:
-        functions_with_args: Список кортежей (функция, аргументы), где аргументы - словарь
-        max_workers: Максимальное количество параллельных рабочих потоков
+        level: Уровень навигации ("overview", "program", "module", "lesson", "gz")
+        program: Название программы для фильтрации
+        module: Название модуля для фильтрации
+        lesson: Название урока для фильтрации
+        gz: Название группы заданий для фильтрации
         
     Returns:
-        dict: Результаты выполнения функций в формате {имя_функции: результат}
+        list: Список async_loader.LevelQuery
     """
-    results = {}
-    
-    def execute_function(func_info):
-        func, args = func_info
-        try:
-            return func.__name__, func(**args)
-        except Exception as e:
-            return func.__name__, f"Error: {str(e)}"
-    
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_func = {executor.submit(execute_function, func_info): func_info for func_info in functions_with_args}
-        for future in concurrent.futures.as_completed(future_to_func):
-            func_name, result = future.result()
-            results[func_name] = result
+    def q(name, query_params, compact=False):
+        query, params = query_params
+        return async_loader.LevelQuery(name, query, params, compact=compact)
     
-    return results
+    if level == "overview":
+        return [q("programs", program_query()), q("modules", module_query())]
+    if level == "program" and program:
+        return [
+            q("modules", module_query(program)),
+            q("lessons", lesson_query(program)),
+            q("program_data", program_query()),
+        ]
+    if level == "module" and module:
+        return [
+            q("lessons", lesson_query(program, module)),
+            q("gz_list", gz_query(program, module)),
+            q("module_data", module_query(program)),
+        ]
+    if level == "lesson" and lesson:
+        return [
+            q("gz_list", gz_query(program, module, lesson)),
+            q("cards", card_query(program, module, lesson), compact=True),
+            q("lesson_data", lesson_query(program, module)),
+        ]
+    if level == "gz" and gz:
+        return [
+            q("cards", card_query(program, module, lesson, gz), compact=True),
+            q("top_cards", top_cards_query(gz)),
+            q("gz_data", gz_query(program, module, lesson)),
+        ]
+    return []
 
 @st.cache_data(ttl=1800)
-def load_data_parallel(program=None, module=None, lesson=None, gz=None, _engine=None, max_workers=4):
+def load_data_parallel(level="overview", program=None, module=None, lesson=None, gz=None, _engine=None, max_workers=4):
     """
-    Загружает несколько наборов данных параллельно в зависимости от уровня навигации.
+    Загружает все наборы данных уровня навигации одновременно.
+    
+    Запросы выполняются асинхронно на соединениях из пула, поэтому время
+    загрузки определяется самым медленным запросом, а не их суммой.
     
     Args:
+        level: Уровень навигации
         program: Название программы для фильтрации
         module: Название модуля для фильтрации
         lesson: Название урока для фильтрации
         gz: Название группы заданий для фильтрации
         _engine: SQLAlchemy engine для подключения к БД
-        max_workers: Максимальное количество параллельных рабочих потоков
+        max_workers: Максимальное количество одновременных запросов
         
     Returns:
-        dict: Словарь с различными наборами данных
+        dict: Словарь {имя набора данных: DataFrame}
+        
+    Raises:
+        async_loader.LevelLoadError: Если хотя бы один запрос не выполнен
     """
     if _engine is None:
         _engine = get_engine()
-        
-    functions_with_args = []
     
-    # Определяем, какие данные нам нужны в зависимости от уровня навигации
-    if gz:
-        # Уровень группы заданий - нужны карточки и топ карточки по риску
-        functions_with_args = [
-            (load_card_data, {'program': program, 'module': module, 'lesson': lesson, 'gz': gz, '_engine': _engine}),
-            (load_top_cards_by_risk, {'gz': gz, '_engine': _engine})
-        ]
-    elif lesson:
-        # Уровень урока - нужны группы заданий и карточки
-        functions_with_args = [
-            (load_gz_data, {'program': program, 'module': module, 'lesson': lesson, '_engine': _engine}),
-            (load_card_data, {'program': program, 'module': module, 'lesson': lesson, '_engine': _engine})
-        ]
-    elif module:
-        # Уровень модуля - нужны уроки
-        functions_with_args = [
-            (load_lesson_data, {'program': program, 'module': module, '_engine': _engine}),
-            (load_gz_data, {'program': program, 'module': module, '_engine': _engine})
-        ]
-    elif program:
-        # Уровень программы - нужны модули
-        functions_with_args = [
-            (load_module_data, {'program': program, '_engine': _engine}),
-            (load_lesson_data, {'program': program, '_engine': _engine})
-        ]
-    else:
-        # Обзорный уровень - нужны программы и модули
-        functions_with_args = [
-            (load_program_data, {'_engine': _engine}),
-            (load_module_data, {'_engine': _engine})
-        ]
-    
-    # Выполняем функции параллельно
-    return execute_in_parallel(functions_with_args, max_workers=max_workers)
+    queries = level_queries(level, program, module, lesson, gz)
+    return async_loader.run_queries(queries, _engine, max_concurrency=max_workers)
 
 # ------------------ Объединенная функция загрузки данных --------------------- #
 
@@ -1123,53 +1287,46 @@ def load_all_data_for_level(level="overview", program=None, module=None, lesson=
         lesson: Название урока для фильтрации
         gz: Название группы заданий для фильтрации
         _engine: SQLAlchemy engine для подключения к БД
-        max_workers: Максимальное количество параллельных рабочих потоков
+        max_workers: Максимальное количество одновременных запросов
         
     Returns:
         dict: Словарь с различными наборами данных для указанного уровня
+        
+    Raises:
+        async_loader.LevelLoadError: Если хотя бы один запрос не выполнен
     """
     if _engine is None:
         _engine = get_engine()
     
-    result = {}
+    result = load_data_parallel(level, program, module, lesson, gz, _engine=_engine, max_workers=max_workers)
+    return select_level_items(result, program, module, lesson, gz)
+
+def fetch_all_data_for_level(level="overview", program=None, module=None, lesson=None, gz=None, _engine=None, max_workers=4):
+    """
+    То же, что load_all_data_for_level, но без st.cache_data.
     
-    # Загружаем базовые данные для уровня
-    if level == "overview":
-        parallel_data = load_data_parallel(_engine=_engine, max_workers=max_workers)
-        result["programs"] = parallel_data.get("load_program_data", pd.DataFrame())
-        result["modules"] = parallel_data.get("load_module_data", pd.DataFrame())
-    
-    elif level == "program" and program:
-        parallel_data = load_data_parallel(program=program, _engine=_engine, max_workers=max_workers)
-        result["modules"] = parallel_data.get("load_module_data", pd.DataFrame())
-        result["lessons"] = parallel_data.get("load_lesson_data", pd.DataFrame())
-        result["program_data"] = load_program_data(_engine=_engine)
-        result["program_data"] = result["program_data"][result["program_data"]["program"] == program]
-    
-    elif level == "module" and module:
-        parallel_data = load_data_parallel(program=program, module=module, _engine=_engine, max_workers=max_workers)
-        result["lessons"] = parallel_data.get("load_lesson_data", pd.DataFrame())
-        result["gz_list"] = parallel_data.get("load_gz_data", pd.DataFrame())
-        result["module_data"] = load_module_data(program=program, _engine=_engine)
-        result["module_data"] = result["module_data"][result["module_data"]["module"] == module]
-    
-    elif level == "lesson" and lesson:
-        parallel_data = load_data_parallel(program=program, module=module, lesson=lesson, _engine=_engine, max_workers=max_workers)
-        result["gz_list"] = parallel_data.get("load_gz_data", pd.DataFrame())
-        result["cards"] = parallel_data.get("load_card_data", pd.DataFrame())
-        result["lesson_data"] = load_lesson_data(program=program, module=module, _engine=_engine)
-        result["lesson_data"] = result["lesson_data"][result["lesson_data"]["lesson"] == lesson]
-    
-    elif level == "gz" and gz:
-        parallel_data = load_data_parallel(program=program, module=module, lesson=lesson, gz=gz, _engine=_engine, max_workers=max_workers)
-        result["cards"] = parallel_data.get("load_card_data", pd.DataFrame())
-        result["top_cards"] = parallel_data.get("load_top_cards_by_risk", pd.DataFrame())
-        result["gz_data"] = load_gz_data(program=program, module=module, lesson=lesson, _engine=_engine)
-        result["gz_data"] = result["gz_data"][result["gz_data"]["gz"] == gz]
-    
-    elif level == "card" and "card_id" in result:
-        card_id = result["card_id"]
-        result["card_data"] = load_card_data(program=program, module=module, lesson=lesson, gz=gz, _engine=_engine)
-        result["card_data"] = result["card_data"][result["card_data"]["card_id"] == card_id]
-    
-    return result
\ No newline at end of file
+    Для фоновых потоков (прогрев): у них нет контекста сессии Streamlit, а
+    результат хранит DataService.
+    """
+    if _engine is None:
+        _engine = get_engine()
+    
+    queries = level_queries(level, program, module, lesson, gz)
+    result = async_loader.run_queries(queries, _engine, max_concurrency=max_workers)
+    return select_level_items(result, program, module, lesson, gz)
+
+def select_level_items(result, program=None, module=None, lesson=None, gz=None):
+    """Оставляет в наборах *_data только выбранный элемент уровня."""
+    result = dict(result)
+    # Данные выбранного элемента берутся из общего запроса уровня выше
+    selected = {
+        "program_data": ("program", program),
+        "module_data": ("module", module),
+        "lesson_data": ("lesson", lesson),
+        "gz_data": ("gz", gz),
+    }
+    for name, (column, value) in selected.items():
+        if name in result:
+            result[name] = result[name][result[name][column] == value]
+    
+    return result
@@ -5,6 +5,7 @@
 
 import os
 import json
+import hashlib
 import logging
 
 # Путь к файлу конфигурации
@@ -71,6 +72,7 @@ DEFAULT_CONFIG = {
 # Кэшированная конфигурация
 _cached_config = None
 _config_last_modified = 0
+_cached_config_version = None
 
 def get_tricky_config():
     """
@@ -126,6 +128,38 @@ def save_tricky_config(tricky_config):
         logging.error(f"Ошибка при сохранении конфигурации трики-карточек: {str(e)}")
         return False
     
+def config_hash(config):
+    """
+    Возвращает хэш содержимого конфигурации.
+    
+    Args:
+        config (dict): Конфигурация
+        
+    Returns:
+        str: Короткий sha1-хэш канонического JSON конфигурации
+    """
+    payload = json.dumps(config, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+def get_config_version():
+    """
+    Возвращает версию текущей конфигурации риска (хэш ее содержимого).
+    
+    Версия пересчитывается только при перезагрузке или сохранении
+    конфигурации, поэтому вызов дешевый и подходит для ключей кэша.
+    
+    Returns:
+        str: Версия конфигурации
+    """
+    global _cached_config_version
+    
+    config = get_config()
+    if config is DEFAULT_CONFIG:
+        return config_hash(DEFAULT_CONFIG)
+    if _cached_config_version is None:
+        _cached_config_version = config_hash(config)
+    return _cached_config_version
+
 def get_config():
     """
     Загружает конфигурацию из файла или возвращает кэшированную версию,
@@ -134,7 +168,7 @@ def get_config():
     Returns:
         dict: Конфигурация риска
     """
-    global _cached_config, _config_last_modified
+    global _cached_config, _config_last_modified, _cached_config_version
     
     try:
         # Проверяем существование файла и время последней модификации
@@ -160,6 +194,7 @@ def get_config():
                 
                 _cached_config = config
                 _config_last_modified = current_mtime
+                _cached_config_version = None
                 return config
         else:
             # Если файл не существует, возвращаем настройки по умолчанию
@@ -179,15 +214,16 @@ def save_config(config):
     Returns:
         bool: True если сохранение успешно, иначе False
     """
-    global _cached_config, _config_last_modified
+    global _cached_config, _config_last_modified, _cached_config_version
     
     try:
         with open(CONFIG_PATH, 'w', encoding='utf-8') as file:
             json.dump(config, file, indent=4, ensure_ascii=False)
         
-        # Обновляем кэш
+        # Обновляем кэш (версия будет пересчитана при следующем запросе)
         _cached_config = config
         _config_last_modified = os.path.getmtime(CONFIG_PATH)
+        _cached_config_version = None
         return True
     except Exception as e:
         logging.error(f"Ошибка при сохранении конфигурации: {str(e)}")
@@ -0,0 +1,180 @@
+# data_service.py
+"""
+Общее для всех сессий хранилище загруженных данных.
+
+Раньше каждая сессия клала результат load_app_data в
+st.session_state[f"data_cache_{current_page}"], поэтому память росла как
+пользователи × страницы. Здесь данные хранятся один раз на процесс, а сессии
+получают версионированный дескриптор (DataHandle) и неглубокие представления
+DataFrame'ов без копирования самих массивов.
+"""
+
+import os
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import pandas as pd
+import streamlit as st
+
+# Как часто (в секундах) проверять, не изменилась ли версия исходных данных
+DATA_REFRESH_SECONDS = float(os.getenv("DATA_REFRESH_SECONDS", "60"))
+
+# Максимальное количество наборов данных (страница + фильтры) в памяти
+MAX_ENTRIES = int(os.getenv("DATA_SERVICE_MAX_ENTRIES", "64"))
+
+# Количество блокировок загрузки: ключ загружается под блокировкой hash(key) % KEY_LOCK_STRIPES.
+# Фиксированный набор не растет вместе с числом комбинаций фильтров
+KEY_LOCK_STRIPES = int(os.getenv("DATA_SERVICE_KEY_LOCK_STRIPES", "64"))
+
+
+class DataHandle:
+    """
+    Версионированный дескриптор набора данных, общего для всех сессий.
+
+    Attributes:
+        key: Ключ набора данных
+        version: Версия сервиса, при которой набор был загружен
+        data: Словарь с данными (только для чтения)
+    """
+
+    def __init__(self, key: Hashable, version: str, data: Dict[str, Any]):
+        self.key = key
+        self.version = version
+        self.data = data
+        self.loaded_at = time.time()
+
+    def view(self) -> Dict[str, Any]:
+        """
+        Возвращает словарь для страницы без копирования данных.
+
+        DataFrame'ы отдаются как неглубокие копии: они разделяют массивы с
+        общим набором, но добавление колонок на странице не затрагивает
+        другие сессии.
+        """
+        return {
+            name: value.copy(deep=False) if isinstance(value, pd.DataFrame) else value
+            for name, value in self.data.items()
+        }
+
+
+class DataService:
+    """Процессный кэш наборов данных с версионированием и явной инвалидацией."""
+
+    def __init__(self, refresh_interval: float = DATA_REFRESH_SECONDS, max_entries: int = MAX_ENTRIES):
+        self.refresh_interval = refresh_interval
+        self.max_entries = max_entries
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[Hashable, DataHandle]" = OrderedDict()
+        self._key_locks = [threading.Lock() for _ in range(max(1, KEY_LOCK_STRIPES))]
+        self._generation = 0
+        self._source_version: Any = None
+        self._checked_at = 0.0
+
+    @property
+    def version(self) -> str:
+        """Текущая версия: номер явной инвалидации + версия исходных данных."""
+        with self._lock:
+            return f"{self._generation}:{self._source_version}"
+
+    def sync(self, source_version_fn: Callable[[], Any]) -> str:
+        """
+        Проверяет версию исходных данных не чаще раза в refresh_interval секунд.
+
+        Если версия изменилась, все наборы данных сбрасываются и будут
+        загружены заново при следующем обращении.
+
+        Args:
+            source_version_fn: Функция, возвращающая текущую версию исходных данных
+
+        Returns:
+            str: Текущая версия сервиса
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self._checked_at and now - self._checked_at < self.refresh_interval:
+                return self.version
+            self._checked_at = now
+        source_version = source_version_fn()
+        with self._lock:
+            if source_version != self._source_version:
+                self._source_version = source_version
+                self._entries.clear()
+            return self.version
+
+    def get(self, key: Hashable, loader: Callable[[], Dict[str, Any]]) -> DataHandle:
+        """
+        Возвращает набор данных по ключу, загружая его один раз на версию.
+
+        Параллельные запросы одного ключа ждут первую загрузку, а не
+        выполняют ее повторно.
+
+        Args:
+            key: Ключ набора данных
+            loader: Функция загрузки, возвращающая словарь с данными
+
+        Returns:
+            DataHandle
+        """
+        with self._lock:
+            handle = self._entries.get(key)
+            if handle is not None and handle.version == self.version:
+                self._entries.move_to_end(key)
+                return handle
+        # Разные ключи с одной блокировкой загружаются по очереди, но повторной загрузки не бывает
+        key_lock = self._key_locks[hash(key) % len(self._key_locks)]
+
+        with key_lock:
+            with self._lock:
+                version = self.version
+                handle = self._entries.get(key)
+                if handle is not None and handle.version == version:
+                    return handle
+            data = loader()
+            handle = DataHandle(key, version, data)
+            with self._lock:
+                # Если за время загрузки данные инвалидировали, не кладем устаревший набор
+                if version == self.version:
+                    self._entries[key] = handle
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+            return handle
+
+    def contains(self, key: Hashable) -> bool:
+        """Возвращает True, если набор данных по ключу загружен для текущей версии."""
+        with self._lock:
+            handle = self._entries.get(key)
+            return handle is not None and handle.version == self.version
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Явно сбрасывает данные.
+
+        Args:
+            key: Ключ набора данных; None — сбросить все наборы и форсировать
+                проверку версии исходных данных при следующем обращении
+        """
+        with self._lock:
+            if key is not None:
+                self._entries.pop(key, None)
+                return
+            self._entries.clear()
+            self._generation += 1
+            self._checked_at = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Сводка по хранилищу для отладки и админки."""
+        with self._lock:
+            return {
+                "version": self.version,
+                "entries": len(self._entries),
+                "keys": list(self._entries.keys()),
+            }
+
+
+@st.cache_resource
+def get_data_service() -> DataService:
+    """Возвращает единственный на процесс экземпляр DataService."""
+    return DataService()
@@ -0,0 +1,389 @@
+# data_snapshot.py
+"""
+Локальный колоночный снапшот таблицы cards_mv.
+
+Снапшот хранится в формате Arrow IPC (Feather v2) и помечается водяным знаком
+базы данных: MAX(updated_at) и количеством строк. Прогретые процессы и
+перезапуски читают файл через memory-map и обращаются к Postgres за полной
+выборкой только тогда, когда водяной знак изменился.
+
+Если водяной знак сдвинулся, сначала пробуется инкрементальная синхронизация:
+выбираются строки с updated_at не ниже последнего известного значения минус
+окно перекрытия (DELTA_OVERLAP_SECONDS) и сливаются с закэшированными данными
+по card_id. Окно ловит строки, закоммиченные после чтения водяного знака с
+более ранним updated_at, и строки с тем же updated_at; повторное слияние по
+card_id идемпотентно. Изменения, которые не сдвигают updated_at (например,
+только в cards_metrics), подхватывает полная пересинхронизация не реже раза
+в FULL_RESYNC_SECONDS.
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from typing import Optional, Dict, Any, Callable
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import CategoricalDtype
+from sqlalchemy import text, bindparam
+
+from db_stream import read_sql_chunked, concat_frames
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow не установлен — снапшоты отключены
+    pa = None
+    feather = None
+
+# Каталог для снапшотов (можно переопределить переменной окружения)
+SNAPSHOT_DIR = os.getenv("CARDS_SNAPSHOT_DIR", os.path.join(".cache", "snapshots"))
+SNAPSHOT_FILE = "cards_mv.arrow"
+SNAPSHOT_META_FILE = "cards_mv.json"
+
+# Колонки, которые выбираются из cards_mv
+CARDS_COLUMNS = [
+    "program", "module", "module_order", "lesson", "lesson_order",
+    "gz", "gz_id", "card_id", "card_type", "card_url",
+    "total_attempts", "attempted_share", "success_rate", "first_try_success_rate",
+    "complaint_rate", "complaints_total", "discrimination_avg", "success_attempts_rate",
+    "time_median",
+    "status", "updated_at",
+]
+
+# Длинные текстовые колонки не входят в снапшот и загружаются по требованию
+TEXT_COLUMNS = ["complaints_text"]
+
+CARDS_SQL = "SELECT {columns} FROM cards_mv c".format(
+    columns=", ".join(f"c.{col}" for col in CARDS_COLUMNS)
+)
+
+# Окно перекрытия инкрементальной выборки (секунды до последнего известного updated_at)
+DELTA_OVERLAP_SECONDS = float(os.getenv("CARDS_DELTA_OVERLAP_SECONDS", "300"))
+
+# Не реже чем раз в столько секунд данные выбираются целиком, даже если водяной знак не изменился
+FULL_RESYNC_SECONDS = float(os.getenv("CARDS_FULL_RESYNC_SECONDS", "3600"))
+
+DELTA_SQL = CARDS_SQL + (
+    " WHERE c.updated_at >= CAST(:since AS timestamptz) - make_interval(secs => :overlap)"
+)
+
+TEXT_SQL = "SELECT c.card_id, {columns} FROM cards_mv c WHERE c.card_id IN :card_ids".format(
+    columns=", ".join(f"c.{col}" for col in TEXT_COLUMNS)
+)
+
+WATERMARK_SQL = "SELECT MAX(updated_at) AS max_updated_at, COUNT(*) AS row_count FROM cards_mv"
+
+# Поля водяного знака (метаданные снапшота дополнительно хранят время полной синхронизации)
+WATERMARK_KEYS = ("max_updated_at", "row_count")
+
+# Ключ в DataFrame.attrs с версией данных (по водяному знаку); attrs сохраняются
+# при копировании и сериализации, поэтому версию можно использовать как ключ кэша
+DATA_VERSION_ATTR = "data_version"
+
+
+def snapshots_enabled() -> bool:
+    """Возвращает True, если снапшоты доступны (установлен pyarrow и они не отключены)."""
+    return pa is not None and os.getenv("CARDS_SNAPSHOT_DISABLED", "0") != "1"
+
+
+def get_watermark(engine) -> Dict[str, Any]:
+    """
+    Получает водяной знак данных cards_mv одним дешевым запросом.
+
+    Args:
+        engine: SQLAlchemy engine для подключения к БД
+
+    Returns:
+        dict: {"max_updated_at": строка с временем или None, "row_count": int}
+    """
+    with engine.connect() as conn:
+        row = conn.execute(text(WATERMARK_SQL)).one()
+    max_updated_at = row.max_updated_at
+    return {
+        "max_updated_at": str(max_updated_at) if max_updated_at is not None else None,
+        "row_count": int(row.row_count),
+    }
+
+
+def watermark_version(watermark: Dict[str, Any]) -> str:
+    """Строковая версия данных по водяному знаку."""
+    return f"{watermark.get('max_updated_at')}|{watermark.get('row_count')}"
+
+
+def same_watermark(meta: Optional[Dict[str, Any]], watermark: Dict[str, Any]) -> bool:
+    """Совпадает ли водяной знак из метаданных снапшота с водяным знаком БД."""
+    return meta is not None and all(meta.get(key) == watermark.get(key) for key in WATERMARK_KEYS)
+
+
+def resync_due(full_sync_at: Optional[float]) -> bool:
+    """Пора ли выбрать данные целиком (последняя полная синхронизация старше FULL_RESYNC_SECONDS)."""
+    return full_sync_at is None or time.time() - full_sync_at >= FULL_RESYNC_SECONDS
+
+
+def _mark_version(df: pd.DataFrame, watermark: Dict[str, Any]) -> pd.DataFrame:
+    df.attrs[DATA_VERSION_ATTR] = watermark_version(watermark)
+    return df
+
+
+def _snapshot_paths():
+    return (
+        os.path.join(SNAPSHOT_DIR, SNAPSHOT_FILE),
+        os.path.join(SNAPSHOT_DIR, SNAPSHOT_META_FILE),
+    )
+
+
+def read_snapshot_meta() -> Optional[Dict[str, Any]]:
+    """Читает метаданные снапшота (водяной знак). Возвращает None, если снапшота нет."""
+    data_path, meta_path = _snapshot_paths()
+    if not (os.path.exists(data_path) and os.path.exists(meta_path)):
+        return None
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logging.warning(f"Не удалось прочитать метаданные снапшота: {str(e)}")
+        return None
+
+
+def read_snapshot() -> Optional[pd.DataFrame]:
+    """
+    Читает снапшот с диска через memory-map.
+
+    Returns:
+        DataFrame или None, если снапшот отсутствует или поврежден
+    """
+    if not snapshots_enabled():
+        return None
+    data_path, _ = _snapshot_paths()
+    if not os.path.exists(data_path):
+        return None
+    try:
+        table = feather.read_table(data_path, memory_map=True)
+        return table.to_pandas()
+    except (OSError, pa.ArrowException) as e:
+        logging.warning(f"Не удалось прочитать снапшот {data_path}: {str(e)}")
+        return None
+
+
+def write_snapshot(df: pd.DataFrame, watermark: Dict[str, Any], full_sync_at: Optional[float] = None) -> bool:
+    """
+    Атомарно записывает снапшот и его водяной знак на диск.
+
+    Файл пишется во временный путь и подменяется через os.replace,
+    поэтому параллельные читатели никогда не видят недописанный снапшот.
+
+    Args:
+        df: DataFrame с данными cards_mv
+        watermark: Водяной знак, соответствующий данным
+        full_sync_at: Время последней полной выборки, на которой основаны данные
+
+    Returns:
+        bool: True, если снапшот записан
+    """
+    if not snapshots_enabled():
+        return False
+    data_path, meta_path = _snapshot_paths()
+    try:
+        os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+        pid = os.getpid()
+        tmp_data = f"{data_path}.{pid}.tmp"
+        tmp_meta = f"{meta_path}.{pid}.tmp"
+        # Без сжатия, чтобы файл можно было отображать в память без распаковки
+        feather.write_feather(df, tmp_data, compression="uncompressed")
+        with open(tmp_meta, "w", encoding="utf-8") as f:
+            json.dump({**watermark, "full_sync_at": full_sync_at}, f)
+        os.replace(tmp_data, data_path)
+        os.replace(tmp_meta, meta_path)
+        return True
+    except (OSError, pa.ArrowException) as e:
+        logging.warning(f"Не удалось записать снапшот {data_path}: {str(e)}")
+        return False
+
+
+def fetch_cards(engine) -> pd.DataFrame:
+    """Полная выборка cards_mv из базы данных (потоково, с компактными типами)."""
+    return read_sql_chunked(text(CARDS_SQL), engine)
+
+
+def fetch_card_texts(engine, card_ids) -> Dict[int, Dict[str, Any]]:
+    """
+    Загружает текстовые колонки (тексты жалоб) для указанных карточек.
+
+    Args:
+        engine: SQLAlchemy engine для подключения к БД
+        card_ids: Идентификаторы карточек
+
+    Returns:
+        dict: {card_id: {колонка: текст}}
+    """
+    card_ids = [int(card_id) for card_id in card_ids]
+    if not card_ids:
+        return {}
+    sql = text(TEXT_SQL).bindparams(bindparam("card_ids", expanding=True))
+    with engine.connect() as conn:
+        rows = conn.execute(sql, {"card_ids": card_ids}).mappings().all()
+    return {int(row["card_id"]): {col: row[col] for col in TEXT_COLUMNS} for row in rows}
+
+
+def fetch_delta(engine, since: str, overlap: float = DELTA_OVERLAP_SECONDS) -> pd.DataFrame:
+    """
+    Выбирает из cards_mv строки, измененные начиная с указанного момента минус окно перекрытия.
+
+    Args:
+        engine: SQLAlchemy engine для подключения к БД
+        since: Последний известный MAX(updated_at)
+        overlap: Окно перекрытия в секундах
+
+    Returns:
+        DataFrame с измененными строками (часть из них может быть уже известна)
+    """
+    return read_sql_chunked(text(DELTA_SQL), engine, params={"since": since, "overlap": overlap})
+
+
+def merge_delta(base: pd.DataFrame, delta: pd.DataFrame,
+                risk_fn: Optional[Callable[[pd.DataFrame], Any]] = None) -> pd.DataFrame:
+    """
+    Сливает измененные строки с закэшированными данными по card_id.
+
+    Строки с уже известными card_id заменяются, новые добавляются в конец.
+    Если в base есть колонка risk и передана risk_fn, риск пересчитывается
+    только для строк из delta.
+
+    Args:
+        base: Закэшированный DataFrame
+        delta: DataFrame с измененными строками
+        risk_fn: Функция расчета риска (например, core.calculate_risk_score)
+
+    Returns:
+        DataFrame с примененными изменениями
+    """
+    if delta.empty:
+        return base
+
+    delta = delta.copy()
+    if "risk" in base.columns and risk_fn is not None:
+        delta["risk"] = np.asarray(risk_fn(delta), dtype=float)
+
+    # Обновляем существующие строки на месте, сохраняя порядок base
+    positions = pd.Index(base["card_id"]).get_indexer(delta["card_id"])
+    is_new = positions < 0
+    merged = base.copy()
+    if (~is_new).any():
+        rows = positions[~is_new]
+        for col in delta.columns.intersection(merged.columns):
+            values = delta[col].to_numpy()[~is_new]
+            if isinstance(merged[col].dtype, CategoricalDtype):
+                # Новые значения (например, новый статус) нужно сначала добавить в категории
+                missing = pd.Index(pd.unique(values)).dropna().difference(merged[col].cat.categories)
+                if len(missing):
+                    merged[col] = merged[col].cat.add_categories(missing)
+            merged.iloc[rows, merged.columns.get_loc(col)] = values
+    if is_new.any():
+        merged = concat_frames([merged, delta.loc[is_new, merged.columns.intersection(delta.columns)]])
+    return merged
+
+
+def _try_delta_sync(engine, base: pd.DataFrame, base_watermark: Dict[str, Any],
+                    watermark: Dict[str, Any], risk_fn=None) -> Optional[pd.DataFrame]:
+    """
+    Пытается обновить base инкрементально.
+
+    Возвращает None, если инкрементальное обновление невозможно: нет
+    предыдущего водяного знака или после слияния количество строк не совпадает
+    с БД (появились карточки без updated_at или часть карточек удалена).
+    """
+    since = base_watermark.get("max_updated_at")
+    if since is None or watermark.get("max_updated_at") is None:
+        return None
+    delta = fetch_delta(engine, since)
+    merged = merge_delta(base, delta, risk_fn)
+    if len(merged) != watermark["row_count"]:
+        return None
+    return merged
+
+
+def load_cards(engine, force_full: bool = False) -> pd.DataFrame:
+    """
+    Возвращает данные cards_mv, используя локальный снапшот, если он актуален.
+
+    Сравнивает водяной знак БД с водяным знаком снапшота. Если они совпадают,
+    данные читаются с диска; если водяной знак сдвинулся, снапшот обновляется
+    инкрементально, а при невозможности этого выполняется полная выборка.
+    Снапшот, полная синхронизация которого старше FULL_RESYNC_SECONDS,
+    выбирается заново целиком.
+
+    Args:
+        engine: SQLAlchemy engine для подключения к БД
+        force_full: Выбрать данные целиком, не используя снапшот
+
+    Returns:
+        DataFrame с данными из таблицы cards_mv
+    """
+    watermark = get_watermark(engine)
+    if not snapshots_enabled():
+        return _mark_version(fetch_cards(engine), watermark)
+
+    meta = read_snapshot_meta()
+    full_sync_at = meta.get("full_sync_at") if meta else None
+    df = read_snapshot() if meta is not None and not force_full and not resync_due(full_sync_at) else None
+    if df is not None and same_watermark(meta, watermark):
+        return _mark_version(df, watermark)
+
+    merged = _try_delta_sync(engine, df, meta, watermark) if df is not None else None
+    if merged is None:
+        merged = fetch_cards(engine)
+        full_sync_at = time.time()
+    write_snapshot(merged, watermark, full_sync_at)
+    return _mark_version(merged, watermark)
+
+
+# Обработанные данные (с колонкой risk), общие для всего процесса
+_processed_lock = threading.Lock()
+_processed_state: Dict[str, Any] = {"watermark": None, "risk_version": None, "data": None, "full_sync_at": None}
+
+
+def load_processed_cards(engine, risk_fn: Callable[[pd.DataFrame], Any], risk_version=None) -> pd.DataFrame:
+    """
+    Возвращает данные cards_mv с рассчитанной колонкой risk.
+
+    При неизменном водяном знаке возвращаются закэшированные данные. При сдвиге
+    водяного знака выбираются только измененные строки и риск пересчитывается
+    только для них; полная перезагрузка выполняется при изменении состава
+    карточек или версии конфигурации риска и не реже раза в FULL_RESYNC_SECONDS.
+
+    Args:
+        engine: SQLAlchemy engine для подключения к БД
+        risk_fn: Функция расчета риска для DataFrame
+        risk_version: Версия конфигурации риска; при ее смене риск пересчитывается полностью
+
+    Returns:
+        DataFrame с данными карточек и колонкой risk
+    """
+    with _processed_lock:
+        watermark = get_watermark(engine)
+        state = _processed_state
+        cached = state["data"]
+        due = resync_due(state["full_sync_at"])
+        if cached is not None and state["risk_version"] == risk_version and not due:
+            if state["watermark"] == watermark:
+                return cached
+            merged = _try_delta_sync(engine, cached, state["watermark"], watermark, risk_fn)
+            if merged is not None:
+                write_snapshot(merged.drop(columns=["risk"]), watermark, state["full_sync_at"])
+                _mark_version(merged, watermark)
+                state.update(watermark=watermark, data=merged)
+                return merged
+
+        # Процессный кэш устарел по времени — снапшот на диске тоже не используется
+        force_full = cached is not None and due
+        data = load_cards(engine, force_full=force_full).copy()
+        meta = read_snapshot_meta() if snapshots_enabled() else None
+        full_sync_at = meta.get("full_sync_at") if meta else None
+        data["risk"] = np.asarray(risk_fn(data), dtype=float)
+        _mark_version(data, watermark)
+        state.update(watermark=watermark, risk_version=risk_version, data=data,
+                     full_sync_at=full_sync_at if full_sync_at is not None else time.time())
+        return data
@@ -0,0 +1,134 @@
+# db_bulk.py
+"""
+Массовая запись DataFrame в Postgres через COPY FROM STDIN.
+
+DataFrame.to_sql отправляет строки INSERT'ами (executemany), и запись
+десятков тысяч строк в облачную БД занимает минуты. COPY передает данные
+одним потоком CSV: DataFrame сериализуется порциями по мере чтения драйвером,
+поэтому весь CSV не держится в памяти. Схема таблицы создается тем же
+сопоставлением типов, что и у to_sql, так что таблицы, записанные раньше
+через to_sql, и таблицы, загруженные через COPY, совпадают.
+"""
+
+import io
+import os
+from typing import List, Optional
+
+import pandas as pd
+from sqlalchemy import text
+
+# Количество строк DataFrame, сериализуемых в CSV за один раз
+COPY_CHUNK_ROWS = int(os.getenv("DB_COPY_CHUNK_ROWS", "50000"))
+
+# Представление NULL в CSV для COPY (по умолчанию NULL — пустое поле, и пустая строка стала бы NULL)
+COPY_NULL = "\\N"
+
+
+class FrameCSVReader(io.RawIOBase):
+    """
+    Файлоподобный объект, отдающий DataFrame в формате CSV порциями.
+
+    copy_expert читает его через read(size); очередная порция строк
+    сериализуется только когда предыдущая уже передана.
+    """
+
+    def __init__(self, df: pd.DataFrame, chunk_rows: int = COPY_CHUNK_ROWS):
+        self.df = df
+        self.chunk_rows = max(1, chunk_rows)
+        self._position = 0
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def _next_chunk(self) -> bytes:
+        chunk = self.df.iloc[self._position:self._position + self.chunk_rows]
+        self._position += self.chunk_rows
+        # Пропуски пишутся как COPY_NULL, чтобы пустые строки не превратились в NULL
+        return chunk.to_csv(header=False, index=False, na_rep=COPY_NULL).encode("utf-8")
+
+    def read(self, size: int = -1) -> bytes:
+        while (size < 0 or len(self._buffer) < size) and self._position < len(self.df):
+            self._buffer += self._next_chunk()
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def create_table_for_frame(conn, df: pd.DataFrame, table: str) -> None:
+    """
+    Создает пустую таблицу с колонками DataFrame (типы как у to_sql).
+
+    Args:
+        conn: SQLAlchemy Connection
+        df: DataFrame, определяющий колонки и типы
+        table: Имя таблицы (не должна существовать)
+    """
+    df.head(0).to_sql(table, conn, if_exists="fail", index=False)
+
+
+def copy_frame(conn, df: pd.DataFrame, table: str, columns: Optional[List[str]] = None,
+               chunk_rows: int = COPY_CHUNK_ROWS) -> int:
+    """
+    Загружает DataFrame в существующую таблицу через COPY FROM STDIN.
+
+    Выполняется в транзакции conn: данные видны другим соединениям только
+    после ее фиксации.
+
+    Args:
+        conn: SQLAlchemy Connection (драйвер psycopg2)
+        df: DataFrame с данными
+        table: Имя таблицы
+        columns: Колонки для загрузки (по умолчанию все колонки df)
+        chunk_rows: Количество строк в одной порции CSV
+
+    Returns:
+        int: Количество загруженных строк
+    """
+    columns = list(df.columns) if columns is None else list(columns)
+    quoted = ", ".join(f'"{column}"' for column in columns)
+    cursor = conn.connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {table} ({quoted}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')",
+            FrameCSVReader(df[columns], chunk_rows),
+        )
+    finally:
+        cursor.close()
+    return len(df)
+
+
+def load_frame(conn, df: pd.DataFrame, table: str, chunk_rows: int = COPY_CHUNK_ROWS) -> int:
+    """
+    Создает таблицу по DataFrame и загружает в нее данные через COPY.
+
+    Args:
+        conn: SQLAlchemy Connection (драйвер psycopg2)
+        df: DataFrame с данными
+        table: Имя новой таблицы
+        chunk_rows: Количество строк в одной порции CSV
+
+    Returns:
+        int: Количество загруженных строк
+    """
+    create_table_for_frame(conn, df, table)
+    return copy_frame(conn, df, table, chunk_rows=chunk_rows)
+
+
+def has_dependent_views(conn, table: str) -> bool:
+    """
+    Есть ли представления (обычные или материализованные), читающие таблицу.
+
+    Такие представления ссылаются на таблицу по OID, поэтому подмена таблицы
+    переименованием оставила бы их на старой версии.
+    """
+    return conn.execute(text("""
+        SELECT EXISTS (
+            SELECT 1 FROM pg_depend d
+            JOIN pg_rewrite r ON r.oid = d.objid
+            WHERE d.classid = 'pg_rewrite'::regclass
+              AND d.refobjid = to_regclass(:table)
+              AND r.ev_class <> d.refobjid
+        )
+    """), {"table": table}).scalar()
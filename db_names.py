@@ -0,0 +1,10 @@
+# db_names.py
+"""
+Имена служебных объектов БД, общие для процессов.
+
+Веб-процесс (например, navigation_regenerator) может ссылаться на эти имена,
+не импортируя optimize_db вместе с его зависимостями и описанием объектов.
+"""
+
+# Таблица с результатом последнего обновления каждого объекта optimize_db
+REFRESH_LOG_TABLE = "mv_refresh_log"
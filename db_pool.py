@@ -0,0 +1,151 @@
+# db_pool.py
+"""
+Пул соединений с облачным Postgres и статистика его использования.
+
+Все модули получают один на процесс engine (core.get_engine), поэтому TLS-
+рукопожатия с облачной БД выполняются только при росте пула, а не на каждый
+вызов. Размер пула, overflow, pre-ping и recycle настраиваются переменными
+окружения; статистика выдачи соединений и ожидания позволяет подобрать размер
+пула под нагрузку.
+"""
+
+import os
+import time
+import threading
+from typing import Any, Dict
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+# Параметры пула по умолчанию (переопределяются переменными окружения)
+POOL_DEFAULTS = {
+    "DB_POOL_SIZE": "5",
+    "DB_MAX_OVERFLOW": "10",
+    "DB_POOL_TIMEOUT": "30",
+    "DB_POOL_RECYCLE": "1800",
+    "DB_POOL_PRE_PING": "1",
+}
+
+
+def get_pool_settings() -> Dict[str, Any]:
+    """
+    Читает параметры пула из переменных окружения.
+
+    Returns:
+        dict: Параметры для create_engine
+    """
+    env = {name: os.getenv(name, default) for name, default in POOL_DEFAULTS.items()}
+    return {
+        "pool_size": int(env["DB_POOL_SIZE"]),
+        "max_overflow": int(env["DB_MAX_OVERFLOW"]),
+        "pool_timeout": float(env["DB_POOL_TIMEOUT"]),
+        "pool_recycle": int(env["DB_POOL_RECYCLE"]),
+        "pool_pre_ping": env["DB_POOL_PRE_PING"] not in ("0", "false", "False", ""),
+    }
+
+
+class PoolStats:
+    """Потокобезопасные счетчики выдачи соединений из пула."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connect_errors = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.slow_checkouts = 0
+
+    def record(self, wait: float, timed_out: bool = False, failed: bool = False, slow_threshold: float = 0.05):
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+                return
+            if failed:
+                # Ошибка подключения (отказ, авторизация, DNS), а не исчерпание пула
+                self.connect_errors += 1
+                return
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            if wait >= slow_threshold:
+                self.slow_checkouts += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "connect_errors": self.connect_errors,
+                "avg_wait_ms": (self.total_wait / self.checkouts * 1000) if self.checkouts else 0.0,
+                "max_wait_ms": self.max_wait * 1000,
+                "slow_checkouts": self.slow_checkouts,
+            }
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool, который замеряет время ожидания свободного соединения."""
+
+    stats: PoolStats
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        except Exception:
+            self.stats.record(time.perf_counter() - start, failed=True)
+            raise
+        self.stats.record(time.perf_counter() - start)
+        return connection
+
+    def recreate(self):
+        # При пересоздании пула (например, после dispose) сохраняем общую статистику
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+def create_pooled_engine(dsn: str):
+    """
+    Создает engine с настроенным пулом соединений и сбором статистики.
+
+    Args:
+        dsn: Строка подключения к БД
+
+    Returns:
+        SQLAlchemy engine
+    """
+    engine = create_engine(dsn, future=True, poolclass=TimedQueuePool, **get_pool_settings())
+    engine.pool.stats = PoolStats()
+    return engine
+
+
+def get_pool_stats(engine) -> Dict[str, Any]:
+    """
+    Возвращает статистику пула: размер, занятые соединения, ожидания.
+
+    Args:
+        engine: Engine, созданный через create_pooled_engine
+
+    Returns:
+        dict: Статистика пула
+    """
+    pool = engine.pool
+    result = {
+        "pool_size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": pool.overflow(),
+        "status": pool.status(),
+    }
+    stats = getattr(pool, "stats", None)
+    if stats is not None:
+        result.update(stats.snapshot())
+    return result
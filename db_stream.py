@@ -0,0 +1,179 @@
+# db_stream.py
+"""
+Потоковая загрузка результатов SQL-запросов в компактный DataFrame.
+
+pd.read_sql буферизует весь результат в psycopg2 и затем строит объектные
+колонки, поэтому пиковое потребление памяти примерно вдвое больше итогового
+DataFrame. Здесь результат читается через именованный серверный курсор
+(stream_results) фиксированными порциями, каждая порция сразу приводится к
+компактным типам, а склейка выполняется один раз в конце.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import CategoricalDtype, is_numeric_dtype
+
+# Размер порции, которую серверный курсор отдает за один раз
+DEFAULT_CHUNK_SIZE = 5000
+
+# Компактные типы для колонок карточек
+COMPACT_DTYPES: Dict[str, str] = {
+    # Иерархия и справочные строки — категории
+    "program": "category",
+    "module": "category",
+    "lesson": "category",
+    "gz": "category",
+    "card_type": "category",
+    "status": "category",
+    # Идентификаторы и порядковые номера — int32
+    "card_id": "int32",
+    "gz_id": "int32",
+    "module_order": "int32",
+    "lesson_order": "int32",
+    # Доли и рейтинги — float32
+    "attempted_share": "float32",
+    "success_rate": "float32",
+    "first_try_success_rate": "float32",
+    "complaint_rate": "float32",
+    "discrimination_avg": "float32",
+    "success_attempts_rate": "float32",
+    "risk": "float32",
+}
+
+_INT32_MIN = np.iinfo(np.int32).min
+_INT32_MAX = np.iinfo(np.int32).max
+
+
+def coerce_chunk(chunk: pd.DataFrame, dtypes: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """
+    Приводит порцию данных к компактным типам.
+
+    Целочисленные колонки приводятся к int32 только если в порции нет пропусков,
+    все значения целые и помещаются в диапазон; иначе колонка остается как
+    есть, чтобы не потерять данные.
+
+    Args:
+        chunk: Порция данных
+        dtypes: Словарь {колонка: тип}; по умолчанию COMPACT_DTYPES
+
+    Returns:
+        DataFrame с приведенными типами
+    """
+    dtypes = COMPACT_DTYPES if dtypes is None else dtypes
+    for col, dtype in dtypes.items():
+        if col not in chunk.columns:
+            continue
+        series = chunk[col]
+        if dtype == "category":
+            chunk[col] = series.astype("category")
+        elif dtype == "int32":
+            if is_numeric_dtype(series) and not series.isna().any() and len(series):
+                values = series.to_numpy()
+                in_range = values.min() >= _INT32_MIN and values.max() <= _INT32_MAX
+                if in_range and np.array_equal(values, np.floor(values)):
+                    chunk[col] = series.astype(np.int32)
+        elif dtype == "float32":
+            chunk[col] = pd.to_numeric(series, errors="coerce").astype(np.float32)
+        else:
+            chunk[col] = series.astype(dtype)
+    return chunk
+
+
+def concat_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Склеивает DataFrame'ы, сохраняя категориальные колонки категориальными.
+
+    pd.concat превращает категории в object, если наборы категорий различаются,
+    поэтому перед склейкой категории всех частей приводятся к объединению.
+    Колонки, которые в одних частях int32, а в других нет, приводятся к общему
+    типу самим pd.concat.
+
+    Args:
+        frames: Список DataFrame'ов с одинаковыми колонками
+
+    Returns:
+        DataFrame
+    """
+    frames = [frame for frame in frames if frame is not None]
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) == 1:
+        return frames[0]
+
+    # Неглубокие копии: категории меняются в новых фреймах, а не в переданных
+    frames = [frame.copy(deep=False) for frame in frames]
+    for col in frames[0].columns:
+        if not all(isinstance(frame[col].dtype, CategoricalDtype) for frame in frames if col in frame):
+            continue
+        categories = pd.Index([])
+        for frame in frames:
+            categories = categories.union(frame[col].cat.categories)
+        for frame in frames:
+            frame[col] = frame[col].cat.set_categories(categories)
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def read_result_chunked(result, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                        dtypes: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """
+    Читает уже выполненный результат порциями и собирает компактный DataFrame.
+
+    Args:
+        result: SQLAlchemy Result (выполненный с stream_results=True)
+        chunk_size: Размер порции
+        dtypes: Словарь {колонка: тип}; по умолчанию COMPACT_DTYPES
+
+    Returns:
+        DataFrame с результатом запроса
+    """
+    chunks = []
+    columns = list(result.keys())
+    for rows in result.partitions(chunk_size):
+        chunks.append(records_to_frame(rows, columns, dtypes))
+
+    if not chunks:
+        return pd.DataFrame(columns=columns)
+    return concat_frames(chunks)
+
+
+def records_to_frame(rows, columns: List[str], dtypes: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """
+    Строит порцию DataFrame из строк результата и приводит ее к компактным типам.
+
+    Args:
+        rows: Последовательность строк (кортежей)
+        columns: Имена колонок
+        dtypes: Словарь {колонка: тип}; по умолчанию COMPACT_DTYPES
+
+    Returns:
+        DataFrame
+    """
+    # coerce_float=True, как в pd.read_sql: Decimal из NUMERIC превращается в float
+    chunk = pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+    return coerce_chunk(chunk, dtypes)
+
+
+def read_sql_chunked(sql, engine, params=None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                     dtypes: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """
+    Выполняет запрос через серверный курсор и собирает результат в компактный DataFrame.
+
+    Args:
+        sql: SQLAlchemy text() запрос
+        engine: SQLAlchemy engine для подключения к БД
+        params: Параметры запроса
+        chunk_size: Размер порции
+        dtypes: Словарь {колонка: тип}; по умолчанию COMPACT_DTYPES
+
+    Returns:
+        DataFrame с результатом запроса
+    """
+    with engine.connect() as conn:
+        # stream_results=True для psycopg2 означает именованный серверный курсор
+        result = conn.execution_options(
+            stream_results=True, max_row_buffer=chunk_size
+        ).execute(sql, params or {})
+        return read_result_chunked(result, chunk_size, dtypes)
@@ -0,0 +1,334 @@
+# index_advisor.py
+"""
+Советник по индексам для объектов optimize_db.
+
+optimize_db объявляет для каждого объекта набор индексов, и многие из них
+избыточны: одноколоночный индекс рядом с составным, начинающимся с той же
+колонки, или индексы, которые не использует ни один запрос дашборда. Каждый
+индекс пересобирается при пересоздании объекта и замедляет его обновление.
+
+Советник:
+- записывает запросы, которые действительно выполняют загрузчики
+  core.load_* (через событие SQLAlchemy before_cursor_execute);
+- выполняет для них EXPLAIN (ANALYZE, BUFFERS) и собирает использованные
+  индексы и последовательные сканирования;
+- читает счетчики pg_stat_user_indexes;
+- оставляет уникальные индексы (нужны для REFRESH CONCURRENTLY),
+  использованные индексы и убирает индексы-префиксы других оставленных.
+
+Результат — план индексов {объект: [(имя, колонки), ...]}, который
+записывается в INDEX_PLAN_PATH; optimize_db создает только индексы из плана
+и удаляет лишние объявленные индексы.
+
+Запуск: python index_advisor.py [--write]
+"""
+
+import sys
+import json
+import time
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+
+import pandas as pd
+from sqlalchemy import event, text
+
+import optimize_db
+from optimize_db import INDEX_PLAN_PATH, RELATIONS
+
+
+class RecordedQuery:
+    """
+    Запрос, выполненный во время записи.
+
+    Attributes:
+        statement: Текст запроса в формате драйвера
+        parameters: Параметры запроса
+        calls: Сколько раз выполнялся
+        total_ms: Суммарное время выполнения
+    """
+
+    def __init__(self, statement: str, parameters: Any):
+        self.statement = statement
+        self.parameters = parameters
+        self.calls = 0
+        self.total_ms = 0.0
+
+
+class QueryRecorder:
+    """
+    Записывает SELECT-запросы, выполняемые через engine, пока активен контекст.
+
+    Пример:
+        with QueryRecorder(engine) as recorder:
+            core.load_program_data(_engine=engine)
+        recorder.queries
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self._queries: Dict[str, RecordedQuery] = {}
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("index_advisor_started", []).append(time.perf_counter())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["index_advisor_started"].pop()
+        if not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            return
+        # Один и тот же запрос с разными фильтрами — разные записи: планы могут отличаться
+        key = f"{statement}\n{parameters!r}"
+        query = self._queries.get(key)
+        if query is None:
+            query = self._queries[key] = RecordedQuery(statement, parameters)
+        query.calls += 1
+        query.total_ms += (time.perf_counter() - started) * 1000
+
+    def __enter__(self) -> "QueryRecorder":
+        event.listen(self.engine, "before_cursor_execute", self._before)
+        event.listen(self.engine, "after_cursor_execute", self._after)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._before)
+        event.remove(self.engine, "after_cursor_execute", self._after)
+        return False
+
+    @property
+    def queries(self) -> List[RecordedQuery]:
+        return list(self._queries.values())
+
+
+# ------------------ Нагрузка дашборда ------------------ #
+
+def _sample_path(engine) -> Dict[str, Optional[str]]:
+    """Программа, модуль, урок и группа заданий одной карточки — для фильтров загрузчиков."""
+    with engine.connect() as conn:
+        row = conn.execute(text(
+            "SELECT program, module, lesson, gz FROM mv_cards_mv WHERE gz IS NOT NULL LIMIT 1"
+        )).mappings().first()
+    return dict(row) if row else {"program": None, "module": None, "lesson": None, "gz": None}
+
+
+def record_workload(engine=None) -> List[RecordedQuery]:
+    """
+    Выполняет загрузчики core.load_* для всех уровней навигации и записывает их запросы.
+
+    Кэш каждого загрузчика очищается перед вызовом, чтобы запрос действительно
+    ушел в БД.
+
+    Args:
+        engine: SQLAlchemy engine (по умолчанию общий engine приложения)
+
+    Returns:
+        list: Записанные запросы
+    """
+    import core  # Импорт здесь: core импортирует streamlit
+
+    engine = engine or core.get_engine()
+    path = _sample_path(engine)
+    program, module, lesson, gz = path["program"], path["module"], path["lesson"], path["gz"]
+    calls = [
+        (core.load_program_data, ()),
+        (core.load_module_data, (None,)),
+        (core.load_module_data, (program,)),
+        (core.load_lesson_data, (program, module)),
+        (core.load_gz_data, (program, module, lesson)),
+        (core.load_card_data, (program, module, lesson, gz)),
+        (core.load_card_data, (program, module, lesson)),
+        (core.load_top_cards_by_risk, (gz,)),
+        (core.load_top_cards_by_risk, (None,)),
+    ]
+    with QueryRecorder(engine) as recorder:
+        for loader, args in calls:
+            loader.clear()
+            loader(*args, _engine=engine)
+    return recorder.queries
+
+
+# ------------------ Планы запросов ------------------ #
+
+def explain(conn, query: RecordedQuery) -> Dict[str, Any]:
+    """EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) записанного запроса; возвращает корневой узел плана."""
+    result = conn.exec_driver_sql(
+        f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {query.statement}", query.parameters
+    ).scalar()
+    if isinstance(result, str):
+        result = json.loads(result)
+    return result[0]
+
+
+def plan_nodes(node: Dict[str, Any]) -> Iterable[Dict[str, Any]]:
+    """Все узлы плана (обход в глубину)."""
+    yield node
+    for child in node.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def used_indexes(plan: Dict[str, Any]) -> Set[str]:
+    """Индексы, которые использует план."""
+    return {node["Index Name"] for node in plan_nodes(plan["Plan"]) if "Index Name" in node}
+
+
+def seq_scans(plan: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Последовательные сканирования плана с фильтром и прочитанными блоками."""
+    return [
+        {
+            "relation": node.get("Relation Name"),
+            "filter": node.get("Filter"),
+            "rows": node.get("Actual Rows"),
+            "shared_blocks": node.get("Shared Hit Blocks", 0) + node.get("Shared Read Blocks", 0),
+        }
+        for node in plan_nodes(plan["Plan"])
+        if node.get("Node Type") == "Seq Scan"
+    ]
+
+
+def index_stats(conn, relations: Sequence[str]) -> pd.DataFrame:
+    """
+    Счетчики использования индексов объектов из pg_stat_user_indexes.
+
+    Returns:
+        DataFrame: relation, index, idx_scan, idx_tup_read, size_bytes
+    """
+    return pd.read_sql(text("""
+        SELECT relname AS relation, indexrelname AS index, idx_scan, idx_tup_read,
+               pg_relation_size(indexrelid) AS size_bytes
+        FROM pg_stat_user_indexes
+        WHERE relname = ANY(:relations)
+        ORDER BY relname, indexrelname
+    """), conn, params={"relations": list(relations)})
+
+
+# ------------------ План индексов ------------------ #
+
+def _columns(columns: str) -> List[str]:
+    return [column.strip() for column in columns.split(",")]
+
+
+def _is_prefix(short: List[str], long: List[str]) -> bool:
+    return len(short) <= len(long) and long[:len(short)] == short
+
+
+class IndexAdvice:
+    """
+    Результат работы советника.
+
+    Attributes:
+        plan: {объект: [(имя индекса, колонки), ...]} — индексы, которые нужно оставить
+        report: DataFrame с решением и причиной для каждого объявленного индекса
+        queries: Записанные запросы с использованными индексами и seq scan'ами
+    """
+
+    def __init__(self, plan: Dict[str, List], report: pd.DataFrame, queries: List[Dict[str, Any]]):
+        self.plan = plan
+        self.report = report
+        self.queries = queries
+
+
+def build_plan(used: Set[str], scans: Dict[str, int]) -> IndexAdvice:
+    """
+    Составляет минимальный план индексов по использованию.
+
+    Индекс остается, если он использован в плане запроса или по pg_stat
+    (idx_scan > 0) и его колонки не являются префиксом другого оставленного
+    индекса (или уникального индекса) того же объекта.
+
+    Args:
+        used: Индексы из планов записанных запросов
+        scans: {индекс: idx_scan} из pg_stat_user_indexes
+
+    Returns:
+        IndexAdvice (без queries)
+    """
+    plan, rows = {}, []
+    for relation in RELATIONS:
+        declared = relation.declared_indexes
+        candidates = [(name, columns) for name, columns in declared if name in used or scans.get(name, 0) > 0]
+        for name, columns in declared:
+            if (name, columns) not in candidates:
+                rows.append((relation.name, name, columns, "drop", "не используется"))
+
+        kept = []
+        covering = [(relation.unique[0], _columns(relation.unique[1]))] if relation.unique else []
+        # Сначала длинные индексы: короткий индекс-префикс заменяется длинным
+        for name, columns in sorted(candidates, key=lambda item: -len(_columns(item[1]))):
+            prefix_of = next((other for other, other_columns in covering
+                              if _is_prefix(_columns(columns), other_columns)), None)
+            if prefix_of:
+                rows.append((relation.name, name, columns, "drop", f"префикс {prefix_of}"))
+                continue
+            kept.append((name, columns))
+            covering.append((name, _columns(columns)))
+            rows.append((relation.name, name, columns, "keep",
+                         "план запроса" if name in used else f"idx_scan={scans.get(name, 0)}"))
+        # Порядок как в объявлении — стабильный план и отпечаток
+        plan[relation.name] = [index for index in declared if index in kept]
+
+    report = pd.DataFrame(rows, columns=["relation", "index", "columns", "decision", "reason"])
+    return IndexAdvice(plan, report, [])
+
+
+def advise(engine=None) -> IndexAdvice:
+    """
+    Записывает нагрузку дашборда, анализирует планы и составляет план индексов.
+
+    Объекты должны быть созданы со всеми объявленными индексами (например,
+    optimize_db без файла плана), иначе удаленные индексы не попадут в планы.
+
+    Args:
+        engine: SQLAlchemy engine (по умолчанию общий engine приложения)
+
+    Returns:
+        IndexAdvice
+    """
+    engine = engine or optimize_db.get_engine()
+    queries = record_workload(engine)
+
+    used, analyzed = set(), []
+    with engine.connect() as conn:
+        for query in queries:
+            try:
+                plan = explain(conn, query)
+            except Exception as e:
+                conn.rollback()
+                logging.warning(f"EXPLAIN не выполнен: {e}")
+                continue
+            indexes = used_indexes(plan)
+            used |= indexes
+            analyzed.append({
+                "statement": " ".join(query.statement.split()),
+                "parameters": query.parameters,
+                "calls": query.calls,
+                "execution_ms": plan.get("Execution Time"),
+                "indexes": sorted(indexes),
+                "seq_scans": seq_scans(plan),
+            })
+        stats = index_stats(conn, [relation.name for relation in RELATIONS])
+        conn.rollback()
+
+    advice = build_plan(used, dict(zip(stats["index"], stats["idx_scan"])))
+    advice.queries = analyzed
+    return advice
+
+
+def write_plan(plan: Dict[str, List], path: str = INDEX_PLAN_PATH) -> None:
+    """Записывает план индексов в JSON-файл, который читает optimize_db."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({relation: [list(index) for index in indexes] for relation, indexes in plan.items()},
+                  f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    result = advise()
+    for item in result.queries:
+        print(f"{item['execution_ms']:.1f} мс  индексы: {', '.join(item['indexes']) or '-'}  "
+              f"seq scan: {', '.join(scan['relation'] for scan in item['seq_scans']) or '-'}")
+        print(f"    {item['statement'][:160]}")
+    with pd.option_context("display.max_rows", None, "display.width", 200):
+        print(result.report.to_string(index=False))
+    kept = int((result.report["decision"] == "keep").sum())
+    print(f"Оставить {kept} из {len(result.report)} объявленных индексов")
+    if "--write" in sys.argv:
+        write_plan(result.plan)
+        print(f"План записан в {INDEX_PLAN_PATH}")
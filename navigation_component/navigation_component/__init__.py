@@ -5,10 +5,8 @@ import streamlit as st
 # Определяем текущий каталог
 current_dir = os.path.dirname(os.path.abspath(__file__))
 
-# Путь к директории сборки фронтенда (TypeScript-компонент)
-build_path = os.path.abspath(os.path.join(
-    current_dir, "..", "..", "component-template", "streamlit-navbar", "streamlit_navbar", "frontend", "build"
-))
+# Путь к директории сборки фронтенда (navigation_component/frontend, outputDir в vue.config.js)
+build_path = os.path.join(current_dir, "frontend", "build")
 
 # Определяем режим работы
 _RELEASE = os.path.exists(build_path)  # Проверяем существует ли директория сборки
@@ -27,33 +25,64 @@ else:
         url="http://localhost:3001",
     )
 
-def navigation_menu(navigation_data, current_page="overview", current_params=None, key=None):
+# Ключ компонента по умолчанию в ленивом режиме (через него читается запрос узла)
+LAZY_KEY = "navigation_menu"
+
+def navigation_menu(navigation_data=None, current_page="overview", current_params=None, key=None, tree=None,
+                    navigation_version=None):
     """
     Отображает навигационное меню
     
+    В ленивом режиме (tree) компоненту передается только корень дерева и путь
+    до текущей страницы. При раскрытии узла компонент запрашивает его
+    дочерние элементы (action "expand"); ответ на последний запрос
+    передается при следующем перезапуске, а компонент кэширует полученные
+    узлы по версии дерева.
+    
     Args:
-        navigation_data: Структура данных для навигации 
+        navigation_data: Структура данных для навигации (полное дерево)
         current_page: Текущая активная страница
         current_params: Словарь с текущими параметрами URL
         key: Уникальный ключ компонента
+        tree: Дерево с методами root(params) и children(node, offset, limit) и
+            атрибутом version (navigation_tree.NavigationTree) — ленивый режим
+        navigation_version: Версия navigation_data (NavigationArtifact.version);
+            компонент не перерисовывает меню, если версия не изменилась
         
     Returns:
-        Результат взаимодействия с компонентом
+        Результат взаимодействия с компонентом; None, если переход из него
+        уже выполнен в одном из прошлых перезапусков
     """
     if current_params is None:
         current_params = {}
     
+    tree_args = {}
+    if tree is not None:
+        key = key or LAZY_KEY
+        tree_args = {
+            "navigationTree": tree.root(current_params),
+            "treeResponse": _tree_response(tree, st.session_state.get(key)),
+        }
+    
     # Вызываем компонент
     component_value = _component_func(
         navigationData=navigation_data,
+        navigationVersion=navigation_version,
         currentPage=current_page,
         currentParams=current_params,
         key=key,
-        default=None
+        default=None,
+        **tree_args
     )
     
     # Обрабатываем результат
     if component_value and component_value.get("action") == "navigate":
+        # Значение компонента повторяется при каждом перезапуске: переход выполняется один раз
+        handled_key = f"{key or LAZY_KEY}_navigated"
+        request_id = component_value.get("request_id")
+        if request_id is not None and st.session_state.get(handled_key) == request_id:
+            return None
+        st.session_state[handled_key] = request_id
         url = component_value.get("url", "")
         if url and hasattr(st, "query_params"):
             # Получаем параметры из URL
@@ -63,6 +92,21 @@ def navigation_menu(navigation_data, current_page="overview", current_params=Non
     
     return component_value
 
+def _tree_response(tree, request):
+    """Ответ на запрос дочерних элементов узла от компонента или None."""
+    if not isinstance(request, dict) or request.get("action") != "expand" or request.get("version") != tree.version:
+        return None
+    node = request.get("node", "")
+    if not isinstance(node, str):
+        return None
+    try:
+        page = tree.children(node, request.get("offset", 0), request.get("limit", 50))
+    except (KeyError, TypeError, ValueError):
+        # Некорректный запрос компонента не должен прерывать перезапуск приложения
+        return None
+    page["request_id"] = request.get("request_id")
+    return page
+
 def parse_query_params(url):
     """Извлекает параметры из URL строки"""
     import urllib.parse as ul
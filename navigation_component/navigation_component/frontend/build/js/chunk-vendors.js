@@ -5,19 +5,19 @@
 * @license MIT
 **/
 /*! #__NO_SIDE_EFFECTS__ */
-function r(t){const e=Object.create(null);for(const n of t.split(","))e[n]=1;return t=>t in e}n.d(e,{$3:function(){return d},$H:function(){return D},BH:function(){return W},BX:function(){return nt},Bm:function(){return x},C4:function(){return q},CE:function(){return v},CP:function(){return u},DY:function(){return L},Gv:function(){return w},J$:function(){return Q},Kg:function(){return _},MZ:function(){return o},Mp:function(){return l},NO:function(){return c},Oj:function(){return i},PT:function(){return $},Qd:function(){return E},Ro:function(){return B},SU:function(){return j},TF:function(){return f},Tg:function(){return I},Tn:function(){return b},Tr:function(){return G},We:function(){return Z},X$:function(){return a},Y2:function(){return tt},ZH:function(){return F},Zf:function(){return O},bB:function(){return U},cy:function(){return h},gd:function(){return m},pD:function(){return r},rU:function(){return R},tE:function(){return s},u3:function(){return rt},vM:function(){return g},v_:function(){return it},yI:function(){return k},yL:function(){return S},yQ:function(){return N}});const o={},i=[],s=()=>{},c=()=>!1,l=t=>111===t.charCodeAt(0)&&110===t.charCodeAt(1)&&(t.charCodeAt(2)>122||t.charCodeAt(2)<97),u=t=>t.startsWith("onUpdate:"),a=Object.assign,f=(t,e)=>{const n=t.indexOf(e);n>-1&&t.splice(n,1)},p=Object.prototype.hasOwnProperty,d=(t,e)=>p.call(t,e),h=Array.isArray,v=t=>"[object Map]"===C(t),g=t=>"[object Set]"===C(t),y=t=>"[object Date]"===C(t),m=t=>"[object RegExp]"===C(t),b=t=>"function"===typeof t,_=t=>"string"===typeof t,x=t=>"symbol"===typeof t,w=t=>null!==t&&"object"===typeof t,S=t=>(w(t)||b(t))&&b(t.then)&&b(t.catch),T=Object.prototype.toString,C=t=>T.call(t),O=t=>C(t).slice(8,-1),E=t=>"[object Object]"===C(t),k=t=>_(t)&&"NaN"!==t&&"-"!==t[0]&&""+parseInt(t,10)===t,j=r(",key,ref,ref_for,ref_key,onVnodeBeforeMount,onVnodeMounted,onVnodeBeforeUpdate,onVnodeUpdated,onVnodeBeforeUnmount,onVnodeUnmounted"),P=t=>{const e=Object.create(null);return n=>{const r=e[n];return r||(e[n]=t(n))}},M=/-(\w)/g,$=P((t=>t.replace(M,((t,e)=>e?e.toUpperCase():"")))),A=/\B([A-Z])/g,I=P((t=>t.replace(A,"-$1").toLowerCase())),F=P((t=>t.charAt(0).toUpperCase()+t.slice(1))),R=P((t=>{const e=t?`on${F(t)}`:"";return e})),D=(t,e)=>!Object.is(t,e),L=(t,...e)=>{for(let n=0;n<t.length;n++)t[n](...e)},N=(t,e,n,r=!1)=>{Object.defineProperty(t,e,{configurable:!0,enumerable:!1,writable:r,value:n})},U=t=>{const e=parseFloat(t);return isNaN(e)?t:e},B=t=>{const e=_(t)?Number(t):NaN;return isNaN(e)?t:e};let V;const Z=()=>V||(V="undefined"!==typeof globalThis?globalThis:"undefined"!==typeof self?self:"undefined"!==typeof window?window:"undefined"!==typeof n.g?n.g:{});const H="Infinity,undefined,NaN,isFinite,isNaN,parseFloat,parseInt,decodeURI,decodeURIComponent,encodeURI,encodeURIComponent,Math,Number,Date,Array,Object,Boolean,String,RegExp,Map,Set,JSON,Intl,BigInt,console,Error,Symbol",W=r(H);function G(t){if(h(t)){const e={};for(let n=0;n<t.length;n++){const r=t[n],o=_(r)?Y(r):G(r);if(o)for(const t in o)e[t]=o[t]}return e}if(_(t)||w(t))return t}const K=/;(?![^(]*\))/g,X=/:([^]+)/,z=/\/\*[^]*?\*\//g;function Y(t){const e={};return t.replace(z,"").split(K).forEach((t=>{if(t){const n=t.split(X);n.length>1&&(e[n[0].trim()]=n[1].trim())}})),e}function q(t){let e="";if(_(t))e=t;else if(h(t))for(let n=0;n<t.length;n++){const r=q(t[n]);r&&(e+=r+" ")}else if(w(t))for(const n in t)t[n]&&(e+=n+" ");return e.trim()}const J="itemscope,allowfullscreen,formnovalidate,ismap,nomodule,novalidate,readonly",Q=r(J);function tt(t){return!!t||""===t}function et(t,e){if(t.length!==e.length)return!1;let n=!0;for(let r=0;n&&r<t.length;r++)n=nt(t[r],e[r]);return n}function nt(t,e){if(t===e)return!0;let n=y(t),r=y(e);if(n||r)return!(!n||!r)&&t.getTime()===e.getTime();if(n=x(t),r=x(e),n||r)return t===e;if(n=h(t),r=h(e),n||r)return!(!n||!r)&&et(t,e);if(n=w(t),r=w(e),n||r){if(!n||!r)return!1;const o=Object.keys(t).length,i=Object.keys(e).length;if(o!==i)return!1;for(const n in t){const r=t.hasOwnProperty(n),o=e.hasOwnProperty(n);if(r&&!o||!r&&o||!nt(t[n],e[n]))return!1}}return String(t)===String(e)}function rt(t,e){return t.findIndex((t=>nt(t,e)))}const ot=t=>!(!t||!0!==t["__v_isRef"]),it=t=>_(t)?t:null==t?"":h(t)||w(t)&&(t.toString===T||!b(t.toString))?ot(t)?it(t.value):JSON.stringify(t,st,2):String(t),st=(t,e)=>ot(e)?st(t,e.value):v(e)?{[`Map(${e.size})`]:[...e.entries()].reduce(((t,[e,n],r)=>(t[ct(e,r)+" =>"]=n,t)),{})}:g(e)?{[`Set(${e.size})`]:[...e.values()].map((t=>ct(t)))}:x(e)?ct(e):!w(e)||h(e)||E(e)?e:String(e),ct=(t,e="")=>{var n;return x(t)?`Symbol(${null!=(n=t.description)?n:e})`:t}},34:function(t,e,n){var r=n(4901);t.exports=function(t){return"object"==typeof t?null!==t:r(t)}},81:function(t,e,n){var r=n(9565),o=n(9306),i=n(8551),s=n(6823),c=n(851),l=TypeError;t.exports=function(t,e){var n=arguments.length<2?c(t):e;if(o(n))return i(r(n,t));throw new l(s(t)+" is not iterable")}},283:function(t,e,n){var r=n(9504),o=n(9039),i=n(4901),s=n(9297),c=n(3724),l=n(350).CONFIGURABLE,u=n(3706),a=n(1181),f=a.enforce,p=a.get,d=String,h=Object.defineProperty,v=r("".slice),g=r("".replace),y=r([].join),m=c&&!o((function(){return 8!==h((function(){}),"length",{value:8}).length})),b=String(String).split("String"),_=t.exports=function(t,e,n){"Symbol("===v(d(e),0,7)&&(e="["+g(d(e),/^Symbol\(([^)]*)\).*$/,"$1")+"]"),n&&n.getter&&(e="get "+e),n&&n.setter&&(e="set "+e),(!s(t,"name")||l&&t.name!==e)&&(c?h(t,"name",{value:e,configurable:!0}):t.name=e),m&&n&&s(n,"arity")&&t.length!==n.arity&&h(t,"length",{value:n.arity});try{n&&s(n,"constructor")&&n.constructor?c&&h(t,"prototype",{writable:!1}):t.prototype&&(t.prototype=void 0)}catch(o){}var r=f(t);return s(r,"source")||(r.source=y(b,"string"==typeof e?e:"")),t};Function.prototype.toString=_((function(){return i(this)&&p(this).source||u(this)}),"toString")},350:function(t,e,n){var r=n(3724),o=n(9297),i=Function.prototype,s=r&&Object.getOwnPropertyDescriptor,c=o(i,"name"),l=c&&"something"===function(){}.name,u=c&&(!r||r&&s(i,"name").configurable);t.exports={EXISTS:c,PROPER:l,CONFIGURABLE:u}},397:function(t,e,n){var r=n(7751);t.exports=r("document","documentElement")},421:function(t){t.exports={}},616:function(t,e,n){var r=n(9039);t.exports=!r((function(){var t=function(){}.bind();return"function"!=typeof t||t.hasOwnProperty("prototype")}))},641:function(t,e,n){n.d(e,{$u:function(){return rt},CE:function(){return Ge},Df:function(){return U},FK:function(){return Fe},Gy:function(){return I},K9:function(){return le},Lk:function(){return Je},MZ:function(){return N},OW:function(){return L},Q3:function(){return on},QP:function(){return R},Wv:function(){return Ke},bF:function(){return Qe},dY:function(){return g},g2:function(){return ft},nI:function(){return vn},pI:function(){return vt},qL:function(){return s},uX:function(){return Be}});var r=n(953),o=n(33);function i(t,e,n,r){try{return r?t(...r):t()}catch(o){c(o,e,n)}}function s(t,e,n,r){if((0,o.Tn)(t)){const s=i(t,e,n,r);return s&&(0,o.yL)(s)&&s.catch((t=>{c(t,e,n)})),s}if((0,o.cy)(t)){const o=[];for(let i=0;i<t.length;i++)o.push(s(t[i],e,n,r));return o}}function c(t,e,n,s=!0){const c=e?e.vnode:null,{errorHandler:u,throwUnhandledErrorInProduction:a}=e&&e.appContext.config||o.MZ;if(e){let o=e.parent;const s=e.proxy,c=`https://vuejs.org/error-reference/#runtime-${n}`;while(o){const e=o.ec;if(e)for(let n=0;n<e.length;n++)if(!1===e[n](t,s,c))return;o=o.parent}if(u)return(0,r.C4)(),i(u,null,10,[t,s,c]),void(0,r.bl)()}l(t,n,c,s,a)}function l(t,e,n,r=!0,o=!1){if(o)throw t;console.error(t)}const u=[];let a=-1;const f=[];let p=null,d=0;const h=Promise.resolve();let v=null;function g(t){const e=v||h;return t?e.then(this?t.bind(this):t):e}function y(t){let e=a+1,n=u.length;while(e<n){const r=e+n>>>1,o=u[r],i=S(o);i<t||i===t&&2&o.flags?e=r+1:n=r}return e}function m(t){if(!(1&t.flags)){const e=S(t),n=u[u.length-1];!n||!(2&t.flags)&&e>=S(n)?u.push(t):u.splice(y(e),0,t),t.flags|=1,b()}}function b(){v||(v=h.then(T))}function _(t){(0,o.cy)(t)?f.push(...t):p&&-1===t.id?p.splice(d+1,0,t):1&t.flags||(f.push(t),t.flags|=1),b()}function x(t,e,n=a+1){for(0;n<u.length;n++){const e=u[n];if(e&&2&e.flags){if(t&&e.id!==t.uid)continue;0,u.splice(n,1),n--,4&e.flags&&(e.flags&=-2),e(),4&e.flags||(e.flags&=-2)}}}function w(t){if(f.length){const t=[...new Set(f)].sort(((t,e)=>S(t)-S(e)));if(f.length=0,p)return void p.push(...t);for(p=t,d=0;d<p.length;d++){const t=p[d];0,4&t.flags&&(t.flags&=-2),8&t.flags||t(),t.flags&=-2}p=null,d=0}}const S=t=>null==t.id?2&t.flags?-1:1/0:t.id;function T(t){o.tE;try{for(a=0;a<u.length;a++){const t=u[a];!t||8&t.flags||(4&t.flags&&(t.flags&=-2),i(t,t.i,t.i?15:14),4&t.flags||(t.flags&=-2))}}finally{for(;a<u.length;a++){const t=u[a];t&&(t.flags&=-2)}a=-1,u.length=0,w(t),v=null,(u.length||f.length)&&T(t)}}let C=null,O=null;function E(t){const e=C;return C=t,O=t&&t.type.__scopeId||null,e}function k(t,e=C,n){if(!e)return t;if(t._n)return t;const r=(...n)=>{r._d&&He(-1);const o=E(e);let i;try{i=t(...n)}finally{E(o),r._d&&He(1)}return i};return r._n=!0,r._c=!0,r._d=!0,r}function j(t,e,n,o){const i=t.dirs,c=e&&e.dirs;for(let l=0;l<i.length;l++){const u=i[l];c&&(u.oldValue=c[l].value);let a=u.dir[o];a&&((0,r.C4)(),s(a,n,8,[t.el,u,t,e]),(0,r.bl)())}}const P=Symbol("_vte"),M=t=>t.__isTeleport;const $=Symbol("_leaveCb"),A=Symbol("_enterCb");function I(){const t={isMounted:!1,isLeaving:!1,isUnmounting:!1,leavingVNodes:new Map};return et((()=>{t.isMounted=!0})),ot((()=>{t.isUnmounting=!0})),t}const F=[Function,Array],R={mode:String,appear:Boolean,persisted:Boolean,onBeforeEnter:F,onEnter:F,onAfterEnter:F,onEnterCancelled:F,onBeforeLeave:F,onLeave:F,onAfterLeave:F,onLeaveCancelled:F,onBeforeAppear:F,onAppear:F,onAfterAppear:F,onAppearCancelled:F};function D(t,e){const{leavingVNodes:n}=t;let r=n.get(e.type);return r||(r=Object.create(null),n.set(e.type,r)),r}function L(t,e,n,r,i){const{appear:c,mode:l,persisted:u=!1,onBeforeEnter:a,onEnter:f,onAfterEnter:p,onEnterCancelled:d,onBeforeLeave:h,onLeave:v,onAfterLeave:g,onLeaveCancelled:y,onBeforeAppear:m,onAppear:b,onAfterAppear:_,onAppearCancelled:x}=e,w=String(t.key),S=D(n,t),T=(t,e)=>{t&&s(t,r,9,e)},C=(t,e)=>{const n=e[1];T(t,e),(0,o.cy)(t)?t.every((t=>t.length<=1))&&n():t.length<=1&&n()},O={mode:l,persisted:u,beforeEnter(e){let r=a;if(!n.isMounted){if(!c)return;r=m||a}e[$]&&e[$](!0);const o=S[w];o&&ze(t,o)&&o.el[$]&&o.el[$](),T(r,[e])},enter(t){let e=f,r=p,o=d;if(!n.isMounted){if(!c)return;e=b||f,r=_||p,o=x||d}let i=!1;const s=t[A]=e=>{i||(i=!0,T(e?o:r,[t]),O.delayedLeave&&O.delayedLeave(),t[A]=void 0)};e?C(e,[t,s]):s()},leave(e,r){const o=String(t.key);if(e[A]&&e[A](!0),n.isUnmounting)return r();T(h,[e]);let i=!1;const s=e[$]=n=>{i||(i=!0,r(),T(n?y:g,[e]),e[$]=void 0,S[o]===t&&delete S[o])};S[o]=t,v?C(v,[e,s]):s()},clone(t){const o=L(t,e,n,r,i);return i&&i(o),o}};return O}function N(t,e){6&t.shapeFlag&&t.component?(t.transition=e,N(t.component.subTree,e)):128&t.shapeFlag?(t.ssContent.transition=e.clone(t.ssContent),t.ssFallback.transition=e.clone(t.ssFallback)):t.transition=e}function U(t,e=!1,n){let r=[],o=0;for(let i=0;i<t.length;i++){let s=t[i];const c=null==n?s.key:String(n)+String(null!=s.key?s.key:i);s.type===Fe?(128&s.patchFlag&&o++,r=r.concat(U(s.children,e,c))):(e||s.type!==De)&&r.push(null!=c?nn(s,{key:c}):s)}if(o>1)for(let i=0;i<r.length;i++)r[i].patchFlag=-2;return r}
-/*! #__NO_SIDE_EFFECTS__ */function B(t){t.ids=[t.ids[0]+t.ids[2]+++"-",0,0]}function V(t,e,n,s,c=!1){if((0,o.cy)(t))return void t.forEach(((t,r)=>V(t,e&&((0,o.cy)(e)?e[r]:e),n,s,c)));if(Z(s)&&!c)return void(512&s.shapeFlag&&s.type.__asyncResolved&&s.component.subTree.component&&V(t,e,n,s.component.subTree));const l=4&s.shapeFlag?Pn(s.component):s.el,u=c?null:l,{i:a,r:f}=t;const p=e&&e.r,d=a.refs===o.MZ?a.refs={}:a.refs,h=a.setupState,v=(0,r.ux)(h),g=h===o.MZ?()=>!1:t=>(0,o.$3)(v,t);if(null!=p&&p!==f&&((0,o.Kg)(p)?(d[p]=null,g(p)&&(h[p]=null)):(0,r.i9)(p)&&(p.value=null)),(0,o.Tn)(f))i(f,a,12,[u,d]);else{const e=(0,o.Kg)(f),i=(0,r.i9)(f);if(e||i){const r=()=>{if(t.f){const n=e?g(f)?h[f]:d[f]:f.value;c?(0,o.cy)(n)&&(0,o.TF)(n,l):(0,o.cy)(n)?n.includes(l)||n.push(l):e?(d[f]=[l],g(f)&&(h[f]=d[f])):(f.value=[l],t.k&&(d[t.k]=f.value))}else e?(d[f]=u,g(f)&&(h[f]=u)):i&&(f.value=u,t.k&&(d[t.k]=u))};u?(r.id=-1,ce(r,n)):r()}else 0}}(0,o.We)().requestIdleCallback,(0,o.We)().cancelIdleCallback;const Z=t=>!!t.type.__asyncLoader
-/*! #__NO_SIDE_EFFECTS__ */;const H=t=>t.type.__isKeepAlive;RegExp,RegExp;function W(t,e){return(0,o.cy)(t)?t.some((t=>W(t,e))):(0,o.Kg)(t)?t.split(",").includes(e):!!(0,o.gd)(t)&&(t.lastIndex=0,t.test(e))}function G(t,e){X(t,"a",e)}function K(t,e){X(t,"da",e)}function X(t,e,n=hn){const r=t.__wdc||(t.__wdc=()=>{let e=n;while(e){if(e.isDeactivated)return;e=e.parent}return t()});if(J(e,r,n),n){let t=n.parent;while(t&&t.parent)H(t.parent.vnode)&&z(r,e,n,t),t=t.parent}}function z(t,e,n,r){const i=J(e,t,r,!0);it((()=>{(0,o.TF)(r[e],i)}),n)}function Y(t){t.shapeFlag&=-257,t.shapeFlag&=-513}function q(t){return 128&t.shapeFlag?t.ssContent:t}function J(t,e,n=hn,o=!1){if(n){const i=n[t]||(n[t]=[]),c=e.__weh||(e.__weh=(...o)=>{(0,r.C4)();const i=mn(n),c=s(e,n,t,o);return i(),(0,r.bl)(),c});return o?i.unshift(c):i.push(c),c}}const Q=t=>(e,n=hn)=>{Sn&&"sp"!==t||J(t,((...t)=>e(...t)),n)},tt=Q("bm"),et=Q("m"),nt=Q("bu"),rt=Q("u"),ot=Q("bum"),it=Q("um"),st=Q("sp"),ct=Q("rtg"),lt=Q("rtc");function ut(t,e=hn){J("ec",t,e)}const at="components";function ft(t,e){return dt(at,t,!0,e)||t}const pt=Symbol.for("v-ndc");function dt(t,e,n=!0,r=!1){const i=C||hn;if(i){const n=i.type;if(t===at){const t=Mn(n,!1);if(t&&(t===e||t===(0,o.PT)(e)||t===(0,o.ZH)((0,o.PT)(e))))return n}const s=ht(i[t]||n[t],e)||ht(i.appContext[t],e);return!s&&r?n:s}}function ht(t,e){return t&&(t[e]||t[(0,o.PT)(e)]||t[(0,o.ZH)((0,o.PT)(e))])}function vt(t,e,n,i){let s;const c=n&&n[i],l=(0,o.cy)(t);if(l||(0,o.Kg)(t)){const n=l&&(0,r.g8)(t);let o=!1;n&&(o=!(0,r.fE)(t),t=(0,r.qA)(t)),s=new Array(t.length);for(let i=0,l=t.length;i<l;i++)s[i]=e(o?(0,r.lJ)(t[i]):t[i],i,void 0,c&&c[i])}else if("number"===typeof t){0,s=new Array(t);for(let n=0;n<t;n++)s[n]=e(n+1,n,void 0,c&&c[n])}else if((0,o.Gv)(t))if(t[Symbol.iterator])s=Array.from(t,((t,n)=>e(t,n,void 0,c&&c[n])));else{const n=Object.keys(t);s=new Array(n.length);for(let r=0,o=n.length;r<o;r++){const o=n[r];s[r]=e(t[o],o,r,c&&c[r])}}else s=[];return n&&(n[i]=s),s}const gt=t=>t?_n(t)?Pn(t):gt(t.parent):null,yt=(0,o.X$)(Object.create(null),{$:t=>t,$el:t=>t.vnode.el,$data:t=>t.data,$props:t=>t.props,$attrs:t=>t.attrs,$slots:t=>t.slots,$refs:t=>t.refs,$parent:t=>gt(t.parent),$root:t=>gt(t.root),$host:t=>t.ce,$emit:t=>t.emit,$options:t=>Ot(t),$forceUpdate:t=>t.f||(t.f=()=>{m(t.update)}),$nextTick:t=>t.n||(t.n=g.bind(t.proxy)),$watch:t=>xe.bind(t)}),mt=(t,e)=>t!==o.MZ&&!t.__isScriptSetup&&(0,o.$3)(t,e),bt={get({_:t},e){if("__v_skip"===e)return!0;const{ctx:n,setupState:i,data:s,props:c,accessCache:l,type:u,appContext:a}=t;let f;if("$"!==e[0]){const r=l[e];if(void 0!==r)switch(r){case 1:return i[e];case 2:return s[e];case 4:return n[e];case 3:return c[e]}else{if(mt(i,e))return l[e]=1,i[e];if(s!==o.MZ&&(0,o.$3)(s,e))return l[e]=2,s[e];if((f=t.propsOptions[0])&&(0,o.$3)(f,e))return l[e]=3,c[e];if(n!==o.MZ&&(0,o.$3)(n,e))return l[e]=4,n[e];xt&&(l[e]=0)}}const p=yt[e];let d,h;return p?("$attrs"===e&&(0,r.u4)(t.attrs,"get",""),p(t)):(d=u.__cssModules)&&(d=d[e])?d:n!==o.MZ&&(0,o.$3)(n,e)?(l[e]=4,n[e]):(h=a.config.globalProperties,(0,o.$3)(h,e)?h[e]:void 0)},set({_:t},e,n){const{data:r,setupState:i,ctx:s}=t;return mt(i,e)?(i[e]=n,!0):r!==o.MZ&&(0,o.$3)(r,e)?(r[e]=n,!0):!(0,o.$3)(t.props,e)&&(("$"!==e[0]||!(e.slice(1)in t))&&(s[e]=n,!0))},has({_:{data:t,setupState:e,accessCache:n,ctx:r,appContext:i,propsOptions:s}},c){let l;return!!n[c]||t!==o.MZ&&(0,o.$3)(t,c)||mt(e,c)||(l=s[0])&&(0,o.$3)(l,c)||(0,o.$3)(r,c)||(0,o.$3)(yt,c)||(0,o.$3)(i.config.globalProperties,c)},defineProperty(t,e,n){return null!=n.get?t._.accessCache[e]=0:(0,o.$3)(n,"value")&&this.set(t,e,n.value,null),Reflect.defineProperty(t,e,n)}};function _t(t){return(0,o.cy)(t)?t.reduce(((t,e)=>(t[e]=null,t)),{}):t}let xt=!0;function wt(t){const e=Ot(t),n=t.proxy,i=t.ctx;xt=!1,e.beforeCreate&&Tt(e.beforeCreate,t,"bc");const{data:s,computed:c,methods:l,watch:u,provide:a,inject:f,created:p,beforeMount:d,mounted:h,beforeUpdate:v,updated:g,activated:y,deactivated:m,beforeDestroy:b,beforeUnmount:_,destroyed:x,unmounted:w,render:S,renderTracked:T,renderTriggered:C,errorCaptured:O,serverPrefetch:E,expose:k,inheritAttrs:j,components:P,directives:M,filters:$}=e,A=null;if(f&&St(f,i,A),l)for(const r in l){const t=l[r];(0,o.Tn)(t)&&(i[r]=t.bind(n))}if(s){0;const e=s.call(n,n);0,(0,o.Gv)(e)&&(t.data=(0,r.Kh)(e))}if(xt=!0,c)for(const r in c){const t=c[r],e=(0,o.Tn)(t)?t.bind(n,n):(0,o.Tn)(t.get)?t.get.bind(n,n):o.tE;0;const s=!(0,o.Tn)(t)&&(0,o.Tn)(t.set)?t.set.bind(n):o.tE,l=An({get:e,set:s});Object.defineProperty(i,r,{enumerable:!0,configurable:!0,get:()=>l.value,set:t=>l.value=t})}if(u)for(const r in u)Ct(u[r],i,n,r);if(a){const t=(0,o.Tn)(a)?a.call(n):a;Reflect.ownKeys(t).forEach((e=>{Ut(e,t[e])}))}function I(t,e){(0,o.cy)(e)?e.forEach((e=>t(e.bind(n)))):e&&t(e.bind(n))}if(p&&Tt(p,t,"c"),I(tt,d),I(et,h),I(nt,v),I(rt,g),I(G,y),I(K,m),I(ut,O),I(lt,T),I(ct,C),I(ot,_),I(it,w),I(st,E),(0,o.cy)(k))if(k.length){const e=t.exposed||(t.exposed={});k.forEach((t=>{Object.defineProperty(e,t,{get:()=>n[t],set:e=>n[t]=e})}))}else t.exposed||(t.exposed={});S&&t.render===o.tE&&(t.render=S),null!=j&&(t.inheritAttrs=j),P&&(t.components=P),M&&(t.directives=M),E&&B(t)}function St(t,e,n=o.tE){(0,o.cy)(t)&&(t=Mt(t));for(const i in t){const n=t[i];let s;s=(0,o.Gv)(n)?"default"in n?Bt(n.from||i,n.default,!0):Bt(n.from||i):Bt(n),(0,r.i9)(s)?Object.defineProperty(e,i,{enumerable:!0,configurable:!0,get:()=>s.value,set:t=>s.value=t}):e[i]=s}}function Tt(t,e,n){s((0,o.cy)(t)?t.map((t=>t.bind(e.proxy))):t.bind(e.proxy),e,n)}function Ct(t,e,n,r){let i=r.includes(".")?we(n,r):()=>n[r];if((0,o.Kg)(t)){const n=e[t];(0,o.Tn)(n)&&be(i,n)}else if((0,o.Tn)(t))be(i,t.bind(n));else if((0,o.Gv)(t))if((0,o.cy)(t))t.forEach((t=>Ct(t,e,n,r)));else{const r=(0,o.Tn)(t.handler)?t.handler.bind(n):e[t.handler];(0,o.Tn)(r)&&be(i,r,t)}else 0}function Ot(t){const e=t.type,{mixins:n,extends:r}=e,{mixins:i,optionsCache:s,config:{optionMergeStrategies:c}}=t.appContext,l=s.get(e);let u;return l?u=l:i.length||n||r?(u={},i.length&&i.forEach((t=>Et(u,t,c,!0))),Et(u,e,c)):u=e,(0,o.Gv)(e)&&s.set(e,u),u}function Et(t,e,n,r=!1){const{mixins:o,extends:i}=e;i&&Et(t,i,n,!0),o&&o.forEach((e=>Et(t,e,n,!0)));for(const s in e)if(r&&"expose"===s);else{const r=kt[s]||n&&n[s];t[s]=r?r(t[s],e[s]):e[s]}return t}const kt={data:jt,props:It,emits:It,methods:At,computed:At,beforeCreate:$t,created:$t,beforeMount:$t,mounted:$t,beforeUpdate:$t,updated:$t,beforeDestroy:$t,beforeUnmount:$t,destroyed:$t,unmounted:$t,activated:$t,deactivated:$t,errorCaptured:$t,serverPrefetch:$t,components:At,directives:At,watch:Ft,provide:jt,inject:Pt};function jt(t,e){return e?t?function(){return(0,o.X$)((0,o.Tn)(t)?t.call(this,this):t,(0,o.Tn)(e)?e.call(this,this):e)}:e:t}function Pt(t,e){return At(Mt(t),Mt(e))}function Mt(t){if((0,o.cy)(t)){const e={};for(let n=0;n<t.length;n++)e[t[n]]=t[n];return e}return t}function $t(t,e){return t?[...new Set([].concat(t,e))]:e}function At(t,e){return t?(0,o.X$)(Object.create(null),t,e):e}function It(t,e){return t?(0,o.cy)(t)&&(0,o.cy)(e)?[...new Set([...t,...e])]:(0,o.X$)(Object.create(null),_t(t),_t(null!=e?e:{})):e}function Ft(t,e){if(!t)return e;if(!e)return t;const n=(0,o.X$)(Object.create(null),t);for(const r in e)n[r]=$t(t[r],e[r]);return n}function Rt(){return{app:null,config:{isNativeTag:o.NO,performance:!1,globalProperties:{},optionMergeStrategies:{},errorHandler:void 0,warnHandler:void 0,compilerOptions:{}},mixins:[],components:{},directives:{},provides:Object.create(null),optionsCache:new WeakMap,propsCache:new WeakMap,emitsCache:new WeakMap}}let Dt=0;function Lt(t,e){return function(n,r=null){(0,o.Tn)(n)||(n=(0,o.X$)({},n)),null==r||(0,o.Gv)(r)||(r=null);const i=Rt(),c=new WeakSet,l=[];let u=!1;const a=i.app={_uid:Dt++,_component:n,_props:r,_container:null,_context:i,_instance:null,version:In,get config(){return i.config},set config(t){0},use(t,...e){return c.has(t)||(t&&(0,o.Tn)(t.install)?(c.add(t),t.install(a,...e)):(0,o.Tn)(t)&&(c.add(t),t(a,...e))),a},mixin(t){return i.mixins.includes(t)||i.mixins.push(t),a},component(t,e){return e?(i.components[t]=e,a):i.components[t]},directive(t,e){return e?(i.directives[t]=e,a):i.directives[t]},mount(o,s,c){if(!u){0;const l=a._ceVNode||Qe(n,r);return l.appContext=i,!0===c?c="svg":!1===c&&(c=void 0),s&&e?e(l,o):t(l,o,c),u=!0,a._container=o,o.__vue_app__=a,Pn(l.component)}},onUnmount(t){l.push(t)},unmount(){u&&(s(l,a._instance,16),t(null,a._container),delete a._container.__vue_app__)},provide(t,e){return i.provides[t]=e,a},runWithContext(t){const e=Nt;Nt=a;try{return t()}finally{Nt=e}}};return a}}let Nt=null;function Ut(t,e){if(hn){let n=hn.provides;const r=hn.parent&&hn.parent.provides;r===n&&(n=hn.provides=Object.create(r)),n[t]=e}else 0}function Bt(t,e,n=!1){const r=hn||C;if(r||Nt){const i=Nt?Nt._context.provides:r?null==r.parent?r.vnode.appContext&&r.vnode.appContext.provides:r.parent.provides:void 0;if(i&&t in i)return i[t];if(arguments.length>1)return n&&(0,o.Tn)(e)?e.call(r&&r.proxy):e}else 0}const Vt={},Zt=()=>Object.create(Vt),Ht=t=>Object.getPrototypeOf(t)===Vt;function Wt(t,e,n,o=!1){const i={},s=Zt();t.propsDefaults=Object.create(null),Kt(t,e,i,s);for(const r in t.propsOptions[0])r in i||(i[r]=void 0);n?t.props=o?i:(0,r.Gc)(i):t.type.props?t.props=i:t.props=s,t.attrs=s}function Gt(t,e,n,i){const{props:s,attrs:c,vnode:{patchFlag:l}}=t,u=(0,r.ux)(s),[a]=t.propsOptions;let f=!1;if(!(i||l>0)||16&l){let r;Kt(t,e,s,c)&&(f=!0);for(const i in u)e&&((0,o.$3)(e,i)||(r=(0,o.Tg)(i))!==i&&(0,o.$3)(e,r))||(a?!n||void 0===n[i]&&void 0===n[r]||(s[i]=Xt(a,u,i,void 0,t,!0)):delete s[i]);if(c!==u)for(const t in c)e&&(0,o.$3)(e,t)||(delete c[t],f=!0)}else if(8&l){const n=t.vnode.dynamicProps;for(let r=0;r<n.length;r++){let i=n[r];if(Oe(t.emitsOptions,i))continue;const l=e[i];if(a)if((0,o.$3)(c,i))l!==c[i]&&(c[i]=l,f=!0);else{const e=(0,o.PT)(i);s[e]=Xt(a,u,e,l,t,!1)}else l!==c[i]&&(c[i]=l,f=!0)}}f&&(0,r.hZ)(t.attrs,"set","")}function Kt(t,e,n,i){const[s,c]=t.propsOptions;let l,u=!1;if(e)for(let r in e){if((0,o.SU)(r))continue;const a=e[r];let f;s&&(0,o.$3)(s,f=(0,o.PT)(r))?c&&c.includes(f)?(l||(l={}))[f]=a:n[f]=a:Oe(t.emitsOptions,r)||r in i&&a===i[r]||(i[r]=a,u=!0)}if(c){const e=(0,r.ux)(n),i=l||o.MZ;for(let r=0;r<c.length;r++){const l=c[r];n[l]=Xt(s,e,l,i[l],t,!(0,o.$3)(i,l))}}return u}function Xt(t,e,n,r,i,s){const c=t[n];if(null!=c){const t=(0,o.$3)(c,"default");if(t&&void 0===r){const t=c.default;if(c.type!==Function&&!c.skipFactory&&(0,o.Tn)(t)){const{propsDefaults:o}=i;if(n in o)r=o[n];else{const s=mn(i);r=o[n]=t.call(null,e),s()}}else r=t;i.ce&&i.ce._setProp(n,r)}c[0]&&(s&&!t?r=!1:!c[1]||""!==r&&r!==(0,o.Tg)(n)||(r=!0))}return r}const zt=new WeakMap;function Yt(t,e,n=!1){const r=n?zt:e.propsCache,i=r.get(t);if(i)return i;const s=t.props,c={},l=[];let u=!1;if(!(0,o.Tn)(t)){const r=t=>{u=!0;const[n,r]=Yt(t,e,!0);(0,o.X$)(c,n),r&&l.push(...r)};!n&&e.mixins.length&&e.mixins.forEach(r),t.extends&&r(t.extends),t.mixins&&t.mixins.forEach(r)}if(!s&&!u)return(0,o.Gv)(t)&&r.set(t,o.Oj),o.Oj;if((0,o.cy)(s))for(let f=0;f<s.length;f++){0;const t=(0,o.PT)(s[f]);qt(t)&&(c[t]=o.MZ)}else if(s){0;for(const t in s){const e=(0,o.PT)(t);if(qt(e)){const n=s[t],r=c[e]=(0,o.cy)(n)||(0,o.Tn)(n)?{type:n}:(0,o.X$)({},n),i=r.type;let u=!1,a=!0;if((0,o.cy)(i))for(let t=0;t<i.length;++t){const e=i[t],n=(0,o.Tn)(e)&&e.name;if("Boolean"===n){u=!0;break}"String"===n&&(a=!1)}else u=(0,o.Tn)(i)&&"Boolean"===i.name;r[0]=u,r[1]=a,(u||(0,o.$3)(r,"default"))&&l.push(e)}}}const a=[c,l];return(0,o.Gv)(t)&&r.set(t,a),a}function qt(t){return"$"!==t[0]&&!(0,o.SU)(t)}const Jt=t=>"_"===t[0]||"$stable"===t,Qt=t=>(0,o.cy)(t)?t.map(sn):[sn(t)],te=(t,e,n)=>{if(e._n)return e;const r=k(((...t)=>Qt(e(...t))),n);return r._c=!1,r},ee=(t,e,n)=>{const r=t._ctx;for(const i in t){if(Jt(i))continue;const n=t[i];if((0,o.Tn)(n))e[i]=te(i,n,r);else if(null!=n){0;const t=Qt(n);e[i]=()=>t}}},ne=(t,e)=>{const n=Qt(e);t.slots.default=()=>n},re=(t,e,n)=>{for(const r in e)(n||"_"!==r)&&(t[r]=e[r])},oe=(t,e,n)=>{const r=t.slots=Zt();if(32&t.vnode.shapeFlag){const t=e._;t?(re(r,e,n),n&&(0,o.yQ)(r,"_",t,!0)):ee(e,r)}else e&&ne(t,e)},ie=(t,e,n)=>{const{vnode:r,slots:i}=t;let s=!0,c=o.MZ;if(32&r.shapeFlag){const t=e._;t?n&&1===t?s=!1:re(i,e,n):(s=!e.$stable,ee(e,i)),c=e}else e&&(ne(t,e),c={default:1});if(s)for(const o in i)Jt(o)||null!=c[o]||delete i[o]};function se(){"boolean"!==typeof __VUE_PROD_HYDRATION_MISMATCH_DETAILS__&&((0,o.We)().__VUE_PROD_HYDRATION_MISMATCH_DETAILS__=!1)}const ce=Ie;function le(t){return ue(t)}function ue(t,e){se();const n=(0,o.We)();n.__VUE__=!0;const{insert:i,remove:s,patchProp:c,createElement:l,createText:u,createComment:a,setText:f,setElementText:p,parentNode:d,nextSibling:h,setScopeId:v=o.tE,insertStaticContent:g}=t,y=(t,e,n,r=null,o=null,i=null,s=void 0,c=null,l=!!e.dynamicChildren)=>{if(t===e)return;t&&!ze(t,e)&&(r=Q(t),X(t,o,i,!0),t=null),-2===e.patchFlag&&(l=!1,e.dynamicChildren=null);const{type:u,ref:a,shapeFlag:f}=e;switch(u){case Re:b(t,e,n,r);break;case De:_(t,e,n,r);break;case Le:null==t&&S(e,n,r,s);break;case Fe:F(t,e,n,r,o,i,s,c,l);break;default:1&f?O(t,e,n,r,o,i,s,c,l):6&f?R(t,e,n,r,o,i,s,c,l):(64&f||128&f)&&u.process(t,e,n,r,o,i,s,c,l,nt)}null!=a&&o&&V(a,t&&t.ref,i,e||t,!e)},b=(t,e,n,r)=>{if(null==t)i(e.el=u(e.children),n,r);else{const n=e.el=t.el;e.children!==t.children&&f(n,e.children)}},_=(t,e,n,r)=>{null==t?i(e.el=a(e.children||""),n,r):e.el=t.el},S=(t,e,n,r)=>{[t.el,t.anchor]=g(t.children,e,n,r,t.el,t.anchor)},T=({el:t,anchor:e},n,r)=>{let o;while(t&&t!==e)o=h(t),i(t,n,r),t=o;i(e,n,r)},C=({el:t,anchor:e})=>{let n;while(t&&t!==e)n=h(t),s(t),t=n;s(e)},O=(t,e,n,r,o,i,s,c,l)=>{"svg"===e.type?s="svg":"math"===e.type&&(s="mathml"),null==t?E(e,n,r,o,i,s,c,l):$(t,e,o,i,s,c,l)},E=(t,e,n,r,s,u,a,f)=>{let d,h;const{props:v,shapeFlag:g,transition:y,dirs:m}=t;if(d=t.el=l(t.type,u,v&&v.is,v),8&g?p(d,t.children):16&g&&M(t.children,d,null,r,s,ae(t,u),a,f),m&&j(t,null,r,"created"),k(d,t,t.scopeId,a,r),v){for(const t in v)"value"===t||(0,o.SU)(t)||c(d,t,null,v[t],u,r);"value"in v&&c(d,"value",null,v.value,u),(h=v.onVnodeBeforeMount)&&an(h,r,t)}m&&j(t,null,r,"beforeMount");const b=pe(s,y);b&&y.beforeEnter(d),i(d,e,n),((h=v&&v.onVnodeMounted)||b||m)&&ce((()=>{h&&an(h,r,t),b&&y.enter(d),m&&j(t,null,r,"mounted")}),s)},k=(t,e,n,r,o)=>{if(n&&v(t,n),r)for(let i=0;i<r.length;i++)v(t,r[i]);if(o){let n=o.subTree;if(e===n||Ae(n.type)&&(n.ssContent===e||n.ssFallback===e)){const e=o.vnode;k(t,e,e.scopeId,e.slotScopeIds,o.parent)}}},M=(t,e,n,r,o,i,s,c,l=0)=>{for(let u=l;u<t.length;u++){const l=t[u]=c?cn(t[u]):sn(t[u]);y(null,l,e,n,r,o,i,s,c)}},$=(t,e,n,r,i,s,l)=>{const u=e.el=t.el;let{patchFlag:a,dynamicChildren:f,dirs:d}=e;a|=16&t.patchFlag;const h=t.props||o.MZ,v=e.props||o.MZ;let g;if(n&&fe(n,!1),(g=v.onVnodeBeforeUpdate)&&an(g,n,e,t),d&&j(e,t,n,"beforeUpdate"),n&&fe(n,!0),(h.innerHTML&&null==v.innerHTML||h.textContent&&null==v.textContent)&&p(u,""),f?A(t.dynamicChildren,f,u,n,r,ae(e,i),s):l||B(t,e,u,null,n,r,ae(e,i),s,!1),a>0){if(16&a)I(u,h,v,n,i);else if(2&a&&h.class!==v.class&&c(u,"class",null,v.class,i),4&a&&c(u,"style",h.style,v.style,i),8&a){const t=e.dynamicProps;for(let e=0;e<t.length;e++){const r=t[e],o=h[r],s=v[r];s===o&&"value"!==r||c(u,r,o,s,i,n)}}1&a&&t.children!==e.children&&p(u,e.children)}else l||null!=f||I(u,h,v,n,i);((g=v.onVnodeUpdated)||d)&&ce((()=>{g&&an(g,n,e,t),d&&j(e,t,n,"updated")}),r)},A=(t,e,n,r,o,i,s)=>{for(let c=0;c<e.length;c++){const l=t[c],u=e[c],a=l.el&&(l.type===Fe||!ze(l,u)||70&l.shapeFlag)?d(l.el):n;y(l,u,a,null,r,o,i,s,!0)}},I=(t,e,n,r,i)=>{if(e!==n){if(e!==o.MZ)for(const s in e)(0,o.SU)(s)||s in n||c(t,s,e[s],null,i,r);for(const s in n){if((0,o.SU)(s))continue;const l=n[s],u=e[s];l!==u&&"value"!==s&&c(t,s,u,l,i,r)}"value"in n&&c(t,"value",e.value,n.value,i)}},F=(t,e,n,r,o,s,c,l,a)=>{const f=e.el=t?t.el:u(""),p=e.anchor=t?t.anchor:u("");let{patchFlag:d,dynamicChildren:h,slotScopeIds:v}=e;v&&(l=l?l.concat(v):v),null==t?(i(f,n,r),i(p,n,r),M(e.children||[],n,p,o,s,c,l,a)):d>0&&64&d&&h&&t.dynamicChildren?(A(t.dynamicChildren,h,n,o,s,c,l),(null!=e.key||o&&e===o.subTree)&&de(t,e,!0)):B(t,e,n,p,o,s,c,l,a)},R=(t,e,n,r,o,i,s,c,l)=>{e.slotScopeIds=c,null==t?512&e.shapeFlag?o.ctx.activate(e,n,r,s,l):D(e,n,r,o,i,s,l):L(t,e,l)},D=(t,e,n,r,o,i,s)=>{const c=t.component=dn(t,r,o);if(H(t)&&(c.ctx.renderer=nt),Tn(c,!1,s),c.asyncDep){if(o&&o.registerDep(c,N,s),!t.el){const t=c.subTree=Qe(De);_(null,t,e,n)}}else N(c,t,e,n,o,i,s)},L=(t,e,n)=>{const r=e.component=t.component;if(Pe(t,e,n)){if(r.asyncDep&&!r.asyncResolved)return void U(r,e,n);r.next=e,r.update()}else e.el=t.el,r.vnode=e},N=(t,e,n,i,s,c,l)=>{const u=()=>{if(t.isMounted){let{next:e,bu:n,u:r,parent:i,vnode:a}=t;{const n=ve(t);if(n)return e&&(e.el=a.el,U(t,e,l)),void n.asyncDep.then((()=>{t.isUnmounted||u()}))}let f,p=e;0,fe(t,!1),e?(e.el=a.el,U(t,e,l)):e=a,n&&(0,o.DY)(n),(f=e.props&&e.props.onVnodeBeforeUpdate)&&an(f,i,e,a),fe(t,!0);const h=Ee(t);0;const v=t.subTree;t.subTree=h,y(v,h,d(v.el),Q(v),t,s,c),e.el=h.el,null===p&&$e(t,h.el),r&&ce(r,s),(f=e.props&&e.props.onVnodeUpdated)&&ce((()=>an(f,i,e,a)),s)}else{let r;const{el:l,props:u}=e,{bm:a,m:f,parent:p,root:d,type:h}=t,v=Z(e);if(fe(t,!1),a&&(0,o.DY)(a),!v&&(r=u&&u.onVnodeBeforeMount)&&an(r,p,e),fe(t,!0),l&&ot){const e=()=>{t.subTree=Ee(t),ot(l,t.subTree,t,s,null)};v&&h.__asyncHydrate?h.__asyncHydrate(l,t,e):e()}else{d.ce&&d.ce._injectChildStyle(h);const r=t.subTree=Ee(t);0,y(null,r,n,i,t,s,c),e.el=r.el}if(f&&ce(f,s),!v&&(r=u&&u.onVnodeMounted)){const t=e;ce((()=>an(r,p,t)),s)}(256&e.shapeFlag||p&&Z(p.vnode)&&256&p.vnode.shapeFlag)&&t.a&&ce(t.a,s),t.isMounted=!0,e=n=i=null}};t.scope.on();const a=t.effect=new r.X2(u);t.scope.off();const f=t.update=a.run.bind(a),p=t.job=a.runIfDirty.bind(a);p.i=t,p.id=t.uid,a.scheduler=()=>m(p),fe(t,!0),f()},U=(t,e,n)=>{e.component=t;const o=t.vnode.props;t.vnode=e,t.next=null,Gt(t,e.props,o,n),ie(t,e.children,n),(0,r.C4)(),x(t),(0,r.bl)()},B=(t,e,n,r,o,i,s,c,l=!1)=>{const u=t&&t.children,a=t?t.shapeFlag:0,f=e.children,{patchFlag:d,shapeFlag:h}=e;if(d>0){if(128&d)return void G(u,f,n,r,o,i,s,c,l);if(256&d)return void W(u,f,n,r,o,i,s,c,l)}8&h?(16&a&&J(u,o,i),f!==u&&p(n,f)):16&a?16&h?G(u,f,n,r,o,i,s,c,l):J(u,o,i,!0):(8&a&&p(n,""),16&h&&M(f,n,r,o,i,s,c,l))},W=(t,e,n,r,i,s,c,l,u)=>{t=t||o.Oj,e=e||o.Oj;const a=t.length,f=e.length,p=Math.min(a,f);let d;for(d=0;d<p;d++){const r=e[d]=u?cn(e[d]):sn(e[d]);y(t[d],r,n,null,i,s,c,l,u)}a>f?J(t,i,s,!0,!1,p):M(e,n,r,i,s,c,l,u,p)},G=(t,e,n,r,i,s,c,l,u)=>{let a=0;const f=e.length;let p=t.length-1,d=f-1;while(a<=p&&a<=d){const r=t[a],o=e[a]=u?cn(e[a]):sn(e[a]);if(!ze(r,o))break;y(r,o,n,null,i,s,c,l,u),a++}while(a<=p&&a<=d){const r=t[p],o=e[d]=u?cn(e[d]):sn(e[d]);if(!ze(r,o))break;y(r,o,n,null,i,s,c,l,u),p--,d--}if(a>p){if(a<=d){const t=d+1,o=t<f?e[t].el:r;while(a<=d)y(null,e[a]=u?cn(e[a]):sn(e[a]),n,o,i,s,c,l,u),a++}}else if(a>d)while(a<=p)X(t[a],i,s,!0),a++;else{const h=a,v=a,g=new Map;for(a=v;a<=d;a++){const t=e[a]=u?cn(e[a]):sn(e[a]);null!=t.key&&g.set(t.key,a)}let m,b=0;const _=d-v+1;let x=!1,w=0;const S=new Array(_);for(a=0;a<_;a++)S[a]=0;for(a=h;a<=p;a++){const r=t[a];if(b>=_){X(r,i,s,!0);continue}let o;if(null!=r.key)o=g.get(r.key);else for(m=v;m<=d;m++)if(0===S[m-v]&&ze(r,e[m])){o=m;break}void 0===o?X(r,i,s,!0):(S[o-v]=a+1,o>=w?w=o:x=!0,y(r,e[o],n,null,i,s,c,l,u),b++)}const T=x?he(S):o.Oj;for(m=T.length-1,a=_-1;a>=0;a--){const t=v+a,o=e[t],p=t+1<f?e[t+1].el:r;0===S[a]?y(null,o,n,p,i,s,c,l,u):x&&(m<0||a!==T[m]?K(o,n,p,2):m--)}}},K=(t,e,n,r,o=null)=>{const{el:s,type:c,transition:l,children:u,shapeFlag:a}=t;if(6&a)return void K(t.component.subTree,e,n,r);if(128&a)return void t.suspense.move(e,n,r);if(64&a)return void c.move(t,e,n,nt);if(c===Fe){i(s,e,n);for(let t=0;t<u.length;t++)K(u[t],e,n,r);return void i(t.anchor,e,n)}if(c===Le)return void T(t,e,n);const f=2!==r&&1&a&&l;if(f)if(0===r)l.beforeEnter(s),i(s,e,n),ce((()=>l.enter(s)),o);else{const{leave:t,delayLeave:r,afterLeave:o}=l,c=()=>i(s,e,n),u=()=>{t(s,(()=>{c(),o&&o()}))};r?r(s,c,u):u()}else i(s,e,n)},X=(t,e,n,r=!1,o=!1)=>{const{type:i,props:s,ref:c,children:l,dynamicChildren:u,shapeFlag:a,patchFlag:f,dirs:p,cacheIndex:d}=t;if(-2===f&&(o=!1),null!=c&&V(c,null,n,t,!0),null!=d&&(e.renderCache[d]=void 0),256&a)return void e.ctx.deactivate(t);const h=1&a&&p,v=!Z(t);let g;if(v&&(g=s&&s.onVnodeBeforeUnmount)&&an(g,e,t),6&a)q(t.component,n,r);else{if(128&a)return void t.suspense.unmount(n,r);h&&j(t,null,e,"beforeUnmount"),64&a?t.type.remove(t,e,n,nt,r):u&&!u.hasOnce&&(i!==Fe||f>0&&64&f)?J(u,e,n,!1,!0):(i===Fe&&384&f||!o&&16&a)&&J(l,e,n),r&&z(t)}(v&&(g=s&&s.onVnodeUnmounted)||h)&&ce((()=>{g&&an(g,e,t),h&&j(t,null,e,"unmounted")}),n)},z=t=>{const{type:e,el:n,anchor:r,transition:o}=t;if(e===Fe)return void Y(n,r);if(e===Le)return void C(t);const i=()=>{s(n),o&&!o.persisted&&o.afterLeave&&o.afterLeave()};if(1&t.shapeFlag&&o&&!o.persisted){const{leave:e,delayLeave:r}=o,s=()=>e(n,i);r?r(t.el,i,s):s()}else i()},Y=(t,e)=>{let n;while(t!==e)n=h(t),s(t),t=n;s(e)},q=(t,e,n)=>{const{bum:r,scope:i,job:s,subTree:c,um:l,m:u,a:a}=t;ge(u),ge(a),r&&(0,o.DY)(r),i.stop(),s&&(s.flags|=8,X(c,t,e,n)),l&&ce(l,e),ce((()=>{t.isUnmounted=!0}),e),e&&e.pendingBranch&&!e.isUnmounted&&t.asyncDep&&!t.asyncResolved&&t.suspenseId===e.pendingId&&(e.deps--,0===e.deps&&e.resolve())},J=(t,e,n,r=!1,o=!1,i=0)=>{for(let s=i;s<t.length;s++)X(t[s],e,n,r,o)},Q=t=>{if(6&t.shapeFlag)return Q(t.component.subTree);if(128&t.shapeFlag)return t.suspense.next();const e=h(t.anchor||t.el),n=e&&e[P];return n?h(n):e};let tt=!1;const et=(t,e,n)=>{null==t?e._vnode&&X(e._vnode,null,null,!0):y(e._vnode||null,t,e,null,null,null,n),e._vnode=t,tt||(tt=!0,x(),w(),tt=!1)},nt={p:y,um:X,m:K,r:z,mt:D,mc:M,pc:B,pbc:A,n:Q,o:t};let rt,ot;return e&&([rt,ot]=e(nt)),{render:et,hydrate:rt,createApp:Lt(et,rt)}}function ae({type:t,props:e},n){return"svg"===n&&"foreignObject"===t||"mathml"===n&&"annotation-xml"===t&&e&&e.encoding&&e.encoding.includes("html")?void 0:n}function fe({effect:t,job:e},n){n?(t.flags|=32,e.flags|=4):(t.flags&=-33,e.flags&=-5)}function pe(t,e){return(!t||t&&!t.pendingBranch)&&e&&!e.persisted}function de(t,e,n=!1){const r=t.children,i=e.children;if((0,o.cy)(r)&&(0,o.cy)(i))for(let o=0;o<r.length;o++){const t=r[o];let e=i[o];1&e.shapeFlag&&!e.dynamicChildren&&((e.patchFlag<=0||32===e.patchFlag)&&(e=i[o]=cn(i[o]),e.el=t.el),n||-2===e.patchFlag||de(t,e)),e.type===Re&&(e.el=t.el)}}function he(t){const e=t.slice(),n=[0];let r,o,i,s,c;const l=t.length;for(r=0;r<l;r++){const l=t[r];if(0!==l){if(o=n[n.length-1],t[o]<l){e[r]=o,n.push(r);continue}i=0,s=n.length-1;while(i<s)c=i+s>>1,t[n[c]]<l?i=c+1:s=c;l<t[n[i]]&&(i>0&&(e[r]=n[i-1]),n[i]=r)}}i=n.length,s=n[i-1];while(i-- >0)n[i]=s,s=e[s];return n}function ve(t){const e=t.subTree.component;if(e)return e.asyncDep&&!e.asyncResolved?e:ve(e)}function ge(t){if(t)for(let e=0;e<t.length;e++)t[e].flags|=8}const ye=Symbol.for("v-scx"),me=()=>{{const t=Bt(ye);return t}};function be(t,e,n){return _e(t,e,n)}function _e(t,e,n=o.MZ){const{immediate:i,deep:c,flush:l,once:u}=n;const a=(0,o.X$)({},n);const f=e&&i||!e&&"post"!==l;let p;if(Sn)if("sync"===l){const t=me();p=t.__watcherHandles||(t.__watcherHandles=[])}else if(!f){const t=()=>{};return t.stop=o.tE,t.resume=o.tE,t.pause=o.tE,t}const d=hn;a.call=(t,e,n)=>s(t,d,e,n);let h=!1;"post"===l?a.scheduler=t=>{ce(t,d&&d.suspense)}:"sync"!==l&&(h=!0,a.scheduler=(t,e)=>{e?t():m(t)}),a.augmentJob=t=>{e&&(t.flags|=4),h&&(t.flags|=2,d&&(t.id=d.uid,t.i=d))};const v=(0,r.wB)(t,e,a);return Sn&&(p?p.push(v):f&&v()),v}function xe(t,e,n){const r=this.proxy,i=(0,o.Kg)(t)?t.includes(".")?we(r,t):()=>r[t]:t.bind(r,r);let s;(0,o.Tn)(e)?s=e:(s=e.handler,n=e);const c=mn(this),l=_e(i,s.bind(r),n);return c(),l}function we(t,e){const n=e.split(".");return()=>{let e=t;for(let t=0;t<n.length&&e;t++)e=e[n[t]];return e}}const Se=(t,e)=>"modelValue"===e||"model-value"===e?t.modelModifiers:t[`${e}Modifiers`]||t[`${(0,o.PT)(e)}Modifiers`]||t[`${(0,o.Tg)(e)}Modifiers`];function Te(t,e,...n){if(t.isUnmounted)return;const r=t.vnode.props||o.MZ;let i=n;const c=e.startsWith("update:"),l=c&&Se(r,e.slice(7));let u;l&&(l.trim&&(i=n.map((t=>(0,o.Kg)(t)?t.trim():t))),l.number&&(i=n.map(o.bB)));let a=r[u=(0,o.rU)(e)]||r[u=(0,o.rU)((0,o.PT)(e))];!a&&c&&(a=r[u=(0,o.rU)((0,o.Tg)(e))]),a&&s(a,t,6,i);const f=r[u+"Once"];if(f){if(t.emitted){if(t.emitted[u])return}else t.emitted={};t.emitted[u]=!0,s(f,t,6,i)}}function Ce(t,e,n=!1){const r=e.emitsCache,i=r.get(t);if(void 0!==i)return i;const s=t.emits;let c={},l=!1;if(!(0,o.Tn)(t)){const r=t=>{const n=Ce(t,e,!0);n&&(l=!0,(0,o.X$)(c,n))};!n&&e.mixins.length&&e.mixins.forEach(r),t.extends&&r(t.extends),t.mixins&&t.mixins.forEach(r)}return s||l?((0,o.cy)(s)?s.forEach((t=>c[t]=null)):(0,o.X$)(c,s),(0,o.Gv)(t)&&r.set(t,c),c):((0,o.Gv)(t)&&r.set(t,null),null)}function Oe(t,e){return!(!t||!(0,o.Mp)(e))&&(e=e.slice(2).replace(/Once$/,""),(0,o.$3)(t,e[0].toLowerCase()+e.slice(1))||(0,o.$3)(t,(0,o.Tg)(e))||(0,o.$3)(t,e))}function Ee(t){const{type:e,vnode:n,proxy:r,withProxy:i,propsOptions:[s],slots:l,attrs:u,emit:a,render:f,renderCache:p,props:d,data:h,setupState:v,ctx:g,inheritAttrs:y}=t,m=E(t);let b,_;try{if(4&n.shapeFlag){const t=i||r,e=t;b=sn(f.call(e,t,p,d,v,h,g)),_=u}else{const t=e;0,b=sn(t.length>1?t(d,{attrs:u,slots:l,emit:a}):t(d,null)),_=e.props?u:ke(u)}}catch(w){Ne.length=0,c(w,t,1),b=Qe(De)}let x=b;if(_&&!1!==y){const t=Object.keys(_),{shapeFlag:e}=x;t.length&&7&e&&(s&&t.some(o.CP)&&(_=je(_,s)),x=nn(x,_,!1,!0))}return n.dirs&&(x=nn(x,null,!1,!0),x.dirs=x.dirs?x.dirs.concat(n.dirs):n.dirs),n.transition&&N(x,n.transition),b=x,E(m),b}const ke=t=>{let e;for(const n in t)("class"===n||"style"===n||(0,o.Mp)(n))&&((e||(e={}))[n]=t[n]);return e},je=(t,e)=>{const n={};for(const r in t)(0,o.CP)(r)&&r.slice(9)in e||(n[r]=t[r]);return n};function Pe(t,e,n){const{props:r,children:o,component:i}=t,{props:s,children:c,patchFlag:l}=e,u=i.emitsOptions;if(e.dirs||e.transition)return!0;if(!(n&&l>=0))return!(!o&&!c||c&&c.$stable)||r!==s&&(r?!s||Me(r,s,u):!!s);if(1024&l)return!0;if(16&l)return r?Me(r,s,u):!!s;if(8&l){const t=e.dynamicProps;for(let e=0;e<t.length;e++){const n=t[e];if(s[n]!==r[n]&&!Oe(u,n))return!0}}return!1}function Me(t,e,n){const r=Object.keys(e);if(r.length!==Object.keys(t).length)return!0;for(let o=0;o<r.length;o++){const i=r[o];if(e[i]!==t[i]&&!Oe(n,i))return!0}return!1}function $e({vnode:t,parent:e},n){while(e){const r=e.subTree;if(r.suspense&&r.suspense.activeBranch===t&&(r.el=t.el),r!==t)break;(t=e.vnode).el=n,e=e.parent}}const Ae=t=>t.__isSuspense;function Ie(t,e){e&&e.pendingBranch?(0,o.cy)(t)?e.effects.push(...t):e.effects.push(t):_(t)}const Fe=Symbol.for("v-fgt"),Re=Symbol.for("v-txt"),De=Symbol.for("v-cmt"),Le=Symbol.for("v-stc"),Ne=[];let Ue=null;function Be(t=!1){Ne.push(Ue=t?null:[])}function Ve(){Ne.pop(),Ue=Ne[Ne.length-1]||null}let Ze=1;function He(t,e=!1){Ze+=t,t<0&&Ue&&e&&(Ue.hasOnce=!0)}function We(t){return t.dynamicChildren=Ze>0?Ue||o.Oj:null,Ve(),Ze>0&&Ue&&Ue.push(t),t}function Ge(t,e,n,r,o,i){return We(Je(t,e,n,r,o,i,!0))}function Ke(t,e,n,r,o){return We(Qe(t,e,n,r,o,!0))}function Xe(t){return!!t&&!0===t.__v_isVNode}function ze(t,e){return t.type===e.type&&t.key===e.key}const Ye=({key:t})=>null!=t?t:null,qe=({ref:t,ref_key:e,ref_for:n})=>("number"===typeof t&&(t=""+t),null!=t?(0,o.Kg)(t)||(0,r.i9)(t)||(0,o.Tn)(t)?{i:C,r:t,k:e,f:!!n}:t:null);function Je(t,e=null,n=null,r=0,i=null,s=(t===Fe?0:1),c=!1,l=!1){const u={__v_isVNode:!0,__v_skip:!0,type:t,props:e,key:e&&Ye(e),ref:e&&qe(e),scopeId:O,slotScopeIds:null,children:n,component:null,suspense:null,ssContent:null,ssFallback:null,dirs:null,transition:null,el:null,anchor:null,target:null,targetStart:null,targetAnchor:null,staticCount:0,shapeFlag:s,patchFlag:r,dynamicProps:i,dynamicChildren:null,appContext:null,ctx:C};return l?(ln(u,n),128&s&&t.normalize(u)):n&&(u.shapeFlag|=(0,o.Kg)(n)?8:16),Ze>0&&!c&&Ue&&(u.patchFlag>0||6&s)&&32!==u.patchFlag&&Ue.push(u),u}const Qe=tn;function tn(t,e=null,n=null,i=0,s=null,c=!1){if(t&&t!==pt||(t=De),Xe(t)){const r=nn(t,e,!0);return n&&ln(r,n),Ze>0&&!c&&Ue&&(6&r.shapeFlag?Ue[Ue.indexOf(t)]=r:Ue.push(r)),r.patchFlag=-2,r}if($n(t)&&(t=t.__vccOpts),e){e=en(e);let{class:t,style:n}=e;t&&!(0,o.Kg)(t)&&(e.class=(0,o.C4)(t)),(0,o.Gv)(n)&&((0,r.ju)(n)&&!(0,o.cy)(n)&&(n=(0,o.X$)({},n)),e.style=(0,o.Tr)(n))}const l=(0,o.Kg)(t)?1:Ae(t)?128:M(t)?64:(0,o.Gv)(t)?4:(0,o.Tn)(t)?2:0;return Je(t,e,n,i,s,l,c,!0)}function en(t){return t?(0,r.ju)(t)||Ht(t)?(0,o.X$)({},t):t:null}function nn(t,e,n=!1,r=!1){const{props:i,ref:s,patchFlag:c,children:l,transition:u}=t,a=e?un(i||{},e):i,f={__v_isVNode:!0,__v_skip:!0,type:t.type,props:a,key:a&&Ye(a),ref:e&&e.ref?n&&s?(0,o.cy)(s)?s.concat(qe(e)):[s,qe(e)]:qe(e):s,scopeId:t.scopeId,slotScopeIds:t.slotScopeIds,children:l,target:t.target,targetStart:t.targetStart,targetAnchor:t.targetAnchor,staticCount:t.staticCount,shapeFlag:t.shapeFlag,patchFlag:e&&t.type!==Fe?-1===c?16:16|c:c,dynamicProps:t.dynamicProps,dynamicChildren:t.dynamicChildren,appContext:t.appContext,dirs:t.dirs,transition:u,component:t.component,suspense:t.suspense,ssContent:t.ssContent&&nn(t.ssContent),ssFallback:t.ssFallback&&nn(t.ssFallback),el:t.el,anchor:t.anchor,ctx:t.ctx,ce:t.ce};return u&&r&&N(f,u.clone(f)),f}function rn(t=" ",e=0){return Qe(Re,null,t,e)}function on(t="",e=!1){return e?(Be(),Ke(De,null,t)):Qe(De,null,t)}function sn(t){return null==t||"boolean"===typeof t?Qe(De):(0,o.cy)(t)?Qe(Fe,null,t.slice()):Xe(t)?cn(t):Qe(Re,null,String(t))}function cn(t){return null===t.el&&-1!==t.patchFlag||t.memo?t:nn(t)}function ln(t,e){let n=0;const{shapeFlag:r}=t;if(null==e)e=null;else if((0,o.cy)(e))n=16;else if("object"===typeof e){if(65&r){const n=e.default;return void(n&&(n._c&&(n._d=!1),ln(t,n()),n._c&&(n._d=!0)))}{n=32;const r=e._;r||Ht(e)?3===r&&C&&(1===C.slots._?e._=1:(e._=2,t.patchFlag|=1024)):e._ctx=C}}else(0,o.Tn)(e)?(e={default:e,_ctx:C},n=32):(e=String(e),64&r?(n=16,e=[rn(e)]):n=8);t.children=e,t.shapeFlag|=n}function un(...t){const e={};for(let n=0;n<t.length;n++){const r=t[n];for(const t in r)if("class"===t)e.class!==r.class&&(e.class=(0,o.C4)([e.class,r.class]));else if("style"===t)e.style=(0,o.Tr)([e.style,r.style]);else if((0,o.Mp)(t)){const n=e[t],i=r[t];!i||n===i||(0,o.cy)(n)&&n.includes(i)||(e[t]=n?[].concat(n,i):i)}else""!==t&&(e[t]=r[t])}return e}function an(t,e,n,r=null){s(t,e,7,[n,r])}const fn=Rt();let pn=0;function dn(t,e,n){const i=t.type,s=(e?e.appContext:t.appContext)||fn,c={uid:pn++,vnode:t,type:i,parent:e,appContext:s,root:null,next:null,subTree:null,effect:null,update:null,job:null,scope:new r.yC(!0),render:null,proxy:null,exposed:null,exposeProxy:null,withProxy:null,provides:e?e.provides:Object.create(s.provides),ids:e?e.ids:["",0,0],accessCache:null,renderCache:[],components:null,directives:null,propsOptions:Yt(i,s),emitsOptions:Ce(i,s),emit:null,emitted:null,propsDefaults:o.MZ,inheritAttrs:i.inheritAttrs,ctx:o.MZ,data:o.MZ,props:o.MZ,attrs:o.MZ,slots:o.MZ,refs:o.MZ,setupState:o.MZ,setupContext:null,suspense:n,suspenseId:n?n.pendingId:0,asyncDep:null,asyncResolved:!1,isMounted:!1,isUnmounted:!1,isDeactivated:!1,bc:null,c:null,bm:null,m:null,bu:null,u:null,um:null,bum:null,da:null,a:null,rtg:null,rtc:null,ec:null,sp:null};return c.ctx={_:c},c.root=e?e.root:c,c.emit=Te.bind(null,c),t.ce&&t.ce(c),c}let hn=null;const vn=()=>hn||C;let gn,yn;{const t=(0,o.We)(),e=(e,n)=>{let r;return(r=t[e])||(r=t[e]=[]),r.push(n),t=>{r.length>1?r.forEach((e=>e(t))):r[0](t)}};gn=e("__VUE_INSTANCE_SETTERS__",(t=>hn=t)),yn=e("__VUE_SSR_SETTERS__",(t=>Sn=t))}const mn=t=>{const e=hn;return gn(t),t.scope.on(),()=>{t.scope.off(),gn(e)}},bn=()=>{hn&&hn.scope.off(),gn(null)};function _n(t){return 4&t.vnode.shapeFlag}let xn,wn,Sn=!1;function Tn(t,e=!1,n=!1){e&&yn(e);const{props:r,children:o}=t.vnode,i=_n(t);Wt(t,r,i,e),oe(t,o,n);const s=i?Cn(t,e):void 0;return e&&yn(!1),s}function Cn(t,e){const n=t.type;t.accessCache=Object.create(null),t.proxy=new Proxy(t.ctx,bt);const{setup:s}=n;if(s){(0,r.C4)();const n=t.setupContext=s.length>1?jn(t):null,l=mn(t),u=i(s,t,0,[t.props,n]),a=(0,o.yL)(u);if((0,r.bl)(),l(),!a&&!t.sp||Z(t)||B(t),a){if(u.then(bn,bn),e)return u.then((n=>{On(t,n,e)})).catch((e=>{c(e,t,0)}));t.asyncDep=u}else On(t,u,e)}else En(t,e)}function On(t,e,n){(0,o.Tn)(e)?t.type.__ssrInlineRender?t.ssrRender=e:t.render=e:(0,o.Gv)(e)&&(t.setupState=(0,r.Pr)(e)),En(t,n)}function En(t,e,n){const i=t.type;if(!t.render){if(!e&&xn&&!i.render){const e=i.template||Ot(t).template;if(e){0;const{isCustomElement:n,compilerOptions:r}=t.appContext.config,{delimiters:s,compilerOptions:c}=i,l=(0,o.X$)((0,o.X$)({isCustomElement:n,delimiters:s},r),c);i.render=xn(e,l)}}t.render=i.render||o.tE,wn&&wn(t)}{const e=mn(t);(0,r.C4)();try{wt(t)}finally{(0,r.bl)(),e()}}}const kn={get(t,e){return(0,r.u4)(t,"get",""),t[e]}};function jn(t){const e=e=>{t.exposed=e||{}};return{attrs:new Proxy(t.attrs,kn),slots:t.slots,emit:t.emit,expose:e}}function Pn(t){return t.exposed?t.exposeProxy||(t.exposeProxy=new Proxy((0,r.Pr)((0,r.IG)(t.exposed)),{get(e,n){return n in e?e[n]:n in yt?yt[n](t):void 0},has(t,e){return e in t||e in yt}})):t.proxy}function Mn(t,e=!0){return(0,o.Tn)(t)?t.displayName||t.name:t.name||e&&t.__name}function $n(t){return(0,o.Tn)(t)&&"__vccOpts"in t}const An=(t,e)=>{const n=(0,r.EW)(t,e,Sn);return n};const In="3.5.13"},679:function(t,e,n){var r=n(1625),o=TypeError;t.exports=function(t,e){if(r(e,t))return t;throw new o("Incorrect invocation")}},741:function(t){var e=Math.ceil,n=Math.floor;t.exports=Math.trunc||function(t){var r=+t;return(r>0?n:e)(r)}},757:function(t,e,n){var r=n(7751),o=n(4901),i=n(1625),s=n(7040),c=Object;t.exports=s?function(t){return"symbol"==typeof t}:function(t){var e=r("Symbol");return o(e)&&i(e.prototype,c(t))}},851:function(t,e,n){var r=n(6955),o=n(5966),i=n(4117),s=n(6269),c=n(8227),l=c("iterator");t.exports=function(t){if(!i(t))return o(t,l)||o(t,"@@iterator")||s[r(t)]}},953:function(t,e,n){n.d(e,{C4:function(){return T},EW:function(){return At},Gc:function(){return yt},IG:function(){return Ct},Kh:function(){return gt},Pr:function(){return Mt},R1:function(){return jt},X2:function(){return u},bl:function(){return C},fE:function(){return wt},g8:function(){return _t},hZ:function(){return R},i9:function(){return kt},ju:function(){return St},lJ:function(){return Ot},qA:function(){return L},u4:function(){return F},ux:function(){return Tt},wB:function(){return Lt},yC:function(){return s}});var r=n(33);
+function r(t){const e=Object.create(null);for(const n of t.split(","))e[n]=1;return t=>t in e}n.d(e,{$3:function(){return d},$H:function(){return D},BH:function(){return W},BX:function(){return nt},Bm:function(){return x},C4:function(){return q},CE:function(){return v},CP:function(){return l},DY:function(){return L},Gv:function(){return w},J$:function(){return Q},Kg:function(){return _},MZ:function(){return o},Mp:function(){return u},NO:function(){return c},Oj:function(){return i},PT:function(){return I},Qd:function(){return E},Ro:function(){return B},SU:function(){return P},TF:function(){return f},Tg:function(){return A},Tn:function(){return b},Tr:function(){return G},We:function(){return V},X$:function(){return a},Y2:function(){return tt},ZH:function(){return F},Zf:function(){return O},bB:function(){return U},cy:function(){return h},gd:function(){return m},pD:function(){return r},rU:function(){return R},tE:function(){return s},u3:function(){return rt},vM:function(){return g},v_:function(){return it},yI:function(){return k},yL:function(){return S},yQ:function(){return N}});const o={},i=[],s=()=>{},c=()=>!1,u=t=>111===t.charCodeAt(0)&&110===t.charCodeAt(1)&&(t.charCodeAt(2)>122||t.charCodeAt(2)<97),l=t=>t.startsWith("onUpdate:"),a=Object.assign,f=(t,e)=>{const n=t.indexOf(e);n>-1&&t.splice(n,1)},p=Object.prototype.hasOwnProperty,d=(t,e)=>p.call(t,e),h=Array.isArray,v=t=>"[object Map]"===C(t),g=t=>"[object Set]"===C(t),y=t=>"[object Date]"===C(t),m=t=>"[object RegExp]"===C(t),b=t=>"function"===typeof t,_=t=>"string"===typeof t,x=t=>"symbol"===typeof t,w=t=>null!==t&&"object"===typeof t,S=t=>(w(t)||b(t))&&b(t.then)&&b(t.catch),T=Object.prototype.toString,C=t=>T.call(t),O=t=>C(t).slice(8,-1),E=t=>"[object Object]"===C(t),k=t=>_(t)&&"NaN"!==t&&"-"!==t[0]&&""+parseInt(t,10)===t,P=r(",key,ref,ref_for,ref_key,onVnodeBeforeMount,onVnodeMounted,onVnodeBeforeUpdate,onVnodeUpdated,onVnodeBeforeUnmount,onVnodeUnmounted"),j=t=>{const e=Object.create(null);return n=>{const r=e[n];return r||(e[n]=t(n))}},M=/-(\w)/g,I=j((t=>t.replace(M,((t,e)=>e?e.toUpperCase():"")))),$=/\B([A-Z])/g,A=j((t=>t.replace($,"-$1").toLowerCase())),F=j((t=>t.charAt(0).toUpperCase()+t.slice(1))),R=j((t=>{const e=t?`on${F(t)}`:"";return e})),D=(t,e)=>!Object.is(t,e),L=(t,...e)=>{for(let n=0;n<t.length;n++)t[n](...e)},N=(t,e,n,r=!1)=>{Object.defineProperty(t,e,{configurable:!0,enumerable:!1,writable:r,value:n})},U=t=>{const e=parseFloat(t);return isNaN(e)?t:e},B=t=>{const e=_(t)?Number(t):NaN;return isNaN(e)?t:e};let H;const V=()=>H||(H="undefined"!==typeof globalThis?globalThis:"undefined"!==typeof self?self:"undefined"!==typeof window?window:"undefined"!==typeof n.g?n.g:{});const Z="Infinity,undefined,NaN,isFinite,isNaN,parseFloat,parseInt,decodeURI,decodeURIComponent,encodeURI,encodeURIComponent,Math,Number,Date,Array,Object,Boolean,String,RegExp,Map,Set,JSON,Intl,BigInt,console,Error,Symbol",W=r(Z);function G(t){if(h(t)){const e={};for(let n=0;n<t.length;n++){const r=t[n],o=_(r)?Y(r):G(r);if(o)for(const t in o)e[t]=o[t]}return e}if(_(t)||w(t))return t}const K=/;(?![^(]*\))/g,X=/:([^]+)/,z=/\/\*[^]*?\*\//g;function Y(t){const e={};return t.replace(z,"").split(K).forEach((t=>{if(t){const n=t.split(X);n.length>1&&(e[n[0].trim()]=n[1].trim())}})),e}function q(t){let e="";if(_(t))e=t;else if(h(t))for(let n=0;n<t.length;n++){const r=q(t[n]);r&&(e+=r+" ")}else if(w(t))for(const n in t)t[n]&&(e+=n+" ");return e.trim()}const J="itemscope,allowfullscreen,formnovalidate,ismap,nomodule,novalidate,readonly",Q=r(J);function tt(t){return!!t||""===t}function et(t,e){if(t.length!==e.length)return!1;let n=!0;for(let r=0;n&&r<t.length;r++)n=nt(t[r],e[r]);return n}function nt(t,e){if(t===e)return!0;let n=y(t),r=y(e);if(n||r)return!(!n||!r)&&t.getTime()===e.getTime();if(n=x(t),r=x(e),n||r)return t===e;if(n=h(t),r=h(e),n||r)return!(!n||!r)&&et(t,e);if(n=w(t),r=w(e),n||r){if(!n||!r)return!1;const o=Object.keys(t).length,i=Object.keys(e).length;if(o!==i)return!1;for(const n in t){const r=t.hasOwnProperty(n),o=e.hasOwnProperty(n);if(r&&!o||!r&&o||!nt(t[n],e[n]))return!1}}return String(t)===String(e)}function rt(t,e){return t.findIndex((t=>nt(t,e)))}const ot=t=>!(!t||!0!==t["__v_isRef"]),it=t=>_(t)?t:null==t?"":h(t)||w(t)&&(t.toString===T||!b(t.toString))?ot(t)?it(t.value):JSON.stringify(t,st,2):String(t),st=(t,e)=>ot(e)?st(t,e.value):v(e)?{[`Map(${e.size})`]:[...e.entries()].reduce(((t,[e,n],r)=>(t[ct(e,r)+" =>"]=n,t)),{})}:g(e)?{[`Set(${e.size})`]:[...e.values()].map((t=>ct(t)))}:x(e)?ct(e):!w(e)||h(e)||E(e)?e:String(e),ct=(t,e="")=>{var n;return x(t)?`Symbol(${null!=(n=t.description)?n:e})`:t}},34:function(t,e,n){var r=n(4901);t.exports=function(t){return"object"==typeof t?null!==t:r(t)}},81:function(t,e,n){var r=n(9565),o=n(9306),i=n(8551),s=n(6823),c=n(851),u=TypeError;t.exports=function(t,e){var n=arguments.length<2?c(t):e;if(o(n))return i(r(n,t));throw new u(s(t)+" is not iterable")}},283:function(t,e,n){var r=n(9504),o=n(9039),i=n(4901),s=n(9297),c=n(3724),u=n(350).CONFIGURABLE,l=n(3706),a=n(1181),f=a.enforce,p=a.get,d=String,h=Object.defineProperty,v=r("".slice),g=r("".replace),y=r([].join),m=c&&!o((function(){return 8!==h((function(){}),"length",{value:8}).length})),b=String(String).split("String"),_=t.exports=function(t,e,n){"Symbol("===v(d(e),0,7)&&(e="["+g(d(e),/^Symbol\(([^)]*)\).*$/,"$1")+"]"),n&&n.getter&&(e="get "+e),n&&n.setter&&(e="set "+e),(!s(t,"name")||u&&t.name!==e)&&(c?h(t,"name",{value:e,configurable:!0}):t.name=e),m&&n&&s(n,"arity")&&t.length!==n.arity&&h(t,"length",{value:n.arity});try{n&&s(n,"constructor")&&n.constructor?c&&h(t,"prototype",{writable:!1}):t.prototype&&(t.prototype=void 0)}catch(o){}var r=f(t);return s(r,"source")||(r.source=y(b,"string"==typeof e?e:"")),t};Function.prototype.toString=_((function(){return i(this)&&p(this).source||l(this)}),"toString")},350:function(t,e,n){var r=n(3724),o=n(9297),i=Function.prototype,s=r&&Object.getOwnPropertyDescriptor,c=o(i,"name"),u=c&&"something"===function(){}.name,l=c&&(!r||r&&s(i,"name").configurable);t.exports={EXISTS:c,PROPER:u,CONFIGURABLE:l}},397:function(t,e,n){var r=n(7751);t.exports=r("document","documentElement")},421:function(t){t.exports={}},616:function(t,e,n){var r=n(9039);t.exports=!r((function(){var t=function(){}.bind();return"function"!=typeof t||t.hasOwnProperty("prototype")}))},641:function(t,e,n){n.d(e,{$u:function(){return rt},CE:function(){return Ge},Df:function(){return U},FK:function(){return Fe},Gy:function(){return A},K9:function(){return ue},Lk:function(){return Je},MZ:function(){return N},OW:function(){return L},Q3:function(){return on},QP:function(){return R},Wv:function(){return Ke},bF:function(){return Qe},dY:function(){return g},g2:function(){return ft},nI:function(){return vn},pI:function(){return vt},qL:function(){return s},uX:function(){return Be}});var r=n(953),o=n(33);function i(t,e,n,r){try{return r?t(...r):t()}catch(o){c(o,e,n)}}function s(t,e,n,r){if((0,o.Tn)(t)){const s=i(t,e,n,r);return s&&(0,o.yL)(s)&&s.catch((t=>{c(t,e,n)})),s}if((0,o.cy)(t)){const o=[];for(let i=0;i<t.length;i++)o.push(s(t[i],e,n,r));return o}}function c(t,e,n,s=!0){const c=e?e.vnode:null,{errorHandler:l,throwUnhandledErrorInProduction:a}=e&&e.appContext.config||o.MZ;if(e){let o=e.parent;const s=e.proxy,c=`https://vuejs.org/error-reference/#runtime-${n}`;while(o){const e=o.ec;if(e)for(let n=0;n<e.length;n++)if(!1===e[n](t,s,c))return;o=o.parent}if(l)return(0,r.C4)(),i(l,null,10,[t,s,c]),void(0,r.bl)()}u(t,n,c,s,a)}function u(t,e,n,r=!0,o=!1){if(o)throw t;console.error(t)}const l=[];let a=-1;const f=[];let p=null,d=0;const h=Promise.resolve();let v=null;function g(t){const e=v||h;return t?e.then(this?t.bind(this):t):e}function y(t){let e=a+1,n=l.length;while(e<n){const r=e+n>>>1,o=l[r],i=S(o);i<t||i===t&&2&o.flags?e=r+1:n=r}return e}function m(t){if(!(1&t.flags)){const e=S(t),n=l[l.length-1];!n||!(2&t.flags)&&e>=S(n)?l.push(t):l.splice(y(e),0,t),t.flags|=1,b()}}function b(){v||(v=h.then(T))}function _(t){(0,o.cy)(t)?f.push(...t):p&&-1===t.id?p.splice(d+1,0,t):1&t.flags||(f.push(t),t.flags|=1),b()}function x(t,e,n=a+1){for(0;n<l.length;n++){const e=l[n];if(e&&2&e.flags){if(t&&e.id!==t.uid)continue;0,l.splice(n,1),n--,4&e.flags&&(e.flags&=-2),e(),4&e.flags||(e.flags&=-2)}}}function w(t){if(f.length){const t=[...new Set(f)].sort(((t,e)=>S(t)-S(e)));if(f.length=0,p)return void p.push(...t);for(p=t,d=0;d<p.length;d++){const t=p[d];0,4&t.flags&&(t.flags&=-2),8&t.flags||t(),t.flags&=-2}p=null,d=0}}const S=t=>null==t.id?2&t.flags?-1:1/0:t.id;function T(t){o.tE;try{for(a=0;a<l.length;a++){const t=l[a];!t||8&t.flags||(4&t.flags&&(t.flags&=-2),i(t,t.i,t.i?15:14),4&t.flags||(t.flags&=-2))}}finally{for(;a<l.length;a++){const t=l[a];t&&(t.flags&=-2)}a=-1,l.length=0,w(t),v=null,(l.length||f.length)&&T(t)}}let C=null,O=null;function E(t){const e=C;return C=t,O=t&&t.type.__scopeId||null,e}function k(t,e=C,n){if(!e)return t;if(t._n)return t;const r=(...n)=>{r._d&&Ze(-1);const o=E(e);let i;try{i=t(...n)}finally{E(o),r._d&&Ze(1)}return i};return r._n=!0,r._c=!0,r._d=!0,r}function P(t,e,n,o){const i=t.dirs,c=e&&e.dirs;for(let u=0;u<i.length;u++){const l=i[u];c&&(l.oldValue=c[u].value);let a=l.dir[o];a&&((0,r.C4)(),s(a,n,8,[t.el,l,t,e]),(0,r.bl)())}}const j=Symbol("_vte"),M=t=>t.__isTeleport;const I=Symbol("_leaveCb"),$=Symbol("_enterCb");function A(){const t={isMounted:!1,isLeaving:!1,isUnmounting:!1,leavingVNodes:new Map};return et((()=>{t.isMounted=!0})),ot((()=>{t.isUnmounting=!0})),t}const F=[Function,Array],R={mode:String,appear:Boolean,persisted:Boolean,onBeforeEnter:F,onEnter:F,onAfterEnter:F,onEnterCancelled:F,onBeforeLeave:F,onLeave:F,onAfterLeave:F,onLeaveCancelled:F,onBeforeAppear:F,onAppear:F,onAfterAppear:F,onAppearCancelled:F};function D(t,e){const{leavingVNodes:n}=t;let r=n.get(e.type);return r||(r=Object.create(null),n.set(e.type,r)),r}function L(t,e,n,r,i){const{appear:c,mode:u,persisted:l=!1,onBeforeEnter:a,onEnter:f,onAfterEnter:p,onEnterCancelled:d,onBeforeLeave:h,onLeave:v,onAfterLeave:g,onLeaveCancelled:y,onBeforeAppear:m,onAppear:b,onAfterAppear:_,onAppearCancelled:x}=e,w=String(t.key),S=D(n,t),T=(t,e)=>{t&&s(t,r,9,e)},C=(t,e)=>{const n=e[1];T(t,e),(0,o.cy)(t)?t.every((t=>t.length<=1))&&n():t.length<=1&&n()},O={mode:u,persisted:l,beforeEnter(e){let r=a;if(!n.isMounted){if(!c)return;r=m||a}e[I]&&e[I](!0);const o=S[w];o&&ze(t,o)&&o.el[I]&&o.el[I](),T(r,[e])},enter(t){let e=f,r=p,o=d;if(!n.isMounted){if(!c)return;e=b||f,r=_||p,o=x||d}let i=!1;const s=t[$]=e=>{i||(i=!0,T(e?o:r,[t]),O.delayedLeave&&O.delayedLeave(),t[$]=void 0)};e?C(e,[t,s]):s()},leave(e,r){const o=String(t.key);if(e[$]&&e[$](!0),n.isUnmounting)return r();T(h,[e]);let i=!1;const s=e[I]=n=>{i||(i=!0,r(),T(n?y:g,[e]),e[I]=void 0,S[o]===t&&delete S[o])};S[o]=t,v?C(v,[e,s]):s()},clone(t){const o=L(t,e,n,r,i);return i&&i(o),o}};return O}function N(t,e){6&t.shapeFlag&&t.component?(t.transition=e,N(t.component.subTree,e)):128&t.shapeFlag?(t.ssContent.transition=e.clone(t.ssContent),t.ssFallback.transition=e.clone(t.ssFallback)):t.transition=e}function U(t,e=!1,n){let r=[],o=0;for(let i=0;i<t.length;i++){let s=t[i];const c=null==n?s.key:String(n)+String(null!=s.key?s.key:i);s.type===Fe?(128&s.patchFlag&&o++,r=r.concat(U(s.children,e,c))):(e||s.type!==De)&&r.push(null!=c?nn(s,{key:c}):s)}if(o>1)for(let i=0;i<r.length;i++)r[i].patchFlag=-2;return r}
+/*! #__NO_SIDE_EFFECTS__ */function B(t){t.ids=[t.ids[0]+t.ids[2]+++"-",0,0]}function H(t,e,n,s,c=!1){if((0,o.cy)(t))return void t.forEach(((t,r)=>H(t,e&&((0,o.cy)(e)?e[r]:e),n,s,c)));if(V(s)&&!c)return void(512&s.shapeFlag&&s.type.__asyncResolved&&s.component.subTree.component&&H(t,e,n,s.component.subTree));const u=4&s.shapeFlag?jn(s.component):s.el,l=c?null:u,{i:a,r:f}=t;const p=e&&e.r,d=a.refs===o.MZ?a.refs={}:a.refs,h=a.setupState,v=(0,r.ux)(h),g=h===o.MZ?()=>!1:t=>(0,o.$3)(v,t);if(null!=p&&p!==f&&((0,o.Kg)(p)?(d[p]=null,g(p)&&(h[p]=null)):(0,r.i9)(p)&&(p.value=null)),(0,o.Tn)(f))i(f,a,12,[l,d]);else{const e=(0,o.Kg)(f),i=(0,r.i9)(f);if(e||i){const r=()=>{if(t.f){const n=e?g(f)?h[f]:d[f]:f.value;c?(0,o.cy)(n)&&(0,o.TF)(n,u):(0,o.cy)(n)?n.includes(u)||n.push(u):e?(d[f]=[u],g(f)&&(h[f]=d[f])):(f.value=[u],t.k&&(d[t.k]=f.value))}else e?(d[f]=l,g(f)&&(h[f]=l)):i&&(f.value=l,t.k&&(d[t.k]=l))};l?(r.id=-1,ce(r,n)):r()}else 0}}(0,o.We)().requestIdleCallback,(0,o.We)().cancelIdleCallback;const V=t=>!!t.type.__asyncLoader
+/*! #__NO_SIDE_EFFECTS__ */;const Z=t=>t.type.__isKeepAlive;RegExp,RegExp;function W(t,e){return(0,o.cy)(t)?t.some((t=>W(t,e))):(0,o.Kg)(t)?t.split(",").includes(e):!!(0,o.gd)(t)&&(t.lastIndex=0,t.test(e))}function G(t,e){X(t,"a",e)}function K(t,e){X(t,"da",e)}function X(t,e,n=hn){const r=t.__wdc||(t.__wdc=()=>{let e=n;while(e){if(e.isDeactivated)return;e=e.parent}return t()});if(J(e,r,n),n){let t=n.parent;while(t&&t.parent)Z(t.parent.vnode)&&z(r,e,n,t),t=t.parent}}function z(t,e,n,r){const i=J(e,t,r,!0);it((()=>{(0,o.TF)(r[e],i)}),n)}function Y(t){t.shapeFlag&=-257,t.shapeFlag&=-513}function q(t){return 128&t.shapeFlag?t.ssContent:t}function J(t,e,n=hn,o=!1){if(n){const i=n[t]||(n[t]=[]),c=e.__weh||(e.__weh=(...o)=>{(0,r.C4)();const i=mn(n),c=s(e,n,t,o);return i(),(0,r.bl)(),c});return o?i.unshift(c):i.push(c),c}}const Q=t=>(e,n=hn)=>{Sn&&"sp"!==t||J(t,((...t)=>e(...t)),n)},tt=Q("bm"),et=Q("m"),nt=Q("bu"),rt=Q("u"),ot=Q("bum"),it=Q("um"),st=Q("sp"),ct=Q("rtg"),ut=Q("rtc");function lt(t,e=hn){J("ec",t,e)}const at="components";function ft(t,e){return dt(at,t,!0,e)||t}const pt=Symbol.for("v-ndc");function dt(t,e,n=!0,r=!1){const i=C||hn;if(i){const n=i.type;if(t===at){const t=Mn(n,!1);if(t&&(t===e||t===(0,o.PT)(e)||t===(0,o.ZH)((0,o.PT)(e))))return n}const s=ht(i[t]||n[t],e)||ht(i.appContext[t],e);return!s&&r?n:s}}function ht(t,e){return t&&(t[e]||t[(0,o.PT)(e)]||t[(0,o.ZH)((0,o.PT)(e))])}function vt(t,e,n,i){let s;const c=n&&n[i],u=(0,o.cy)(t);if(u||(0,o.Kg)(t)){const n=u&&(0,r.g8)(t);let o=!1;n&&(o=!(0,r.fE)(t),t=(0,r.qA)(t)),s=new Array(t.length);for(let i=0,u=t.length;i<u;i++)s[i]=e(o?(0,r.lJ)(t[i]):t[i],i,void 0,c&&c[i])}else if("number"===typeof t){0,s=new Array(t);for(let n=0;n<t;n++)s[n]=e(n+1,n,void 0,c&&c[n])}else if((0,o.Gv)(t))if(t[Symbol.iterator])s=Array.from(t,((t,n)=>e(t,n,void 0,c&&c[n])));else{const n=Object.keys(t);s=new Array(n.length);for(let r=0,o=n.length;r<o;r++){const o=n[r];s[r]=e(t[o],o,r,c&&c[r])}}else s=[];return n&&(n[i]=s),s}const gt=t=>t?_n(t)?jn(t):gt(t.parent):null,yt=(0,o.X$)(Object.create(null),{$:t=>t,$el:t=>t.vnode.el,$data:t=>t.data,$props:t=>t.props,$attrs:t=>t.attrs,$slots:t=>t.slots,$refs:t=>t.refs,$parent:t=>gt(t.parent),$root:t=>gt(t.root),$host:t=>t.ce,$emit:t=>t.emit,$options:t=>Ot(t),$forceUpdate:t=>t.f||(t.f=()=>{m(t.update)}),$nextTick:t=>t.n||(t.n=g.bind(t.proxy)),$watch:t=>xe.bind(t)}),mt=(t,e)=>t!==o.MZ&&!t.__isScriptSetup&&(0,o.$3)(t,e),bt={get({_:t},e){if("__v_skip"===e)return!0;const{ctx:n,setupState:i,data:s,props:c,accessCache:u,type:l,appContext:a}=t;let f;if("$"!==e[0]){const r=u[e];if(void 0!==r)switch(r){case 1:return i[e];case 2:return s[e];case 4:return n[e];case 3:return c[e]}else{if(mt(i,e))return u[e]=1,i[e];if(s!==o.MZ&&(0,o.$3)(s,e))return u[e]=2,s[e];if((f=t.propsOptions[0])&&(0,o.$3)(f,e))return u[e]=3,c[e];if(n!==o.MZ&&(0,o.$3)(n,e))return u[e]=4,n[e];xt&&(u[e]=0)}}const p=yt[e];let d,h;return p?("$attrs"===e&&(0,r.u4)(t.attrs,"get",""),p(t)):(d=l.__cssModules)&&(d=d[e])?d:n!==o.MZ&&(0,o.$3)(n,e)?(u[e]=4,n[e]):(h=a.config.globalProperties,(0,o.$3)(h,e)?h[e]:void 0)},set({_:t},e,n){const{data:r,setupState:i,ctx:s}=t;return mt(i,e)?(i[e]=n,!0):r!==o.MZ&&(0,o.$3)(r,e)?(r[e]=n,!0):!(0,o.$3)(t.props,e)&&(("$"!==e[0]||!(e.slice(1)in t))&&(s[e]=n,!0))},has({_:{data:t,setupState:e,accessCache:n,ctx:r,appContext:i,propsOptions:s}},c){let u;return!!n[c]||t!==o.MZ&&(0,o.$3)(t,c)||mt(e,c)||(u=s[0])&&(0,o.$3)(u,c)||(0,o.$3)(r,c)||(0,o.$3)(yt,c)||(0,o.$3)(i.config.globalProperties,c)},defineProperty(t,e,n){return null!=n.get?t._.accessCache[e]=0:(0,o.$3)(n,"value")&&this.set(t,e,n.value,null),Reflect.defineProperty(t,e,n)}};function _t(t){return(0,o.cy)(t)?t.reduce(((t,e)=>(t[e]=null,t)),{}):t}let xt=!0;function wt(t){const e=Ot(t),n=t.proxy,i=t.ctx;xt=!1,e.beforeCreate&&Tt(e.beforeCreate,t,"bc");const{data:s,computed:c,methods:u,watch:l,provide:a,inject:f,created:p,beforeMount:d,mounted:h,beforeUpdate:v,updated:g,activated:y,deactivated:m,beforeDestroy:b,beforeUnmount:_,destroyed:x,unmounted:w,render:S,renderTracked:T,renderTriggered:C,errorCaptured:O,serverPrefetch:E,expose:k,inheritAttrs:P,components:j,directives:M,filters:I}=e,$=null;if(f&&St(f,i,$),u)for(const r in u){const t=u[r];(0,o.Tn)(t)&&(i[r]=t.bind(n))}if(s){0;const e=s.call(n,n);0,(0,o.Gv)(e)&&(t.data=(0,r.Kh)(e))}if(xt=!0,c)for(const r in c){const t=c[r],e=(0,o.Tn)(t)?t.bind(n,n):(0,o.Tn)(t.get)?t.get.bind(n,n):o.tE;0;const s=!(0,o.Tn)(t)&&(0,o.Tn)(t.set)?t.set.bind(n):o.tE,u=$n({get:e,set:s});Object.defineProperty(i,r,{enumerable:!0,configurable:!0,get:()=>u.value,set:t=>u.value=t})}if(l)for(const r in l)Ct(l[r],i,n,r);if(a){const t=(0,o.Tn)(a)?a.call(n):a;Reflect.ownKeys(t).forEach((e=>{Ut(e,t[e])}))}function A(t,e){(0,o.cy)(e)?e.forEach((e=>t(e.bind(n)))):e&&t(e.bind(n))}if(p&&Tt(p,t,"c"),A(tt,d),A(et,h),A(nt,v),A(rt,g),A(G,y),A(K,m),A(lt,O),A(ut,T),A(ct,C),A(ot,_),A(it,w),A(st,E),(0,o.cy)(k))if(k.length){const e=t.exposed||(t.exposed={});k.forEach((t=>{Object.defineProperty(e,t,{get:()=>n[t],set:e=>n[t]=e})}))}else t.exposed||(t.exposed={});S&&t.render===o.tE&&(t.render=S),null!=P&&(t.inheritAttrs=P),j&&(t.components=j),M&&(t.directives=M),E&&B(t)}function St(t,e,n=o.tE){(0,o.cy)(t)&&(t=Mt(t));for(const i in t){const n=t[i];let s;s=(0,o.Gv)(n)?"default"in n?Bt(n.from||i,n.default,!0):Bt(n.from||i):Bt(n),(0,r.i9)(s)?Object.defineProperty(e,i,{enumerable:!0,configurable:!0,get:()=>s.value,set:t=>s.value=t}):e[i]=s}}function Tt(t,e,n){s((0,o.cy)(t)?t.map((t=>t.bind(e.proxy))):t.bind(e.proxy),e,n)}function Ct(t,e,n,r){let i=r.includes(".")?we(n,r):()=>n[r];if((0,o.Kg)(t)){const n=e[t];(0,o.Tn)(n)&&be(i,n)}else if((0,o.Tn)(t))be(i,t.bind(n));else if((0,o.Gv)(t))if((0,o.cy)(t))t.forEach((t=>Ct(t,e,n,r)));else{const r=(0,o.Tn)(t.handler)?t.handler.bind(n):e[t.handler];(0,o.Tn)(r)&&be(i,r,t)}else 0}function Ot(t){const e=t.type,{mixins:n,extends:r}=e,{mixins:i,optionsCache:s,config:{optionMergeStrategies:c}}=t.appContext,u=s.get(e);let l;return u?l=u:i.length||n||r?(l={},i.length&&i.forEach((t=>Et(l,t,c,!0))),Et(l,e,c)):l=e,(0,o.Gv)(e)&&s.set(e,l),l}function Et(t,e,n,r=!1){const{mixins:o,extends:i}=e;i&&Et(t,i,n,!0),o&&o.forEach((e=>Et(t,e,n,!0)));for(const s in e)if(r&&"expose"===s);else{const r=kt[s]||n&&n[s];t[s]=r?r(t[s],e[s]):e[s]}return t}const kt={data:Pt,props:At,emits:At,methods:$t,computed:$t,beforeCreate:It,created:It,beforeMount:It,mounted:It,beforeUpdate:It,updated:It,beforeDestroy:It,beforeUnmount:It,destroyed:It,unmounted:It,activated:It,deactivated:It,errorCaptured:It,serverPrefetch:It,components:$t,directives:$t,watch:Ft,provide:Pt,inject:jt};function Pt(t,e){return e?t?function(){return(0,o.X$)((0,o.Tn)(t)?t.call(this,this):t,(0,o.Tn)(e)?e.call(this,this):e)}:e:t}function jt(t,e){return $t(Mt(t),Mt(e))}function Mt(t){if((0,o.cy)(t)){const e={};for(let n=0;n<t.length;n++)e[t[n]]=t[n];return e}return t}function It(t,e){return t?[...new Set([].concat(t,e))]:e}function $t(t,e){return t?(0,o.X$)(Object.create(null),t,e):e}function At(t,e){return t?(0,o.cy)(t)&&(0,o.cy)(e)?[...new Set([...t,...e])]:(0,o.X$)(Object.create(null),_t(t),_t(null!=e?e:{})):e}function Ft(t,e){if(!t)return e;if(!e)return t;const n=(0,o.X$)(Object.create(null),t);for(const r in e)n[r]=It(t[r],e[r]);return n}function Rt(){return{app:null,config:{isNativeTag:o.NO,performance:!1,globalProperties:{},optionMergeStrategies:{},errorHandler:void 0,warnHandler:void 0,compilerOptions:{}},mixins:[],components:{},directives:{},provides:Object.create(null),optionsCache:new WeakMap,propsCache:new WeakMap,emitsCache:new WeakMap}}let Dt=0;function Lt(t,e){return function(n,r=null){(0,o.Tn)(n)||(n=(0,o.X$)({},n)),null==r||(0,o.Gv)(r)||(r=null);const i=Rt(),c=new WeakSet,u=[];let l=!1;const a=i.app={_uid:Dt++,_component:n,_props:r,_container:null,_context:i,_instance:null,version:An,get config(){return i.config},set config(t){0},use(t,...e){return c.has(t)||(t&&(0,o.Tn)(t.install)?(c.add(t),t.install(a,...e)):(0,o.Tn)(t)&&(c.add(t),t(a,...e))),a},mixin(t){return i.mixins.includes(t)||i.mixins.push(t),a},component(t,e){return e?(i.components[t]=e,a):i.components[t]},directive(t,e){return e?(i.directives[t]=e,a):i.directives[t]},mount(o,s,c){if(!l){0;const u=a._ceVNode||Qe(n,r);return u.appContext=i,!0===c?c="svg":!1===c&&(c=void 0),s&&e?e(u,o):t(u,o,c),l=!0,a._container=o,o.__vue_app__=a,jn(u.component)}},onUnmount(t){u.push(t)},unmount(){l&&(s(u,a._instance,16),t(null,a._container),delete a._container.__vue_app__)},provide(t,e){return i.provides[t]=e,a},runWithContext(t){const e=Nt;Nt=a;try{return t()}finally{Nt=e}}};return a}}let Nt=null;function Ut(t,e){if(hn){let n=hn.provides;const r=hn.parent&&hn.parent.provides;r===n&&(n=hn.provides=Object.create(r)),n[t]=e}else 0}function Bt(t,e,n=!1){const r=hn||C;if(r||Nt){const i=Nt?Nt._context.provides:r?null==r.parent?r.vnode.appContext&&r.vnode.appContext.provides:r.parent.provides:void 0;if(i&&t in i)return i[t];if(arguments.length>1)return n&&(0,o.Tn)(e)?e.call(r&&r.proxy):e}else 0}const Ht={},Vt=()=>Object.create(Ht),Zt=t=>Object.getPrototypeOf(t)===Ht;function Wt(t,e,n,o=!1){const i={},s=Vt();t.propsDefaults=Object.create(null),Kt(t,e,i,s);for(const r in t.propsOptions[0])r in i||(i[r]=void 0);n?t.props=o?i:(0,r.Gc)(i):t.type.props?t.props=i:t.props=s,t.attrs=s}function Gt(t,e,n,i){const{props:s,attrs:c,vnode:{patchFlag:u}}=t,l=(0,r.ux)(s),[a]=t.propsOptions;let f=!1;if(!(i||u>0)||16&u){let r;Kt(t,e,s,c)&&(f=!0);for(const i in l)e&&((0,o.$3)(e,i)||(r=(0,o.Tg)(i))!==i&&(0,o.$3)(e,r))||(a?!n||void 0===n[i]&&void 0===n[r]||(s[i]=Xt(a,l,i,void 0,t,!0)):delete s[i]);if(c!==l)for(const t in c)e&&(0,o.$3)(e,t)||(delete c[t],f=!0)}else if(8&u){const n=t.vnode.dynamicProps;for(let r=0;r<n.length;r++){let i=n[r];if(Oe(t.emitsOptions,i))continue;const u=e[i];if(a)if((0,o.$3)(c,i))u!==c[i]&&(c[i]=u,f=!0);else{const e=(0,o.PT)(i);s[e]=Xt(a,l,e,u,t,!1)}else u!==c[i]&&(c[i]=u,f=!0)}}f&&(0,r.hZ)(t.attrs,"set","")}function Kt(t,e,n,i){const[s,c]=t.propsOptions;let u,l=!1;if(e)for(let r in e){if((0,o.SU)(r))continue;const a=e[r];let f;s&&(0,o.$3)(s,f=(0,o.PT)(r))?c&&c.includes(f)?(u||(u={}))[f]=a:n[f]=a:Oe(t.emitsOptions,r)||r in i&&a===i[r]||(i[r]=a,l=!0)}if(c){const e=(0,r.ux)(n),i=u||o.MZ;for(let r=0;r<c.length;r++){const u=c[r];n[u]=Xt(s,e,u,i[u],t,!(0,o.$3)(i,u))}}return l}function Xt(t,e,n,r,i,s){const c=t[n];if(null!=c){const t=(0,o.$3)(c,"default");if(t&&void 0===r){const t=c.default;if(c.type!==Function&&!c.skipFactory&&(0,o.Tn)(t)){const{propsDefaults:o}=i;if(n in o)r=o[n];else{const s=mn(i);r=o[n]=t.call(null,e),s()}}else r=t;i.ce&&i.ce._setProp(n,r)}c[0]&&(s&&!t?r=!1:!c[1]||""!==r&&r!==(0,o.Tg)(n)||(r=!0))}return r}const zt=new WeakMap;function Yt(t,e,n=!1){const r=n?zt:e.propsCache,i=r.get(t);if(i)return i;const s=t.props,c={},u=[];let l=!1;if(!(0,o.Tn)(t)){const r=t=>{l=!0;const[n,r]=Yt(t,e,!0);(0,o.X$)(c,n),r&&u.push(...r)};!n&&e.mixins.length&&e.mixins.forEach(r),t.extends&&r(t.extends),t.mixins&&t.mixins.forEach(r)}if(!s&&!l)return(0,o.Gv)(t)&&r.set(t,o.Oj),o.Oj;if((0,o.cy)(s))for(let f=0;f<s.length;f++){0;const t=(0,o.PT)(s[f]);qt(t)&&(c[t]=o.MZ)}else if(s){0;for(const t in s){const e=(0,o.PT)(t);if(qt(e)){const n=s[t],r=c[e]=(0,o.cy)(n)||(0,o.Tn)(n)?{type:n}:(0,o.X$)({},n),i=r.type;let l=!1,a=!0;if((0,o.cy)(i))for(let t=0;t<i.length;++t){const e=i[t],n=(0,o.Tn)(e)&&e.name;if("Boolean"===n){l=!0;break}"String"===n&&(a=!1)}else l=(0,o.Tn)(i)&&"Boolean"===i.name;r[0]=l,r[1]=a,(l||(0,o.$3)(r,"default"))&&u.push(e)}}}const a=[c,u];return(0,o.Gv)(t)&&r.set(t,a),a}function qt(t){return"$"!==t[0]&&!(0,o.SU)(t)}const Jt=t=>"_"===t[0]||"$stable"===t,Qt=t=>(0,o.cy)(t)?t.map(sn):[sn(t)],te=(t,e,n)=>{if(e._n)return e;const r=k(((...t)=>Qt(e(...t))),n);return r._c=!1,r},ee=(t,e,n)=>{const r=t._ctx;for(const i in t){if(Jt(i))continue;const n=t[i];if((0,o.Tn)(n))e[i]=te(i,n,r);else if(null!=n){0;const t=Qt(n);e[i]=()=>t}}},ne=(t,e)=>{const n=Qt(e);t.slots.default=()=>n},re=(t,e,n)=>{for(const r in e)(n||"_"!==r)&&(t[r]=e[r])},oe=(t,e,n)=>{const r=t.slots=Vt();if(32&t.vnode.shapeFlag){const t=e._;t?(re(r,e,n),n&&(0,o.yQ)(r,"_",t,!0)):ee(e,r)}else e&&ne(t,e)},ie=(t,e,n)=>{const{vnode:r,slots:i}=t;let s=!0,c=o.MZ;if(32&r.shapeFlag){const t=e._;t?n&&1===t?s=!1:re(i,e,n):(s=!e.$stable,ee(e,i)),c=e}else e&&(ne(t,e),c={default:1});if(s)for(const o in i)Jt(o)||null!=c[o]||delete i[o]};function se(){"boolean"!==typeof __VUE_PROD_HYDRATION_MISMATCH_DETAILS__&&((0,o.We)().__VUE_PROD_HYDRATION_MISMATCH_DETAILS__=!1)}const ce=Ae;function ue(t){return le(t)}function le(t,e){se();const n=(0,o.We)();n.__VUE__=!0;const{insert:i,remove:s,patchProp:c,createElement:u,createText:l,createComment:a,setText:f,setElementText:p,parentNode:d,nextSibling:h,setScopeId:v=o.tE,insertStaticContent:g}=t,y=(t,e,n,r=null,o=null,i=null,s=void 0,c=null,u=!!e.dynamicChildren)=>{if(t===e)return;t&&!ze(t,e)&&(r=Q(t),X(t,o,i,!0),t=null),-2===e.patchFlag&&(u=!1,e.dynamicChildren=null);const{type:l,ref:a,shapeFlag:f}=e;switch(l){case Re:b(t,e,n,r);break;case De:_(t,e,n,r);break;case Le:null==t&&S(e,n,r,s);break;case Fe:F(t,e,n,r,o,i,s,c,u);break;default:1&f?O(t,e,n,r,o,i,s,c,u):6&f?R(t,e,n,r,o,i,s,c,u):(64&f||128&f)&&l.process(t,e,n,r,o,i,s,c,u,nt)}null!=a&&o&&H(a,t&&t.ref,i,e||t,!e)},b=(t,e,n,r)=>{if(null==t)i(e.el=l(e.children),n,r);else{const n=e.el=t.el;e.children!==t.children&&f(n,e.children)}},_=(t,e,n,r)=>{null==t?i(e.el=a(e.children||""),n,r):e.el=t.el},S=(t,e,n,r)=>{[t.el,t.anchor]=g(t.children,e,n,r,t.el,t.anchor)},T=({el:t,anchor:e},n,r)=>{let o;while(t&&t!==e)o=h(t),i(t,n,r),t=o;i(e,n,r)},C=({el:t,anchor:e})=>{let n;while(t&&t!==e)n=h(t),s(t),t=n;s(e)},O=(t,e,n,r,o,i,s,c,u)=>{"svg"===e.type?s="svg":"math"===e.type&&(s="mathml"),null==t?E(e,n,r,o,i,s,c,u):I(t,e,o,i,s,c,u)},E=(t,e,n,r,s,l,a,f)=>{let d,h;const{props:v,shapeFlag:g,transition:y,dirs:m}=t;if(d=t.el=u(t.type,l,v&&v.is,v),8&g?p(d,t.children):16&g&&M(t.children,d,null,r,s,ae(t,l),a,f),m&&P(t,null,r,"created"),k(d,t,t.scopeId,a,r),v){for(const t in v)"value"===t||(0,o.SU)(t)||c(d,t,null,v[t],l,r);"value"in v&&c(d,"value",null,v.value,l),(h=v.onVnodeBeforeMount)&&an(h,r,t)}m&&P(t,null,r,"beforeMount");const b=pe(s,y);b&&y.beforeEnter(d),i(d,e,n),((h=v&&v.onVnodeMounted)||b||m)&&ce((()=>{h&&an(h,r,t),b&&y.enter(d),m&&P(t,null,r,"mounted")}),s)},k=(t,e,n,r,o)=>{if(n&&v(t,n),r)for(let i=0;i<r.length;i++)v(t,r[i]);if(o){let n=o.subTree;if(e===n||$e(n.type)&&(n.ssContent===e||n.ssFallback===e)){const e=o.vnode;k(t,e,e.scopeId,e.slotScopeIds,o.parent)}}},M=(t,e,n,r,o,i,s,c,u=0)=>{for(let l=u;l<t.length;l++){const u=t[l]=c?cn(t[l]):sn(t[l]);y(null,u,e,n,r,o,i,s,c)}},I=(t,e,n,r,i,s,u)=>{const l=e.el=t.el;let{patchFlag:a,dynamicChildren:f,dirs:d}=e;a|=16&t.patchFlag;const h=t.props||o.MZ,v=e.props||o.MZ;let g;if(n&&fe(n,!1),(g=v.onVnodeBeforeUpdate)&&an(g,n,e,t),d&&P(e,t,n,"beforeUpdate"),n&&fe(n,!0),(h.innerHTML&&null==v.innerHTML||h.textContent&&null==v.textContent)&&p(l,""),f?$(t.dynamicChildren,f,l,n,r,ae(e,i),s):u||B(t,e,l,null,n,r,ae(e,i),s,!1),a>0){if(16&a)A(l,h,v,n,i);else if(2&a&&h.class!==v.class&&c(l,"class",null,v.class,i),4&a&&c(l,"style",h.style,v.style,i),8&a){const t=e.dynamicProps;for(let e=0;e<t.length;e++){const r=t[e],o=h[r],s=v[r];s===o&&"value"!==r||c(l,r,o,s,i,n)}}1&a&&t.children!==e.children&&p(l,e.children)}else u||null!=f||A(l,h,v,n,i);((g=v.onVnodeUpdated)||d)&&ce((()=>{g&&an(g,n,e,t),d&&P(e,t,n,"updated")}),r)},$=(t,e,n,r,o,i,s)=>{for(let c=0;c<e.length;c++){const u=t[c],l=e[c],a=u.el&&(u.type===Fe||!ze(u,l)||70&u.shapeFlag)?d(u.el):n;y(u,l,a,null,r,o,i,s,!0)}},A=(t,e,n,r,i)=>{if(e!==n){if(e!==o.MZ)for(const s in e)(0,o.SU)(s)||s in n||c(t,s,e[s],null,i,r);for(const s in n){if((0,o.SU)(s))continue;const u=n[s],l=e[s];u!==l&&"value"!==s&&c(t,s,l,u,i,r)}"value"in n&&c(t,"value",e.value,n.value,i)}},F=(t,e,n,r,o,s,c,u,a)=>{const f=e.el=t?t.el:l(""),p=e.anchor=t?t.anchor:l("");let{patchFlag:d,dynamicChildren:h,slotScopeIds:v}=e;v&&(u=u?u.concat(v):v),null==t?(i(f,n,r),i(p,n,r),M(e.children||[],n,p,o,s,c,u,a)):d>0&&64&d&&h&&t.dynamicChildren?($(t.dynamicChildren,h,n,o,s,c,u),(null!=e.key||o&&e===o.subTree)&&de(t,e,!0)):B(t,e,n,p,o,s,c,u,a)},R=(t,e,n,r,o,i,s,c,u)=>{e.slotScopeIds=c,null==t?512&e.shapeFlag?o.ctx.activate(e,n,r,s,u):D(e,n,r,o,i,s,u):L(t,e,u)},D=(t,e,n,r,o,i,s)=>{const c=t.component=dn(t,r,o);if(Z(t)&&(c.ctx.renderer=nt),Tn(c,!1,s),c.asyncDep){if(o&&o.registerDep(c,N,s),!t.el){const t=c.subTree=Qe(De);_(null,t,e,n)}}else N(c,t,e,n,o,i,s)},L=(t,e,n)=>{const r=e.component=t.component;if(je(t,e,n)){if(r.asyncDep&&!r.asyncResolved)return void U(r,e,n);r.next=e,r.update()}else e.el=t.el,r.vnode=e},N=(t,e,n,i,s,c,u)=>{const l=()=>{if(t.isMounted){let{next:e,bu:n,u:r,parent:i,vnode:a}=t;{const n=ve(t);if(n)return e&&(e.el=a.el,U(t,e,u)),void n.asyncDep.then((()=>{t.isUnmounted||l()}))}let f,p=e;0,fe(t,!1),e?(e.el=a.el,U(t,e,u)):e=a,n&&(0,o.DY)(n),(f=e.props&&e.props.onVnodeBeforeUpdate)&&an(f,i,e,a),fe(t,!0);const h=Ee(t);0;const v=t.subTree;t.subTree=h,y(v,h,d(v.el),Q(v),t,s,c),e.el=h.el,null===p&&Ie(t,h.el),r&&ce(r,s),(f=e.props&&e.props.onVnodeUpdated)&&ce((()=>an(f,i,e,a)),s)}else{let r;const{el:u,props:l}=e,{bm:a,m:f,parent:p,root:d,type:h}=t,v=V(e);if(fe(t,!1),a&&(0,o.DY)(a),!v&&(r=l&&l.onVnodeBeforeMount)&&an(r,p,e),fe(t,!0),u&&ot){const e=()=>{t.subTree=Ee(t),ot(u,t.subTree,t,s,null)};v&&h.__asyncHydrate?h.__asyncHydrate(u,t,e):e()}else{d.ce&&d.ce._injectChildStyle(h);const r=t.subTree=Ee(t);0,y(null,r,n,i,t,s,c),e.el=r.el}if(f&&ce(f,s),!v&&(r=l&&l.onVnodeMounted)){const t=e;ce((()=>an(r,p,t)),s)}(256&e.shapeFlag||p&&V(p.vnode)&&256&p.vnode.shapeFlag)&&t.a&&ce(t.a,s),t.isMounted=!0,e=n=i=null}};t.scope.on();const a=t.effect=new r.X2(l);t.scope.off();const f=t.update=a.run.bind(a),p=t.job=a.runIfDirty.bind(a);p.i=t,p.id=t.uid,a.scheduler=()=>m(p),fe(t,!0),f()},U=(t,e,n)=>{e.component=t;const o=t.vnode.props;t.vnode=e,t.next=null,Gt(t,e.props,o,n),ie(t,e.children,n),(0,r.C4)(),x(t),(0,r.bl)()},B=(t,e,n,r,o,i,s,c,u=!1)=>{const l=t&&t.children,a=t?t.shapeFlag:0,f=e.children,{patchFlag:d,shapeFlag:h}=e;if(d>0){if(128&d)return void G(l,f,n,r,o,i,s,c,u);if(256&d)return void W(l,f,n,r,o,i,s,c,u)}8&h?(16&a&&J(l,o,i),f!==l&&p(n,f)):16&a?16&h?G(l,f,n,r,o,i,s,c,u):J(l,o,i,!0):(8&a&&p(n,""),16&h&&M(f,n,r,o,i,s,c,u))},W=(t,e,n,r,i,s,c,u,l)=>{t=t||o.Oj,e=e||o.Oj;const a=t.length,f=e.length,p=Math.min(a,f);let d;for(d=0;d<p;d++){const r=e[d]=l?cn(e[d]):sn(e[d]);y(t[d],r,n,null,i,s,c,u,l)}a>f?J(t,i,s,!0,!1,p):M(e,n,r,i,s,c,u,l,p)},G=(t,e,n,r,i,s,c,u,l)=>{let a=0;const f=e.length;let p=t.length-1,d=f-1;while(a<=p&&a<=d){const r=t[a],o=e[a]=l?cn(e[a]):sn(e[a]);if(!ze(r,o))break;y(r,o,n,null,i,s,c,u,l),a++}while(a<=p&&a<=d){const r=t[p],o=e[d]=l?cn(e[d]):sn(e[d]);if(!ze(r,o))break;y(r,o,n,null,i,s,c,u,l),p--,d--}if(a>p){if(a<=d){const t=d+1,o=t<f?e[t].el:r;while(a<=d)y(null,e[a]=l?cn(e[a]):sn(e[a]),n,o,i,s,c,u,l),a++}}else if(a>d)while(a<=p)X(t[a],i,s,!0),a++;else{const h=a,v=a,g=new Map;for(a=v;a<=d;a++){const t=e[a]=l?cn(e[a]):sn(e[a]);null!=t.key&&g.set(t.key,a)}let m,b=0;const _=d-v+1;let x=!1,w=0;const S=new Array(_);for(a=0;a<_;a++)S[a]=0;for(a=h;a<=p;a++){const r=t[a];if(b>=_){X(r,i,s,!0);continue}let o;if(null!=r.key)o=g.get(r.key);else for(m=v;m<=d;m++)if(0===S[m-v]&&ze(r,e[m])){o=m;break}void 0===o?X(r,i,s,!0):(S[o-v]=a+1,o>=w?w=o:x=!0,y(r,e[o],n,null,i,s,c,u,l),b++)}const T=x?he(S):o.Oj;for(m=T.length-1,a=_-1;a>=0;a--){const t=v+a,o=e[t],p=t+1<f?e[t+1].el:r;0===S[a]?y(null,o,n,p,i,s,c,u,l):x&&(m<0||a!==T[m]?K(o,n,p,2):m--)}}},K=(t,e,n,r,o=null)=>{const{el:s,type:c,transition:u,children:l,shapeFlag:a}=t;if(6&a)return void K(t.component.subTree,e,n,r);if(128&a)return void t.suspense.move(e,n,r);if(64&a)return void c.move(t,e,n,nt);if(c===Fe){i(s,e,n);for(let t=0;t<l.length;t++)K(l[t],e,n,r);return void i(t.anchor,e,n)}if(c===Le)return void T(t,e,n);const f=2!==r&&1&a&&u;if(f)if(0===r)u.beforeEnter(s),i(s,e,n),ce((()=>u.enter(s)),o);else{const{leave:t,delayLeave:r,afterLeave:o}=u,c=()=>i(s,e,n),l=()=>{t(s,(()=>{c(),o&&o()}))};r?r(s,c,l):l()}else i(s,e,n)},X=(t,e,n,r=!1,o=!1)=>{const{type:i,props:s,ref:c,children:u,dynamicChildren:l,shapeFlag:a,patchFlag:f,dirs:p,cacheIndex:d}=t;if(-2===f&&(o=!1),null!=c&&H(c,null,n,t,!0),null!=d&&(e.renderCache[d]=void 0),256&a)return void e.ctx.deactivate(t);const h=1&a&&p,v=!V(t);let g;if(v&&(g=s&&s.onVnodeBeforeUnmount)&&an(g,e,t),6&a)q(t.component,n,r);else{if(128&a)return void t.suspense.unmount(n,r);h&&P(t,null,e,"beforeUnmount"),64&a?t.type.remove(t,e,n,nt,r):l&&!l.hasOnce&&(i!==Fe||f>0&&64&f)?J(l,e,n,!1,!0):(i===Fe&&384&f||!o&&16&a)&&J(u,e,n),r&&z(t)}(v&&(g=s&&s.onVnodeUnmounted)||h)&&ce((()=>{g&&an(g,e,t),h&&P(t,null,e,"unmounted")}),n)},z=t=>{const{type:e,el:n,anchor:r,transition:o}=t;if(e===Fe)return void Y(n,r);if(e===Le)return void C(t);const i=()=>{s(n),o&&!o.persisted&&o.afterLeave&&o.afterLeave()};if(1&t.shapeFlag&&o&&!o.persisted){const{leave:e,delayLeave:r}=o,s=()=>e(n,i);r?r(t.el,i,s):s()}else i()},Y=(t,e)=>{let n;while(t!==e)n=h(t),s(t),t=n;s(e)},q=(t,e,n)=>{const{bum:r,scope:i,job:s,subTree:c,um:u,m:l,a:a}=t;ge(l),ge(a),r&&(0,o.DY)(r),i.stop(),s&&(s.flags|=8,X(c,t,e,n)),u&&ce(u,e),ce((()=>{t.isUnmounted=!0}),e),e&&e.pendingBranch&&!e.isUnmounted&&t.asyncDep&&!t.asyncResolved&&t.suspenseId===e.pendingId&&(e.deps--,0===e.deps&&e.resolve())},J=(t,e,n,r=!1,o=!1,i=0)=>{for(let s=i;s<t.length;s++)X(t[s],e,n,r,o)},Q=t=>{if(6&t.shapeFlag)return Q(t.component.subTree);if(128&t.shapeFlag)return t.suspense.next();const e=h(t.anchor||t.el),n=e&&e[j];return n?h(n):e};let tt=!1;const et=(t,e,n)=>{null==t?e._vnode&&X(e._vnode,null,null,!0):y(e._vnode||null,t,e,null,null,null,n),e._vnode=t,tt||(tt=!0,x(),w(),tt=!1)},nt={p:y,um:X,m:K,r:z,mt:D,mc:M,pc:B,pbc:$,n:Q,o:t};let rt,ot;return e&&([rt,ot]=e(nt)),{render:et,hydrate:rt,createApp:Lt(et,rt)}}function ae({type:t,props:e},n){return"svg"===n&&"foreignObject"===t||"mathml"===n&&"annotation-xml"===t&&e&&e.encoding&&e.encoding.includes("html")?void 0:n}function fe({effect:t,job:e},n){n?(t.flags|=32,e.flags|=4):(t.flags&=-33,e.flags&=-5)}function pe(t,e){return(!t||t&&!t.pendingBranch)&&e&&!e.persisted}function de(t,e,n=!1){const r=t.children,i=e.children;if((0,o.cy)(r)&&(0,o.cy)(i))for(let o=0;o<r.length;o++){const t=r[o];let e=i[o];1&e.shapeFlag&&!e.dynamicChildren&&((e.patchFlag<=0||32===e.patchFlag)&&(e=i[o]=cn(i[o]),e.el=t.el),n||-2===e.patchFlag||de(t,e)),e.type===Re&&(e.el=t.el)}}function he(t){const e=t.slice(),n=[0];let r,o,i,s,c;const u=t.length;for(r=0;r<u;r++){const u=t[r];if(0!==u){if(o=n[n.length-1],t[o]<u){e[r]=o,n.push(r);continue}i=0,s=n.length-1;while(i<s)c=i+s>>1,t[n[c]]<u?i=c+1:s=c;u<t[n[i]]&&(i>0&&(e[r]=n[i-1]),n[i]=r)}}i=n.length,s=n[i-1];while(i-- >0)n[i]=s,s=e[s];return n}function ve(t){const e=t.subTree.component;if(e)return e.asyncDep&&!e.asyncResolved?e:ve(e)}function ge(t){if(t)for(let e=0;e<t.length;e++)t[e].flags|=8}const ye=Symbol.for("v-scx"),me=()=>{{const t=Bt(ye);return t}};function be(t,e,n){return _e(t,e,n)}function _e(t,e,n=o.MZ){const{immediate:i,deep:c,flush:u,once:l}=n;const a=(0,o.X$)({},n);const f=e&&i||!e&&"post"!==u;let p;if(Sn)if("sync"===u){const t=me();p=t.__watcherHandles||(t.__watcherHandles=[])}else if(!f){const t=()=>{};return t.stop=o.tE,t.resume=o.tE,t.pause=o.tE,t}const d=hn;a.call=(t,e,n)=>s(t,d,e,n);let h=!1;"post"===u?a.scheduler=t=>{ce(t,d&&d.suspense)}:"sync"!==u&&(h=!0,a.scheduler=(t,e)=>{e?t():m(t)}),a.augmentJob=t=>{e&&(t.flags|=4),h&&(t.flags|=2,d&&(t.id=d.uid,t.i=d))};const v=(0,r.wB)(t,e,a);return Sn&&(p?p.push(v):f&&v()),v}function xe(t,e,n){const r=this.proxy,i=(0,o.Kg)(t)?t.includes(".")?we(r,t):()=>r[t]:t.bind(r,r);let s;(0,o.Tn)(e)?s=e:(s=e.handler,n=e);const c=mn(this),u=_e(i,s.bind(r),n);return c(),u}function we(t,e){const n=e.split(".");return()=>{let e=t;for(let t=0;t<n.length&&e;t++)e=e[n[t]];return e}}const Se=(t,e)=>"modelValue"===e||"model-value"===e?t.modelModifiers:t[`${e}Modifiers`]||t[`${(0,o.PT)(e)}Modifiers`]||t[`${(0,o.Tg)(e)}Modifiers`];function Te(t,e,...n){if(t.isUnmounted)return;const r=t.vnode.props||o.MZ;let i=n;const c=e.startsWith("update:"),u=c&&Se(r,e.slice(7));let l;u&&(u.trim&&(i=n.map((t=>(0,o.Kg)(t)?t.trim():t))),u.number&&(i=n.map(o.bB)));let a=r[l=(0,o.rU)(e)]||r[l=(0,o.rU)((0,o.PT)(e))];!a&&c&&(a=r[l=(0,o.rU)((0,o.Tg)(e))]),a&&s(a,t,6,i);const f=r[l+"Once"];if(f){if(t.emitted){if(t.emitted[l])return}else t.emitted={};t.emitted[l]=!0,s(f,t,6,i)}}function Ce(t,e,n=!1){const r=e.emitsCache,i=r.get(t);if(void 0!==i)return i;const s=t.emits;let c={},u=!1;if(!(0,o.Tn)(t)){const r=t=>{const n=Ce(t,e,!0);n&&(u=!0,(0,o.X$)(c,n))};!n&&e.mixins.length&&e.mixins.forEach(r),t.extends&&r(t.extends),t.mixins&&t.mixins.forEach(r)}return s||u?((0,o.cy)(s)?s.forEach((t=>c[t]=null)):(0,o.X$)(c,s),(0,o.Gv)(t)&&r.set(t,c),c):((0,o.Gv)(t)&&r.set(t,null),null)}function Oe(t,e){return!(!t||!(0,o.Mp)(e))&&(e=e.slice(2).replace(/Once$/,""),(0,o.$3)(t,e[0].toLowerCase()+e.slice(1))||(0,o.$3)(t,(0,o.Tg)(e))||(0,o.$3)(t,e))}function Ee(t){const{type:e,vnode:n,proxy:r,withProxy:i,propsOptions:[s],slots:u,attrs:l,emit:a,render:f,renderCache:p,props:d,data:h,setupState:v,ctx:g,inheritAttrs:y}=t,m=E(t);let b,_;try{if(4&n.shapeFlag){const t=i||r,e=t;b=sn(f.call(e,t,p,d,v,h,g)),_=l}else{const t=e;0,b=sn(t.length>1?t(d,{attrs:l,slots:u,emit:a}):t(d,null)),_=e.props?l:ke(l)}}catch(w){Ne.length=0,c(w,t,1),b=Qe(De)}let x=b;if(_&&!1!==y){const t=Object.keys(_),{shapeFlag:e}=x;t.length&&7&e&&(s&&t.some(o.CP)&&(_=Pe(_,s)),x=nn(x,_,!1,!0))}return n.dirs&&(x=nn(x,null,!1,!0),x.dirs=x.dirs?x.dirs.concat(n.dirs):n.dirs),n.transition&&N(x,n.transition),b=x,E(m),b}const ke=t=>{let e;for(const n in t)("class"===n||"style"===n||(0,o.Mp)(n))&&((e||(e={}))[n]=t[n]);return e},Pe=(t,e)=>{const n={};for(const r in t)(0,o.CP)(r)&&r.slice(9)in e||(n[r]=t[r]);return n};function je(t,e,n){const{props:r,children:o,component:i}=t,{props:s,children:c,patchFlag:u}=e,l=i.emitsOptions;if(e.dirs||e.transition)return!0;if(!(n&&u>=0))return!(!o&&!c||c&&c.$stable)||r!==s&&(r?!s||Me(r,s,l):!!s);if(1024&u)return!0;if(16&u)return r?Me(r,s,l):!!s;if(8&u){const t=e.dynamicProps;for(let e=0;e<t.length;e++){const n=t[e];if(s[n]!==r[n]&&!Oe(l,n))return!0}}return!1}function Me(t,e,n){const r=Object.keys(e);if(r.length!==Object.keys(t).length)return!0;for(let o=0;o<r.length;o++){const i=r[o];if(e[i]!==t[i]&&!Oe(n,i))return!0}return!1}function Ie({vnode:t,parent:e},n){while(e){const r=e.subTree;if(r.suspense&&r.suspense.activeBranch===t&&(r.el=t.el),r!==t)break;(t=e.vnode).el=n,e=e.parent}}const $e=t=>t.__isSuspense;function Ae(t,e){e&&e.pendingBranch?(0,o.cy)(t)?e.effects.push(...t):e.effects.push(t):_(t)}const Fe=Symbol.for("v-fgt"),Re=Symbol.for("v-txt"),De=Symbol.for("v-cmt"),Le=Symbol.for("v-stc"),Ne=[];let Ue=null;function Be(t=!1){Ne.push(Ue=t?null:[])}function He(){Ne.pop(),Ue=Ne[Ne.length-1]||null}let Ve=1;function Ze(t,e=!1){Ve+=t,t<0&&Ue&&e&&(Ue.hasOnce=!0)}function We(t){return t.dynamicChildren=Ve>0?Ue||o.Oj:null,He(),Ve>0&&Ue&&Ue.push(t),t}function Ge(t,e,n,r,o,i){return We(Je(t,e,n,r,o,i,!0))}function Ke(t,e,n,r,o){return We(Qe(t,e,n,r,o,!0))}function Xe(t){return!!t&&!0===t.__v_isVNode}function ze(t,e){return t.type===e.type&&t.key===e.key}const Ye=({key:t})=>null!=t?t:null,qe=({ref:t,ref_key:e,ref_for:n})=>("number"===typeof t&&(t=""+t),null!=t?(0,o.Kg)(t)||(0,r.i9)(t)||(0,o.Tn)(t)?{i:C,r:t,k:e,f:!!n}:t:null);function Je(t,e=null,n=null,r=0,i=null,s=(t===Fe?0:1),c=!1,u=!1){const l={__v_isVNode:!0,__v_skip:!0,type:t,props:e,key:e&&Ye(e),ref:e&&qe(e),scopeId:O,slotScopeIds:null,children:n,component:null,suspense:null,ssContent:null,ssFallback:null,dirs:null,transition:null,el:null,anchor:null,target:null,targetStart:null,targetAnchor:null,staticCount:0,shapeFlag:s,patchFlag:r,dynamicProps:i,dynamicChildren:null,appContext:null,ctx:C};return u?(un(l,n),128&s&&t.normalize(l)):n&&(l.shapeFlag|=(0,o.Kg)(n)?8:16),Ve>0&&!c&&Ue&&(l.patchFlag>0||6&s)&&32!==l.patchFlag&&Ue.push(l),l}const Qe=tn;function tn(t,e=null,n=null,i=0,s=null,c=!1){if(t&&t!==pt||(t=De),Xe(t)){const r=nn(t,e,!0);return n&&un(r,n),Ve>0&&!c&&Ue&&(6&r.shapeFlag?Ue[Ue.indexOf(t)]=r:Ue.push(r)),r.patchFlag=-2,r}if(In(t)&&(t=t.__vccOpts),e){e=en(e);let{class:t,style:n}=e;t&&!(0,o.Kg)(t)&&(e.class=(0,o.C4)(t)),(0,o.Gv)(n)&&((0,r.ju)(n)&&!(0,o.cy)(n)&&(n=(0,o.X$)({},n)),e.style=(0,o.Tr)(n))}const u=(0,o.Kg)(t)?1:$e(t)?128:M(t)?64:(0,o.Gv)(t)?4:(0,o.Tn)(t)?2:0;return Je(t,e,n,i,s,u,c,!0)}function en(t){return t?(0,r.ju)(t)||Zt(t)?(0,o.X$)({},t):t:null}function nn(t,e,n=!1,r=!1){const{props:i,ref:s,patchFlag:c,children:u,transition:l}=t,a=e?ln(i||{},e):i,f={__v_isVNode:!0,__v_skip:!0,type:t.type,props:a,key:a&&Ye(a),ref:e&&e.ref?n&&s?(0,o.cy)(s)?s.concat(qe(e)):[s,qe(e)]:qe(e):s,scopeId:t.scopeId,slotScopeIds:t.slotScopeIds,children:u,target:t.target,targetStart:t.targetStart,targetAnchor:t.targetAnchor,staticCount:t.staticCount,shapeFlag:t.shapeFlag,patchFlag:e&&t.type!==Fe?-1===c?16:16|c:c,dynamicProps:t.dynamicProps,dynamicChildren:t.dynamicChildren,appContext:t.appContext,dirs:t.dirs,transition:l,component:t.component,suspense:t.suspense,ssContent:t.ssContent&&nn(t.ssContent),ssFallback:t.ssFallback&&nn(t.ssFallback),el:t.el,anchor:t.anchor,ctx:t.ctx,ce:t.ce};return l&&r&&N(f,l.clone(f)),f}function rn(t=" ",e=0){return Qe(Re,null,t,e)}function on(t="",e=!1){return e?(Be(),Ke(De,null,t)):Qe(De,null,t)}function sn(t){return null==t||"boolean"===typeof t?Qe(De):(0,o.cy)(t)?Qe(Fe,null,t.slice()):Xe(t)?cn(t):Qe(Re,null,String(t))}function cn(t){return null===t.el&&-1!==t.patchFlag||t.memo?t:nn(t)}function un(t,e){let n=0;const{shapeFlag:r}=t;if(null==e)e=null;else if((0,o.cy)(e))n=16;else if("object"===typeof e){if(65&r){const n=e.default;return void(n&&(n._c&&(n._d=!1),un(t,n()),n._c&&(n._d=!0)))}{n=32;const r=e._;r||Zt(e)?3===r&&C&&(1===C.slots._?e._=1:(e._=2,t.patchFlag|=1024)):e._ctx=C}}else(0,o.Tn)(e)?(e={default:e,_ctx:C},n=32):(e=String(e),64&r?(n=16,e=[rn(e)]):n=8);t.children=e,t.shapeFlag|=n}function ln(...t){const e={};for(let n=0;n<t.length;n++){const r=t[n];for(const t in r)if("class"===t)e.class!==r.class&&(e.class=(0,o.C4)([e.class,r.class]));else if("style"===t)e.style=(0,o.Tr)([e.style,r.style]);else if((0,o.Mp)(t)){const n=e[t],i=r[t];!i||n===i||(0,o.cy)(n)&&n.includes(i)||(e[t]=n?[].concat(n,i):i)}else""!==t&&(e[t]=r[t])}return e}function an(t,e,n,r=null){s(t,e,7,[n,r])}const fn=Rt();let pn=0;function dn(t,e,n){const i=t.type,s=(e?e.appContext:t.appContext)||fn,c={uid:pn++,vnode:t,type:i,parent:e,appContext:s,root:null,next:null,subTree:null,effect:null,update:null,job:null,scope:new r.yC(!0),render:null,proxy:null,exposed:null,exposeProxy:null,withProxy:null,provides:e?e.provides:Object.create(s.provides),ids:e?e.ids:["",0,0],accessCache:null,renderCache:[],components:null,directives:null,propsOptions:Yt(i,s),emitsOptions:Ce(i,s),emit:null,emitted:null,propsDefaults:o.MZ,inheritAttrs:i.inheritAttrs,ctx:o.MZ,data:o.MZ,props:o.MZ,attrs:o.MZ,slots:o.MZ,refs:o.MZ,setupState:o.MZ,setupContext:null,suspense:n,suspenseId:n?n.pendingId:0,asyncDep:null,asyncResolved:!1,isMounted:!1,isUnmounted:!1,isDeactivated:!1,bc:null,c:null,bm:null,m:null,bu:null,u:null,um:null,bum:null,da:null,a:null,rtg:null,rtc:null,ec:null,sp:null};return c.ctx={_:c},c.root=e?e.root:c,c.emit=Te.bind(null,c),t.ce&&t.ce(c),c}let hn=null;const vn=()=>hn||C;let gn,yn;{const t=(0,o.We)(),e=(e,n)=>{let r;return(r=t[e])||(r=t[e]=[]),r.push(n),t=>{r.length>1?r.forEach((e=>e(t))):r[0](t)}};gn=e("__VUE_INSTANCE_SETTERS__",(t=>hn=t)),yn=e("__VUE_SSR_SETTERS__",(t=>Sn=t))}const mn=t=>{const e=hn;return gn(t),t.scope.on(),()=>{t.scope.off(),gn(e)}},bn=()=>{hn&&hn.scope.off(),gn(null)};function _n(t){return 4&t.vnode.shapeFlag}let xn,wn,Sn=!1;function Tn(t,e=!1,n=!1){e&&yn(e);const{props:r,children:o}=t.vnode,i=_n(t);Wt(t,r,i,e),oe(t,o,n);const s=i?Cn(t,e):void 0;return e&&yn(!1),s}function Cn(t,e){const n=t.type;t.accessCache=Object.create(null),t.proxy=new Proxy(t.ctx,bt);const{setup:s}=n;if(s){(0,r.C4)();const n=t.setupContext=s.length>1?Pn(t):null,u=mn(t),l=i(s,t,0,[t.props,n]),a=(0,o.yL)(l);if((0,r.bl)(),u(),!a&&!t.sp||V(t)||B(t),a){if(l.then(bn,bn),e)return l.then((n=>{On(t,n,e)})).catch((e=>{c(e,t,0)}));t.asyncDep=l}else On(t,l,e)}else En(t,e)}function On(t,e,n){(0,o.Tn)(e)?t.type.__ssrInlineRender?t.ssrRender=e:t.render=e:(0,o.Gv)(e)&&(t.setupState=(0,r.Pr)(e)),En(t,n)}function En(t,e,n){const i=t.type;if(!t.render){if(!e&&xn&&!i.render){const e=i.template||Ot(t).template;if(e){0;const{isCustomElement:n,compilerOptions:r}=t.appContext.config,{delimiters:s,compilerOptions:c}=i,u=(0,o.X$)((0,o.X$)({isCustomElement:n,delimiters:s},r),c);i.render=xn(e,u)}}t.render=i.render||o.tE,wn&&wn(t)}{const e=mn(t);(0,r.C4)();try{wt(t)}finally{(0,r.bl)(),e()}}}const kn={get(t,e){return(0,r.u4)(t,"get",""),t[e]}};function Pn(t){const e=e=>{t.exposed=e||{}};return{attrs:new Proxy(t.attrs,kn),slots:t.slots,emit:t.emit,expose:e}}function jn(t){return t.exposed?t.exposeProxy||(t.exposeProxy=new Proxy((0,r.Pr)((0,r.IG)(t.exposed)),{get(e,n){return n in e?e[n]:n in yt?yt[n](t):void 0},has(t,e){return e in t||e in yt}})):t.proxy}function Mn(t,e=!0){return(0,o.Tn)(t)?t.displayName||t.name:t.name||e&&t.__name}function In(t){return(0,o.Tn)(t)&&"__vccOpts"in t}const $n=(t,e)=>{const n=(0,r.EW)(t,e,Sn);return n};const An="3.5.13"},679:function(t,e,n){var r=n(1625),o=TypeError;t.exports=function(t,e){if(r(e,t))return t;throw new o("Incorrect invocation")}},741:function(t){var e=Math.ceil,n=Math.floor;t.exports=Math.trunc||function(t){var r=+t;return(r>0?n:e)(r)}},757:function(t,e,n){var r=n(7751),o=n(4901),i=n(1625),s=n(7040),c=Object;t.exports=s?function(t){return"symbol"==typeof t}:function(t){var e=r("Symbol");return o(e)&&i(e.prototype,c(t))}},851:function(t,e,n){var r=n(6955),o=n(5966),i=n(4117),s=n(6269),c=n(8227),u=c("iterator");t.exports=function(t){if(!i(t))return o(t,u)||o(t,"@@iterator")||s[r(t)]}},953:function(t,e,n){n.d(e,{C4:function(){return T},EW:function(){return $t},Gc:function(){return yt},IG:function(){return Ct},Kh:function(){return gt},Pr:function(){return Mt},R1:function(){return Pt},X2:function(){return l},bl:function(){return C},fE:function(){return wt},g8:function(){return _t},hZ:function(){return R},i9:function(){return kt},ju:function(){return St},lJ:function(){return Ot},qA:function(){return L},u4:function(){return F},ux:function(){return Tt},wB:function(){return Lt},yC:function(){return s}});var r=n(33);
 /**
 * @vue/reactivity v3.5.13
 * (c) 2018-present Yuxi (Evan) You and Vue contributors
 * @license MIT
-**/let o,i;class s{constructor(t=!1){this.detached=t,this._active=!0,this.effects=[],this.cleanups=[],this._isPaused=!1,this.parent=o,!t&&o&&(this.index=(o.scopes||(o.scopes=[])).push(this)-1)}get active(){return this._active}pause(){if(this._active){let t,e;if(this._isPaused=!0,this.scopes)for(t=0,e=this.scopes.length;t<e;t++)this.scopes[t].pause();for(t=0,e=this.effects.length;t<e;t++)this.effects[t].pause()}}resume(){if(this._active&&this._isPaused){let t,e;if(this._isPaused=!1,this.scopes)for(t=0,e=this.scopes.length;t<e;t++)this.scopes[t].resume();for(t=0,e=this.effects.length;t<e;t++)this.effects[t].resume()}}run(t){if(this._active){const e=o;try{return o=this,t()}finally{o=e}}else 0}on(){o=this}off(){o=this.parent}stop(t){if(this._active){let e,n;for(this._active=!1,e=0,n=this.effects.length;e<n;e++)this.effects[e].stop();for(this.effects.length=0,e=0,n=this.cleanups.length;e<n;e++)this.cleanups[e]();if(this.cleanups.length=0,this.scopes){for(e=0,n=this.scopes.length;e<n;e++)this.scopes[e].stop(!0);this.scopes.length=0}if(!this.detached&&this.parent&&!t){const t=this.parent.scopes.pop();t&&t!==this&&(this.parent.scopes[this.index]=t,t.index=this.index)}this.parent=void 0}}}function c(){return o}const l=new WeakSet;class u{constructor(t){this.fn=t,this.deps=void 0,this.depsTail=void 0,this.flags=5,this.next=void 0,this.cleanup=void 0,this.scheduler=void 0,o&&o.active&&o.effects.push(this)}pause(){this.flags|=64}resume(){64&this.flags&&(this.flags&=-65,l.has(this)&&(l.delete(this),this.trigger()))}notify(){2&this.flags&&!(32&this.flags)||8&this.flags||d(this)}run(){if(!(1&this.flags))return this.fn();this.flags|=2,O(this),g(this);const t=i,e=w;i=this,w=!0;try{return this.fn()}finally{0,y(this),i=t,w=e,this.flags&=-3}}stop(){if(1&this.flags){for(let t=this.deps;t;t=t.nextDep)_(t);this.deps=this.depsTail=void 0,O(this),this.onStop&&this.onStop(),this.flags&=-2}}trigger(){64&this.flags?l.add(this):this.scheduler?this.scheduler():this.runIfDirty()}runIfDirty(){m(this)&&this.run()}get dirty(){return m(this)}}let a,f,p=0;function d(t,e=!1){if(t.flags|=8,e)return t.next=f,void(f=t);t.next=a,a=t}function h(){p++}function v(){if(--p>0)return;if(f){let t=f;f=void 0;while(t){const e=t.next;t.next=void 0,t.flags&=-9,t=e}}let t;while(a){let n=a;a=void 0;while(n){const r=n.next;if(n.next=void 0,n.flags&=-9,1&n.flags)try{n.trigger()}catch(e){t||(t=e)}n=r}}if(t)throw t}function g(t){for(let e=t.deps;e;e=e.nextDep)e.version=-1,e.prevActiveLink=e.dep.activeLink,e.dep.activeLink=e}function y(t){let e,n=t.depsTail,r=n;while(r){const t=r.prevDep;-1===r.version?(r===n&&(n=t),_(r),x(r)):e=r,r.dep.activeLink=r.prevActiveLink,r.prevActiveLink=void 0,r=t}t.deps=e,t.depsTail=n}function m(t){for(let e=t.deps;e;e=e.nextDep)if(e.dep.version!==e.version||e.dep.computed&&(b(e.dep.computed)||e.dep.version!==e.version))return!0;return!!t._dirty}function b(t){if(4&t.flags&&!(16&t.flags))return;if(t.flags&=-17,t.globalVersion===E)return;t.globalVersion=E;const e=t.dep;if(t.flags|=2,e.version>0&&!t.isSSR&&t.deps&&!m(t))return void(t.flags&=-3);const n=i,o=w;i=t,w=!0;try{g(t);const n=t.fn(t._value);(0===e.version||(0,r.$H)(n,t._value))&&(t._value=n,e.version++)}catch(s){throw e.version++,s}finally{i=n,w=o,y(t),t.flags&=-3}}function _(t,e=!1){const{dep:n,prevSub:r,nextSub:o}=t;if(r&&(r.nextSub=o,t.prevSub=void 0),o&&(o.prevSub=r,t.nextSub=void 0),n.subs===t&&(n.subs=r,!r&&n.computed)){n.computed.flags&=-5;for(let t=n.computed.deps;t;t=t.nextDep)_(t,!0)}e||--n.sc||!n.map||n.map.delete(n.key)}function x(t){const{prevDep:e,nextDep:n}=t;e&&(e.nextDep=n,t.prevDep=void 0),n&&(n.prevDep=e,t.nextDep=void 0)}let w=!0;const S=[];function T(){S.push(w),w=!1}function C(){const t=S.pop();w=void 0===t||t}function O(t){const{cleanup:e}=t;if(t.cleanup=void 0,e){const t=i;i=void 0;try{e()}finally{i=t}}}let E=0;class k{constructor(t,e){this.sub=t,this.dep=e,this.version=e.version,this.nextDep=this.prevDep=this.nextSub=this.prevSub=this.prevActiveLink=void 0}}class j{constructor(t){this.computed=t,this.version=0,this.activeLink=void 0,this.subs=void 0,this.map=void 0,this.key=void 0,this.sc=0}track(t){if(!i||!w||i===this.computed)return;let e=this.activeLink;if(void 0===e||e.sub!==i)e=this.activeLink=new k(i,this),i.deps?(e.prevDep=i.depsTail,i.depsTail.nextDep=e,i.depsTail=e):i.deps=i.depsTail=e,P(e);else if(-1===e.version&&(e.version=this.version,e.nextDep)){const t=e.nextDep;t.prevDep=e.prevDep,e.prevDep&&(e.prevDep.nextDep=t),e.prevDep=i.depsTail,e.nextDep=void 0,i.depsTail.nextDep=e,i.depsTail=e,i.deps===e&&(i.deps=t)}return e}trigger(t){this.version++,E++,this.notify(t)}notify(t){h();try{0;for(let t=this.subs;t;t=t.prevSub)t.sub.notify()&&t.sub.dep.notify()}finally{v()}}}function P(t){if(t.dep.sc++,4&t.sub.flags){const e=t.dep.computed;if(e&&!t.dep.subs){e.flags|=20;for(let t=e.deps;t;t=t.nextDep)P(t)}const n=t.dep.subs;n!==t&&(t.prevSub=n,n&&(n.nextSub=t)),t.dep.subs=t}}const M=new WeakMap,$=Symbol(""),A=Symbol(""),I=Symbol("");function F(t,e,n){if(w&&i){let e=M.get(t);e||M.set(t,e=new Map);let r=e.get(n);r||(e.set(n,r=new j),r.map=e,r.key=n),r.track()}}function R(t,e,n,o,i,s){const c=M.get(t);if(!c)return void E++;const l=t=>{t&&t.trigger()};if(h(),"clear"===e)c.forEach(l);else{const i=(0,r.cy)(t),s=i&&(0,r.yI)(n);if(i&&"length"===n){const t=Number(o);c.forEach(((e,n)=>{("length"===n||n===I||!(0,r.Bm)(n)&&n>=t)&&l(e)}))}else switch((void 0!==n||c.has(void 0))&&l(c.get(n)),s&&l(c.get(I)),e){case"add":i?s&&l(c.get("length")):(l(c.get($)),(0,r.CE)(t)&&l(c.get(A)));break;case"delete":i||(l(c.get($)),(0,r.CE)(t)&&l(c.get(A)));break;case"set":(0,r.CE)(t)&&l(c.get($));break}}v()}function D(t){const e=Tt(t);return e===t?e:(F(e,"iterate",I),wt(t)?e:e.map(Ot))}function L(t){return F(t=Tt(t),"iterate",I),t}const N={__proto__:null,[Symbol.iterator](){return U(this,Symbol.iterator,Ot)},concat(...t){return D(this).concat(...t.map((t=>(0,r.cy)(t)?D(t):t)))},entries(){return U(this,"entries",(t=>(t[1]=Ot(t[1]),t)))},every(t,e){return V(this,"every",t,e,void 0,arguments)},filter(t,e){return V(this,"filter",t,e,(t=>t.map(Ot)),arguments)},find(t,e){return V(this,"find",t,e,Ot,arguments)},findIndex(t,e){return V(this,"findIndex",t,e,void 0,arguments)},findLast(t,e){return V(this,"findLast",t,e,Ot,arguments)},findLastIndex(t,e){return V(this,"findLastIndex",t,e,void 0,arguments)},forEach(t,e){return V(this,"forEach",t,e,void 0,arguments)},includes(...t){return H(this,"includes",t)},indexOf(...t){return H(this,"indexOf",t)},join(t){return D(this).join(t)},lastIndexOf(...t){return H(this,"lastIndexOf",t)},map(t,e){return V(this,"map",t,e,void 0,arguments)},pop(){return W(this,"pop")},push(...t){return W(this,"push",t)},reduce(t,...e){return Z(this,"reduce",t,e)},reduceRight(t,...e){return Z(this,"reduceRight",t,e)},shift(){return W(this,"shift")},some(t,e){return V(this,"some",t,e,void 0,arguments)},splice(...t){return W(this,"splice",t)},toReversed(){return D(this).toReversed()},toSorted(t){return D(this).toSorted(t)},toSpliced(...t){return D(this).toSpliced(...t)},unshift(...t){return W(this,"unshift",t)},values(){return U(this,"values",Ot)}};function U(t,e,n){const r=L(t),o=r[e]();return r===t||wt(t)||(o._next=o.next,o.next=()=>{const t=o._next();return t.value&&(t.value=n(t.value)),t}),o}const B=Array.prototype;function V(t,e,n,r,o,i){const s=L(t),c=s!==t&&!wt(t),l=s[e];if(l!==B[e]){const e=l.apply(t,i);return c?Ot(e):e}let u=n;s!==t&&(c?u=function(e,r){return n.call(this,Ot(e),r,t)}:n.length>2&&(u=function(e,r){return n.call(this,e,r,t)}));const a=l.call(s,u,r);return c&&o?o(a):a}function Z(t,e,n,r){const o=L(t);let i=n;return o!==t&&(wt(t)?n.length>3&&(i=function(e,r,o){return n.call(this,e,r,o,t)}):i=function(e,r,o){return n.call(this,e,Ot(r),o,t)}),o[e](i,...r)}function H(t,e,n){const r=Tt(t);F(r,"iterate",I);const o=r[e](...n);return-1!==o&&!1!==o||!St(n[0])?o:(n[0]=Tt(n[0]),r[e](...n))}function W(t,e,n=[]){T(),h();const r=Tt(t)[e].apply(t,n);return v(),C(),r}const G=(0,r.pD)("__proto__,__v_isRef,__isVue"),K=new Set(Object.getOwnPropertyNames(Symbol).filter((t=>"arguments"!==t&&"caller"!==t)).map((t=>Symbol[t])).filter(r.Bm));function X(t){(0,r.Bm)(t)||(t=String(t));const e=Tt(this);return F(e,"has",t),e.hasOwnProperty(t)}class z{constructor(t=!1,e=!1){this._isReadonly=t,this._isShallow=e}get(t,e,n){if("__v_skip"===e)return t["__v_skip"];const o=this._isReadonly,i=this._isShallow;if("__v_isReactive"===e)return!o;if("__v_isReadonly"===e)return o;if("__v_isShallow"===e)return i;if("__v_raw"===e)return n===(o?i?dt:pt:i?ft:at).get(t)||Object.getPrototypeOf(t)===Object.getPrototypeOf(n)?t:void 0;const s=(0,r.cy)(t);if(!o){let t;if(s&&(t=N[e]))return t;if("hasOwnProperty"===e)return X}const c=Reflect.get(t,e,kt(t)?t:n);return((0,r.Bm)(e)?K.has(e):G(e))?c:(o||F(t,"get",e),i?c:kt(c)?s&&(0,r.yI)(e)?c:c.value:(0,r.Gv)(c)?o?mt(c):gt(c):c)}}class Y extends z{constructor(t=!1){super(!1,t)}set(t,e,n,o){let i=t[e];if(!this._isShallow){const e=xt(i);if(wt(n)||xt(n)||(i=Tt(i),n=Tt(n)),!(0,r.cy)(t)&&kt(i)&&!kt(n))return!e&&(i.value=n,!0)}const s=(0,r.cy)(t)&&(0,r.yI)(e)?Number(e)<t.length:(0,r.$3)(t,e),c=Reflect.set(t,e,n,kt(t)?t:o);return t===Tt(o)&&(s?(0,r.$H)(n,i)&&R(t,"set",e,n,i):R(t,"add",e,n)),c}deleteProperty(t,e){const n=(0,r.$3)(t,e),o=t[e],i=Reflect.deleteProperty(t,e);return i&&n&&R(t,"delete",e,void 0,o),i}has(t,e){const n=Reflect.has(t,e);return(0,r.Bm)(e)&&K.has(e)||F(t,"has",e),n}ownKeys(t){return F(t,"iterate",(0,r.cy)(t)?"length":$),Reflect.ownKeys(t)}}class q extends z{constructor(t=!1){super(!0,t)}set(t,e){return!0}deleteProperty(t,e){return!0}}const J=new Y,Q=new q,tt=new Y(!0),et=t=>t,nt=t=>Reflect.getPrototypeOf(t);function rt(t,e,n){return function(...o){const i=this["__v_raw"],s=Tt(i),c=(0,r.CE)(s),l="entries"===t||t===Symbol.iterator&&c,u="keys"===t&&c,a=i[t](...o),f=n?et:e?Et:Ot;return!e&&F(s,"iterate",u?A:$),{next(){const{value:t,done:e}=a.next();return e?{value:t,done:e}:{value:l?[f(t[0]),f(t[1])]:f(t),done:e}},[Symbol.iterator](){return this}}}}function ot(t){return function(...e){return"delete"!==t&&("clear"===t?void 0:this)}}function it(t,e){const n={get(n){const o=this["__v_raw"],i=Tt(o),s=Tt(n);t||((0,r.$H)(n,s)&&F(i,"get",n),F(i,"get",s));const{has:c}=nt(i),l=e?et:t?Et:Ot;return c.call(i,n)?l(o.get(n)):c.call(i,s)?l(o.get(s)):void(o!==i&&o.get(n))},get size(){const e=this["__v_raw"];return!t&&F(Tt(e),"iterate",$),Reflect.get(e,"size",e)},has(e){const n=this["__v_raw"],o=Tt(n),i=Tt(e);return t||((0,r.$H)(e,i)&&F(o,"has",e),F(o,"has",i)),e===i?n.has(e):n.has(e)||n.has(i)},forEach(n,r){const o=this,i=o["__v_raw"],s=Tt(i),c=e?et:t?Et:Ot;return!t&&F(s,"iterate",$),i.forEach(((t,e)=>n.call(r,c(t),c(e),o)))}};(0,r.X$)(n,t?{add:ot("add"),set:ot("set"),delete:ot("delete"),clear:ot("clear")}:{add(t){e||wt(t)||xt(t)||(t=Tt(t));const n=Tt(this),r=nt(n),o=r.has.call(n,t);return o||(n.add(t),R(n,"add",t,t)),this},set(t,n){e||wt(n)||xt(n)||(n=Tt(n));const o=Tt(this),{has:i,get:s}=nt(o);let c=i.call(o,t);c||(t=Tt(t),c=i.call(o,t));const l=s.call(o,t);return o.set(t,n),c?(0,r.$H)(n,l)&&R(o,"set",t,n,l):R(o,"add",t,n),this},delete(t){const e=Tt(this),{has:n,get:r}=nt(e);let o=n.call(e,t);o||(t=Tt(t),o=n.call(e,t));const i=r?r.call(e,t):void 0,s=e.delete(t);return o&&R(e,"delete",t,void 0,i),s},clear(){const t=Tt(this),e=0!==t.size,n=void 0,r=t.clear();return e&&R(t,"clear",void 0,void 0,n),r}});const o=["keys","values","entries",Symbol.iterator];return o.forEach((r=>{n[r]=rt(r,t,e)})),n}function st(t,e){const n=it(t,e);return(e,o,i)=>"__v_isReactive"===o?!t:"__v_isReadonly"===o?t:"__v_raw"===o?e:Reflect.get((0,r.$3)(n,o)&&o in e?n:e,o,i)}const ct={get:st(!1,!1)},lt={get:st(!1,!0)},ut={get:st(!0,!1)};const at=new WeakMap,ft=new WeakMap,pt=new WeakMap,dt=new WeakMap;function ht(t){switch(t){case"Object":case"Array":return 1;case"Map":case"Set":case"WeakMap":case"WeakSet":return 2;default:return 0}}function vt(t){return t["__v_skip"]||!Object.isExtensible(t)?0:ht((0,r.Zf)(t))}function gt(t){return xt(t)?t:bt(t,!1,J,ct,at)}function yt(t){return bt(t,!1,tt,lt,ft)}function mt(t){return bt(t,!0,Q,ut,pt)}function bt(t,e,n,o,i){if(!(0,r.Gv)(t))return t;if(t["__v_raw"]&&(!e||!t["__v_isReactive"]))return t;const s=i.get(t);if(s)return s;const c=vt(t);if(0===c)return t;const l=new Proxy(t,2===c?o:n);return i.set(t,l),l}function _t(t){return xt(t)?_t(t["__v_raw"]):!(!t||!t["__v_isReactive"])}function xt(t){return!(!t||!t["__v_isReadonly"])}function wt(t){return!(!t||!t["__v_isShallow"])}function St(t){return!!t&&!!t["__v_raw"]}function Tt(t){const e=t&&t["__v_raw"];return e?Tt(e):t}function Ct(t){return!(0,r.$3)(t,"__v_skip")&&Object.isExtensible(t)&&(0,r.yQ)(t,"__v_skip",!0),t}const Ot=t=>(0,r.Gv)(t)?gt(t):t,Et=t=>(0,r.Gv)(t)?mt(t):t;function kt(t){return!!t&&!0===t["__v_isRef"]}function jt(t){return kt(t)?t.value:t}const Pt={get:(t,e,n)=>"__v_raw"===e?t:jt(Reflect.get(t,e,n)),set:(t,e,n,r)=>{const o=t[e];return kt(o)&&!kt(n)?(o.value=n,!0):Reflect.set(t,e,n,r)}};function Mt(t){return _t(t)?t:new Proxy(t,Pt)}class $t{constructor(t,e,n){this.fn=t,this.setter=e,this._value=void 0,this.dep=new j(this),this.__v_isRef=!0,this.deps=void 0,this.depsTail=void 0,this.flags=16,this.globalVersion=E-1,this.next=void 0,this.effect=this,this["__v_isReadonly"]=!e,this.isSSR=n}notify(){if(this.flags|=16,!(8&this.flags||i===this))return d(this,!0),!0}get value(){const t=this.dep.track();return b(this),t&&(t.version=this.dep.version),this._value}set value(t){this.setter&&this.setter(t)}}function At(t,e,n=!1){let o,i;(0,r.Tn)(t)?o=t:(o=t.get,i=t.set);const s=new $t(o,i,n);return s}const It={},Ft=new WeakMap;let Rt;function Dt(t,e=!1,n=Rt){if(n){let e=Ft.get(n);e||Ft.set(n,e=[]),e.push(t)}else 0}function Lt(t,e,n=r.MZ){const{immediate:o,deep:i,once:s,scheduler:l,augmentJob:a,call:f}=n,p=t=>i?t:wt(t)||!1===i||0===i?Nt(t,1):Nt(t);let d,h,v,g,y=!1,m=!1;if(kt(t)?(h=()=>t.value,y=wt(t)):_t(t)?(h=()=>p(t),y=!0):(0,r.cy)(t)?(m=!0,y=t.some((t=>_t(t)||wt(t))),h=()=>t.map((t=>kt(t)?t.value:_t(t)?p(t):(0,r.Tn)(t)?f?f(t,2):t():void 0))):h=(0,r.Tn)(t)?e?f?()=>f(t,2):t:()=>{if(v){T();try{v()}finally{C()}}const e=Rt;Rt=d;try{return f?f(t,3,[g]):t(g)}finally{Rt=e}}:r.tE,e&&i){const t=h,e=!0===i?1/0:i;h=()=>Nt(t(),e)}const b=c(),_=()=>{d.stop(),b&&b.active&&(0,r.TF)(b.effects,d)};if(s&&e){const t=e;e=(...e)=>{t(...e),_()}}let x=m?new Array(t.length).fill(It):It;const w=t=>{if(1&d.flags&&(d.dirty||t))if(e){const t=d.run();if(i||y||(m?t.some(((t,e)=>(0,r.$H)(t,x[e]))):(0,r.$H)(t,x))){v&&v();const n=Rt;Rt=d;try{const n=[t,x===It?void 0:m&&x[0]===It?[]:x,g];f?f(e,3,n):e(...n),x=t}finally{Rt=n}}}else d.run()};return a&&a(w),d=new u(h),d.scheduler=l?()=>l(w,!1):w,g=t=>Dt(t,!1,d),v=d.onStop=()=>{const t=Ft.get(d);if(t){if(f)f(t,4);else for(const e of t)e();Ft.delete(d)}},e?o?w(!0):x=d.run():l?l(w.bind(null,!0),!0):d.run(),_.pause=d.pause.bind(d),_.resume=d.resume.bind(d),_.stop=_,_}function Nt(t,e=1/0,n){if(e<=0||!(0,r.Gv)(t)||t["__v_skip"])return t;if(n=n||new Set,n.has(t))return t;if(n.add(t),e--,kt(t))Nt(t.value,e,n);else if((0,r.cy)(t))for(let r=0;r<t.length;r++)Nt(t[r],e,n);else if((0,r.vM)(t)||(0,r.CE)(t))t.forEach((t=>{Nt(t,e,n)}));else if((0,r.Qd)(t)){for(const r in t)Nt(t[r],e,n);for(const r of Object.getOwnPropertySymbols(t))Object.prototype.propertyIsEnumerable.call(t,r)&&Nt(t[r],e,n)}return t}},1072:function(t,e,n){var r=n(1828),o=n(8727);t.exports=Object.keys||function(t){return r(t,o)}},1181:function(t,e,n){var r,o,i,s=n(8622),c=n(4576),l=n(34),u=n(6699),a=n(9297),f=n(7629),p=n(6119),d=n(421),h="Object already initialized",v=c.TypeError,g=c.WeakMap,y=function(t){return i(t)?o(t):r(t,{})},m=function(t){return function(e){var n;if(!l(e)||(n=o(e)).type!==t)throw new v("Incompatible receiver, "+t+" required");return n}};if(s||f.state){var b=f.state||(f.state=new g);b.get=b.get,b.has=b.has,b.set=b.set,r=function(t,e){if(b.has(t))throw new v(h);return e.facade=t,b.set(t,e),e},o=function(t){return b.get(t)||{}},i=function(t){return b.has(t)}}else{var _=p("state");d[_]=!0,r=function(t,e){if(a(t,_))throw new v(h);return e.facade=t,u(t,_,e),e},o=function(t){return a(t,_)?t[_]:{}},i=function(t){return a(t,_)}}t.exports={set:r,get:o,has:i,enforce:y,getterFor:m}},1291:function(t,e,n){var r=n(741);t.exports=function(t){var e=+t;return e!==e||0===e?0:r(e)}},1625:function(t,e,n){var r=n(9504);t.exports=r({}.isPrototypeOf)},1767:function(t){t.exports=function(t){return{iterator:t,next:t.next,done:!1}}},1828:function(t,e,n){var r=n(9504),o=n(9297),i=n(5397),s=n(9617).indexOf,c=n(421),l=r([].push);t.exports=function(t,e){var n,r=i(t),u=0,a=[];for(n in r)!o(c,n)&&o(r,n)&&l(a,n);while(e.length>u)o(r,n=e[u++])&&(~s(a,n)||l(a,n));return a}},2106:function(t,e,n){var r=n(283),o=n(4913);t.exports=function(t,e,n){return n.get&&r(n.get,e,{getter:!0}),n.set&&r(n.set,e,{setter:!0}),o.f(t,e,n)}},2140:function(t,e,n){var r=n(8227),o=r("toStringTag"),i={};i[o]="z",t.exports="[object z]"===String(i)},2195:function(t,e,n){var r=n(9504),o=r({}.toString),i=r("".slice);t.exports=function(t){return i(o(t),8,-1)}},2211:function(t,e,n){var r=n(9039);t.exports=!r((function(){function t(){}return t.prototype.constructor=null,Object.getPrototypeOf(new t)!==t.prototype}))},2360:function(t,e,n){var r,o=n(8551),i=n(6801),s=n(8727),c=n(421),l=n(397),u=n(4055),a=n(6119),f=">",p="<",d="prototype",h="script",v=a("IE_PROTO"),g=function(){},y=function(t){return p+h+f+t+p+"/"+h+f},m=function(t){t.write(y("")),t.close();var e=t.parentWindow.Object;return t=null,e},b=function(){var t,e=u("iframe"),n="java"+h+":";return e.style.display="none",l.appendChild(e),e.src=String(n),t=e.contentWindow.document,t.open(),t.write(y("document.F=Object")),t.close(),t.F},_=function(){try{r=new ActiveXObject("htmlfile")}catch(e){}_="undefined"!=typeof document?document.domain&&r?m(r):b():m(r);var t=s.length;while(t--)delete _[d][s[t]];return _()};c[v]=!0,t.exports=Object.create||function(t,e){var n;return null!==t?(g[d]=o(t),n=new g,g[d]=null,n[v]=t):n=_(),void 0===e?n:i.f(n,e)}},2652:function(t,e,n){var r=n(6080),o=n(9565),i=n(8551),s=n(6823),c=n(4209),l=n(6198),u=n(1625),a=n(81),f=n(851),p=n(9539),d=TypeError,h=function(t,e){this.stopped=t,this.result=e},v=h.prototype;t.exports=function(t,e,n){var g,y,m,b,_,x,w,S=n&&n.that,T=!(!n||!n.AS_ENTRIES),C=!(!n||!n.IS_RECORD),O=!(!n||!n.IS_ITERATOR),E=!(!n||!n.INTERRUPTED),k=r(e,S),j=function(t){return g&&p(g,"normal",t),new h(!0,t)},P=function(t){return T?(i(t),E?k(t[0],t[1],j):k(t[0],t[1])):E?k(t,j):k(t)};if(C)g=t.iterator;else if(O)g=t;else{if(y=f(t),!y)throw new d(s(t)+" is not iterable");if(c(y)){for(m=0,b=l(t);b>m;m++)if(_=P(t[m]),_&&u(v,_))return _;return new h(!1)}g=a(t,y)}x=C?t.next:g.next;while(!(w=o(x,g)).done){try{_=P(w.value)}catch(M){p(g,"throw",M)}if("object"==typeof _&&_&&u(v,_))return _}return new h(!1)}},2777:function(t,e,n){var r=n(9565),o=n(34),i=n(757),s=n(5966),c=n(4270),l=n(8227),u=TypeError,a=l("toPrimitive");t.exports=function(t,e){if(!o(t)||i(t))return t;var n,l=s(t,a);if(l){if(void 0===e&&(e="default"),n=r(l,t,e),!o(n)||i(n))return n;throw new u("Can't convert object to primitive value")}return void 0===e&&(e="number"),c(t,e)}},2787:function(t,e,n){var r=n(9297),o=n(4901),i=n(8981),s=n(6119),c=n(2211),l=s("IE_PROTO"),u=Object,a=u.prototype;t.exports=c?u.getPrototypeOf:function(t){var e=i(t);if(r(e,l))return e[l];var n=e.constructor;return o(n)&&e instanceof n?n.prototype:e instanceof u?a:null}},2796:function(t,e,n){var r=n(9039),o=n(4901),i=/#|\.prototype\./,s=function(t,e){var n=l[c(t)];return n===a||n!==u&&(o(e)?r(e):!!e)},c=s.normalize=function(t){return String(t).replace(i,".").toLowerCase()},l=s.data={},u=s.NATIVE="N",a=s.POLYFILL="P";t.exports=s},2839:function(t,e,n){var r=n(4576),o=r.navigator,i=o&&o.userAgent;t.exports=i?String(i):""},3392:function(t,e,n){var r=n(9504),o=0,i=Math.random(),s=r(1..toString);t.exports=function(t){return"Symbol("+(void 0===t?"":t)+")_"+s(++o+i,36)}},3579:function(t,e,n){var r=n(6518),o=n(2652),i=n(9306),s=n(8551),c=n(1767);r({target:"Iterator",proto:!0,real:!0},{some:function(t){s(this),i(t);var e=c(this),n=0;return o(e,(function(e,r){if(t(e,n++))return r()}),{IS_RECORD:!0,INTERRUPTED:!0}).stopped}})},3706:function(t,e,n){var r=n(9504),o=n(4901),i=n(7629),s=r(Function.toString);o(i.inspectSource)||(i.inspectSource=function(t){return s(t)}),t.exports=i.inspectSource},3717:function(t,e){e.f=Object.getOwnPropertySymbols},3724:function(t,e,n){var r=n(9039);t.exports=!r((function(){return 7!==Object.defineProperty({},1,{get:function(){return 7}})[1]}))},3751:function(t,e,n){n.d(e,{D$:function(){return W},Ef:function(){return z}});var r=n(641),o=n(33);n(953);
+**/let o,i;class s{constructor(t=!1){this.detached=t,this._active=!0,this.effects=[],this.cleanups=[],this._isPaused=!1,this.parent=o,!t&&o&&(this.index=(o.scopes||(o.scopes=[])).push(this)-1)}get active(){return this._active}pause(){if(this._active){let t,e;if(this._isPaused=!0,this.scopes)for(t=0,e=this.scopes.length;t<e;t++)this.scopes[t].pause();for(t=0,e=this.effects.length;t<e;t++)this.effects[t].pause()}}resume(){if(this._active&&this._isPaused){let t,e;if(this._isPaused=!1,this.scopes)for(t=0,e=this.scopes.length;t<e;t++)this.scopes[t].resume();for(t=0,e=this.effects.length;t<e;t++)this.effects[t].resume()}}run(t){if(this._active){const e=o;try{return o=this,t()}finally{o=e}}else 0}on(){o=this}off(){o=this.parent}stop(t){if(this._active){let e,n;for(this._active=!1,e=0,n=this.effects.length;e<n;e++)this.effects[e].stop();for(this.effects.length=0,e=0,n=this.cleanups.length;e<n;e++)this.cleanups[e]();if(this.cleanups.length=0,this.scopes){for(e=0,n=this.scopes.length;e<n;e++)this.scopes[e].stop(!0);this.scopes.length=0}if(!this.detached&&this.parent&&!t){const t=this.parent.scopes.pop();t&&t!==this&&(this.parent.scopes[this.index]=t,t.index=this.index)}this.parent=void 0}}}function c(){return o}const u=new WeakSet;class l{constructor(t){this.fn=t,this.deps=void 0,this.depsTail=void 0,this.flags=5,this.next=void 0,this.cleanup=void 0,this.scheduler=void 0,o&&o.active&&o.effects.push(this)}pause(){this.flags|=64}resume(){64&this.flags&&(this.flags&=-65,u.has(this)&&(u.delete(this),this.trigger()))}notify(){2&this.flags&&!(32&this.flags)||8&this.flags||d(this)}run(){if(!(1&this.flags))return this.fn();this.flags|=2,O(this),g(this);const t=i,e=w;i=this,w=!0;try{return this.fn()}finally{0,y(this),i=t,w=e,this.flags&=-3}}stop(){if(1&this.flags){for(let t=this.deps;t;t=t.nextDep)_(t);this.deps=this.depsTail=void 0,O(this),this.onStop&&this.onStop(),this.flags&=-2}}trigger(){64&this.flags?u.add(this):this.scheduler?this.scheduler():this.runIfDirty()}runIfDirty(){m(this)&&this.run()}get dirty(){return m(this)}}let a,f,p=0;function d(t,e=!1){if(t.flags|=8,e)return t.next=f,void(f=t);t.next=a,a=t}function h(){p++}function v(){if(--p>0)return;if(f){let t=f;f=void 0;while(t){const e=t.next;t.next=void 0,t.flags&=-9,t=e}}let t;while(a){let n=a;a=void 0;while(n){const r=n.next;if(n.next=void 0,n.flags&=-9,1&n.flags)try{n.trigger()}catch(e){t||(t=e)}n=r}}if(t)throw t}function g(t){for(let e=t.deps;e;e=e.nextDep)e.version=-1,e.prevActiveLink=e.dep.activeLink,e.dep.activeLink=e}function y(t){let e,n=t.depsTail,r=n;while(r){const t=r.prevDep;-1===r.version?(r===n&&(n=t),_(r),x(r)):e=r,r.dep.activeLink=r.prevActiveLink,r.prevActiveLink=void 0,r=t}t.deps=e,t.depsTail=n}function m(t){for(let e=t.deps;e;e=e.nextDep)if(e.dep.version!==e.version||e.dep.computed&&(b(e.dep.computed)||e.dep.version!==e.version))return!0;return!!t._dirty}function b(t){if(4&t.flags&&!(16&t.flags))return;if(t.flags&=-17,t.globalVersion===E)return;t.globalVersion=E;const e=t.dep;if(t.flags|=2,e.version>0&&!t.isSSR&&t.deps&&!m(t))return void(t.flags&=-3);const n=i,o=w;i=t,w=!0;try{g(t);const n=t.fn(t._value);(0===e.version||(0,r.$H)(n,t._value))&&(t._value=n,e.version++)}catch(s){throw e.version++,s}finally{i=n,w=o,y(t),t.flags&=-3}}function _(t,e=!1){const{dep:n,prevSub:r,nextSub:o}=t;if(r&&(r.nextSub=o,t.prevSub=void 0),o&&(o.prevSub=r,t.nextSub=void 0),n.subs===t&&(n.subs=r,!r&&n.computed)){n.computed.flags&=-5;for(let t=n.computed.deps;t;t=t.nextDep)_(t,!0)}e||--n.sc||!n.map||n.map.delete(n.key)}function x(t){const{prevDep:e,nextDep:n}=t;e&&(e.nextDep=n,t.prevDep=void 0),n&&(n.prevDep=e,t.nextDep=void 0)}let w=!0;const S=[];function T(){S.push(w),w=!1}function C(){const t=S.pop();w=void 0===t||t}function O(t){const{cleanup:e}=t;if(t.cleanup=void 0,e){const t=i;i=void 0;try{e()}finally{i=t}}}let E=0;class k{constructor(t,e){this.sub=t,this.dep=e,this.version=e.version,this.nextDep=this.prevDep=this.nextSub=this.prevSub=this.prevActiveLink=void 0}}class P{constructor(t){this.computed=t,this.version=0,this.activeLink=void 0,this.subs=void 0,this.map=void 0,this.key=void 0,this.sc=0}track(t){if(!i||!w||i===this.computed)return;let e=this.activeLink;if(void 0===e||e.sub!==i)e=this.activeLink=new k(i,this),i.deps?(e.prevDep=i.depsTail,i.depsTail.nextDep=e,i.depsTail=e):i.deps=i.depsTail=e,j(e);else if(-1===e.version&&(e.version=this.version,e.nextDep)){const t=e.nextDep;t.prevDep=e.prevDep,e.prevDep&&(e.prevDep.nextDep=t),e.prevDep=i.depsTail,e.nextDep=void 0,i.depsTail.nextDep=e,i.depsTail=e,i.deps===e&&(i.deps=t)}return e}trigger(t){this.version++,E++,this.notify(t)}notify(t){h();try{0;for(let t=this.subs;t;t=t.prevSub)t.sub.notify()&&t.sub.dep.notify()}finally{v()}}}function j(t){if(t.dep.sc++,4&t.sub.flags){const e=t.dep.computed;if(e&&!t.dep.subs){e.flags|=20;for(let t=e.deps;t;t=t.nextDep)j(t)}const n=t.dep.subs;n!==t&&(t.prevSub=n,n&&(n.nextSub=t)),t.dep.subs=t}}const M=new WeakMap,I=Symbol(""),$=Symbol(""),A=Symbol("");function F(t,e,n){if(w&&i){let e=M.get(t);e||M.set(t,e=new Map);let r=e.get(n);r||(e.set(n,r=new P),r.map=e,r.key=n),r.track()}}function R(t,e,n,o,i,s){const c=M.get(t);if(!c)return void E++;const u=t=>{t&&t.trigger()};if(h(),"clear"===e)c.forEach(u);else{const i=(0,r.cy)(t),s=i&&(0,r.yI)(n);if(i&&"length"===n){const t=Number(o);c.forEach(((e,n)=>{("length"===n||n===A||!(0,r.Bm)(n)&&n>=t)&&u(e)}))}else switch((void 0!==n||c.has(void 0))&&u(c.get(n)),s&&u(c.get(A)),e){case"add":i?s&&u(c.get("length")):(u(c.get(I)),(0,r.CE)(t)&&u(c.get($)));break;case"delete":i||(u(c.get(I)),(0,r.CE)(t)&&u(c.get($)));break;case"set":(0,r.CE)(t)&&u(c.get(I));break}}v()}function D(t){const e=Tt(t);return e===t?e:(F(e,"iterate",A),wt(t)?e:e.map(Ot))}function L(t){return F(t=Tt(t),"iterate",A),t}const N={__proto__:null,[Symbol.iterator](){return U(this,Symbol.iterator,Ot)},concat(...t){return D(this).concat(...t.map((t=>(0,r.cy)(t)?D(t):t)))},entries(){return U(this,"entries",(t=>(t[1]=Ot(t[1]),t)))},every(t,e){return H(this,"every",t,e,void 0,arguments)},filter(t,e){return H(this,"filter",t,e,(t=>t.map(Ot)),arguments)},find(t,e){return H(this,"find",t,e,Ot,arguments)},findIndex(t,e){return H(this,"findIndex",t,e,void 0,arguments)},findLast(t,e){return H(this,"findLast",t,e,Ot,arguments)},findLastIndex(t,e){return H(this,"findLastIndex",t,e,void 0,arguments)},forEach(t,e){return H(this,"forEach",t,e,void 0,arguments)},includes(...t){return Z(this,"includes",t)},indexOf(...t){return Z(this,"indexOf",t)},join(t){return D(this).join(t)},lastIndexOf(...t){return Z(this,"lastIndexOf",t)},map(t,e){return H(this,"map",t,e,void 0,arguments)},pop(){return W(this,"pop")},push(...t){return W(this,"push",t)},reduce(t,...e){return V(this,"reduce",t,e)},reduceRight(t,...e){return V(this,"reduceRight",t,e)},shift(){return W(this,"shift")},some(t,e){return H(this,"some",t,e,void 0,arguments)},splice(...t){return W(this,"splice",t)},toReversed(){return D(this).toReversed()},toSorted(t){return D(this).toSorted(t)},toSpliced(...t){return D(this).toSpliced(...t)},unshift(...t){return W(this,"unshift",t)},values(){return U(this,"values",Ot)}};function U(t,e,n){const r=L(t),o=r[e]();return r===t||wt(t)||(o._next=o.next,o.next=()=>{const t=o._next();return t.value&&(t.value=n(t.value)),t}),o}const B=Array.prototype;function H(t,e,n,r,o,i){const s=L(t),c=s!==t&&!wt(t),u=s[e];if(u!==B[e]){const e=u.apply(t,i);return c?Ot(e):e}let l=n;s!==t&&(c?l=function(e,r){return n.call(this,Ot(e),r,t)}:n.length>2&&(l=function(e,r){return n.call(this,e,r,t)}));const a=u.call(s,l,r);return c&&o?o(a):a}function V(t,e,n,r){const o=L(t);let i=n;return o!==t&&(wt(t)?n.length>3&&(i=function(e,r,o){return n.call(this,e,r,o,t)}):i=function(e,r,o){return n.call(this,e,Ot(r),o,t)}),o[e](i,...r)}function Z(t,e,n){const r=Tt(t);F(r,"iterate",A);const o=r[e](...n);return-1!==o&&!1!==o||!St(n[0])?o:(n[0]=Tt(n[0]),r[e](...n))}function W(t,e,n=[]){T(),h();const r=Tt(t)[e].apply(t,n);return v(),C(),r}const G=(0,r.pD)("__proto__,__v_isRef,__isVue"),K=new Set(Object.getOwnPropertyNames(Symbol).filter((t=>"arguments"!==t&&"caller"!==t)).map((t=>Symbol[t])).filter(r.Bm));function X(t){(0,r.Bm)(t)||(t=String(t));const e=Tt(this);return F(e,"has",t),e.hasOwnProperty(t)}class z{constructor(t=!1,e=!1){this._isReadonly=t,this._isShallow=e}get(t,e,n){if("__v_skip"===e)return t["__v_skip"];const o=this._isReadonly,i=this._isShallow;if("__v_isReactive"===e)return!o;if("__v_isReadonly"===e)return o;if("__v_isShallow"===e)return i;if("__v_raw"===e)return n===(o?i?dt:pt:i?ft:at).get(t)||Object.getPrototypeOf(t)===Object.getPrototypeOf(n)?t:void 0;const s=(0,r.cy)(t);if(!o){let t;if(s&&(t=N[e]))return t;if("hasOwnProperty"===e)return X}const c=Reflect.get(t,e,kt(t)?t:n);return((0,r.Bm)(e)?K.has(e):G(e))?c:(o||F(t,"get",e),i?c:kt(c)?s&&(0,r.yI)(e)?c:c.value:(0,r.Gv)(c)?o?mt(c):gt(c):c)}}class Y extends z{constructor(t=!1){super(!1,t)}set(t,e,n,o){let i=t[e];if(!this._isShallow){const e=xt(i);if(wt(n)||xt(n)||(i=Tt(i),n=Tt(n)),!(0,r.cy)(t)&&kt(i)&&!kt(n))return!e&&(i.value=n,!0)}const s=(0,r.cy)(t)&&(0,r.yI)(e)?Number(e)<t.length:(0,r.$3)(t,e),c=Reflect.set(t,e,n,kt(t)?t:o);return t===Tt(o)&&(s?(0,r.$H)(n,i)&&R(t,"set",e,n,i):R(t,"add",e,n)),c}deleteProperty(t,e){const n=(0,r.$3)(t,e),o=t[e],i=Reflect.deleteProperty(t,e);return i&&n&&R(t,"delete",e,void 0,o),i}has(t,e){const n=Reflect.has(t,e);return(0,r.Bm)(e)&&K.has(e)||F(t,"has",e),n}ownKeys(t){return F(t,"iterate",(0,r.cy)(t)?"length":I),Reflect.ownKeys(t)}}class q extends z{constructor(t=!1){super(!0,t)}set(t,e){return!0}deleteProperty(t,e){return!0}}const J=new Y,Q=new q,tt=new Y(!0),et=t=>t,nt=t=>Reflect.getPrototypeOf(t);function rt(t,e,n){return function(...o){const i=this["__v_raw"],s=Tt(i),c=(0,r.CE)(s),u="entries"===t||t===Symbol.iterator&&c,l="keys"===t&&c,a=i[t](...o),f=n?et:e?Et:Ot;return!e&&F(s,"iterate",l?$:I),{next(){const{value:t,done:e}=a.next();return e?{value:t,done:e}:{value:u?[f(t[0]),f(t[1])]:f(t),done:e}},[Symbol.iterator](){return this}}}}function ot(t){return function(...e){return"delete"!==t&&("clear"===t?void 0:this)}}function it(t,e){const n={get(n){const o=this["__v_raw"],i=Tt(o),s=Tt(n);t||((0,r.$H)(n,s)&&F(i,"get",n),F(i,"get",s));const{has:c}=nt(i),u=e?et:t?Et:Ot;return c.call(i,n)?u(o.get(n)):c.call(i,s)?u(o.get(s)):void(o!==i&&o.get(n))},get size(){const e=this["__v_raw"];return!t&&F(Tt(e),"iterate",I),Reflect.get(e,"size",e)},has(e){const n=this["__v_raw"],o=Tt(n),i=Tt(e);return t||((0,r.$H)(e,i)&&F(o,"has",e),F(o,"has",i)),e===i?n.has(e):n.has(e)||n.has(i)},forEach(n,r){const o=this,i=o["__v_raw"],s=Tt(i),c=e?et:t?Et:Ot;return!t&&F(s,"iterate",I),i.forEach(((t,e)=>n.call(r,c(t),c(e),o)))}};(0,r.X$)(n,t?{add:ot("add"),set:ot("set"),delete:ot("delete"),clear:ot("clear")}:{add(t){e||wt(t)||xt(t)||(t=Tt(t));const n=Tt(this),r=nt(n),o=r.has.call(n,t);return o||(n.add(t),R(n,"add",t,t)),this},set(t,n){e||wt(n)||xt(n)||(n=Tt(n));const o=Tt(this),{has:i,get:s}=nt(o);let c=i.call(o,t);c||(t=Tt(t),c=i.call(o,t));const u=s.call(o,t);return o.set(t,n),c?(0,r.$H)(n,u)&&R(o,"set",t,n,u):R(o,"add",t,n),this},delete(t){const e=Tt(this),{has:n,get:r}=nt(e);let o=n.call(e,t);o||(t=Tt(t),o=n.call(e,t));const i=r?r.call(e,t):void 0,s=e.delete(t);return o&&R(e,"delete",t,void 0,i),s},clear(){const t=Tt(this),e=0!==t.size,n=void 0,r=t.clear();return e&&R(t,"clear",void 0,void 0,n),r}});const o=["keys","values","entries",Symbol.iterator];return o.forEach((r=>{n[r]=rt(r,t,e)})),n}function st(t,e){const n=it(t,e);return(e,o,i)=>"__v_isReactive"===o?!t:"__v_isReadonly"===o?t:"__v_raw"===o?e:Reflect.get((0,r.$3)(n,o)&&o in e?n:e,o,i)}const ct={get:st(!1,!1)},ut={get:st(!1,!0)},lt={get:st(!0,!1)};const at=new WeakMap,ft=new WeakMap,pt=new WeakMap,dt=new WeakMap;function ht(t){switch(t){case"Object":case"Array":return 1;case"Map":case"Set":case"WeakMap":case"WeakSet":return 2;default:return 0}}function vt(t){return t["__v_skip"]||!Object.isExtensible(t)?0:ht((0,r.Zf)(t))}function gt(t){return xt(t)?t:bt(t,!1,J,ct,at)}function yt(t){return bt(t,!1,tt,ut,ft)}function mt(t){return bt(t,!0,Q,lt,pt)}function bt(t,e,n,o,i){if(!(0,r.Gv)(t))return t;if(t["__v_raw"]&&(!e||!t["__v_isReactive"]))return t;const s=i.get(t);if(s)return s;const c=vt(t);if(0===c)return t;const u=new Proxy(t,2===c?o:n);return i.set(t,u),u}function _t(t){return xt(t)?_t(t["__v_raw"]):!(!t||!t["__v_isReactive"])}function xt(t){return!(!t||!t["__v_isReadonly"])}function wt(t){return!(!t||!t["__v_isShallow"])}function St(t){return!!t&&!!t["__v_raw"]}function Tt(t){const e=t&&t["__v_raw"];return e?Tt(e):t}function Ct(t){return!(0,r.$3)(t,"__v_skip")&&Object.isExtensible(t)&&(0,r.yQ)(t,"__v_skip",!0),t}const Ot=t=>(0,r.Gv)(t)?gt(t):t,Et=t=>(0,r.Gv)(t)?mt(t):t;function kt(t){return!!t&&!0===t["__v_isRef"]}function Pt(t){return kt(t)?t.value:t}const jt={get:(t,e,n)=>"__v_raw"===e?t:Pt(Reflect.get(t,e,n)),set:(t,e,n,r)=>{const o=t[e];return kt(o)&&!kt(n)?(o.value=n,!0):Reflect.set(t,e,n,r)}};function Mt(t){return _t(t)?t:new Proxy(t,jt)}class It{constructor(t,e,n){this.fn=t,this.setter=e,this._value=void 0,this.dep=new P(this),this.__v_isRef=!0,this.deps=void 0,this.depsTail=void 0,this.flags=16,this.globalVersion=E-1,this.next=void 0,this.effect=this,this["__v_isReadonly"]=!e,this.isSSR=n}notify(){if(this.flags|=16,!(8&this.flags||i===this))return d(this,!0),!0}get value(){const t=this.dep.track();return b(this),t&&(t.version=this.dep.version),this._value}set value(t){this.setter&&this.setter(t)}}function $t(t,e,n=!1){let o,i;(0,r.Tn)(t)?o=t:(o=t.get,i=t.set);const s=new It(o,i,n);return s}const At={},Ft=new WeakMap;let Rt;function Dt(t,e=!1,n=Rt){if(n){let e=Ft.get(n);e||Ft.set(n,e=[]),e.push(t)}else 0}function Lt(t,e,n=r.MZ){const{immediate:o,deep:i,once:s,scheduler:u,augmentJob:a,call:f}=n,p=t=>i?t:wt(t)||!1===i||0===i?Nt(t,1):Nt(t);let d,h,v,g,y=!1,m=!1;if(kt(t)?(h=()=>t.value,y=wt(t)):_t(t)?(h=()=>p(t),y=!0):(0,r.cy)(t)?(m=!0,y=t.some((t=>_t(t)||wt(t))),h=()=>t.map((t=>kt(t)?t.value:_t(t)?p(t):(0,r.Tn)(t)?f?f(t,2):t():void 0))):h=(0,r.Tn)(t)?e?f?()=>f(t,2):t:()=>{if(v){T();try{v()}finally{C()}}const e=Rt;Rt=d;try{return f?f(t,3,[g]):t(g)}finally{Rt=e}}:r.tE,e&&i){const t=h,e=!0===i?1/0:i;h=()=>Nt(t(),e)}const b=c(),_=()=>{d.stop(),b&&b.active&&(0,r.TF)(b.effects,d)};if(s&&e){const t=e;e=(...e)=>{t(...e),_()}}let x=m?new Array(t.length).fill(At):At;const w=t=>{if(1&d.flags&&(d.dirty||t))if(e){const t=d.run();if(i||y||(m?t.some(((t,e)=>(0,r.$H)(t,x[e]))):(0,r.$H)(t,x))){v&&v();const n=Rt;Rt=d;try{const n=[t,x===At?void 0:m&&x[0]===At?[]:x,g];f?f(e,3,n):e(...n),x=t}finally{Rt=n}}}else d.run()};return a&&a(w),d=new l(h),d.scheduler=u?()=>u(w,!1):w,g=t=>Dt(t,!1,d),v=d.onStop=()=>{const t=Ft.get(d);if(t){if(f)f(t,4);else for(const e of t)e();Ft.delete(d)}},e?o?w(!0):x=d.run():u?u(w.bind(null,!0),!0):d.run(),_.pause=d.pause.bind(d),_.resume=d.resume.bind(d),_.stop=_,_}function Nt(t,e=1/0,n){if(e<=0||!(0,r.Gv)(t)||t["__v_skip"])return t;if(n=n||new Set,n.has(t))return t;if(n.add(t),e--,kt(t))Nt(t.value,e,n);else if((0,r.cy)(t))for(let r=0;r<t.length;r++)Nt(t[r],e,n);else if((0,r.vM)(t)||(0,r.CE)(t))t.forEach((t=>{Nt(t,e,n)}));else if((0,r.Qd)(t)){for(const r in t)Nt(t[r],e,n);for(const r of Object.getOwnPropertySymbols(t))Object.prototype.propertyIsEnumerable.call(t,r)&&Nt(t[r],e,n)}return t}},1072:function(t,e,n){var r=n(1828),o=n(8727);t.exports=Object.keys||function(t){return r(t,o)}},1181:function(t,e,n){var r,o,i,s=n(8622),c=n(4576),u=n(34),l=n(6699),a=n(9297),f=n(7629),p=n(6119),d=n(421),h="Object already initialized",v=c.TypeError,g=c.WeakMap,y=function(t){return i(t)?o(t):r(t,{})},m=function(t){return function(e){var n;if(!u(e)||(n=o(e)).type!==t)throw new v("Incompatible receiver, "+t+" required");return n}};if(s||f.state){var b=f.state||(f.state=new g);b.get=b.get,b.has=b.has,b.set=b.set,r=function(t,e){if(b.has(t))throw new v(h);return e.facade=t,b.set(t,e),e},o=function(t){return b.get(t)||{}},i=function(t){return b.has(t)}}else{var _=p("state");d[_]=!0,r=function(t,e){if(a(t,_))throw new v(h);return e.facade=t,l(t,_,e),e},o=function(t){return a(t,_)?t[_]:{}},i=function(t){return a(t,_)}}t.exports={set:r,get:o,has:i,enforce:y,getterFor:m}},1291:function(t,e,n){var r=n(741);t.exports=function(t){var e=+t;return e!==e||0===e?0:r(e)}},1625:function(t,e,n){var r=n(9504);t.exports=r({}.isPrototypeOf)},1767:function(t){t.exports=function(t){return{iterator:t,next:t.next,done:!1}}},1828:function(t,e,n){var r=n(9504),o=n(9297),i=n(5397),s=n(9617).indexOf,c=n(421),u=r([].push);t.exports=function(t,e){var n,r=i(t),l=0,a=[];for(n in r)!o(c,n)&&o(r,n)&&u(a,n);while(e.length>l)o(r,n=e[l++])&&(~s(a,n)||u(a,n));return a}},2106:function(t,e,n){var r=n(283),o=n(4913);t.exports=function(t,e,n){return n.get&&r(n.get,e,{getter:!0}),n.set&&r(n.set,e,{setter:!0}),o.f(t,e,n)}},2140:function(t,e,n){var r=n(8227),o=r("toStringTag"),i={};i[o]="z",t.exports="[object z]"===String(i)},2195:function(t,e,n){var r=n(9504),o=r({}.toString),i=r("".slice);t.exports=function(t){return i(o(t),8,-1)}},2211:function(t,e,n){var r=n(9039);t.exports=!r((function(){function t(){}return t.prototype.constructor=null,Object.getPrototypeOf(new t)!==t.prototype}))},2360:function(t,e,n){var r,o=n(8551),i=n(6801),s=n(8727),c=n(421),u=n(397),l=n(4055),a=n(6119),f=">",p="<",d="prototype",h="script",v=a("IE_PROTO"),g=function(){},y=function(t){return p+h+f+t+p+"/"+h+f},m=function(t){t.write(y("")),t.close();var e=t.parentWindow.Object;return t=null,e},b=function(){var t,e=l("iframe"),n="java"+h+":";return e.style.display="none",u.appendChild(e),e.src=String(n),t=e.contentWindow.document,t.open(),t.write(y("document.F=Object")),t.close(),t.F},_=function(){try{r=new ActiveXObject("htmlfile")}catch(e){}_="undefined"!=typeof document?document.domain&&r?m(r):b():m(r);var t=s.length;while(t--)delete _[d][s[t]];return _()};c[v]=!0,t.exports=Object.create||function(t,e){var n;return null!==t?(g[d]=o(t),n=new g,g[d]=null,n[v]=t):n=_(),void 0===e?n:i.f(n,e)}},2489:function(t,e,n){var r=n(6518),o=n(9565),i=n(9306),s=n(8551),c=n(1767),u=n(9462),l=n(6319),a=n(6395),f=u((function(){var t,e,n,r=this.iterator,i=this.predicate,c=this.next;while(1){if(t=s(o(c,r)),e=this.done=!!t.done,e)return;if(n=t.value,l(r,i,[n,this.counter++],!0))return n}}));r({target:"Iterator",proto:!0,real:!0,forced:a},{filter:function(t){return s(this),i(t),new f(c(this),{predicate:t})}})},2529:function(t){t.exports=function(t,e){return{value:t,done:e}}},2652:function(t,e,n){var r=n(6080),o=n(9565),i=n(8551),s=n(6823),c=n(4209),u=n(6198),l=n(1625),a=n(81),f=n(851),p=n(9539),d=TypeError,h=function(t,e){this.stopped=t,this.result=e},v=h.prototype;t.exports=function(t,e,n){var g,y,m,b,_,x,w,S=n&&n.that,T=!(!n||!n.AS_ENTRIES),C=!(!n||!n.IS_RECORD),O=!(!n||!n.IS_ITERATOR),E=!(!n||!n.INTERRUPTED),k=r(e,S),P=function(t){return g&&p(g,"normal",t),new h(!0,t)},j=function(t){return T?(i(t),E?k(t[0],t[1],P):k(t[0],t[1])):E?k(t,P):k(t)};if(C)g=t.iterator;else if(O)g=t;else{if(y=f(t),!y)throw new d(s(t)+" is not iterable");if(c(y)){for(m=0,b=u(t);b>m;m++)if(_=j(t[m]),_&&l(v,_))return _;return new h(!1)}g=a(t,y)}x=C?t.next:g.next;while(!(w=o(x,g)).done){try{_=j(w.value)}catch(M){p(g,"throw",M)}if("object"==typeof _&&_&&l(v,_))return _}return new h(!1)}},2777:function(t,e,n){var r=n(9565),o=n(34),i=n(757),s=n(5966),c=n(4270),u=n(8227),l=TypeError,a=u("toPrimitive");t.exports=function(t,e){if(!o(t)||i(t))return t;var n,u=s(t,a);if(u){if(void 0===e&&(e="default"),n=r(u,t,e),!o(n)||i(n))return n;throw new l("Can't convert object to primitive value")}return void 0===e&&(e="number"),c(t,e)}},2787:function(t,e,n){var r=n(9297),o=n(4901),i=n(8981),s=n(6119),c=n(2211),u=s("IE_PROTO"),l=Object,a=l.prototype;t.exports=c?l.getPrototypeOf:function(t){var e=i(t);if(r(e,u))return e[u];var n=e.constructor;return o(n)&&e instanceof n?n.prototype:e instanceof l?a:null}},2796:function(t,e,n){var r=n(9039),o=n(4901),i=/#|\.prototype\./,s=function(t,e){var n=u[c(t)];return n===a||n!==l&&(o(e)?r(e):!!e)},c=s.normalize=function(t){return String(t).replace(i,".").toLowerCase()},u=s.data={},l=s.NATIVE="N",a=s.POLYFILL="P";t.exports=s},2839:function(t,e,n){var r=n(4576),o=r.navigator,i=o&&o.userAgent;t.exports=i?String(i):""},3392:function(t,e,n){var r=n(9504),o=0,i=Math.random(),s=r(1..toString);t.exports=function(t){return"Symbol("+(void 0===t?"":t)+")_"+s(++o+i,36)}},3579:function(t,e,n){var r=n(6518),o=n(2652),i=n(9306),s=n(8551),c=n(1767);r({target:"Iterator",proto:!0,real:!0},{some:function(t){s(this),i(t);var e=c(this),n=0;return o(e,(function(e,r){if(t(e,n++))return r()}),{IS_RECORD:!0,INTERRUPTED:!0}).stopped}})},3706:function(t,e,n){var r=n(9504),o=n(4901),i=n(7629),s=r(Function.toString);o(i.inspectSource)||(i.inspectSource=function(t){return s(t)}),t.exports=i.inspectSource},3717:function(t,e){e.f=Object.getOwnPropertySymbols},3724:function(t,e,n){var r=n(9039);t.exports=!r((function(){return 7!==Object.defineProperty({},1,{get:function(){return 7}})[1]}))},3751:function(t,e,n){n.d(e,{D$:function(){return W},Ef:function(){return z}});var r=n(641),o=n(33);n(953);
 /**
 * @vue/runtime-dom v3.5.13
 * (c) 2018-present Yuxi (Evan) You and Vue contributors
 * @license MIT
 **/
-let i;const s="undefined"!==typeof window&&window.trustedTypes;if(s)try{i=s.createPolicy("vue",{createHTML:t=>t})}catch(J){}const c=i?t=>i.createHTML(t):t=>t,l="http://www.w3.org/2000/svg",u="http://www.w3.org/1998/Math/MathML",a="undefined"!==typeof document?document:null,f=a&&a.createElement("template"),p={insert:(t,e,n)=>{e.insertBefore(t,n||null)},remove:t=>{const e=t.parentNode;e&&e.removeChild(t)},createElement:(t,e,n,r)=>{const o="svg"===e?a.createElementNS(l,t):"mathml"===e?a.createElementNS(u,t):n?a.createElement(t,{is:n}):a.createElement(t);return"select"===t&&r&&null!=r.multiple&&o.setAttribute("multiple",r.multiple),o},createText:t=>a.createTextNode(t),createComment:t=>a.createComment(t),setText:(t,e)=>{t.nodeValue=e},setElementText:(t,e)=>{t.textContent=e},parentNode:t=>t.parentNode,nextSibling:t=>t.nextSibling,querySelector:t=>a.querySelector(t),setScopeId(t,e){t.setAttribute(e,"")},insertStaticContent(t,e,n,r,o,i){const s=n?n.previousSibling:e.lastChild;if(o&&(o===i||o.nextSibling)){while(1)if(e.insertBefore(o.cloneNode(!0),n),o===i||!(o=o.nextSibling))break}else{f.innerHTML=c("svg"===r?`<svg>${t}</svg>`:"mathml"===r?`<math>${t}</math>`:t);const o=f.content;if("svg"===r||"mathml"===r){const t=o.firstChild;while(t.firstChild)o.appendChild(t.firstChild);o.removeChild(t)}e.insertBefore(o,n)}return[s?s.nextSibling:e.firstChild,n?n.previousSibling:e.lastChild]}},d=Symbol("_vtc"),h={name:String,type:String,css:{type:Boolean,default:!0},duration:[String,Number,Object],enterFromClass:String,enterActiveClass:String,enterToClass:String,appearFromClass:String,appearActiveClass:String,appearToClass:String,leaveFromClass:String,leaveActiveClass:String,leaveToClass:String};r.QP;function v(t,e,n){const r=t[d];r&&(e=(e?[e,...r]:[...r]).join(" ")),null==e?t.removeAttribute("class"):n?t.setAttribute("class",e):t.className=e}const g=Symbol("_vod"),y=Symbol("_vsh");const m=Symbol("");const b=/(^|;)\s*display\s*:/;function _(t,e,n){const r=t.style,i=(0,o.Kg)(n);let s=!1;if(n&&!i){if(e)if((0,o.Kg)(e))for(const t of e.split(";")){const e=t.slice(0,t.indexOf(":")).trim();null==n[e]&&w(r,e,"")}else for(const t in e)null==n[t]&&w(r,t,"");for(const t in n)"display"===t&&(s=!0),w(r,t,n[t])}else if(i){if(e!==n){const t=r[m];t&&(n+=";"+t),r.cssText=n,s=b.test(n)}}else e&&t.removeAttribute("style");g in t&&(t[g]=s?r.display:"",t[y]&&(r.display="none"))}const x=/\s*!important$/;function w(t,e,n){if((0,o.cy)(n))n.forEach((n=>w(t,e,n)));else if(null==n&&(n=""),e.startsWith("--"))t.setProperty(e,n);else{const r=C(t,e);x.test(n)?t.setProperty((0,o.Tg)(r),n.replace(x,""),"important"):t[r]=n}}const S=["Webkit","Moz","ms"],T={};function C(t,e){const n=T[e];if(n)return n;let r=(0,o.PT)(e);if("filter"!==r&&r in t)return T[e]=r;r=(0,o.ZH)(r);for(let o=0;o<S.length;o++){const n=S[o]+r;if(n in t)return T[e]=n}return e}const O="http://www.w3.org/1999/xlink";function E(t,e,n,r,i,s=(0,o.J$)(e)){r&&e.startsWith("xlink:")?null==n?t.removeAttributeNS(O,e.slice(6,e.length)):t.setAttributeNS(O,e,n):null==n||s&&!(0,o.Y2)(n)?t.removeAttribute(e):t.setAttribute(e,s?"":(0,o.Bm)(n)?String(n):n)}function k(t,e,n,r,i){if("innerHTML"===e||"textContent"===e)return void(null!=n&&(t[e]="innerHTML"===e?c(n):n));const s=t.tagName;if("value"===e&&"PROGRESS"!==s&&!s.includes("-")){const r="OPTION"===s?t.getAttribute("value")||"":t.value,o=null==n?"checkbox"===t.type?"on":"":String(n);return r===o&&"_value"in t||(t.value=o),null==n&&t.removeAttribute(e),void(t._value=n)}let l=!1;if(""===n||null==n){const r=typeof t[e];"boolean"===r?n=(0,o.Y2)(n):null==n&&"string"===r?(n="",l=!0):"number"===r&&(n=0,l=!0)}try{t[e]=n}catch(J){0}l&&t.removeAttribute(i||e)}function j(t,e,n,r){t.addEventListener(e,n,r)}function P(t,e,n,r){t.removeEventListener(e,n,r)}const M=Symbol("_vei");function $(t,e,n,r,o=null){const i=t[M]||(t[M]={}),s=i[e];if(r&&s)s.value=r;else{const[n,c]=I(e);if(r){const s=i[e]=L(r,o);j(t,n,s,c)}else s&&(P(t,n,s,c),i[e]=void 0)}}const A=/(?:Once|Passive|Capture)$/;function I(t){let e;if(A.test(t)){let n;e={};while(n=t.match(A))t=t.slice(0,t.length-n[0].length),e[n[0].toLowerCase()]=!0}const n=":"===t[2]?t.slice(3):(0,o.Tg)(t.slice(2));return[n,e]}let F=0;const R=Promise.resolve(),D=()=>F||(R.then((()=>F=0)),F=Date.now());function L(t,e){const n=t=>{if(t._vts){if(t._vts<=n.attached)return}else t._vts=Date.now();(0,r.qL)(N(t,n.value),e,5,[t])};return n.value=t,n.attached=D(),n}function N(t,e){if((0,o.cy)(e)){const n=t.stopImmediatePropagation;return t.stopImmediatePropagation=()=>{n.call(t),t._stopped=!0},e.map((t=>e=>!e._stopped&&t&&t(e)))}return e}const U=t=>111===t.charCodeAt(0)&&110===t.charCodeAt(1)&&t.charCodeAt(2)>96&&t.charCodeAt(2)<123,B=(t,e,n,r,i,s)=>{const c="svg"===i;"class"===e?v(t,r,c):"style"===e?_(t,n,r):(0,o.Mp)(e)?(0,o.CP)(e)||$(t,e,n,r,s):("."===e[0]?(e=e.slice(1),1):"^"===e[0]?(e=e.slice(1),0):V(t,e,r,c))?(k(t,e,r),t.tagName.includes("-")||"value"!==e&&"checked"!==e&&"selected"!==e||E(t,e,r,c,s,"value"!==e)):!t._isVueCE||!/[A-Z]/.test(e)&&(0,o.Kg)(r)?("true-value"===e?t._trueValue=r:"false-value"===e&&(t._falseValue=r),E(t,e,r,c)):k(t,(0,o.PT)(e),r,s,e)};function V(t,e,n,r){if(r)return"innerHTML"===e||"textContent"===e||!!(e in t&&U(e)&&(0,o.Tn)(n));if("spellcheck"===e||"draggable"===e||"translate"===e)return!1;if("form"===e)return!1;if("list"===e&&"INPUT"===t.tagName)return!1;if("type"===e&&"TEXTAREA"===t.tagName)return!1;if("width"===e||"height"===e){const e=t.tagName;if("IMG"===e||"VIDEO"===e||"CANVAS"===e||"SOURCE"===e)return!1}return(!U(e)||!(0,o.Kg)(n))&&e in t}
+let i;const s="undefined"!==typeof window&&window.trustedTypes;if(s)try{i=s.createPolicy("vue",{createHTML:t=>t})}catch(J){}const c=i?t=>i.createHTML(t):t=>t,u="http://www.w3.org/2000/svg",l="http://www.w3.org/1998/Math/MathML",a="undefined"!==typeof document?document:null,f=a&&a.createElement("template"),p={insert:(t,e,n)=>{e.insertBefore(t,n||null)},remove:t=>{const e=t.parentNode;e&&e.removeChild(t)},createElement:(t,e,n,r)=>{const o="svg"===e?a.createElementNS(u,t):"mathml"===e?a.createElementNS(l,t):n?a.createElement(t,{is:n}):a.createElement(t);return"select"===t&&r&&null!=r.multiple&&o.setAttribute("multiple",r.multiple),o},createText:t=>a.createTextNode(t),createComment:t=>a.createComment(t),setText:(t,e)=>{t.nodeValue=e},setElementText:(t,e)=>{t.textContent=e},parentNode:t=>t.parentNode,nextSibling:t=>t.nextSibling,querySelector:t=>a.querySelector(t),setScopeId(t,e){t.setAttribute(e,"")},insertStaticContent(t,e,n,r,o,i){const s=n?n.previousSibling:e.lastChild;if(o&&(o===i||o.nextSibling)){while(1)if(e.insertBefore(o.cloneNode(!0),n),o===i||!(o=o.nextSibling))break}else{f.innerHTML=c("svg"===r?`<svg>${t}</svg>`:"mathml"===r?`<math>${t}</math>`:t);const o=f.content;if("svg"===r||"mathml"===r){const t=o.firstChild;while(t.firstChild)o.appendChild(t.firstChild);o.removeChild(t)}e.insertBefore(o,n)}return[s?s.nextSibling:e.firstChild,n?n.previousSibling:e.lastChild]}},d=Symbol("_vtc"),h={name:String,type:String,css:{type:Boolean,default:!0},duration:[String,Number,Object],enterFromClass:String,enterActiveClass:String,enterToClass:String,appearFromClass:String,appearActiveClass:String,appearToClass:String,leaveFromClass:String,leaveActiveClass:String,leaveToClass:String};r.QP;function v(t,e,n){const r=t[d];r&&(e=(e?[e,...r]:[...r]).join(" ")),null==e?t.removeAttribute("class"):n?t.setAttribute("class",e):t.className=e}const g=Symbol("_vod"),y=Symbol("_vsh");const m=Symbol("");const b=/(^|;)\s*display\s*:/;function _(t,e,n){const r=t.style,i=(0,o.Kg)(n);let s=!1;if(n&&!i){if(e)if((0,o.Kg)(e))for(const t of e.split(";")){const e=t.slice(0,t.indexOf(":")).trim();null==n[e]&&w(r,e,"")}else for(const t in e)null==n[t]&&w(r,t,"");for(const t in n)"display"===t&&(s=!0),w(r,t,n[t])}else if(i){if(e!==n){const t=r[m];t&&(n+=";"+t),r.cssText=n,s=b.test(n)}}else e&&t.removeAttribute("style");g in t&&(t[g]=s?r.display:"",t[y]&&(r.display="none"))}const x=/\s*!important$/;function w(t,e,n){if((0,o.cy)(n))n.forEach((n=>w(t,e,n)));else if(null==n&&(n=""),e.startsWith("--"))t.setProperty(e,n);else{const r=C(t,e);x.test(n)?t.setProperty((0,o.Tg)(r),n.replace(x,""),"important"):t[r]=n}}const S=["Webkit","Moz","ms"],T={};function C(t,e){const n=T[e];if(n)return n;let r=(0,o.PT)(e);if("filter"!==r&&r in t)return T[e]=r;r=(0,o.ZH)(r);for(let o=0;o<S.length;o++){const n=S[o]+r;if(n in t)return T[e]=n}return e}const O="http://www.w3.org/1999/xlink";function E(t,e,n,r,i,s=(0,o.J$)(e)){r&&e.startsWith("xlink:")?null==n?t.removeAttributeNS(O,e.slice(6,e.length)):t.setAttributeNS(O,e,n):null==n||s&&!(0,o.Y2)(n)?t.removeAttribute(e):t.setAttribute(e,s?"":(0,o.Bm)(n)?String(n):n)}function k(t,e,n,r,i){if("innerHTML"===e||"textContent"===e)return void(null!=n&&(t[e]="innerHTML"===e?c(n):n));const s=t.tagName;if("value"===e&&"PROGRESS"!==s&&!s.includes("-")){const r="OPTION"===s?t.getAttribute("value")||"":t.value,o=null==n?"checkbox"===t.type?"on":"":String(n);return r===o&&"_value"in t||(t.value=o),null==n&&t.removeAttribute(e),void(t._value=n)}let u=!1;if(""===n||null==n){const r=typeof t[e];"boolean"===r?n=(0,o.Y2)(n):null==n&&"string"===r?(n="",u=!0):"number"===r&&(n=0,u=!0)}try{t[e]=n}catch(J){0}u&&t.removeAttribute(i||e)}function P(t,e,n,r){t.addEventListener(e,n,r)}function j(t,e,n,r){t.removeEventListener(e,n,r)}const M=Symbol("_vei");function I(t,e,n,r,o=null){const i=t[M]||(t[M]={}),s=i[e];if(r&&s)s.value=r;else{const[n,c]=A(e);if(r){const s=i[e]=L(r,o);P(t,n,s,c)}else s&&(j(t,n,s,c),i[e]=void 0)}}const $=/(?:Once|Passive|Capture)$/;function A(t){let e;if($.test(t)){let n;e={};while(n=t.match($))t=t.slice(0,t.length-n[0].length),e[n[0].toLowerCase()]=!0}const n=":"===t[2]?t.slice(3):(0,o.Tg)(t.slice(2));return[n,e]}let F=0;const R=Promise.resolve(),D=()=>F||(R.then((()=>F=0)),F=Date.now());function L(t,e){const n=t=>{if(t._vts){if(t._vts<=n.attached)return}else t._vts=Date.now();(0,r.qL)(N(t,n.value),e,5,[t])};return n.value=t,n.attached=D(),n}function N(t,e){if((0,o.cy)(e)){const n=t.stopImmediatePropagation;return t.stopImmediatePropagation=()=>{n.call(t),t._stopped=!0},e.map((t=>e=>!e._stopped&&t&&t(e)))}return e}const U=t=>111===t.charCodeAt(0)&&110===t.charCodeAt(1)&&t.charCodeAt(2)>96&&t.charCodeAt(2)<123,B=(t,e,n,r,i,s)=>{const c="svg"===i;"class"===e?v(t,r,c):"style"===e?_(t,n,r):(0,o.Mp)(e)?(0,o.CP)(e)||I(t,e,n,r,s):("."===e[0]?(e=e.slice(1),1):"^"===e[0]?(e=e.slice(1),0):H(t,e,r,c))?(k(t,e,r),t.tagName.includes("-")||"value"!==e&&"checked"!==e&&"selected"!==e||E(t,e,r,c,s,"value"!==e)):!t._isVueCE||!/[A-Z]/.test(e)&&(0,o.Kg)(r)?("true-value"===e?t._trueValue=r:"false-value"===e&&(t._falseValue=r),E(t,e,r,c)):k(t,(0,o.PT)(e),r,s,e)};function H(t,e,n,r){if(r)return"innerHTML"===e||"textContent"===e||!!(e in t&&U(e)&&(0,o.Tn)(n));if("spellcheck"===e||"draggable"===e||"translate"===e)return!1;if("form"===e)return!1;if("list"===e&&"INPUT"===t.tagName)return!1;if("type"===e&&"TEXTAREA"===t.tagName)return!1;if("width"===e||"height"===e){const e=t.tagName;if("IMG"===e||"VIDEO"===e||"CANVAS"===e||"SOURCE"===e)return!1}return(!U(e)||!(0,o.Kg)(n))&&e in t}
 /*! #__NO_SIDE_EFFECTS__ */
-"undefined"!==typeof HTMLElement&&HTMLElement;Symbol("_moveCb"),Symbol("_enterCb");Symbol("_assign");const Z=["ctrl","shift","alt","meta"],H={stop:t=>t.stopPropagation(),prevent:t=>t.preventDefault(),self:t=>t.target!==t.currentTarget,ctrl:t=>!t.ctrlKey,shift:t=>!t.shiftKey,alt:t=>!t.altKey,meta:t=>!t.metaKey,left:t=>"button"in t&&0!==t.button,middle:t=>"button"in t&&1!==t.button,right:t=>"button"in t&&2!==t.button,exact:(t,e)=>Z.some((n=>t[`${n}Key`]&&!e.includes(n)))},W=(t,e)=>{const n=t._withMods||(t._withMods={}),r=e.join(".");return n[r]||(n[r]=(n,...r)=>{for(let t=0;t<e.length;t++){const r=H[e[t]];if(r&&r(n,e))return}return t(n,...r)})},G=(0,o.X$)({patchProp:B},p);let K;function X(){return K||(K=(0,r.K9)(G))}const z=(...t)=>{const e=X().createApp(...t);const{mount:n}=e;return e.mount=t=>{const r=q(t);if(!r)return;const i=e._component;(0,o.Tn)(i)||i.render||i.template||(i.template=r.innerHTML),1===r.nodeType&&(r.textContent="");const s=n(r,!1,Y(r));return r instanceof Element&&(r.removeAttribute("v-cloak"),r.setAttribute("data-v-app","")),s},e};function Y(t){return t instanceof SVGElement?"svg":"function"===typeof MathMLElement&&t instanceof MathMLElement?"mathml":void 0}function q(t){if((0,o.Kg)(t)){const e=document.querySelector(t);return e}return t}},4055:function(t,e,n){var r=n(4576),o=n(34),i=r.document,s=o(i)&&o(i.createElement);t.exports=function(t){return s?i.createElement(t):{}}},4117:function(t){t.exports=function(t){return null===t||void 0===t}},4209:function(t,e,n){var r=n(8227),o=n(6269),i=r("iterator"),s=Array.prototype;t.exports=function(t){return void 0!==t&&(o.Array===t||s[i]===t)}},4270:function(t,e,n){var r=n(9565),o=n(4901),i=n(34),s=TypeError;t.exports=function(t,e){var n,c;if("string"===e&&o(n=t.toString)&&!i(c=r(n,t)))return c;if(o(n=t.valueOf)&&!i(c=r(n,t)))return c;if("string"!==e&&o(n=t.toString)&&!i(c=r(n,t)))return c;throw new s("Can't convert object to primitive value")}},4495:function(t,e,n){var r=n(9519),o=n(9039),i=n(4576),s=i.String;t.exports=!!Object.getOwnPropertySymbols&&!o((function(){var t=Symbol("symbol detection");return!s(t)||!(Object(t)instanceof Symbol)||!Symbol.sham&&r&&r<41}))},4576:function(t,e,n){var r=function(t){return t&&t.Math===Math&&t};t.exports=r("object"==typeof globalThis&&globalThis)||r("object"==typeof window&&window)||r("object"==typeof self&&self)||r("object"==typeof n.g&&n.g)||r("object"==typeof this&&this)||function(){return this}()||Function("return this")()},4659:function(t,e,n){var r=n(3724),o=n(4913),i=n(6980);t.exports=function(t,e,n){r?o.f(t,e,i(0,n)):t[e]=n}},4901:function(t){var e="object"==typeof document&&document.all;t.exports="undefined"==typeof e&&void 0!==e?function(t){return"function"==typeof t||t===e}:function(t){return"function"==typeof t}},4913:function(t,e,n){var r=n(3724),o=n(5917),i=n(8686),s=n(8551),c=n(6969),l=TypeError,u=Object.defineProperty,a=Object.getOwnPropertyDescriptor,f="enumerable",p="configurable",d="writable";e.f=r?i?function(t,e,n){if(s(t),e=c(e),s(n),"function"===typeof t&&"prototype"===e&&"value"in n&&d in n&&!n[d]){var r=a(t,e);r&&r[d]&&(t[e]=n.value,n={configurable:p in n?n[p]:r[p],enumerable:f in n?n[f]:r[f],writable:!1})}return u(t,e,n)}:u:function(t,e,n){if(s(t),e=c(e),s(n),o)try{return u(t,e,n)}catch(r){}if("get"in n||"set"in n)throw new l("Accessors not supported");return"value"in n&&(t[e]=n.value),t}},5031:function(t,e,n){var r=n(7751),o=n(9504),i=n(8480),s=n(3717),c=n(8551),l=o([].concat);t.exports=r("Reflect","ownKeys")||function(t){var e=i.f(c(t)),n=s.f;return n?l(e,n(t)):e}},5397:function(t,e,n){var r=n(7055),o=n(7750);t.exports=function(t){return r(o(t))}},5610:function(t,e,n){var r=n(1291),o=Math.max,i=Math.min;t.exports=function(t,e){var n=r(t);return n<0?o(n+e,0):i(n,e)}},5745:function(t,e,n){var r=n(7629);t.exports=function(t,e){return r[t]||(r[t]=e||{})}},5917:function(t,e,n){var r=n(3724),o=n(9039),i=n(4055);t.exports=!r&&!o((function(){return 7!==Object.defineProperty(i("div"),"a",{get:function(){return 7}}).a}))},5966:function(t,e,n){var r=n(9306),o=n(4117);t.exports=function(t,e){var n=t[e];return o(n)?void 0:r(n)}},6080:function(t,e,n){var r=n(7476),o=n(9306),i=n(616),s=r(r.bind);t.exports=function(t,e){return o(t),void 0===e?t:i?s(t,e):function(){return t.apply(e,arguments)}}},6119:function(t,e,n){var r=n(5745),o=n(3392),i=r("keys");t.exports=function(t){return i[t]||(i[t]=o(t))}},6198:function(t,e,n){var r=n(8014);t.exports=function(t){return r(t.length)}},6262:function(t,e){e.A=(t,e)=>{const n=t.__vccOpts||t;for(const[r,o]of e)n[r]=o;return n}},6269:function(t){t.exports={}},6395:function(t){t.exports=!1},6518:function(t,e,n){var r=n(4576),o=n(7347).f,i=n(6699),s=n(6840),c=n(9433),l=n(7740),u=n(2796);t.exports=function(t,e){var n,a,f,p,d,h,v=t.target,g=t.global,y=t.stat;if(a=g?r:y?r[v]||c(v,{}):r[v]&&r[v].prototype,a)for(f in e){if(d=e[f],t.dontCallGetSet?(h=o(a,f),p=h&&h.value):p=a[f],n=u(g?f:v+(y?".":"#")+f,t.forced),!n&&void 0!==p){if(typeof d==typeof p)continue;l(d,p)}(t.sham||p&&p.sham)&&i(d,"sham",!0),s(a,f,d,t)}}},6699:function(t,e,n){var r=n(3724),o=n(4913),i=n(6980);t.exports=r?function(t,e,n){return o.f(t,e,i(1,n))}:function(t,e,n){return t[e]=n,t}},6801:function(t,e,n){var r=n(3724),o=n(8686),i=n(4913),s=n(8551),c=n(5397),l=n(1072);e.f=r&&!o?Object.defineProperties:function(t,e){s(t);var n,r=c(e),o=l(e),u=o.length,a=0;while(u>a)i.f(t,n=o[a++],r[n]);return t}},6823:function(t){var e=String;t.exports=function(t){try{return e(t)}catch(n){return"Object"}}},6840:function(t,e,n){var r=n(4901),o=n(4913),i=n(283),s=n(9433);t.exports=function(t,e,n,c){c||(c={});var l=c.enumerable,u=void 0!==c.name?c.name:e;if(r(n)&&i(n,u,c),c.global)l?t[e]=n:s(e,n);else{try{c.unsafe?t[e]&&(l=!0):delete t[e]}catch(a){}l?t[e]=n:o.f(t,e,{value:n,enumerable:!1,configurable:!c.nonConfigurable,writable:!c.nonWritable})}return t}},6955:function(t,e,n){var r=n(2140),o=n(4901),i=n(2195),s=n(8227),c=s("toStringTag"),l=Object,u="Arguments"===i(function(){return arguments}()),a=function(t,e){try{return t[e]}catch(n){}};t.exports=r?i:function(t){var e,n,r;return void 0===t?"Undefined":null===t?"Null":"string"==typeof(n=a(e=l(t),c))?n:u?i(e):"Object"===(r=i(e))&&o(e.callee)?"Arguments":r}},6969:function(t,e,n){var r=n(2777),o=n(757);t.exports=function(t){var e=r(t,"string");return o(e)?e:e+""}},6980:function(t){t.exports=function(t,e){return{enumerable:!(1&t),configurable:!(2&t),writable:!(4&t),value:e}}},7040:function(t,e,n){var r=n(4495);t.exports=r&&!Symbol.sham&&"symbol"==typeof Symbol.iterator},7055:function(t,e,n){var r=n(9504),o=n(9039),i=n(2195),s=Object,c=r("".split);t.exports=o((function(){return!s("z").propertyIsEnumerable(0)}))?function(t){return"String"===i(t)?c(t,""):s(t)}:s},7347:function(t,e,n){var r=n(3724),o=n(9565),i=n(8773),s=n(6980),c=n(5397),l=n(6969),u=n(9297),a=n(5917),f=Object.getOwnPropertyDescriptor;e.f=r?f:function(t,e){if(t=c(t),e=l(e),a)try{return f(t,e)}catch(n){}if(u(t,e))return s(!o(i.f,t,e),t[e])}},7476:function(t,e,n){var r=n(2195),o=n(9504);t.exports=function(t){if("Function"===r(t))return o(t)}},7629:function(t,e,n){var r=n(6395),o=n(4576),i=n(9433),s="__core-js_shared__",c=t.exports=o[s]||i(s,{});(c.versions||(c.versions=[])).push({version:"3.41.0",mode:r?"pure":"global",copyright:"© 2014-2025 Denis Pushkarev (zloirock.ru)",license:"https://github.com/zloirock/core-js/blob/v3.41.0/LICENSE",source:"https://github.com/zloirock/core-js"})},7657:function(t,e,n){var r,o,i,s=n(9039),c=n(4901),l=n(34),u=n(2360),a=n(2787),f=n(6840),p=n(8227),d=n(6395),h=p("iterator"),v=!1;[].keys&&(i=[].keys(),"next"in i?(o=a(a(i)),o!==Object.prototype&&(r=o)):v=!0);var g=!l(r)||s((function(){var t={};return r[h].call(t)!==t}));g?r={}:d&&(r=u(r)),c(r[h])||f(r,h,(function(){return this})),t.exports={IteratorPrototype:r,BUGGY_SAFARI_ITERATORS:v}},7740:function(t,e,n){var r=n(9297),o=n(5031),i=n(7347),s=n(4913);t.exports=function(t,e,n){for(var c=o(e),l=s.f,u=i.f,a=0;a<c.length;a++){var f=c[a];r(t,f)||n&&r(n,f)||l(t,f,u(e,f))}}},7750:function(t,e,n){var r=n(4117),o=TypeError;t.exports=function(t){if(r(t))throw new o("Can't call method on "+t);return t}},7751:function(t,e,n){var r=n(4576),o=n(4901),i=function(t){return o(t)?t:void 0};t.exports=function(t,e){return arguments.length<2?i(r[t]):r[t]&&r[t][e]}},8014:function(t,e,n){var r=n(1291),o=Math.min;t.exports=function(t){var e=r(t);return e>0?o(e,9007199254740991):0}},8111:function(t,e,n){var r=n(6518),o=n(4576),i=n(679),s=n(8551),c=n(4901),l=n(2787),u=n(2106),a=n(4659),f=n(9039),p=n(9297),d=n(8227),h=n(7657).IteratorPrototype,v=n(3724),g=n(6395),y="constructor",m="Iterator",b=d("toStringTag"),_=TypeError,x=o[m],w=g||!c(x)||x.prototype!==h||!f((function(){x({})})),S=function(){if(i(this,h),l(this)===h)throw new _("Abstract class Iterator not directly constructable")},T=function(t,e){v?u(h,t,{configurable:!0,get:function(){return e},set:function(e){if(s(this),this===h)throw new _("You can't redefine this property");p(this,t)?this[t]=e:a(this,t,e)}}):h[t]=e};p(h,b)||T(b,m),!w&&p(h,y)&&h[y]!==Object||T(y,S),S.prototype=h,r({global:!0,constructor:!0,forced:w},{Iterator:S})},8227:function(t,e,n){var r=n(4576),o=n(5745),i=n(9297),s=n(3392),c=n(4495),l=n(7040),u=r.Symbol,a=o("wks"),f=l?u["for"]||u:u&&u.withoutSetter||s;t.exports=function(t){return i(a,t)||(a[t]=c&&i(u,t)?u[t]:f("Symbol."+t)),a[t]}},8480:function(t,e,n){var r=n(1828),o=n(8727),i=o.concat("length","prototype");e.f=Object.getOwnPropertyNames||function(t){return r(t,i)}},8551:function(t,e,n){var r=n(34),o=String,i=TypeError;t.exports=function(t){if(r(t))return t;throw new i(o(t)+" is not an object")}},8622:function(t,e,n){var r=n(4576),o=n(4901),i=r.WeakMap;t.exports=o(i)&&/native code/.test(String(i))},8686:function(t,e,n){var r=n(3724),o=n(9039);t.exports=r&&o((function(){return 42!==Object.defineProperty((function(){}),"prototype",{value:42,writable:!1}).prototype}))},8727:function(t){t.exports=["constructor","hasOwnProperty","isPrototypeOf","propertyIsEnumerable","toLocaleString","toString","valueOf"]},8773:function(t,e){var n={}.propertyIsEnumerable,r=Object.getOwnPropertyDescriptor,o=r&&!n.call({1:2},1);e.f=o?function(t){var e=r(this,t);return!!e&&e.enumerable}:n},8981:function(t,e,n){var r=n(7750),o=Object;t.exports=function(t){return o(r(t))}},9039:function(t){t.exports=function(t){try{return!!t()}catch(e){return!0}}},9297:function(t,e,n){var r=n(9504),o=n(8981),i=r({}.hasOwnProperty);t.exports=Object.hasOwn||function(t,e){return i(o(t),e)}},9306:function(t,e,n){var r=n(4901),o=n(6823),i=TypeError;t.exports=function(t){if(r(t))return t;throw new i(o(t)+" is not a function")}},9433:function(t,e,n){var r=n(4576),o=Object.defineProperty;t.exports=function(t,e){try{o(r,t,{value:e,configurable:!0,writable:!0})}catch(n){r[t]=e}return e}},9504:function(t,e,n){var r=n(616),o=Function.prototype,i=o.call,s=r&&o.bind.bind(i,i);t.exports=r?s:function(t){return function(){return i.apply(t,arguments)}}},9519:function(t,e,n){var r,o,i=n(4576),s=n(2839),c=i.process,l=i.Deno,u=c&&c.versions||l&&l.version,a=u&&u.v8;a&&(r=a.split("."),o=r[0]>0&&r[0]<4?1:+(r[0]+r[1])),!o&&s&&(r=s.match(/Edge\/(\d+)/),(!r||r[1]>=74)&&(r=s.match(/Chrome\/(\d+)/),r&&(o=+r[1]))),t.exports=o},9539:function(t,e,n){var r=n(9565),o=n(8551),i=n(5966);t.exports=function(t,e,n){var s,c;o(t);try{if(s=i(t,"return"),!s){if("throw"===e)throw n;return n}s=r(s,t)}catch(l){c=!0,s=l}if("throw"===e)throw n;if(c)throw s;return o(s),n}},9565:function(t,e,n){var r=n(616),o=Function.prototype.call;t.exports=r?o.bind(o):function(){return o.apply(o,arguments)}},9617:function(t,e,n){var r=n(5397),o=n(5610),i=n(6198),s=function(t){return function(e,n,s){var c=r(e),l=i(c);if(0===l)return!t&&-1;var u,a=o(s,l);if(t&&n!==n){while(l>a)if(u=c[a++],u!==u)return!0}else for(;l>a;a++)if((t||a in c)&&c[a]===n)return t||a||0;return!t&&-1}};t.exports={includes:s(!0),indexOf:s(!1)}}}]);
\ No newline at end of file
+"undefined"!==typeof HTMLElement&&HTMLElement;Symbol("_moveCb"),Symbol("_enterCb");Symbol("_assign");const V=["ctrl","shift","alt","meta"],Z={stop:t=>t.stopPropagation(),prevent:t=>t.preventDefault(),self:t=>t.target!==t.currentTarget,ctrl:t=>!t.ctrlKey,shift:t=>!t.shiftKey,alt:t=>!t.altKey,meta:t=>!t.metaKey,left:t=>"button"in t&&0!==t.button,middle:t=>"button"in t&&1!==t.button,right:t=>"button"in t&&2!==t.button,exact:(t,e)=>V.some((n=>t[`${n}Key`]&&!e.includes(n)))},W=(t,e)=>{const n=t._withMods||(t._withMods={}),r=e.join(".");return n[r]||(n[r]=(n,...r)=>{for(let t=0;t<e.length;t++){const r=Z[e[t]];if(r&&r(n,e))return}return t(n,...r)})},G=(0,o.X$)({patchProp:B},p);let K;function X(){return K||(K=(0,r.K9)(G))}const z=(...t)=>{const e=X().createApp(...t);const{mount:n}=e;return e.mount=t=>{const r=q(t);if(!r)return;const i=e._component;(0,o.Tn)(i)||i.render||i.template||(i.template=r.innerHTML),1===r.nodeType&&(r.textContent="");const s=n(r,!1,Y(r));return r instanceof Element&&(r.removeAttribute("v-cloak"),r.setAttribute("data-v-app","")),s},e};function Y(t){return t instanceof SVGElement?"svg":"function"===typeof MathMLElement&&t instanceof MathMLElement?"mathml":void 0}function q(t){if((0,o.Kg)(t)){const e=document.querySelector(t);return e}return t}},4055:function(t,e,n){var r=n(4576),o=n(34),i=r.document,s=o(i)&&o(i.createElement);t.exports=function(t){return s?i.createElement(t):{}}},4117:function(t){t.exports=function(t){return null===t||void 0===t}},4209:function(t,e,n){var r=n(8227),o=n(6269),i=r("iterator"),s=Array.prototype;t.exports=function(t){return void 0!==t&&(o.Array===t||s[i]===t)}},4270:function(t,e,n){var r=n(9565),o=n(4901),i=n(34),s=TypeError;t.exports=function(t,e){var n,c;if("string"===e&&o(n=t.toString)&&!i(c=r(n,t)))return c;if(o(n=t.valueOf)&&!i(c=r(n,t)))return c;if("string"!==e&&o(n=t.toString)&&!i(c=r(n,t)))return c;throw new s("Can't convert object to primitive value")}},4495:function(t,e,n){var r=n(9519),o=n(9039),i=n(4576),s=i.String;t.exports=!!Object.getOwnPropertySymbols&&!o((function(){var t=Symbol("symbol detection");return!s(t)||!(Object(t)instanceof Symbol)||!Symbol.sham&&r&&r<41}))},4576:function(t,e,n){var r=function(t){return t&&t.Math===Math&&t};t.exports=r("object"==typeof globalThis&&globalThis)||r("object"==typeof window&&window)||r("object"==typeof self&&self)||r("object"==typeof n.g&&n.g)||r("object"==typeof this&&this)||function(){return this}()||Function("return this")()},4659:function(t,e,n){var r=n(3724),o=n(4913),i=n(6980);t.exports=function(t,e,n){r?o.f(t,e,i(0,n)):t[e]=n}},4901:function(t){var e="object"==typeof document&&document.all;t.exports="undefined"==typeof e&&void 0!==e?function(t){return"function"==typeof t||t===e}:function(t){return"function"==typeof t}},4913:function(t,e,n){var r=n(3724),o=n(5917),i=n(8686),s=n(8551),c=n(6969),u=TypeError,l=Object.defineProperty,a=Object.getOwnPropertyDescriptor,f="enumerable",p="configurable",d="writable";e.f=r?i?function(t,e,n){if(s(t),e=c(e),s(n),"function"===typeof t&&"prototype"===e&&"value"in n&&d in n&&!n[d]){var r=a(t,e);r&&r[d]&&(t[e]=n.value,n={configurable:p in n?n[p]:r[p],enumerable:f in n?n[f]:r[f],writable:!1})}return l(t,e,n)}:l:function(t,e,n){if(s(t),e=c(e),s(n),o)try{return l(t,e,n)}catch(r){}if("get"in n||"set"in n)throw new u("Accessors not supported");return"value"in n&&(t[e]=n.value),t}},5031:function(t,e,n){var r=n(7751),o=n(9504),i=n(8480),s=n(3717),c=n(8551),u=o([].concat);t.exports=r("Reflect","ownKeys")||function(t){var e=i.f(c(t)),n=s.f;return n?u(e,n(t)):e}},5397:function(t,e,n){var r=n(7055),o=n(7750);t.exports=function(t){return r(o(t))}},5610:function(t,e,n){var r=n(1291),o=Math.max,i=Math.min;t.exports=function(t,e){var n=r(t);return n<0?o(n+e,0):i(n,e)}},5745:function(t,e,n){var r=n(7629);t.exports=function(t,e){return r[t]||(r[t]=e||{})}},5917:function(t,e,n){var r=n(3724),o=n(9039),i=n(4055);t.exports=!r&&!o((function(){return 7!==Object.defineProperty(i("div"),"a",{get:function(){return 7}}).a}))},5966:function(t,e,n){var r=n(9306),o=n(4117);t.exports=function(t,e){var n=t[e];return o(n)?void 0:r(n)}},6080:function(t,e,n){var r=n(7476),o=n(9306),i=n(616),s=r(r.bind);t.exports=function(t,e){return o(t),void 0===e?t:i?s(t,e):function(){return t.apply(e,arguments)}}},6119:function(t,e,n){var r=n(5745),o=n(3392),i=r("keys");t.exports=function(t){return i[t]||(i[t]=o(t))}},6198:function(t,e,n){var r=n(8014);t.exports=function(t){return r(t.length)}},6262:function(t,e){e.A=(t,e)=>{const n=t.__vccOpts||t;for(const[r,o]of e)n[r]=o;return n}},6269:function(t){t.exports={}},6279:function(t,e,n){var r=n(6840);t.exports=function(t,e,n){for(var o in e)r(t,o,e[o],n);return t}},6319:function(t,e,n){var r=n(8551),o=n(9539);t.exports=function(t,e,n,i){try{return i?e(r(n)[0],n[1]):e(n)}catch(s){o(t,"throw",s)}}},6395:function(t){t.exports=!1},6518:function(t,e,n){var r=n(4576),o=n(7347).f,i=n(6699),s=n(6840),c=n(9433),u=n(7740),l=n(2796);t.exports=function(t,e){var n,a,f,p,d,h,v=t.target,g=t.global,y=t.stat;if(a=g?r:y?r[v]||c(v,{}):r[v]&&r[v].prototype,a)for(f in e){if(d=e[f],t.dontCallGetSet?(h=o(a,f),p=h&&h.value):p=a[f],n=l(g?f:v+(y?".":"#")+f,t.forced),!n&&void 0!==p){if(typeof d==typeof p)continue;u(d,p)}(t.sham||p&&p.sham)&&i(d,"sham",!0),s(a,f,d,t)}}},6699:function(t,e,n){var r=n(3724),o=n(4913),i=n(6980);t.exports=r?function(t,e,n){return o.f(t,e,i(1,n))}:function(t,e,n){return t[e]=n,t}},6801:function(t,e,n){var r=n(3724),o=n(8686),i=n(4913),s=n(8551),c=n(5397),u=n(1072);e.f=r&&!o?Object.defineProperties:function(t,e){s(t);var n,r=c(e),o=u(e),l=o.length,a=0;while(l>a)i.f(t,n=o[a++],r[n]);return t}},6823:function(t){var e=String;t.exports=function(t){try{return e(t)}catch(n){return"Object"}}},6840:function(t,e,n){var r=n(4901),o=n(4913),i=n(283),s=n(9433);t.exports=function(t,e,n,c){c||(c={});var u=c.enumerable,l=void 0!==c.name?c.name:e;if(r(n)&&i(n,l,c),c.global)u?t[e]=n:s(e,n);else{try{c.unsafe?t[e]&&(u=!0):delete t[e]}catch(a){}u?t[e]=n:o.f(t,e,{value:n,enumerable:!1,configurable:!c.nonConfigurable,writable:!c.nonWritable})}return t}},6955:function(t,e,n){var r=n(2140),o=n(4901),i=n(2195),s=n(8227),c=s("toStringTag"),u=Object,l="Arguments"===i(function(){return arguments}()),a=function(t,e){try{return t[e]}catch(n){}};t.exports=r?i:function(t){var e,n,r;return void 0===t?"Undefined":null===t?"Null":"string"==typeof(n=a(e=u(t),c))?n:l?i(e):"Object"===(r=i(e))&&o(e.callee)?"Arguments":r}},6969:function(t,e,n){var r=n(2777),o=n(757);t.exports=function(t){var e=r(t,"string");return o(e)?e:e+""}},6980:function(t){t.exports=function(t,e){return{enumerable:!(1&t),configurable:!(2&t),writable:!(4&t),value:e}}},7040:function(t,e,n){var r=n(4495);t.exports=r&&!Symbol.sham&&"symbol"==typeof Symbol.iterator},7055:function(t,e,n){var r=n(9504),o=n(9039),i=n(2195),s=Object,c=r("".split);t.exports=o((function(){return!s("z").propertyIsEnumerable(0)}))?function(t){return"String"===i(t)?c(t,""):s(t)}:s},7347:function(t,e,n){var r=n(3724),o=n(9565),i=n(8773),s=n(6980),c=n(5397),u=n(6969),l=n(9297),a=n(5917),f=Object.getOwnPropertyDescriptor;e.f=r?f:function(t,e){if(t=c(t),e=u(e),a)try{return f(t,e)}catch(n){}if(l(t,e))return s(!o(i.f,t,e),t[e])}},7476:function(t,e,n){var r=n(2195),o=n(9504);t.exports=function(t){if("Function"===r(t))return o(t)}},7588:function(t,e,n){var r=n(6518),o=n(2652),i=n(9306),s=n(8551),c=n(1767);r({target:"Iterator",proto:!0,real:!0},{forEach:function(t){s(this),i(t);var e=c(this),n=0;o(e,(function(e){t(e,n++)}),{IS_RECORD:!0})}})},7629:function(t,e,n){var r=n(6395),o=n(4576),i=n(9433),s="__core-js_shared__",c=t.exports=o[s]||i(s,{});(c.versions||(c.versions=[])).push({version:"3.41.0",mode:r?"pure":"global",copyright:"© 2014-2025 Denis Pushkarev (zloirock.ru)",license:"https://github.com/zloirock/core-js/blob/v3.41.0/LICENSE",source:"https://github.com/zloirock/core-js"})},7657:function(t,e,n){var r,o,i,s=n(9039),c=n(4901),u=n(34),l=n(2360),a=n(2787),f=n(6840),p=n(8227),d=n(6395),h=p("iterator"),v=!1;[].keys&&(i=[].keys(),"next"in i?(o=a(a(i)),o!==Object.prototype&&(r=o)):v=!0);var g=!u(r)||s((function(){var t={};return r[h].call(t)!==t}));g?r={}:d&&(r=l(r)),c(r[h])||f(r,h,(function(){return this})),t.exports={IteratorPrototype:r,BUGGY_SAFARI_ITERATORS:v}},7740:function(t,e,n){var r=n(9297),o=n(5031),i=n(7347),s=n(4913);t.exports=function(t,e,n){for(var c=o(e),u=s.f,l=i.f,a=0;a<c.length;a++){var f=c[a];r(t,f)||n&&r(n,f)||u(t,f,l(e,f))}}},7750:function(t,e,n){var r=n(4117),o=TypeError;t.exports=function(t){if(r(t))throw new o("Can't call method on "+t);return t}},7751:function(t,e,n){var r=n(4576),o=n(4901),i=function(t){return o(t)?t:void 0};t.exports=function(t,e){return arguments.length<2?i(r[t]):r[t]&&r[t][e]}},8014:function(t,e,n){var r=n(1291),o=Math.min;t.exports=function(t){var e=r(t);return e>0?o(e,9007199254740991):0}},8111:function(t,e,n){var r=n(6518),o=n(4576),i=n(679),s=n(8551),c=n(4901),u=n(2787),l=n(2106),a=n(4659),f=n(9039),p=n(9297),d=n(8227),h=n(7657).IteratorPrototype,v=n(3724),g=n(6395),y="constructor",m="Iterator",b=d("toStringTag"),_=TypeError,x=o[m],w=g||!c(x)||x.prototype!==h||!f((function(){x({})})),S=function(){if(i(this,h),u(this)===h)throw new _("Abstract class Iterator not directly constructable")},T=function(t,e){v?l(h,t,{configurable:!0,get:function(){return e},set:function(e){if(s(this),this===h)throw new _("You can't redefine this property");p(this,t)?this[t]=e:a(this,t,e)}}):h[t]=e};p(h,b)||T(b,m),!w&&p(h,y)&&h[y]!==Object||T(y,S),S.prototype=h,r({global:!0,constructor:!0,forced:w},{Iterator:S})},8227:function(t,e,n){var r=n(4576),o=n(5745),i=n(9297),s=n(3392),c=n(4495),u=n(7040),l=r.Symbol,a=o("wks"),f=u?l["for"]||l:l&&l.withoutSetter||s;t.exports=function(t){return i(a,t)||(a[t]=c&&i(l,t)?l[t]:f("Symbol."+t)),a[t]}},8480:function(t,e,n){var r=n(1828),o=n(8727),i=o.concat("length","prototype");e.f=Object.getOwnPropertyNames||function(t){return r(t,i)}},8551:function(t,e,n){var r=n(34),o=String,i=TypeError;t.exports=function(t){if(r(t))return t;throw new i(o(t)+" is not an object")}},8622:function(t,e,n){var r=n(4576),o=n(4901),i=r.WeakMap;t.exports=o(i)&&/native code/.test(String(i))},8686:function(t,e,n){var r=n(3724),o=n(9039);t.exports=r&&o((function(){return 42!==Object.defineProperty((function(){}),"prototype",{value:42,writable:!1}).prototype}))},8727:function(t){t.exports=["constructor","hasOwnProperty","isPrototypeOf","propertyIsEnumerable","toLocaleString","toString","valueOf"]},8773:function(t,e){var n={}.propertyIsEnumerable,r=Object.getOwnPropertyDescriptor,o=r&&!n.call({1:2},1);e.f=o?function(t){var e=r(this,t);return!!e&&e.enumerable}:n},8981:function(t,e,n){var r=n(7750),o=Object;t.exports=function(t){return o(r(t))}},9039:function(t){t.exports=function(t){try{return!!t()}catch(e){return!0}}},9297:function(t,e,n){var r=n(9504),o=n(8981),i=r({}.hasOwnProperty);t.exports=Object.hasOwn||function(t,e){return i(o(t),e)}},9306:function(t,e,n){var r=n(4901),o=n(6823),i=TypeError;t.exports=function(t){if(r(t))return t;throw new i(o(t)+" is not a function")}},9433:function(t,e,n){var r=n(4576),o=Object.defineProperty;t.exports=function(t,e){try{o(r,t,{value:e,configurable:!0,writable:!0})}catch(n){r[t]=e}return e}},9462:function(t,e,n){var r=n(9565),o=n(2360),i=n(6699),s=n(6279),c=n(8227),u=n(1181),l=n(5966),a=n(7657).IteratorPrototype,f=n(2529),p=n(9539),d=c("toStringTag"),h="IteratorHelper",v="WrapForValidIterator",g=u.set,y=function(t){var e=u.getterFor(t?v:h);return s(o(a),{next:function(){var n=e(this);if(t)return n.nextHandler();if(n.done)return f(void 0,!0);try{var r=n.nextHandler();return n.returnHandlerResult?r:f(r,n.done)}catch(o){throw n.done=!0,o}},return:function(){var n=e(this),o=n.iterator;if(n.done=!0,t){var i=l(o,"return");return i?r(i,o):f(void 0,!0)}if(n.inner)try{p(n.inner.iterator,"normal")}catch(s){return p(o,"throw",s)}return o&&p(o,"normal"),f(void 0,!0)}})},m=y(!0),b=y(!1);i(b,d,"Iterator Helper"),t.exports=function(t,e,n){var r=function(r,o){o?(o.iterator=r.iterator,o.next=r.next):o=r,o.type=e?v:h,o.returnHandlerResult=!!n,o.nextHandler=t,o.counter=0,o.done=!1,g(this,o)};return r.prototype=e?m:b,r}},9504:function(t,e,n){var r=n(616),o=Function.prototype,i=o.call,s=r&&o.bind.bind(i,i);t.exports=r?s:function(t){return function(){return i.apply(t,arguments)}}},9519:function(t,e,n){var r,o,i=n(4576),s=n(2839),c=i.process,u=i.Deno,l=c&&c.versions||u&&u.version,a=l&&l.v8;a&&(r=a.split("."),o=r[0]>0&&r[0]<4?1:+(r[0]+r[1])),!o&&s&&(r=s.match(/Edge\/(\d+)/),(!r||r[1]>=74)&&(r=s.match(/Chrome\/(\d+)/),r&&(o=+r[1]))),t.exports=o},9539:function(t,e,n){var r=n(9565),o=n(8551),i=n(5966);t.exports=function(t,e,n){var s,c;o(t);try{if(s=i(t,"return"),!s){if("throw"===e)throw n;return n}s=r(s,t)}catch(u){c=!0,s=u}if("throw"===e)throw n;if(c)throw s;return o(s),n}},9565:function(t,e,n){var r=n(616),o=Function.prototype.call;t.exports=r?o.bind(o):function(){return o.apply(o,arguments)}},9617:function(t,e,n){var r=n(5397),o=n(5610),i=n(6198),s=function(t){return function(e,n,s){var c=r(e),u=i(c);if(0===u)return!t&&-1;var l,a=o(s,u);if(t&&n!==n){while(u>a)if(l=c[a++],l!==l)return!0}else for(;u>a;a++)if((t||a in c)&&c[a]===n)return t||a||0;return!t&&-1}};t.exports={includes:s(!0),indexOf:s(!1)}}}]);
\ No newline at end of file
@@ -5,6 +5,11 @@
 
 import os
 import json
+import time
+import base64
+import hashlib
+import threading
+import numpy as np
 import pandas as pd
 import urllib.parse as ul
 
@@ -30,18 +35,111 @@ def create_link(page, **params):
     
     return base_url + "&".join(param_strings)
 
-def prepare_navigation_json(df, output_path="components/navigation_data.json"):
+# Уровни навигации в порядке вложенности и количество карточек в группе заданий
+NAVIGATION_KEYS = ["program", "module", "lesson", "gz"]
+TOP_CARDS = 10
+
+def url_quoter():
+    """Функция кодирования значения параметра URL (как в create_link) с кэшем по значению."""
+    quoted = {}
+    
+    def quote(value):
+        text = str(value)
+        result = quoted.get(text)
+        if result is None:
+            result = quoted[text] = ul.quote_plus(text)
+        return result
+    
+    return quote
+
+def _group_starts(values, parent_starts):
+    """Маска начала новой группы: сменилось значение ключа или родительская группа."""
+    starts = parent_starts.copy()
+    if len(values) > 1:
+        starts[1:] |= values[1:] != values[:-1]
+    return starts
+
+def _value_order(column):
+    """Ключ сортировки: категориальная колонка заменяется ее значениями."""
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return column.astype(object)
+    return column
+
+def sort_cards(df):
     """
-    Создает и сохраняет полный JSON со структурой навигации
+    Сортирует карточки для построения навигации и находит границы групп.
+    
+    Карточки сортируются один раз по программе, модулю, уроку, группе заданий
+    и убыванию риска (карточки без риска — в конце); границы групп всех
+    уровней находятся сравнением соседних строк.
     
     Args:
-        df: DataFrame с данными о курсах
-        output_path: Путь для сохранения JSON-файла
+        df: DataFrame с колонками program, module, lesson, gz, card_id, risk
     
     Returns:
-        dict: Структура навигации в виде словаря
+        tuple: (keys, card_ids, risks, level_starts) — массивы значений
+        NAVIGATION_KEYS, id и риск карточек в порядке сортировки и маски начала
+        групп каждого уровня; None, если карточек нет
+    """
+    data = df[NAVIGATION_KEYS + ["card_id", "risk"]].dropna(subset=NAVIGATION_KEYS)
+    if data.empty:
+        return None
+    data = data.assign(risk=pd.to_numeric(data["risk"], errors="coerce"))
+    # Категориальные колонки сортируются по значениям, а не по порядку категорий
+    data = data.sort_values(NAVIGATION_KEYS + ["risk"], ascending=[True] * len(NAVIGATION_KEYS) + [False],
+                            na_position="last", kind="mergesort", key=_value_order)
+    
+    keys = [data[key].to_numpy(dtype=object) for key in NAVIGATION_KEYS]
+    card_ids = data["card_id"].to_numpy(dtype=np.int64)
+    risks = data["risk"].to_numpy(dtype=np.float64)
+    
+    # Начала групп каждого уровня: группа уровня начинается и при смене любого родителя
+    starts = np.zeros(len(data), dtype=bool)
+    starts[0] = True
+    level_starts = []
+    for values in keys:
+        starts = _group_starts(values, starts)
+        level_starts.append(starts)
+    return keys, card_ids, risks, level_starts
+
+def card_items(card_ids, risks, card_url):
+    """
+    Элементы навигации для карточек.
+    
+    Args:
+        card_ids: id карточек
+        risks: Риск карточек (NaN — нет риска)
+        card_url: Начало ссылки на карточку (до значения card_id)
+    
+    Returns:
+        list: Словари карточек
+    """
+    cards = []
+    for card_id, risk in zip(card_ids.tolist(), risks.tolist()):
+        risk_json = None if risk != risk else risk
+        risk_str = "N/A" if risk_json is None else f"{risk_json:.2f}"
+        cards.append({
+            "id": str(card_id),
+            "name": f"ID: {card_id} - Риск: {risk_str}",
+            "risk": risk_json,
+            "url": f"{card_url}{card_id}"
+        })
+    return cards
+
+def build_navigation(df):
+    """
+    Строит структуру навигации за один проход по отсортированным карточкам.
+    
+    Карточки сортируются один раз (sort_cards), поэтому дерево собирается за
+    линейное время без повторной фильтрации DataFrame. В группу заданий
+    попадают TOP_CARDS карточек с наибольшим риском.
+    
+    Args:
+        df: DataFrame с колонками program, module, lesson, gz, card_id, risk
+    
+    Returns:
+        dict: Структура навигации
     """
-    # Создаем основную структуру
     navigation = {
         "main_sections": [
             {"id": "overview", "name": "Обзор", "icon": "📊", "url": create_link("overview")},
@@ -50,124 +148,253 @@ def prepare_navigation_json(df, output_path="components/navigation_data.json"):
         "programs": []
     }
     
-    # Получаем все уникальные программы
-    programs = sorted(df["program"].unique())
+    cards_sorted = sort_cards(df)
+    if cards_sorted is None:
+        return navigation
+    keys, card_ids, risks, level_starts = cards_sorted
+    program_starts, module_starts, lesson_starts, gz_starts = level_starts
+    n = len(card_ids)
     
-    # Для каждой программы
-    for program_name in programs:
-        program_df = df[df["program"] == program_name]
-        
-        # Создаем структуру программы
-        program = {
-            "id": program_name,
-            "name": program_name,
-            "url": create_link("programs", program=program_name),
-            "modules": []
-        }
-        
-        # Получаем все модули для программы
-        modules = sorted(program_df["module"].unique())
-        
-        # Для каждого модуля
-        for module_name in modules:
-            module_df = program_df[program_df["module"] == module_name]
-            
-            # Создаем структуру модуля
+    # Параметры ссылок наращиваются по уровням: каждое значение кодируется один раз
+    # (та же строка, что дает create_link для этих параметров)
+    quote = url_quoter()
+    gz_bounds = np.append(np.flatnonzero(gz_starts), n)
+    programs, modules, lessons = navigation["programs"], None, None
+    for begin, end in zip(gz_bounds[:-1], gz_bounds[1:]):
+        program_name, module_name, lesson_name, group_name = (values[begin] for values in keys)
+        if program_starts[begin]:
+            program_query = f"&program={quote(program_name)}"
+            program = {
+                "id": program_name,
+                "name": program_name,
+                "url": "?page=programs" + program_query,
+                "modules": []
+            }
+            programs.append(program)
+            modules = program["modules"]
+        if module_starts[begin]:
+            module_query = f"{program_query}&module={quote(module_name)}"
             module = {
                 "id": module_name,
                 "name": module_name,
-                "url": create_link("modules", program=program_name, module=module_name),
+                "url": "?page=modules" + module_query,
                 "lessons": []
             }
-            
-            # Получаем все уроки для модуля
-            lessons = sorted(module_df["lesson"].unique())
-            
-            # Для каждого урока
-            for lesson_name in lessons:
-                lesson_df = module_df[module_df["lesson"] == lesson_name]
-                
-                # Создаем структуру урока
-                lesson = {
-                    "id": lesson_name,
-                    "name": lesson_name,
-                    "url": create_link("lessons", program=program_name, module=module_name, lesson=lesson_name),
-                    "groups": []
-                }
-                
-                # Получаем все группы заданий для урока
-                groups = sorted(lesson_df["gz"].unique())
-                
-                # Для каждой группы заданий
-                for group_name in groups:
-                    group_df = lesson_df[lesson_df["gz"] == group_name]
-                    
-                    # Создаем структуру группы заданий
-                    group = {
-                        "id": group_name,
-                        "name": group_name,
-                        "url": create_link("gz", program=program_name, module=module_name, lesson=lesson_name, gz=group_name),
-                        "cards": []
-                    }
-                    
-                    # Получаем карточки для группы заданий
-                    # Сортируем по риску, берем топ-10
-                    cards_df = group_df.sort_values("risk", ascending=False).head(10)
-                    
-                    # Проверяем, есть ли еще карточки
-                    has_more_cards = len(group_df) > 10
-                    more_cards_count = len(group_df) - 10 if has_more_cards else 0
-                    
-                    # Для каждой карточки
-                    for _, card in cards_df.iterrows():
-                        card_id = int(card["card_id"])
-                        raw_risk = card["risk"]
-                        if pd.isna(raw_risk):
-                            risk_json = None
-                            risk_str = "N/A"
-                        else:
-                            risk_json = float(raw_risk)
-                            risk_str = f"{risk_json:.2f}"
-                        # Создаем структуру карточки
-                        card_data = {
-                            "id": str(card_id),
-                            "name": f"ID: {card_id} - Риск: {risk_str}",
-                            "risk": risk_json,
-                            "url": create_link("cards", program=program_name, module=module_name, 
-                                              lesson=lesson_name, gz=group_name, card_id=card_id)
-                        }
-                        
-                        group["cards"].append(card_data)
-                    
-                    # Добавляем информацию о дополнительных карточках
-                    group["has_more_cards"] = has_more_cards
-                    group["more_cards_count"] = more_cards_count
-                    
-                    # Добавляем группу в урок
-                    lesson["groups"].append(group)
-                
-                # Добавляем урок в модуль
-                module["lessons"].append(lesson)
-            
-            # Добавляем модуль в программу
-            program["modules"].append(module)
+            modules.append(module)
+            lessons = module["lessons"]
+        if lesson_starts[begin]:
+            lesson_query = f"{module_query}&lesson={quote(lesson_name)}"
+            lesson = {
+                "id": lesson_name,
+                "name": lesson_name,
+                "url": "?page=lessons" + lesson_query,
+                "groups": []
+            }
+            lessons.append(lesson)
+        
+        gz_query = f"{lesson_query}&gz={quote(group_name)}"
+        card_url = "?page=cards" + gz_query + "&card_id="
+        
+        # Карточки группы уже отсортированы по убыванию риска
+        top = slice(begin, min(end, begin + TOP_CARDS))
+        cards = card_items(card_ids[top], risks[top], card_url)
         
-        # Добавляем программу в навигацию
-        navigation["programs"].append(program)
+        size = int(end - begin)
+        lesson["groups"].append({
+            "id": group_name,
+            "name": group_name,
+            "url": "?page=gz" + gz_query,
+            "cards": cards,
+            "has_more_cards": size > TOP_CARDS,
+            "more_cards_count": max(0, size - TOP_CARDS)
+        })
     
-    # Убеждаемся, что директория существует
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    return navigation
+
+# Каталог артефактов навигации, манифест и количество хранимых версий
+NAVIGATION_DIR = "components"
+MANIFEST_NAME = "navigation_manifest.json"
+LEGACY_NAME = "navigation_data.json"
+KEEP_ARTIFACTS = int(os.getenv("NAVIGATION_KEEP_ARTIFACTS", "2"))
+
+class NavigationArtifact:
+    """
+    Версия данных навигации: разобранная структура и ее закодированные формы.
+    
+    Attributes:
+        version: Хэш содержимого JSON (меняется только вместе с содержимым)
+        data: Структура навигации
+        text: Компактный JSON
+    """
     
-    # Сохраняем структуру в JSON
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(navigation, f, ensure_ascii=False, indent=2)
+    def __init__(self, version, data, text):
+        self.version = version
+        self.data = data
+        self.text = text
+        self._data_uri = None
     
+    @property
+    def data_uri(self):
+        """data: URI с JSON в base64 (кодируется один раз на версию)."""
+        if self._data_uri is None:
+            encoded = base64.b64encode(self.text.encode("utf-8")).decode("ascii")
+            self._data_uri = f"data:application/json;base64,{encoded}"
+        return self._data_uri
+
+# Последний прочитанный артефакт: (каталог, mtime_ns манифеста) -> NavigationArtifact
+_artifact_lock = threading.Lock()
+_artifact_cache = {}
+
+def content_version(text):
+    """Версия артефакта — первые 16 символов sha256 от JSON."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+def artifact_name(version):
+    return f"navigation_data.{version}.json"
+
+def _write_atomic(path, text):
+    """Записывает файл через временный файл и os.replace: читатели видят старую или новую версию целиком."""
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+def read_manifest(directory=NAVIGATION_DIR):
+    """Манифест артефактов навигации или None, если его нет."""
+    try:
+        with open(os.path.join(directory, MANIFEST_NAME), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def write_navigation_artifact(navigation, directory=NAVIGATION_DIR):
+    """
+    Сохраняет структуру навигации как артефакт с хэшем содержимого
+    
+    Файл navigation_data.<хэш>.json пишется только если такой версии еще нет;
+    затем манифест и navigation_data.json (для страниц, читающих файл
+    напрямую) — только при смене версии. Хранятся KEEP_ARTIFACTS последних
+    версий, чтобы читатели старого манифеста успели дочитать свой файл.
+    
+    Args:
+        navigation: Структура навигации (build_navigation)
+        directory: Каталог артефактов
+    
+    Returns:
+        NavigationArtifact
+    """
+    # Компактный JSON (json.dumps использует C-кодировщик, json.dump — нет)
+    text = json.dumps(navigation, ensure_ascii=False, separators=(",", ":"))
+    version = content_version(text)
+    artifact = NavigationArtifact(version, navigation, text)
+    
+    os.makedirs(directory, exist_ok=True)
+    manifest = read_manifest(directory) or {}
+    if manifest.get("version") == version and os.path.exists(os.path.join(directory, manifest.get("file", ""))):
+        return artifact
+    
+    file_name = artifact_name(version)
+    if not os.path.exists(os.path.join(directory, file_name)):
+        _write_atomic(os.path.join(directory, file_name), text)
+    
+    history = [version] + [old for old in manifest.get("history", []) if old != version]
+    _write_atomic(os.path.join(directory, MANIFEST_NAME), json.dumps({
+        "version": version,
+        "file": file_name,
+        "size": len(text.encode("utf-8")),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "history": history[:KEEP_ARTIFACTS],
+    }, ensure_ascii=False))
+    
+    # Записанная версия сразу доступна load_navigation_artifact без повторного разбора
+    mtime = os.stat(os.path.join(directory, MANIFEST_NAME)).st_mtime_ns
+    with _artifact_lock:
+        _artifact_cache[directory] = (mtime, artifact)
+    
+    # navigation_data.json — после манифеста: увидевший новый файл читатель
+    # найдет в манифесте ту же или более новую версию
+    _write_atomic(os.path.join(directory, LEGACY_NAME), text)
+    
+    for old in history[KEEP_ARTIFACTS:]:
+        try:
+            os.remove(os.path.join(directory, artifact_name(old)))
+        except OSError:
+            pass
+    return artifact
+
+def load_navigation_artifact(directory=NAVIGATION_DIR):
+    """
+    Текущий артефакт навигации по манифесту
+    
+    Разобранная структура хранится в памяти до смены версии: пока манифест не
+    изменился, вызов стоит одного stat; новый манифест с той же версией не
+    приводит к повторному разбору.
+    
+    Args:
+        directory: Каталог артефактов
+    
+    Returns:
+        NavigationArtifact; при поврежденном манифесте — из navigation_data.json;
+        None, если манифеста нет или ничего не читается
+    """
+    try:
+        mtime = os.stat(os.path.join(directory, MANIFEST_NAME)).st_mtime_ns
+    except OSError:
+        return None
+    
+    with _artifact_lock:
+        cached = _artifact_cache.get(directory)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    manifest = read_manifest(directory)
+    try:
+        if cached is not None and cached[1].version == manifest["version"]:
+            artifact = cached[1]
+        else:
+            with open(os.path.join(directory, manifest["file"]), "r", encoding="utf-8") as f:
+                text = f.read()
+            artifact = NavigationArtifact(manifest["version"], json.loads(text), text)
+    except (OSError, ValueError, KeyError, TypeError):
+        # Манифест поврежден или его файл не читается — читаем navigation_data.json
+        return _load_legacy_artifact(directory)
+    
+    with _artifact_lock:
+        _artifact_cache[directory] = (mtime, artifact)
+    return artifact
+
+def _load_legacy_artifact(directory):
+    """Артефакт из navigation_data.json (без кэша) или None, если файла нет или он не читается."""
+    try:
+        with open(os.path.join(directory, LEGACY_NAME), "r", encoding="utf-8") as f:
+            text = f.read()
+        return NavigationArtifact(content_version(text), json.loads(text), text)
+    except (OSError, ValueError):
+        return None
+
+def prepare_navigation_json(df, output_path="components/navigation_data.json"):
+    """
+    Создает и сохраняет полный JSON со структурой навигации
+    
+    Структура строится build_navigation и сохраняется как артефакт с хэшем
+    содержимого в каталоге output_path (write_navigation_artifact); если
+    содержимое не изменилось, файлы не переписываются.
+    
+    Args:
+        df: DataFrame с данными о курсах
+        output_path: Путь к JSON-файлу навигации (его каталог — каталог артефактов)
+    
+    Returns:
+        dict: Структура навигации в виде словаря
+    """
+    navigation = build_navigation(df)
+    write_navigation_artifact(navigation, os.path.dirname(output_path) or ".")
     return navigation
 
 def get_navigation_data(df=None, force_update=False):
     """
-    Получает данные навигации - либо загружает существующий JSON, 
-    либо создает новый, если файл не существует или требуется обновление
+    Получает данные навигации - либо загружает текущий артефакт, 
+    либо создает новый, если его нет или требуется обновление
     
     Args:
         df: DataFrame с данными (опционально, если нужно обновить)
@@ -176,25 +403,30 @@ def get_navigation_data(df=None, force_update=False):
     Returns:
         dict: Структура навигации
     """
-    json_path = "components/navigation_data.json"
+    artifact = get_navigation_artifact(df, force_update)
+    if artifact is None:
+        # Если ничего не сработало, возвращаем пустую структуру
+        return {"main_sections": [], "programs": []}
+    return artifact.data
+
+def get_navigation_artifact(df=None, force_update=False, directory=NAVIGATION_DIR):
+    """
+    То же, что get_navigation_data, но возвращает NavigationArtifact (с версией)
     
+    Args:
+        df: DataFrame с данными (опционально, если нужно обновить)
+        force_update: Принудительно обновить данные
+        directory: Каталог артефактов
+        
+    Returns:
+        NavigationArtifact или None
+    """
     # Если требуется обновление и есть данные
     if force_update and df is not None:
-        return prepare_navigation_json(df, json_path)
+        return write_navigation_artifact(build_navigation(df), directory)
     
-    # Пробуем загрузить существующий файл
-    if os.path.exists(json_path):
-        try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except:
-            # Если не удалось загрузить и есть данные, создаем новый
-            if df is not None:
-                return prepare_navigation_json(df, json_path)
-    else:
-        # Если файла нет и есть данные, создаем новый
-        if df is not None:
-            return prepare_navigation_json(df, json_path)
-    
-    # Если ничего не сработало, возвращаем пустую структуру
-    return {"main_sections": [], "programs": []}
\ No newline at end of file
+    artifact = load_navigation_artifact(directory)
+    # Если артефакта нет и есть данные, создаем новый
+    if artifact is None and df is not None:
+        artifact = write_navigation_artifact(build_navigation(df), directory)
+    return artifact
@@ -0,0 +1,160 @@
+# navigation_regenerator.py
+"""
+Фоновое обновление данных навигации.
+
+Раньше JSON навигации пересобирался вручную скриптом update_navigation.py
+(или, при отсутствии файла, в запросе пользователя). NavigationRegenerator
+работает в отдельном потоке процесса приложения (или в update_navigation.py
+--daemon) и раз в NAVIGATION_REGEN_SECONDS сверяет версию данных карточек —
+водяной знак cards_mv (data_snapshot) вместе с версией конфигурации риска.
+Только при ее смене навигация строится один раз:
+данные с риском берутся через core.load_processed_data (пакетный расчет
+calculate_risk_batch и инкрементальная синхронизация), артефакт
+записывается атомарно (navigation_data.write_navigation_artifact), а ленивое
+дерево navigation_tree прогревается для новой версии хранилища карточек —
+того же фрейма, по которому его ищет сайдбар.
+"""
+
+import os
+import time
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+import streamlit as st
+
+import core
+import data_snapshot
+from core_config import get_config_version
+from navigation_data import NAVIGATION_DIR, build_navigation, read_manifest, write_navigation_artifact
+from navigation_tree import tree_for
+
+# Как часто (в секундах) проверять версию данных карточек
+NAVIGATION_REGEN_SECONDS = float(os.getenv("NAVIGATION_REGEN_SECONDS", "60"))
+
+# Отключение фонового обновления переменной окружения
+NAVIGATION_REGEN_DISABLED = os.getenv("NAVIGATION_REGEN_DISABLED", "0") == "1"
+
+
+def source_version(engine) -> str:
+    """
+    Версия данных, из которых строится навигация.
+
+    Водяной знак cards_mv — тот же, которым data_snapshot помечает
+    загруженные карточки, — вместе с версией конфигурации риска.
+
+    Args:
+        engine: SQLAlchemy engine для подключения к БД
+
+    Returns:
+        str: Версия данных вместе с версией конфигурации риска
+    """
+    data_version = data_snapshot.watermark_version(data_snapshot.get_watermark(engine))
+    return f"{data_version}|config={get_config_version()}"
+
+
+def regenerate(engine, directory: str = NAVIGATION_DIR) -> Dict[str, Any]:
+    """
+    Строит навигацию по текущим данным и атомарно заменяет артефакт.
+
+    Args:
+        engine: SQLAlchemy engine для подключения к БД
+        directory: Каталог артефактов навигации
+
+    Returns:
+        dict: version (версия артефакта), programs, cards и duration_ms
+    """
+    started = time.perf_counter()
+    data = core.load_processed_data(engine)
+    navigation = build_navigation(data)
+    artifact = write_navigation_artifact(navigation, directory)
+    # Дерево для ленивого меню строится здесь же, а не в первом запросе новой версии.
+    # Ключ дерева — по тому же фрейму, что у сайдбара app.py (хранилище карточек,
+    # версия "store:<n>"), иначе прогретое дерево в приложении не найдется
+    cards = core.load_card_store(engine).to_frame()
+    tree_for(cards, core.get_data_version(cards))
+    return {
+        "version": artifact.version,
+        "programs": len(navigation["programs"]),
+        "cards": len(data),
+        "duration_ms": (time.perf_counter() - started) * 1000,
+    }
+
+
+class NavigationRegenerator:
+    """Фоновый поток, пересобирающий навигацию при смене версии данных."""
+
+    def __init__(self, engine, directory: str = NAVIGATION_DIR, interval: float = NAVIGATION_REGEN_SECONDS):
+        self.engine = engine
+        self.directory = directory
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._source_version: Optional[str] = None
+        self._status: Dict[str, Any] = {"runs": 0, "failures": 0, "last_result": None, "last_error": None}
+
+    def start(self) -> "NavigationRegenerator":
+        """Запускает поток, если он еще не запущен."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._loop, name="navigation-regenerator", daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Останавливает поток и ждет его завершения."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def trigger(self) -> None:
+        """Проверяет версию данных сейчас, не дожидаясь интервала (например, после optimize_db)."""
+        self._wake.set()
+
+    def check(self) -> bool:
+        """
+        Сверяет версию данных и пересобирает навигацию, если она изменилась.
+
+        Returns:
+            bool: True, если навигация была пересобрана
+        """
+        version = source_version(self.engine)
+        if version == self._source_version and read_manifest(self.directory) is not None:
+            return False
+        result = regenerate(self.engine, self.directory)
+        with self._lock:
+            # Версия запоминается только после успешной записи: при ошибке попытка повторится
+            self._source_version = version
+            self._status["runs"] += 1
+            self._status["last_result"] = {**result, "source_version": version, "finished_at": time.time()}
+        logging.info(f"Навигация обновлена: версия {result['version']}, {result['duration_ms']:.0f} мс")
+        return True
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.check()
+            except Exception as e:
+                # Ошибка обновления не затрагивает пользователей: остается предыдущий артефакт
+                logging.warning(f"Не удалось обновить навигацию: {str(e)}")
+                with self._lock:
+                    self._status["failures"] += 1
+                    self._status["last_error"] = str(e)
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def status(self) -> Dict[str, Any]:
+        """Сводка по обновлениям для отладки и админки."""
+        with self._lock:
+            running = self._thread is not None and self._thread.is_alive()
+            return {"running": running, "source_version": self._source_version, **self._status}
+
+
+@st.cache_resource
+def get_regenerator(_engine) -> NavigationRegenerator:
+    """Возвращает единственный на процесс запущенный NavigationRegenerator."""
+    return NavigationRegenerator(_engine).start()
@@ -0,0 +1,233 @@
+# navigation_tree.py
+"""
+Ленивое дерево навигации с постраничной выдачей дочерних узлов.
+
+Полное дерево навигации (navigation_data.build_navigation) растет линейно с
+каталогом и передавалось компоненту целиком при каждом перезапуске
+Streamlit. NavigationTree строится один раз на версию данных из тех же
+отсортированных карточек (navigation_data.sort_cards) и хранит только
+границы групп; узлы отдаются по запросу: root() — основные разделы,
+программы и путь до текущей страницы, children(node, offset, limit) —
+страница дочерних элементов узла. Карточки группы заданий отдаются
+страницами по убыванию риска, поэтому доступны все карточки, а не только
+первые десять.
+
+Узлы адресуются индексами в дереве: "3" — программа, "3.5" — модуль,
+"3.5.2" — урок, "3.5.2.1" — группа заданий; корень — "". Идентификаторы
+действительны только для своей версии дерева (NavigationTree.version).
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from core_config import get_config_version
+from navigation_data import NAVIGATION_KEYS, card_items, create_link, sort_cards, url_quoter
+
+# Размер страницы дочерних элементов по умолчанию и максимальный
+PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# Страница приложения для узлов каждого уровня (в порядке NAVIGATION_KEYS)
+LEVEL_PAGES = ["programs", "modules", "lessons", "gz"]
+
+
+class _Node:
+    """Узел дерева: имя, параметры ссылки, дочерние узлы или диапазон карточек."""
+
+    __slots__ = ("name", "query", "children", "begin", "end")
+
+    def __init__(self, name, query: str):
+        self.name = name
+        self.query = query
+        self.children: List["_Node"] = []
+        self.begin = self.end = 0
+
+
+class NavigationTree:
+    """
+    Дерево навигации с доступом к узлам по частям.
+
+    Attributes:
+        version: Версия дерева (меняется вместе с данными и конфигурацией риска)
+    """
+
+    def __init__(self, df: pd.DataFrame, version: str = ""):
+        self.version = version
+        self.main_sections = [
+            {"id": "overview", "name": "Обзор", "icon": "📊", "url": create_link("overview")},
+            {"id": "admin", "name": "Настройки", "icon": "⚙️", "url": create_link("admin")},
+        ]
+        self._root = _Node(None, "")
+        self._card_ids = self._risks = None
+
+        cards_sorted = sort_cards(df)
+        if cards_sorted is None:
+            return
+        keys, self._card_ids, self._risks, level_starts = cards_sorted
+
+        # Один проход по началам групп: узел уровня создается там, где начинается его группа
+        quote = url_quoter()
+        path = [self._root]
+        ends = level_starts[-1].nonzero()[0].tolist() + [len(self._card_ids)]
+        for begin, end in zip(ends[:-1], ends[1:]):
+            for level, starts in enumerate(level_starts):
+                if starts[begin]:
+                    parent = path[level]
+                    name = keys[level][begin]
+                    node = _Node(name, f"{parent.query}&{NAVIGATION_KEYS[level]}={quote(name)}")
+                    parent.children.append(node)
+                    del path[level + 1:]
+                    path.append(node)
+            path[-1].begin, path[-1].end = begin, end
+
+    # ------------------ Узлы ------------------ #
+
+    def _find(self, node_id: str) -> _Node:
+        node = self._root
+        if node_id:
+            for index in node_id.split("."):
+                # Только неотрицательные индексы: "-1" иначе адресовал бы последний узел
+                if not index.isdigit():
+                    raise KeyError(node_id)
+                node = node.children[int(index)]
+        return node
+
+    @staticmethod
+    def _depth(node_id: str) -> int:
+        return node_id.count(".") + 1 if node_id else 0
+
+    def _item(self, node: _Node, node_id: str) -> Dict[str, Any]:
+        depth = self._depth(node_id)
+        is_group = depth == len(NAVIGATION_KEYS)
+        return {
+            "id": node.name,
+            "node": node_id,
+            "name": node.name,
+            "url": f"?page={LEVEL_PAGES[depth - 1]}{node.query}",
+            "has_children": bool(node.end > node.begin if is_group else node.children),
+            "child_count": node.end - node.begin if is_group else len(node.children),
+        }
+
+    def children(self, node_id: str = "", offset: int = 0, limit: int = PAGE_SIZE) -> Dict[str, Any]:
+        """
+        Страница дочерних элементов узла.
+
+        Args:
+            node_id: Идентификатор узла ("" — корень, дочерние — программы)
+            offset: Смещение первого элемента страницы
+            limit: Размер страницы (не больше MAX_PAGE_SIZE)
+
+        Returns:
+            dict: version, node, offset, total, items и next_offset (None на последней странице)
+
+        Raises:
+            KeyError: Если узла нет в этой версии дерева
+            TypeError, ValueError: Если offset или limit не приводятся к int
+        """
+        try:
+            node = self._find(node_id)
+        except IndexError:
+            raise KeyError(node_id)
+        offset = max(0, int(offset))
+        limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+
+        if self._depth(node_id) == len(NAVIGATION_KEYS):
+            # Карточки группы заданий уже отсортированы по убыванию риска
+            total = node.end - node.begin
+            rows = slice(node.begin + offset, min(node.end, node.begin + offset + limit))
+            items = card_items(self._card_ids[rows], self._risks[rows], f"?page=cards{node.query}&card_id=")
+        else:
+            total = len(node.children)
+            prefix = f"{node_id}." if node_id else ""
+            items = [self._item(node.children[i], f"{prefix}{i}") for i in range(offset, min(total, offset + limit))]
+
+        next_offset = offset + len(items)
+        return {
+            "version": self.version,
+            "node": node_id,
+            "offset": offset,
+            "total": total,
+            "items": items,
+            "next_offset": next_offset if next_offset < total else None,
+        }
+
+    def active_path(self, params: Optional[Dict[str, Any]]) -> List[str]:
+        """
+        Идентификаторы узлов на пути к текущей странице.
+
+        Args:
+            params: Параметры URL (program, module, lesson, gz)
+
+        Returns:
+            list: Идентификаторы от программы до самого глубокого найденного узла
+        """
+        path, node, node_id = [], self._root, ""
+        for key in NAVIGATION_KEYS:
+            value = (params or {}).get(key)
+            if value is None:
+                break
+            index = next((i for i, child in enumerate(node.children) if str(child.name) == str(value)), None)
+            if index is None:
+                break
+            node = node.children[index]
+            node_id = f"{node_id}.{index}" if node_id else str(index)
+            path.append(node_id)
+        return path
+
+    def root(self, params: Optional[Dict[str, Any]] = None, limit: int = PAGE_SIZE) -> Dict[str, Any]:
+        """
+        Начальные данные компонента: основные разделы и первые страницы узлов.
+
+        Кроме списка программ включаются первые страницы всех узлов на пути к
+        текущей странице, чтобы он отображался раскрытым без дополнительных запросов.
+
+        Args:
+            params: Параметры URL текущей страницы
+            limit: Размер страниц
+
+        Returns:
+            dict: version, main_sections и pages {узел: страница}
+        """
+        pages = {"": self.children("", 0, MAX_PAGE_SIZE)}
+        for node_id in self.active_path(params):
+            pages[node_id] = self.children(node_id, 0, limit)
+        return {"version": self.version, "main_sections": self.main_sections, "pages": pages}
+
+
+# Деревья по версии данных и конфигурации (общие для всех сессий)
+_trees_lock = threading.Lock()
+_trees: "OrderedDict[Any, NavigationTree]" = OrderedDict()
+MAX_TREES = 2
+
+
+def tree_for(df: pd.DataFrame, data_version: Optional[str] = None) -> NavigationTree:
+    """
+    Возвращает дерево навигации для набора карточек, переиспользуя уже построенное.
+
+    Args:
+        df: DataFrame с карточками и колонкой risk
+        data_version: Версия данных (например, core.get_data_version(df));
+            без версии дерево строится заново
+
+    Returns:
+        NavigationTree
+    """
+    key = (data_version, len(df), get_config_version())
+    version = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()[:12]
+    if data_version is None:
+        return NavigationTree(df, version)
+    with _trees_lock:
+        tree = _trees.get(key)
+        if tree is not None:
+            _trees.move_to_end(key)
+            return tree
+    tree = NavigationTree(df, version)
+    with _trees_lock:
+        _trees[key] = tree
+        while len(_trees) > MAX_TREES:
+            _trees.popitem(last=False)
+    return tree
@@ -1,32 +1,238 @@
-from sqlalchemy import text
+# optimize_db.py
+"""
+Материализованные представления, плоская таблица, кэш риска и топ-10 карточек.
+
+Раньше optimize_db удалял и заново создавал все объекты, и на время
+пересборки дашборд оставался без таблиц. Теперь объекты описаны
+декларативно (RELATIONS, в порядке зависимостей) и обновляются инкрементально:
+
+- для каждого объекта считается отпечаток входных данных (количество строк
+  и наибольший xmin базовых таблиц, версия конфигурации риска для кэша
+  риска, отпечатки зависимостей); объекты с неизменившимся отпечатком
+  пропускаются, но не дольше REFRESH_MAX_AGE_MINUTES;
+- материализованные представления обновляются через
+  REFRESH MATERIALIZED VIEW CONCURRENTLY (для этого у каждого есть
+  уникальный индекс), поэтому читатели продолжают видеть старые данные;
+- таблицы обновляются в одной транзакции (DELETE + INSERT), читатели до
+  фиксации видят прежнее содержимое;
+- риск карточек считается в БД функцией card_risk, сгенерированной из
+  конфигурации (risk_sql): кэш риска и топ-10 — материализованные
+  представления, и все обновление выполняется без выгрузки карточек в
+  Python. При RISK_IN_DB=0 риск считается в Python;
+- таблицы, рассчитанные в Python (кэш риска, топ-10), загружаются через
+  COPY FROM STDIN (db_bulk) в таблицу name__new и подменяются
+  переименованием; если таблицу читают представления, данные заменяются
+  в одной транзакции (DELETE + COPY), чтобы представления не остались
+  на старой версии;
+- при изменении определения объект строится рядом под именем *__new и
+  подменяется переименованием в транзакции; зависящие от него представления
+  пересоздаются так же. Старые версии удаляются в конце.
+
+Результат каждого обновления записывается в таблицу mv_refresh_log.
+
+Набор обычных индексов задается планом index_advisor (INDEX_PLAN_PATH):
+создаются только оставленные в нем индексы, лишние объявленные удаляются.
+
+Запуск: python optimize_db.py [--force] [--all-indexes]
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import logging
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
 import pandas as pd
-from core import get_engine, load_raw_data, process_data, risk_score
+from sqlalchemy import text
 
-def optimize_db():
-    """Создаёт materialized view, плоскую таблицу, таблицу кэша риска и топ-10 карточек по группам, а также необходимые индексы."""
-    engine = get_engine()
-    
-    # Сначала удаляем все зависимые материализованные представления в правильном порядке
-    with engine.begin() as conn:
-        # Сначала удаляем представления с риском, которые зависят от статистик
-        conn.exec_driver_sql("DROP MATERIALIZED VIEW IF EXISTS mv_gz_risk;")
-        conn.exec_driver_sql("DROP MATERIALIZED VIEW IF EXISTS mv_lesson_risk;")
-        conn.exec_driver_sql("DROP MATERIALIZED VIEW IF EXISTS mv_module_risk;")
-        conn.exec_driver_sql("DROP MATERIALIZED VIEW IF EXISTS mv_program_risk;")
-        
-        # Затем удаляем представления со статистиками, которые зависят от базового представления
-        conn.exec_driver_sql("DROP MATERIALIZED VIEW IF EXISTS mv_gz_stats;")
-        conn.exec_driver_sql("DROP MATERIALIZED VIEW IF EXISTS mv_lesson_stats;")
-        conn.exec_driver_sql("DROP MATERIALIZED VIEW IF EXISTS mv_module_stats;")
-        conn.exec_driver_sql("DROP MATERIALIZED VIEW IF EXISTS mv_program_stats;")
-        
-        # Теперь можно безопасно удалить базовое представление
-        conn.exec_driver_sql("DROP MATERIALIZED VIEW IF EXISTS mv_cards_mv;")
-        
-        # 1. Создаем базовое материализованное представление mv_cards_mv
-        conn.exec_driver_sql(
-            """
-            CREATE MATERIALIZED VIEW mv_cards_mv AS
+import db_bulk
+import risk_sql
+from core import get_engine, load_raw_data, process_data
+from core_config import get_config_version
+from db_names import REFRESH_LOG_TABLE
+
+# Суффиксы имен при подмене объекта с новым определением
+NEW_SUFFIX = "__new"
+OLD_SUFFIX = "__old"
+
+# Расчет риска внутри БД функцией risk_sql (0 — в Python с загрузкой через COPY)
+RISK_IN_DB = os.getenv("RISK_IN_DB", "1") not in ("0", "false", "False", "")
+
+# План индексов от index_advisor: {объект: [(имя, колонки), ...]}; без файла создаются все объявленные
+INDEX_PLAN_PATH = os.getenv("INDEX_PLAN_PATH", "index_plan.json")
+
+# Базовые таблицы, изменения которых отслеживаются
+BASE_TABLES = ["cards_structure", "cards_metrics", "card_status"]
+
+# Объект обновляется, если с прошлого обновления прошло больше стольких минут (0 — без ограничения)
+REFRESH_MAX_AGE_MINUTES = float(os.getenv("REFRESH_MAX_AGE_MINUTES", "60"))
+
+
+class Relation:
+    """
+    Описание объекта БД, который поддерживает optimize_db.
+
+    Attributes:
+        name: Имя объекта
+        kind: "matview" — материализованное представление, "table" — таблица из
+            запроса (CREATE TABLE AS), "frame" — таблица из DataFrame
+        sql: SELECT-запрос определения (для matview и table)
+        frame: Функция frame(context) -> DataFrame (для frame)
+        columns: Колонки DataFrame (для frame; входят в определение)
+        deps: Объекты из RELATIONS, от которых зависит этот объект
+        sources: Базовые таблицы, от которых зависит объект
+        unique: (имя индекса, колонки) — уникальный индекс для REFRESH CONCURRENTLY
+        indexes: Список (имя индекса, колонки), которые нужно поддерживать
+            (объявленные или оставленные планом индексов)
+        declared_indexes: Все объявленные индексы
+        config_dependent: Зависит ли содержимое от конфигурации риска
+    """
+
+    def __init__(self, name: str, kind: str, sql: Optional[str] = None,
+                 frame: Optional[Callable[["RefreshContext"], pd.DataFrame]] = None,
+                 columns: Sequence[str] = (), deps: Sequence[str] = (), sources: Sequence[str] = (),
+                 unique: Optional[Tuple[str, str]] = None,
+                 indexes: Sequence[Tuple[str, str]] = (), config_dependent: bool = False):
+        self.name = name
+        self.kind = kind
+        self.sql = sql
+        self.frame = frame
+        self.columns = list(columns)
+        self.deps = list(deps)
+        self.sources = list(sources)
+        self.unique = unique
+        self.indexes = list(indexes)
+        self.declared_indexes = list(indexes)
+        self.config_dependent = config_dependent
+
+    @property
+    def db_kind(self) -> str:
+        """Тип объекта в SQL (MATERIALIZED VIEW или TABLE)."""
+        return "MATERIALIZED VIEW" if self.kind == "matview" else "TABLE"
+
+    def definition_hash(self) -> str:
+        """
+        Отпечаток определения: запрос или колонки и уникальный индекс.
+
+        Обычные индексы в отпечаток не входят: они добавляются и удаляются
+        на месте (_sync_indexes) без пересоздания объекта.
+        """
+        parts = [self.kind, self.sql or "", repr(self.columns), repr(self.unique)]
+        return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+class RefreshContext:
+    """Общие для одного обновления данные: лениво рассчитанные риск и DataFrame'ы таблиц."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self._frames: Dict[str, pd.DataFrame] = {}
+        self._risk_data: Optional[pd.DataFrame] = None
+
+    def risk_data(self) -> pd.DataFrame:
+        """Данные карточек с рассчитанным риском (один раз на обновление)."""
+        if self._risk_data is None:
+            self._risk_data = process_data(load_raw_data(self.engine))
+        return self._risk_data
+
+    def frame(self, relation: Relation) -> pd.DataFrame:
+        if relation.name not in self._frames:
+            self._frames[relation.name] = relation.frame(self)[relation.columns]
+        return self._frames[relation.name]
+
+
+def _risk_cache_frame(context: RefreshContext) -> pd.DataFrame:
+    return context.risk_data()[["card_id", "risk"]].copy()
+
+
+def _top10_frame(context: RefreshContext) -> pd.DataFrame:
+    # Топ-10 карточек по каждой группе с учетом риска
+    return (
+        context.risk_data()[["gz", "card_id", "risk"]]
+        .sort_values(["gz", "risk"], ascending=[True, False])
+        .groupby("gz")
+        .head(10)
+        .assign(rn=lambda d: d.groupby("gz").cumcount() + 1)
+    )
+
+
+def _risk_cache_relation() -> Relation:
+    """Кэш риска: в БД через функцию risk_sql или в Python (RISK_IN_DB=0)."""
+    if RISK_IN_DB:
+        return Relation(
+            "card_risk_cache", "matview",
+            sql=f"""
+                SELECT c.card_id, {risk_sql.risk_call_sql("c")} AS risk
+                FROM mv_cards_mv c
+            """,
+            deps=["mv_cards_mv"],
+            unique=("idx_risk_cache_card_id", "card_id"),
+            indexes=[
+                ("idx_risk_cache_risk", "risk"),
+            ],
+            config_dependent=True,
+        )
+    return Relation(
+        "card_risk_cache", "frame",
+        frame=_risk_cache_frame,
+        columns=["card_id", "risk"],
+        sources=BASE_TABLES,
+        indexes=[
+            ("idx_risk_cache_card_id", "card_id"),
+            ("idx_risk_cache_risk", "risk"),
+        ],
+        config_dependent=True,
+    )
+
+
+def _top10_relation() -> Relation:
+    """Топ-10 карточек по группам: в БД по кэшу риска или в Python (RISK_IN_DB=0)."""
+    if RISK_IN_DB:
+        return Relation(
+            "top10_by_group", "matview",
+            sql="""
+                SELECT gz, card_id, risk, rn
+                FROM (
+                    SELECT c.gz, c.card_id, r.risk,
+                           ROW_NUMBER() OVER (PARTITION BY c.gz ORDER BY r.risk DESC NULLS LAST, c.card_id) AS rn
+                    FROM mv_cards_mv c
+                    JOIN card_risk_cache r ON c.card_id = r.card_id
+                    WHERE c.gz IS NOT NULL
+                ) ranked
+                WHERE rn <= 10
+            """,
+            deps=["mv_cards_mv", "card_risk_cache"],
+            unique=("idx_top10_gz_rn", "gz, rn"),
+            indexes=[
+                ("idx_top10_card_id", "card_id"),
+                ("idx_top10_risk", "risk"),
+                ("idx_top10_gz", "gz"),
+            ],
+            config_dependent=True,
+        )
+    return Relation(
+        "top10_by_group", "frame",
+        frame=_top10_frame,
+        columns=["gz", "card_id", "risk", "rn"],
+        sources=BASE_TABLES,
+        indexes=[
+            ("idx_top10_gz_rn", "gz, rn"),
+            ("idx_top10_card_id", "card_id"),
+            ("idx_top10_risk", "risk"),
+            ("idx_top10_gz", "gz"),
+        ],
+        config_dependent=True,
+    )
+
+
+# Объекты в порядке зависимостей: каждый объект идет после всех своих deps
+RELATIONS = [
+    # 1. Базовое материализованное представление
+    Relation(
+        "mv_cards_mv", "matview",
+        sql="""
             SELECT
                 s.program, s.module, s.module_order, s.lesson, s.lesson_order,
                 s.gz, s.gz_id, s.card_id, s.card_type, s.card_url,
@@ -37,490 +243,532 @@ def optimize_db():
                 COALESCE(st.status,'new') AS status, st.updated_at
             FROM cards_structure s
             JOIN cards_metrics m USING(card_id)
-            LEFT JOIN card_status st USING(card_id);
-            """
-        )
-        # Основные индексы для mv_cards_mv
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_mv_program ON mv_cards_mv (program);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_mv_filters ON mv_cards_mv (program, module, lesson, gz);"
-        )
-        # Дополнительные индексы для mv_cards_mv
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_mv_card_id ON mv_cards_mv (card_id);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_mv_program_module ON mv_cards_mv (program, module);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_mv_program_module_lesson ON mv_cards_mv (program, module, lesson);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_mv_module ON mv_cards_mv (module);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_mv_lesson ON mv_cards_mv (lesson);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_mv_gz ON mv_cards_mv (gz);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_mv_module_order ON mv_cards_mv (module_order);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_mv_lesson_order ON mv_cards_mv (lesson_order);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_mv_status ON mv_cards_mv (status);"
-        )
-        # Составные индексы для сортировки
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_mv_program_module_orders ON mv_cards_mv (program, module_order, lesson_order);"
-        )
-        
-        # Создаем материализованные представления для каждого уровня навигации
-        
-        # 2. Уровень программ (program)
-        conn.exec_driver_sql("DROP MATERIALIZED VIEW IF EXISTS mv_program_stats;")
-        conn.exec_driver_sql(
-            """
-            CREATE MATERIALIZED VIEW mv_program_stats AS
-            SELECT 
-                program,
-                COUNT(DISTINCT card_id) AS card_count,
-                AVG(success_rate) AS avg_success_rate,
-                AVG(complaint_rate) AS avg_complaint_rate,
-                AVG(attempted_share) AS avg_attempted_share,
-                AVG(discrimination_avg) AS avg_discrimination,
-                SUM(total_attempts) AS total_attempts_sum,
-                AVG(time_median) AS avg_time_median,
-                SUM(time_median) AS total_time_median,
-                COUNT(DISTINCT module) AS module_count,
-                COUNT(DISTINCT lesson) AS lesson_count,
-                COUNT(DISTINCT gz) AS gz_count,
-                MAX(updated_at) AS last_updated
-            FROM mv_cards_mv
-            GROUP BY program;
-            """
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_program_stats ON mv_program_stats (program);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_program_stats_success ON mv_program_stats (avg_success_rate);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_program_stats_complaint ON mv_program_stats (avg_complaint_rate);"
-        )
-        
-        # 3. Уровень модулей (module)
-        conn.exec_driver_sql("DROP MATERIALIZED VIEW IF EXISTS mv_module_stats;")
-        conn.exec_driver_sql(
-            """
-            CREATE MATERIALIZED VIEW mv_module_stats AS
-            SELECT 
-                program,
-                module,
-                module_order,
-                COUNT(DISTINCT card_id) AS card_count,
-                AVG(success_rate) AS avg_success_rate,
-                AVG(complaint_rate) AS avg_complaint_rate,
-                AVG(attempted_share) AS avg_attempted_share,
-                AVG(discrimination_avg) AS avg_discrimination,
-                SUM(total_attempts) AS total_attempts_sum,
-                AVG(time_median) AS avg_time_median,
-                SUM(time_median) AS total_time_median,
-                COUNT(DISTINCT lesson) AS lesson_count,
-                COUNT(DISTINCT gz) AS gz_count,
-                MAX(updated_at) AS last_updated
-            FROM mv_cards_mv
-            GROUP BY program, module, module_order
-            ORDER BY program, module_order;
-            """
-        )
-        # Основные индексы для mv_module_stats
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_module_stats_program ON mv_module_stats (program);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_module_stats_module ON mv_module_stats (module);"
-        )
-        # Дополнительные индексы для mv_module_stats
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_module_stats_program_module ON mv_module_stats (program, module);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_module_stats_module_order ON mv_module_stats (module_order);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_module_stats_program_order ON mv_module_stats (program, module_order);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_module_stats_success ON mv_module_stats (avg_success_rate);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_module_stats_complaint ON mv_module_stats (avg_complaint_rate);"
-        )
-        
-        # 4. Уровень уроков (lesson)
-        conn.exec_driver_sql("DROP MATERIALIZED VIEW IF EXISTS mv_lesson_stats;")
-        conn.exec_driver_sql(
-            """
-            CREATE MATERIALIZED VIEW mv_lesson_stats AS
-            SELECT 
-                program,
-                module,
-                module_order,
-                lesson,
-                lesson_order,
-                COUNT(DISTINCT card_id) AS card_count,
-                AVG(success_rate) AS avg_success_rate,
-                AVG(complaint_rate) AS avg_complaint_rate,
-                AVG(attempted_share) AS avg_attempted_share,
-                AVG(discrimination_avg) AS avg_discrimination,
-                SUM(total_attempts) AS total_attempts_sum,
-                AVG(time_median) AS avg_time_median,
-                SUM(time_median) AS total_time_median,
-                COUNT(DISTINCT gz) AS gz_count,
-                MAX(updated_at) AS last_updated
-            FROM mv_cards_mv
-            GROUP BY program, module, module_order, lesson, lesson_order
-            ORDER BY program, module_order, lesson_order;
-            """
-        )
-        # Основные индексы для mv_lesson_stats
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_lesson_stats_program_module ON mv_lesson_stats (program, module);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_lesson_stats_lesson ON mv_lesson_stats (lesson);"
-        )
-        # Дополнительные индексы для mv_lesson_stats
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_lesson_stats_program_module_lesson ON mv_lesson_stats (program, module, lesson);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_lesson_stats_module_order ON mv_lesson_stats (module_order);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_lesson_stats_lesson_order ON mv_lesson_stats (lesson_order);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_lesson_stats_orders ON mv_lesson_stats (module_order, lesson_order);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_lesson_stats_program_orders ON mv_lesson_stats (program, module_order, lesson_order);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_lesson_stats_success ON mv_lesson_stats (avg_success_rate);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_lesson_stats_complaint ON mv_lesson_stats (avg_complaint_rate);"
-        )
-        
-        # 5. Уровень групп заданий (gz)
-        conn.exec_driver_sql("DROP MATERIALIZED VIEW IF EXISTS mv_gz_stats;")
-        conn.exec_driver_sql(
-            """
-            CREATE MATERIALIZED VIEW mv_gz_stats AS
-            SELECT 
-                program,
-                module,
-                module_order,
-                lesson,
-                lesson_order,
-                gz,
-                gz_id,
-                COUNT(DISTINCT card_id) AS card_count,
-                AVG(success_rate) AS avg_success_rate,
-                AVG(complaint_rate) AS avg_complaint_rate,
-                AVG(attempted_share) AS avg_attempted_share,
-                AVG(discrimination_avg) AS avg_discrimination,
-                SUM(total_attempts) AS total_attempts_sum,
-                AVG(time_median) AS avg_time_median,
-                SUM(time_median) AS total_time_median,
-                COUNT(DISTINCT card_type) AS card_type_count,
-                MAX(updated_at) AS last_updated
-            FROM mv_cards_mv
-            GROUP BY program, module, module_order, lesson, lesson_order, gz, gz_id
-            ORDER BY program, module_order, lesson_order, gz;
-            """
-        )
-        # Основные индексы для mv_gz_stats
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_gz_stats_program_module_lesson ON mv_gz_stats (program, module, lesson);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_gz_stats_gz ON mv_gz_stats (gz);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_gz_stats_gz_id ON mv_gz_stats (gz_id);"
-        )
-        # Дополнительные индексы для mv_gz_stats
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_gz_stats_program_module ON mv_gz_stats (program, module);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_gz_stats_module_order ON mv_gz_stats (module_order);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_gz_stats_lesson_order ON mv_gz_stats (lesson_order);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_gz_stats_orders ON mv_gz_stats (module_order, lesson_order);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_gz_stats_program_orders ON mv_gz_stats (program, module_order, lesson_order);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_gz_stats_all_filter ON mv_gz_stats (program, module, lesson, gz);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_gz_stats_success ON mv_gz_stats (avg_success_rate);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_gz_stats_complaint ON mv_gz_stats (avg_complaint_rate);"
+            LEFT JOIN card_status st USING(card_id)
+        """,
+        sources=BASE_TABLES,
+        unique=("idx_mv_card_id", "card_id"),
+        indexes=[
+            ("idx_mv_program", "program"),
+            ("idx_mv_filters", "program, module, lesson, gz"),
+            ("idx_mv_program_module", "program, module"),
+            ("idx_mv_program_module_lesson", "program, module, lesson"),
+            ("idx_mv_module", "module"),
+            ("idx_mv_lesson", "lesson"),
+            ("idx_mv_gz", "gz"),
+            ("idx_mv_module_order", "module_order"),
+            ("idx_mv_lesson_order", "lesson_order"),
+            ("idx_mv_status", "status"),
+            ("idx_mv_program_module_orders", "program, module_order, lesson_order"),
+        ],
+    ),
+    # 2. Кэш риска
+    _risk_cache_relation(),
+    # 3. Статистика и средний риск всех уровней иерархии за один проход
+    Relation(
+        "mv_hierarchy_stats", "matview",
+        sql="""
+            SELECT
+                CASE GROUPING(c.module, c.lesson, c.gz)
+                    WHEN 7 THEN 'program'
+                    WHEN 3 THEN 'module'
+                    WHEN 1 THEN 'lesson'
+                    ELSE 'gz'
+                END AS level,
+                c.program, c.module, c.module_order, c.lesson, c.lesson_order, c.gz, c.gz_id,
+                -- Ключ строки без NULL: NULL в колонках уровня не нарушал бы уникальный индекс,
+                -- а JSON отличает NULL в данных ("null") от пустой строки ("")
+                json_build_array(
+                    c.program, c.module, c.module_order, c.lesson, c.lesson_order, c.gz, c.gz_id
+                )::text AS hierarchy_key,
+                COUNT(DISTINCT c.card_id) AS card_count,
+                AVG(c.success_rate) AS avg_success_rate,
+                AVG(c.complaint_rate) AS avg_complaint_rate,
+                AVG(c.attempted_share) AS avg_attempted_share,
+                AVG(c.discrimination_avg) AS avg_discrimination,
+                SUM(c.total_attempts) AS total_attempts_sum,
+                AVG(c.time_median) AS avg_time_median,
+                SUM(c.time_median) AS total_time_median,
+                COUNT(DISTINCT c.module) AS module_count,
+                COUNT(DISTINCT c.lesson) AS lesson_count,
+                COUNT(DISTINCT c.gz) AS gz_count,
+                COUNT(DISTINCT c.card_type) AS card_type_count,
+                MAX(c.updated_at) AS last_updated,
+                AVG(r.risk) AS avg_risk
+            FROM mv_cards_mv c
+            LEFT JOIN card_risk_cache r ON c.card_id = r.card_id
+            GROUP BY GROUPING SETS (
+                (c.program),
+                (c.program, c.module, c.module_order),
+                (c.program, c.module, c.module_order, c.lesson, c.lesson_order),
+                (c.program, c.module, c.module_order, c.lesson, c.lesson_order, c.gz, c.gz_id)
+            )
+        """,
+        deps=["mv_cards_mv", "card_risk_cache"],
+        unique=("uq_hierarchy_stats", "level, hierarchy_key"),
+        indexes=[
+            ("idx_hierarchy_filters", "level, program, module, lesson"),
+            ("idx_hierarchy_orders", "level, program, module_order, lesson_order"),
+            ("idx_hierarchy_avg_risk", "level, avg_risk"),
+        ],
+    ),
+    # 4. Плоская таблица cards_flat (копия mv_cards_mv)
+    Relation(
+        "cards_flat", "table",
+        sql="SELECT * FROM mv_cards_mv",
+        deps=["mv_cards_mv"],
+        indexes=[
+            ("idx_flat_filters", "program, module, lesson, gz"),
+            ("idx_flat_card_id", "card_id"),
+            ("idx_flat_program", "program"),
+            ("idx_flat_module", "module"),
+            ("idx_flat_lesson", "lesson"),
+            ("idx_flat_gz", "gz"),
+            ("idx_flat_orders", "module_order, lesson_order"),
+            ("idx_flat_status", "status"),
+        ],
+    ),
+    # 5. Топ-10 карточек по каждой группе с учетом риска
+    _top10_relation(),
+]
+
+RELATIONS_BY_NAME = {relation.name: relation for relation in RELATIONS}
+
+# Прежние представления по уровням (отдельный GROUP BY и отдельное соединение
+# с кэшем риска на каждый уровень), замененные mv_hierarchy_stats.
+# Удаляются после обновления: сначала зависимые, затем базовые
+RETIRED_RELATIONS = [
+    "mv_program_risk", "mv_module_risk", "mv_lesson_risk", "mv_gz_risk",
+    "mv_program_stats", "mv_module_stats", "mv_lesson_stats", "mv_gz_stats",
+]
+
+
+# ------------------ План индексов ------------------ #
+
+def load_index_plan(path: str = INDEX_PLAN_PATH) -> Optional[Dict[str, List[Tuple[str, str]]]]:
+    """
+    Читает план индексов, составленный index_advisor.
+
+    Returns:
+        dict: {объект: [(имя индекса, колонки), ...]} или None, если файла нет
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        plan = json.load(f)
+    return {relation: [tuple(index) for index in indexes] for relation, indexes in plan.items()}
+
+
+def apply_index_plan(plan: Optional[Dict[str, List[Tuple[str, str]]]]) -> None:
+    """Устанавливает поддерживаемые индексы объектов по плану (None — все объявленные)."""
+    for relation in RELATIONS:
+        if plan is not None and relation.name in plan:
+            relation.indexes = list(plan[relation.name])
+        else:
+            relation.indexes = list(relation.declared_indexes)
+
+
+# ------------------ Отпечатки и журнал ------------------ #
+
+def base_table_fingerprints(conn, tables: Sequence[str] = BASE_TABLES) -> Dict[str, str]:
+    """
+    Отпечатки базовых таблиц по самим данным.
+
+    Отпечаток — количество строк и наибольший xmin (номер транзакции,
+    записавшей строку): вставка и обновление дают строку с новым xmin,
+    удаление меняет количество. Счетчики pg_stat_user_tables для этого не
+    подходят: статистика собирается асинхронно, сбрасывается
+    pg_stat_reset и после аварийного перезапуска.
+
+    Args:
+        conn: Соединение с БД
+        tables: Имена таблиц
+
+    Returns:
+        dict: {таблица: отпечаток}
+    """
+    fingerprints = {}
+    for table in tables:
+        count, max_xmin = conn.execute(text(
+            f"SELECT COUNT(*), MAX(xmin::text::bigint) FROM {table}"
+        )).one()
+        fingerprints[table] = f"{count}:{max_xmin}"
+    return fingerprints
+
+
+def input_hash(relation: Relation, definition: str, fingerprints: Dict[str, str],
+               dep_hashes: Dict[str, str]) -> str:
+    """Отпечаток входных данных объекта: определение, базовые таблицы, зависимости и конфигурация."""
+    parts = [definition]
+    parts += [f"{table}={fingerprints[table]}" for table in relation.sources]
+    parts += [f"{dep}={dep_hashes[dep]}" for dep in relation.deps]
+    if relation.config_dependent:
+        parts.append(f"config={get_config_version()}")
+        if RISK_IN_DB:
+            # Текст функции риска меняется и без смены конфигурации (правка генератора risk_sql)
+            parts.append(f"risk_function={risk_sql.risk_function_version()}")
+    return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def ensure_refresh_log(conn) -> None:
+    conn.exec_driver_sql(f"""
+        CREATE TABLE IF NOT EXISTS {REFRESH_LOG_TABLE} (
+            relation TEXT PRIMARY KEY,
+            definition_hash TEXT,
+            input_hash TEXT,
+            mode TEXT,
+            duration_ms DOUBLE PRECISION,
+            refreshed_at TIMESTAMPTZ DEFAULT now()
+        );
+    """)
+
+
+def read_refresh_log(conn) -> Dict[str, Dict[str, Any]]:
+    """Результаты последних обновлений: {объект: строка журнала и age_seconds — сколько прошло с обновления}."""
+    rows = conn.execute(text(f"""
+        SELECT *, EXTRACT(EPOCH FROM now() - refreshed_at) AS age_seconds FROM {REFRESH_LOG_TABLE}
+    """)).mappings().fetchall()
+    return {row["relation"]: dict(row) for row in rows}
+
+
+def _write_refresh_log(conn, relation: str, definition: str, inputs: str, mode: str, duration_ms: float) -> None:
+    conn.execute(text(f"""
+        INSERT INTO {REFRESH_LOG_TABLE} (relation, definition_hash, input_hash, mode, duration_ms, refreshed_at)
+        VALUES (:relation, :definition, :inputs, :mode, :duration_ms, now())
+        ON CONFLICT (relation) DO UPDATE SET
+            definition_hash = EXCLUDED.definition_hash,
+            input_hash = EXCLUDED.input_hash,
+            mode = EXCLUDED.mode,
+            duration_ms = EXCLUDED.duration_ms,
+            refreshed_at = EXCLUDED.refreshed_at
+    """), {"relation": relation, "definition": definition, "inputs": inputs,
+           "mode": mode, "duration_ms": duration_ms})
+
+
+def _relation_exists(conn, name: str) -> bool:
+    return conn.execute(text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name}).scalar()
+
+
+def _relation_kind(conn, name: str) -> Optional[str]:
+    """Тип существующего объекта в SQL (MATERIALIZED VIEW / TABLE) или None."""
+    return conn.execute(text(
+        "SELECT CASE relkind WHEN 'm' THEN 'MATERIALIZED VIEW' ELSE 'TABLE' END "
+        "FROM pg_class WHERE oid = to_regclass(:name)"
+    ), {"name": name}).scalar()
+
+
+def _drop_old(conn, name: str) -> bool:
+    """
+    Удаляет старую версию name__old, если от нее больше ничего не зависит.
+
+    Returns:
+        bool: True, если старой версии нет или она удалена
+    """
+    kind = _relation_kind(conn, f"{name}{OLD_SUFFIX}")
+    if not kind:
+        return True
+    savepoint = conn.begin_nested()
+    try:
+        conn.exec_driver_sql(f"DROP {kind} {name}{OLD_SUFFIX};")
+        savepoint.commit()
+        return True
+    except Exception as e:
+        # На старую версию еще ссылаются представления — их пересоздаст обновление
+        savepoint.rollback()
+        logging.warning(f"{name}{OLD_SUFFIX} не удалена: {e}")
+        return False
+
+
+def _drop_leftovers(conn) -> None:
+    """Удаляет версии *__new / *__old, оставшиеся от прерванного обновления."""
+    for relation in reversed(RELATIONS):
+        # Недостроенные новые версии никто не читает
+        kind = _relation_kind(conn, f"{relation.name}{NEW_SUFFIX}")
+        if kind:
+            conn.exec_driver_sql(f"DROP {kind} {relation.name}{NEW_SUFFIX} CASCADE;")
+        _drop_old(conn, relation.name)
+
+
+def _drop_retired(conn) -> None:
+    """Удаляет объекты, которых больше нет в RELATIONS, и их записи в журнале."""
+    for name in RETIRED_RELATIONS:
+        kind = _relation_kind(conn, name)
+        if kind:
+            conn.exec_driver_sql(f"DROP {kind} {name};")
+            logging.info(f"{name}: удалено (заменено mv_hierarchy_stats)")
+    conn.execute(text(f"DELETE FROM {REFRESH_LOG_TABLE} WHERE relation = ANY(:names)"),
+                 {"names": RETIRED_RELATIONS})
+
+
+def _references_old(conn, name: str) -> bool:
+    """Ссылается ли представление на старую версию другого объекта (после прерванной подмены)."""
+    definition = conn.execute(text("SELECT pg_get_viewdef(to_regclass(:name))"), {"name": name}).scalar()
+    return OLD_SUFFIX in (definition or "")
+
+
+def _has_unique_index(conn, name: str) -> bool:
+    return conn.execute(text("""
+        SELECT EXISTS (
+            SELECT 1 FROM pg_index i
+            WHERE i.indrelid = to_regclass(:name) AND i.indisunique AND i.indpred IS NULL AND i.indexprs IS NULL
         )
+    """), {"name": name}).scalar()
+
+
+# ------------------ Создание и обновление ------------------ #
+
+def _build(conn, relation: Relation, target: str, context: RefreshContext, suffix: str = "") -> None:
+    """Создает объект под именем target вместе с индексами (имена индексов с суффиксом)."""
+    if relation.kind == "frame":
+        db_bulk.load_frame(conn, context.frame(relation), target)
+    else:
+        conn.exec_driver_sql(f"CREATE {relation.db_kind} {target} AS {relation.sql};")
+
+    if relation.unique:
+        index_name, columns = relation.unique
+        # Без уникального индекса представление обновляется обычным REFRESH (например, при дублях)
+        savepoint = conn.begin_nested()
+        try:
+            conn.exec_driver_sql(f"CREATE UNIQUE INDEX {index_name}{suffix} ON {target} ({columns});")
+            savepoint.commit()
+        except Exception as e:
+            savepoint.rollback()
+            logging.warning(f"{relation.name}: не удалось создать уникальный индекс {index_name} ({e}); "
+                            f"обновление будет блокирующим")
+            conn.exec_driver_sql(f"CREATE INDEX {index_name}{suffix} ON {target} ({columns});")
+    for index_name, columns in relation.indexes:
+        conn.exec_driver_sql(f"CREATE INDEX {index_name}{suffix} ON {target} ({columns});")
+    if relation.kind == "frame":
+        # Статистика планировщика для только что загруженной таблицы
+        conn.exec_driver_sql(f"ANALYZE {target};")
+
+
+def _sync_indexes(conn, relation: Relation) -> List[str]:
+    """
+    Приводит обычные индексы объекта к relation.indexes.
+
+    Удаляются только объявленные индексы, исключенные планом; индексы,
+    созданные вручную, не затрагиваются.
+
+    Returns:
+        list: Описание изменений ("+имя" / "-имя")
+    """
+    existing = set(conn.execute(text("""
+        SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE i.indrelid = to_regclass(:name)
+    """), {"name": relation.name}).scalars())
+    wanted = {name for name, _ in relation.indexes}
+    changes = []
+    for index_name, _ in relation.declared_indexes:
+        if index_name in existing and index_name not in wanted:
+            conn.exec_driver_sql(f"DROP INDEX {index_name};")
+            changes.append(f"-{index_name}")
+    for index_name, columns in relation.indexes:
+        if index_name not in existing:
+            conn.exec_driver_sql(f"CREATE INDEX {index_name} ON {relation.name} ({columns});")
+            changes.append(f"+{index_name}")
+    return changes
 
-    # Создаем кэш риска и обновляем материализованные представления с учетом риска
-    # Сначала загружаем данные и рассчитываем риск
-    raw_data = load_raw_data(engine)
-    df = process_data(raw_data)
-    
-    # Создаем таблицу кэша риска
-    df_cache = df[['card_id','risk']].copy()
-    df_cache['updated_at'] = pd.Timestamp.utcnow()
-    df_cache.to_sql('card_risk_cache', engine, if_exists='replace', index=False)
-
-    # Обновляем представления с учетом риска
+
+def _index_names(relation: Relation) -> List[str]:
+    return ([relation.unique[0]] if relation.unique else []) + [name for name, _ in relation.indexes]
+
+
+def _create(engine, relation: Relation, context: RefreshContext) -> str:
+    """Создает объект, которого еще нет."""
     with engine.begin() as conn:
-        # Индекс для кэша риска
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_risk_cache_card_id ON card_risk_cache (card_id);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_risk_cache_risk ON card_risk_cache (risk);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_risk_cache_updated ON card_risk_cache (updated_at);"
-        )
-        
-        # Материализованные представления с учетом риска
-        conn.exec_driver_sql("DROP MATERIALIZED VIEW IF EXISTS mv_program_risk;")
-        conn.exec_driver_sql(
-            """
-            CREATE MATERIALIZED VIEW mv_program_risk AS
-            SELECT 
-                p.program,
-                p.card_count,
-                p.avg_success_rate,
-                p.avg_complaint_rate,
-                AVG(r.risk) AS avg_risk,
-                p.last_updated
-            FROM mv_program_stats p
-            JOIN mv_cards_mv c ON p.program = c.program
-            JOIN card_risk_cache r ON c.card_id = r.card_id
-            GROUP BY p.program, p.card_count, p.avg_success_rate, p.avg_complaint_rate, p.last_updated;
-            """
-        )
-        # Индексы для mv_program_risk
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_program_risk_program ON mv_program_risk (program);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_program_risk_avg_risk ON mv_program_risk (avg_risk);"
-        )
-        
-        conn.exec_driver_sql("DROP MATERIALIZED VIEW IF EXISTS mv_module_risk;")
-        conn.exec_driver_sql(
-            """
-            CREATE MATERIALIZED VIEW mv_module_risk AS
-            SELECT 
-                m.program,
-                m.module,
-                m.module_order,
-                m.card_count,
-                m.avg_success_rate,
-                m.avg_complaint_rate,
-                AVG(r.risk) AS avg_risk,
-                m.last_updated
-            FROM mv_module_stats m
-            JOIN mv_cards_mv c ON m.program = c.program AND m.module = c.module
-            JOIN card_risk_cache r ON c.card_id = r.card_id
-            GROUP BY m.program, m.module, m.module_order, m.card_count, m.avg_success_rate, m.avg_complaint_rate, m.last_updated
-            ORDER BY m.program, m.module_order;
-            """
-        )
-        # Индексы для mv_module_risk
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_module_risk_program ON mv_module_risk (program);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_module_risk_module ON mv_module_risk (module);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_module_risk_program_module ON mv_module_risk (program, module);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_module_risk_module_order ON mv_module_risk (module_order);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_module_risk_avg_risk ON mv_module_risk (avg_risk);"
-        )
-        
-        conn.exec_driver_sql("DROP MATERIALIZED VIEW IF EXISTS mv_lesson_risk;")
-        conn.exec_driver_sql(
-            """
-            CREATE MATERIALIZED VIEW mv_lesson_risk AS
-            SELECT 
-                l.program,
-                l.module,
-                l.module_order,
-                l.lesson,
-                l.lesson_order,
-                l.card_count,
-                l.avg_success_rate,
-                l.avg_complaint_rate,
-                AVG(r.risk) AS avg_risk,
-                l.last_updated
-            FROM mv_lesson_stats l
-            JOIN mv_cards_mv c ON l.program = c.program AND l.module = c.module AND l.lesson = c.lesson
-            JOIN card_risk_cache r ON c.card_id = r.card_id
-            GROUP BY l.program, l.module, l.module_order, l.lesson, l.lesson_order, l.card_count, l.avg_success_rate, l.avg_complaint_rate, l.last_updated
-            ORDER BY l.program, l.module_order, l.lesson_order;
-            """
-        )
-        # Индексы для mv_lesson_risk
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_lesson_risk_program ON mv_lesson_risk (program);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_lesson_risk_module ON mv_lesson_risk (module);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_lesson_risk_lesson ON mv_lesson_risk (lesson);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_lesson_risk_program_module ON mv_lesson_risk (program, module);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_lesson_risk_program_module_lesson ON mv_lesson_risk (program, module, lesson);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_lesson_risk_orders ON mv_lesson_risk (module_order, lesson_order);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_lesson_risk_avg_risk ON mv_lesson_risk (avg_risk);"
-        )
-        
-        conn.exec_driver_sql("DROP MATERIALIZED VIEW IF EXISTS mv_gz_risk;")
-        conn.exec_driver_sql(
-            """
-            CREATE MATERIALIZED VIEW mv_gz_risk AS
-            SELECT 
-                g.program,
-                g.module,
-                g.module_order,
-                g.lesson,
-                g.lesson_order,
-                g.gz,
-                g.gz_id,
-                g.card_count,
-                g.avg_success_rate,
-                g.avg_complaint_rate,
-                AVG(r.risk) AS avg_risk,
-                g.last_updated
-            FROM mv_gz_stats g
-            JOIN mv_cards_mv c ON g.program = c.program AND g.module = c.module AND g.lesson = c.lesson AND g.gz = c.gz
-            JOIN card_risk_cache r ON c.card_id = r.card_id
-            GROUP BY g.program, g.module, g.module_order, g.lesson, g.lesson_order, g.gz, g.gz_id, g.card_count, g.avg_success_rate, g.avg_complaint_rate, g.last_updated
-            ORDER BY g.program, g.module_order, g.lesson_order;
-            """
-        )
-        # Индексы для mv_gz_risk
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_gz_risk_program ON mv_gz_risk (program);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_gz_risk_module ON mv_gz_risk (module);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_gz_risk_lesson ON mv_gz_risk (lesson);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_gz_risk_gz ON mv_gz_risk (gz);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_gz_risk_gz_id ON mv_gz_risk (gz_id);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_gz_risk_program_module ON mv_gz_risk (program, module);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_gz_risk_program_module_lesson ON mv_gz_risk (program, module, lesson);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_gz_risk_all_filter ON mv_gz_risk (program, module, lesson, gz);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_gz_risk_avg_risk ON mv_gz_risk (avg_risk);"
-        )
+        _build(conn, relation, relation.name, context)
+    return "create"
 
-    # Старая часть: плоская таблица cards_flat и топ-10 карточек
+
+def _replace(engine, relation: Relation, context: RefreshContext) -> str:
+    """
+    Пересоздает объект с новым определением без окна, когда его нет.
+
+    Новая версия строится под именем name__new, затем в одной транзакции
+    старая переименовывается в name__old, а новая — в name. Зависящие от
+    старой версии представления продолжают работать, пока их тоже не
+    пересоздадут; name__old удаляются в конце обновления.
+    """
+    new_name, old_name = f"{relation.name}{NEW_SUFFIX}", f"{relation.name}{OLD_SUFFIX}"
     with engine.begin() as conn:
-        conn.exec_driver_sql("DROP TABLE IF EXISTS cards_flat;")
-        conn.exec_driver_sql("CREATE TABLE cards_flat AS SELECT * FROM mv_cards_mv;")
-        # Индексы для cards_flat
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_flat_filters ON cards_flat (program, module, lesson, gz);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_flat_card_id ON cards_flat (card_id);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_flat_program ON cards_flat (program);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_flat_module ON cards_flat (module);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_flat_lesson ON cards_flat (lesson);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_flat_gz ON cards_flat (gz);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_flat_orders ON cards_flat (module_order, lesson_order);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_flat_status ON cards_flat (status);"
-        )
+        conn.exec_driver_sql(f"DROP {relation.db_kind} IF EXISTS {new_name} CASCADE;")
+        _build(conn, relation, new_name, context, NEW_SUFFIX)
+    with engine.begin() as conn:
+        if not _drop_old(conn, relation.name):
+            raise RuntimeError(f"{old_name} еще используется, подмена {relation.name} невозможна")
+        old_kind = _relation_kind(conn, relation.name)
+        conn.exec_driver_sql(f"ALTER {old_kind} {relation.name} RENAME TO {old_name};")
+        # Имена индексов общие для схемы: освобождаем их у старой версии
+        for index_name in _index_names(relation):
+            conn.exec_driver_sql(f"DROP INDEX IF EXISTS {index_name}{OLD_SUFFIX};")
+            conn.exec_driver_sql(f"ALTER INDEX IF EXISTS {index_name} RENAME TO {index_name}{OLD_SUFFIX};")
+        conn.exec_driver_sql(f"ALTER {relation.db_kind} {new_name} RENAME TO {relation.name};")
+        for index_name in _index_names(relation):
+            conn.exec_driver_sql(f"ALTER INDEX {index_name}{NEW_SUFFIX} RENAME TO {index_name};")
+    return "replace"
 
-    # Топ-10 карточек по каждой группе с учетом риска
-    df_top = (
-        df[['gz','card_id','risk']]
-        .sort_values(['gz','risk'], ascending=[True,False])
-        .groupby('gz')
-        .head(10)
-        .assign(rn=lambda d: d.groupby('gz').cumcount()+1)
-    )
-    df_top.to_sql('top10_by_group', engine, if_exists='replace', index=False)
+
+def _reload_frame(engine, relation: Relation, context: RefreshContext) -> str:
+    """
+    Перезаписывает таблицу, рассчитанную в Python, через COPY.
+
+    Если таблицу не читают представления, новая версия загружается в
+    name__new вместе с индексами и подменяется переименованием (как при
+    _replace) — старая версия удаляется сразу. Иначе представления остались бы
+    на старой версии (они ссылаются на таблицу по OID), поэтому данные
+    заменяются на месте: DELETE и COPY в одной транзакции.
+    """
     with engine.begin() as conn:
-        # Индексы для top10_by_group
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_top10_gz_rn ON top10_by_group (gz, rn);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_top10_card_id ON top10_by_group (card_id);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_top10_risk ON top10_by_group (risk);"
-        )
-        conn.exec_driver_sql(
-            "CREATE INDEX IF NOT EXISTS idx_top10_gz ON top10_by_group (gz);"
-        )
+        dependents = db_bulk.has_dependent_views(conn, relation.name)
+    if not dependents:
+        _replace(engine, relation, context)
+        with engine.begin() as conn:
+            _drop_old(conn, relation.name)
+        return "copy_swap"
+    with engine.begin() as conn:
+        conn.exec_driver_sql(f"DELETE FROM {relation.name};")
+        db_bulk.copy_frame(conn, context.frame(relation), relation.name)
+    return "copy"
+
+
+def _refresh(engine, relation: Relation, context: RefreshContext) -> str:
+    """Обновляет данные существующего объекта; читатели видят старые данные до фиксации."""
+    if relation.kind == "frame":
+        return _reload_frame(engine, relation, context)
+    with engine.begin() as conn:
+        if relation.kind == "matview":
+            if _has_unique_index(conn, relation.name):
+                conn.exec_driver_sql(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {relation.name};")
+                return "refresh_concurrently"
+            conn.exec_driver_sql(f"REFRESH MATERIALIZED VIEW {relation.name};")
+            return "refresh"
+        conn.exec_driver_sql(f"DELETE FROM {relation.name};")
+        conn.exec_driver_sql(f"INSERT INTO {relation.name} {relation.sql};")
+        return "refresh"
+
+
+def plan_refresh(engine=None, force: bool = False) -> List[Dict[str, Any]]:
+    """
+    Определяет, какие объекты нужно создать, пересоздать или обновить.
+
+    Args:
+        engine: SQLAlchemy engine (по умолчанию общий engine приложения)
+        force: Обновить все объекты, даже если входные данные не изменились
+
+    Returns:
+        list: Для каждого объекта из RELATIONS словарь с ключами
+        relation, action ("create", "replace", "refresh" или "skip"),
+        definition_hash, input_hash
+    """
+    engine = engine or get_engine()
+    return _plan(engine, force)
+
+
+def _refresh_overdue(logged: Dict[str, Any]) -> bool:
+    """Прошло ли с последнего обновления объекта больше REFRESH_MAX_AGE_MINUTES."""
+    age = logged.get("age_seconds")
+    return REFRESH_MAX_AGE_MINUTES > 0 and age is not None and float(age) > REFRESH_MAX_AGE_MINUTES * 60
+
+
+def _plan(engine, force: bool) -> List[Dict[str, Any]]:
+    with engine.begin() as conn:
+        ensure_refresh_log(conn)
+        _drop_leftovers(conn)
+        log = read_refresh_log(conn)
+        fingerprints = base_table_fingerprints(conn)
+        existing = {relation.name: _relation_exists(conn, relation.name) for relation in RELATIONS}
+        stale = {
+            relation.name for relation in RELATIONS
+            if relation.kind == "matview" and existing[relation.name] and _references_old(conn, relation.name)
+        }
+
+    plan, hashes, replaced = [], {}, set()
+    for relation in RELATIONS:
+        definition = relation.definition_hash()
+        inputs = input_hash(relation, definition, fingerprints, hashes)
+        logged = log.get(relation.name, {})
+
+        if not existing[relation.name]:
+            action = "create"
+        elif logged.get("definition_hash") != definition:
+            action = "replace"
+        elif relation.kind == "matview" and (replaced & set(relation.deps) or relation.name in stale):
+            # Представление ссылается на подмененную зависимость — его тоже нужно пересоздать
+            action = "replace"
+        elif force or logged.get("input_hash") != inputs or _refresh_overdue(logged):
+            action = "refresh"
+        else:
+            action = "skip"
+
+        if action == "replace":
+            replaced.add(relation.name)
+        hashes[relation.name] = inputs
+        plan.append({"relation": relation.name, "action": action,
+                     "definition_hash": definition, "input_hash": inputs})
+    return plan
+
+
+def refresh_db(engine=None, force: bool = False, use_index_plan: bool = True) -> List[Dict[str, Any]]:
+    """
+    Инкрементально обновляет все объекты в порядке зависимостей.
+
+    Args:
+        engine: SQLAlchemy engine (по умолчанию общий engine приложения)
+        force: Обновить все объекты, даже если входные данные не изменились
+        use_index_plan: Поддерживать только индексы из плана INDEX_PLAN_PATH;
+            False — все объявленные индексы (например, перед запуском index_advisor)
+
+    Returns:
+        list: План с фактическим режимом и длительностью обновления каждого объекта
+    """
+    engine = engine or get_engine()
+    context = RefreshContext(engine)
+    apply_index_plan(load_index_plan() if use_index_plan else None)
+    if RISK_IN_DB:
+        # Функция риска должна соответствовать текущей конфигурации до обновления кэша риска
+        with engine.begin() as conn:
+            if risk_sql.ensure_risk_function(conn):
+                logging.info(f"{risk_sql.RISK_FUNCTION}: функция риска обновлена")
+    plan = _plan(engine, force)
+    actions = {"create": _create, "replace": _replace, "refresh": _refresh}
+
+    for step in plan:
+        relation = RELATIONS_BY_NAME[step["relation"]]
+        if step["action"] in ("skip", "refresh"):
+            # Созданные и пересозданные объекты уже построены с индексами из плана
+            with engine.begin() as conn:
+                changes = _sync_indexes(conn, relation)
+            if changes:
+                logging.info(f"{relation.name}: индексы {' '.join(changes)}")
+        if step["action"] == "skip":
+            step["mode"], step["duration_ms"] = "skip", 0.0
+            continue
+        started = time.perf_counter()
+        step["mode"] = actions[step["action"]](engine, relation, context)
+        step["duration_ms"] = (time.perf_counter() - started) * 1000
+        with engine.begin() as conn:
+            _write_refresh_log(conn, relation.name, step["definition_hash"], step["input_hash"],
+                               step["mode"], step["duration_ms"])
+        logging.info(f"{relation.name}: {step['mode']} за {step['duration_ms']:.0f} мс")
+
+    with engine.begin() as conn:
+        # Прежние представления могут ссылаться на старые версии объектов — удаляем их первыми
+        _drop_retired(conn)
+    # Старые версии пересозданных объектов больше никому не нужны — удаляем от зависимых к базовым
+    if any(step["action"] == "replace" for step in plan):
+        with engine.begin() as conn:
+            for relation in reversed(RELATIONS):
+                _drop_old(conn, relation.name)
+    return plan
+
+
+def optimize_db(force: bool = False, use_index_plan: bool = True):
+    """Создаёт или инкрементально обновляет materialized view, плоскую таблицу, таблицу кэша риска и топ-10 карточек по группам, а также необходимые индексы."""
+    return refresh_db(force=force, use_index_plan=use_index_plan)
+
 
 if __name__ == '__main__':
-    optimize_db()
+    # --all-indexes: создать все объявленные индексы (перед запуском index_advisor)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    for step in optimize_db(force="--force" in sys.argv, use_index_plan="--all-indexes" not in sys.argv):
+        print(f"{step['relation']}: {step['mode']} ({step['duration_ms']:.0f} мс)")
@@ -6,16 +6,95 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
+import copy
 import json
 import os
 import plotly.express as px
 import plotly.graph_objects as go
 
 import core
+import data_service
+import rerun_profiler
+import what_if
+from risk_kernel import RiskKernel
 from core_config import get_tricky_config, save_tricky_config, get_config, save_config
 
 
 
+# Цвета участков водопада по виду
+PROFILE_KIND_COLORS = {
+    "phase": "#4da6ff",
+    "section": "#09ab3b",
+    "plotly": "#ff8f00",
+    "render": "#a66cff",
+    "dataframe": "#ff4b4b",
+}
+
+
+def display_rerun_waterfall(record):
+    """Водопад участков одного перезапуска app.py."""
+    frame = rerun_profiler.waterfall_frame(record)
+    if frame.empty:
+        st.info("В профиле нет участков")
+        return
+    fig = go.Figure()
+    for kind, part in frame.groupby("kind", sort=False):
+        fig.add_trace(go.Bar(
+            y=part.index.astype(str),
+            x=part["duration_ms"],
+            base=part["start_ms"],
+            orientation="h",
+            name=kind,
+            marker_color=PROFILE_KIND_COLORS.get(kind, "#888888"),
+            customdata=part[["label", "duration_ms"]],
+            hovertemplate="%{customdata[0]}<br>%{customdata[1]:.1f} мс<extra></extra>",
+        ))
+    fig.update_yaxes(
+        autorange="reversed",
+        tickmode="array",
+        tickvals=frame.index.astype(str),
+        ticktext=frame["label"],
+    )
+    fig.update_layout(
+        barmode="overlay",
+        height=max(250, 22 * len(frame) + 80),
+        xaxis_title="мс от начала перезапуска",
+        margin=dict(l=10, r=10, t=30, b=10),
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+
+def display_rerun_profiles():
+    """Профили перезапусков текущей сессии и сводка по JSONL-трассам."""
+    profiles = st.session_state.get(rerun_profiler.SESSION_PROFILES_KEY, [])
+    if not profiles:
+        st.info("Профилей нет. Откройте приложение с параметром ?profile=1 (для администратора) "
+                "или запустите с переменной окружения APP_PROFILE=1.")
+    else:
+        options = list(range(len(profiles)))[::-1]
+        selected = st.selectbox(
+            "Перезапуск",
+            options,
+            format_func=lambda i: f"{profiles[i]['page']} — {profiles[i]['total_ms']:.0f} мс ({profiles[i]['status']})",
+            key="rerun_profile_select",
+        )
+        record = profiles[selected]
+        phases = [span for span in record["spans"] if span["kind"] == "phase"]
+        phase_cols = st.columns(max(1, len(phases)))
+        for col, span in zip(phase_cols, phases):
+            col.metric(span["name"], f"{span['duration_ms'] or 0:.0f} мс")
+        if record.get("dropped_spans"):
+            st.caption(f"Не записано участков: {record['dropped_spans']} (APP_PROFILE_MAX_SPANS)")
+        display_rerun_waterfall(record)
+
+    trace_files = rerun_profiler.trace_files()
+    if trace_files:
+        path = st.selectbox("Трасса", trace_files, format_func=os.path.basename, key="rerun_trace_select")
+        records = rerun_profiler.read_traces(path, limit=500)
+        st.caption(f"Перезапусков в трассе: {len(records)}")
+        st.dataframe(rerun_profiler.phase_summary(records).round(1), use_container_width=True, hide_index=True)
+
+
 # Вспомогательная функция для отображения таблицы с трики-карточками
 def display_tricky_cards_table(tricky_df):
     # Показываем только основные колонки
@@ -78,6 +157,7 @@ def page_admin(df: pd.DataFrame):
         if st.button("🔄 Пересчитать данные с новыми параметрами", type="primary"):
             # Очищаем кэш данных для принудительного пересчета
             st.cache_data.clear()
+            data_service.get_data_service().invalidate()
             st.success("Данные будут пересчитаны с новыми параметрами!")
             st.rerun()
 
@@ -182,6 +262,7 @@ def page_admin(df: pd.DataFrame):
             ):
                 # Очищаем кэш данных, чтобы при следующем обращении данные загрузились заново
                 st.cache_data.clear()
+                data_service.get_data_service().invalidate()
                 st.success("Кэш очищен. Данные будут пересчитаны с новыми параметрами!")
                 st.rerun()
 
@@ -260,8 +341,9 @@ def page_admin(df: pd.DataFrame):
     # Путь к файлу конфигурации
     config_path = "risk_config.json"
     
-    # Загрузка конфигурации из текущих значений через get_config()
-    config = get_config()
+    # Рабочая копия конфигурации: слайдеры меняют ее, не затрагивая кэшированную
+    # конфигурацию, пока изменения не сохранены
+    config = copy.deepcopy(get_config())
     
     st.markdown("""
     Эта страница позволяет настраивать параметры для вычисления риска карточек.
@@ -328,21 +410,7 @@ def page_admin(df: pd.DataFrame):
         with col2:
             # Визуализация границ дискриминативности
             x = np.linspace(0, 1, 100)
-            y = []
-            
-            for val in x:
-                if val >= discrimination_good:
-                    # Хорошая дискриминативность (0-0.25)
-                    normalized = min(1.0, (val - discrimination_good) / 0.4)
-                    y.append(max(0, 0.25 * (1 - normalized)))
-                elif val >= discrimination_medium:
-                    # Средняя дискриминативность (0.26-0.50)
-                    normalized = (val - discrimination_medium) / (discrimination_good - discrimination_medium)
-                    y.append(0.50 - normalized * 0.24)
-                else:
-                    # Низкая дискриминативность (0.51-1.0)
-                    normalized = max(0, val / discrimination_medium)
-                    y.append(1.0 - normalized * 0.49)
+            y = what_if.component_curve(config, "discrimination", x)
             
             fig = go.Figure()
             fig.add_trace(go.Scatter(
@@ -492,25 +560,7 @@ def page_admin(df: pd.DataFrame):
             st.markdown("### График риска для успешности")
             
             x = np.linspace(0, 1, 100)
-            success_y = []
-            
-            for val in x:
-                if val > success_boring:
-                    # Скучная (слишком простая) задача (0.30-0.40)
-                    normalized = min(1.0, (val - success_boring) / 0.05)
-                    success_y.append(0.30 + normalized * 0.10)
-                elif val >= success_optimal_low:
-                    # Оптимальная успешность (0-0.25)
-                    normalized = (val - success_optimal_low) / (success_boring - success_optimal_low)
-                    success_y.append(0.25 * (1 - normalized))
-                elif val >= success_suboptimal_low:
-                    # Субоптимальная успешность (0.26-0.50)
-                    normalized = (val - success_suboptimal_low) / (success_optimal_low - success_suboptimal_low)
-                    success_y.append(0.50 - normalized * 0.24)
-                else:
-                    # Фрустрирующая успешность (0.51-1.0)
-                    normalized = max(0, val / success_suboptimal_low)
-                    success_y.append(1.0 - normalized * 0.49)
+            success_y = what_if.component_curve(config, "success", x)
             
             fig_success = go.Figure()
             fig_success.add_trace(go.Scatter(
@@ -549,25 +599,20 @@ def page_admin(df: pd.DataFrame):
             # Визуализация границ успешности с первой попытки
             st.markdown("### График риска для успешности с первой попытки")
             
-            first_try_y = []
-            
-            for val in x:
-                if val > first_try_too_easy:
+            # Метрика не входит в итоговый риск, поэтому кривая считается здесь, а не ядром
+            first_try_y = np.select(
+                [x > first_try_too_easy, x >= first_try_optimal_low, x >= first_try_multiple_low],
+                [
                     # Слишком простая задача (0.26-0.35)
-                    normalized = min(1.0, (val - first_try_too_easy) / 0.1)
-                    first_try_y.append(0.26 + normalized * 0.09)
-                elif val >= first_try_optimal_low:
+                    0.26 + np.minimum(1.0, (x - first_try_too_easy) / 0.1) * 0.09,
                     # Оптимальная успешность с первой попытки (0-0.25)
-                    normalized = (val - first_try_optimal_low) / (first_try_too_easy - first_try_optimal_low)
-                    first_try_y.append(0.25 * (1 - normalized))
-                elif val >= first_try_multiple_low:
+                    0.25 * (1 - (x - first_try_optimal_low) / (first_try_too_easy - first_try_optimal_low)),
                     # Требует нескольких попыток (0.26-0.50)
-                    normalized = (val - first_try_multiple_low) / (first_try_optimal_low - first_try_multiple_low)
-                    first_try_y.append(0.50 - normalized * 0.24)
-                else:
-                    # Сложная задача (0.51-1.0)
-                    normalized = max(0, val / first_try_multiple_low)
-                    first_try_y.append(1.0 - normalized * 0.49)
+                    0.50 - (x - first_try_multiple_low) / (first_try_optimal_low - first_try_multiple_low) * 0.24,
+                ],
+                # Сложная задача (0.51-1.0)
+                1.0 - np.maximum(0, x / first_try_multiple_low) * 0.49,
+            )
             
             fig_first_try = go.Figure()
             fig_first_try.add_trace(go.Scatter(
@@ -712,26 +757,7 @@ def page_admin(df: pd.DataFrame):
             
             # Создаем массив значений для жалоб
             complaints_x = np.linspace(0, int(complaints_critical * 1.5), 100)
-            complaints_y = []
-            
-            for val in complaints_x:
-                if val > complaints_critical:
-                    # Критический уровень жалоб (0.76-1.0)
-                    excess = min(100, val - complaints_critical)
-                    normalized = excess / 100
-                    complaints_y.append(0.76 + normalized * 0.24)
-                elif val >= complaints_high:
-                    # Высокий уровень жалоб (0.51-0.75)
-                    normalized = (val - complaints_high) / (complaints_critical - complaints_high)
-                    complaints_y.append(0.51 + normalized * 0.24)
-                elif val >= complaints_medium:
-                    # Средний уровень жалоб (0.26-0.50)
-                    normalized = (val - complaints_medium) / (complaints_high - complaints_medium)
-                    complaints_y.append(0.26 + normalized * 0.24)
-                else:
-                    # Низкий уровень жалоб (0-0.25)
-                    normalized = val / max(1, complaints_medium)
-                    complaints_y.append(normalized * 0.25)
+            complaints_y = what_if.component_curve(config, "complaints", complaints_x)
             
             fig_complaints = go.Figure()
             fig_complaints.add_trace(go.Scatter(
@@ -771,25 +797,7 @@ def page_admin(df: pd.DataFrame):
             st.markdown("### График риска для доли пытавшихся")
             
             x = np.linspace(0, 1, 100)
-            attempts_y = []
-            
-            for val in x:
-                if val > attempts_high:
-                    # Высокая доля пытавшихся (0-0.10)
-                    normalized = min(1.0, (val - attempts_high) / 0.05)
-                    attempts_y.append(0.10 * (1 - normalized))
-                elif val >= attempts_normal_low:
-                    # Нормальная доля пытавшихся (0-0.25)
-                    normalized = (val - attempts_normal_low) / (attempts_high - attempts_normal_low)
-                    attempts_y.append(0.25 - normalized * 0.15)
-                elif val >= attempts_insufficient_low:
-                    # Недостаточная доля пытавшихся (0.26-0.50)
-                    normalized = (val - attempts_insufficient_low) / (attempts_normal_low - attempts_insufficient_low)
-                    attempts_y.append(0.50 - normalized * 0.24)
-                else:
-                    # Игнорируемая доля пытавшихся (0.51-1.0)
-                    normalized = max(0, val / attempts_insufficient_low)
-                    attempts_y.append(1.0 - normalized * 0.49)
+            attempts_y = what_if.component_curve(config, "attempted", x)
             
             fig_attempts = go.Figure()
             fig_attempts.add_trace(go.Scatter(
@@ -1025,11 +1033,7 @@ def page_admin(df: pd.DataFrame):
             st.markdown("### Влияние количества попыток на корректировку риска")
             
             attempts_x = np.linspace(0, significance_threshold * 1.5, 100)
-            confidence_y = []
-            
-            for val in attempts_x:
-                confidence_factor = min(val / significance_threshold, 1.0)
-                confidence_y.append(confidence_factor)
+            confidence_y = np.minimum(attempts_x / significance_threshold, 1.0)
             
             fig_confidence = go.Figure()
             fig_confidence.add_trace(go.Scatter(
@@ -1583,6 +1587,72 @@ def page_admin(df: pd.DataFrame):
                     st.info("Нет трики-карточек низкого уровня.")
     # Вкладка тестирования
     with tabs[5]:
+        st.subheader("Влияние изменений на все карточки")
+        
+        if not df.empty:
+            # Движок держит входные массивы всех карточек и пересчитывает риск
+            # для текущих значений слайдеров на каждом перезапуске страницы
+            engine = what_if.engine_for(df, core.get_data_version(df))
+            what_if_result = engine.run(config, top_n=20)
+            
+            impact_cols = st.columns(3)
+            impact_cols[0].metric("Сменили категорию риска", f"{what_if_result.changed} из {len(engine)}")
+            impact_cols[1].metric(
+                "Средний риск",
+                f"{np.nanmean(what_if_result.risk):.3f}",
+                f"{np.nanmean(what_if_result.delta):+.3f}",
+                delta_color="inverse"
+            )
+            impact_cols[2].metric("Максимальное изменение", f"{np.nanmax(np.abs(what_if_result.delta)):.3f}")
+            
+            impact_col1, impact_col2 = st.columns(2)
+            
+            with impact_col1:
+                counts_long = what_if_result.counts.melt(
+                    id_vars="Категория",
+                    value_vars=["Текущая конфигурация", "Новая конфигурация"],
+                    var_name="Конфигурация",
+                    value_name="Количество"
+                )
+                fig_counts = px.bar(
+                    counts_long,
+                    x="Категория",
+                    y="Количество",
+                    color="Конфигурация",
+                    barmode="group",
+                    title="Количество карточек по категориям риска"
+                )
+                fig_counts.update_layout(height=350)
+                st.plotly_chart(fig_counts, use_container_width=True)
+            
+            with impact_col2:
+                fig_dist = go.Figure()
+                fig_dist.add_trace(go.Histogram(x=what_if_result.baseline, name="Текущая конфигурация", opacity=0.6, nbinsx=40))
+                fig_dist.add_trace(go.Histogram(x=what_if_result.risk, name="Новая конфигурация", opacity=0.6, nbinsx=40))
+                fig_dist.update_layout(
+                    barmode="overlay",
+                    title="Распределение риска",
+                    xaxis_title="Риск",
+                    yaxis_title="Количество карточек",
+                    height=350
+                )
+                st.plotly_chart(fig_dist, use_container_width=True)
+            
+            st.markdown("#### Переходы между категориями (строки - было, столбцы - стало)")
+            st.dataframe(what_if_result.transitions, use_container_width=True)
+            
+            st.markdown("#### Карточки с наибольшим изменением риска")
+            st.dataframe(
+                what_if_result.top_movers.style.format({
+                    "Текущий риск": "{:.3f}",
+                    "Новый риск": "{:.3f}",
+                    "Изменение": "{:+.3f}"
+                }),
+                hide_index=True,
+                use_container_width=True
+            )
+        
+        st.markdown("---")
         st.subheader("Тестирование конфигурации на примере карточек")
         
         # Выбор карточек для тестирования
@@ -1639,122 +1709,41 @@ def page_admin(df: pd.DataFrame):
                 
                 # Рассчитываем риски отдельных метрик с новыми настройками
                 try:
-                    # Преобразуем серию в словарь для более простой работы
-                    card_dict = selected_card.to_dict()
-                    card_series = pd.Series(card_dict)
-                    
-                    # Рассчитываем компоненты риска с новыми параметрами
                     old_risk = selected_card["risk"]
                     
-                    # Создаем функции расчета риска с новыми параметрами
-                    def discrimination_risk_score_new(discrimination_avg):
-                        if discrimination_avg >= config["discrimination"]["good"]:
-                            normalized = min(1.0, (discrimination_avg - config["discrimination"]["good"]) / 0.4)
-                            return max(0, 0.25 * (1 - normalized))
-                        elif discrimination_avg >= config["discrimination"]["medium"]:
-                            normalized = (discrimination_avg - config["discrimination"]["medium"]) / (config["discrimination"]["good"] - config["discrimination"]["medium"])
-                            return 0.50 - normalized * 0.24
-                        else:
-                            normalized = max(0, discrimination_avg / config["discrimination"]["medium"])
-                            return 1.0 - normalized * 0.49
+                    # Компоненты и итоговый риск с новыми параметрами считает то же ядро,
+                    # что и основной расчет, поэтому предпросмотр совпадает с результатом после сохранения
+                    kernel = RiskKernel(config)
+                    card_frame = pd.DataFrame([selected_card.to_dict()]).infer_objects()
+                    if "complaints_total" not in card_frame.columns:
+                        card_frame["complaints_total"] = 0
+                    card_risk = {name: values[0] for name, values in kernel.evaluate(card_frame).items()}
                     
-                    def success_rate_risk_score_new(success_rate):
-                        if success_rate > config["success_rate"]["too_easy"]:
-                            normalized = min(1.0, (success_rate - config["success_rate"]["too_easy"]) / 0.1)
-                            return 0.26 + normalized * 0.09
-                        elif success_rate >= config["success_rate"]["optimal_low"]:
-                            normalized = (success_rate - config["success_rate"]["optimal_low"]) / (config["success_rate"]["too_easy"] - config["success_rate"]["optimal_low"])
-                            return 0.25 * (1 - normalized)
-                        elif success_rate >= config["success_rate"]["suboptimal_low"]:
-                            normalized = (success_rate - config["success_rate"]["suboptimal_low"]) / (config["success_rate"]["optimal_low"] - config["success_rate"]["suboptimal_low"])
-                            return 0.50 - normalized * 0.24
-                        else:
-                            normalized = max(0, success_rate / config["success_rate"]["suboptimal_low"])
-                            return 1.0 - normalized * 0.49
+                    risk_discr = card_risk["risk_discrimination"]
+                    risk_success = card_risk["risk_success"]
+                    risk_trickiness = card_risk["risk_trickiness"]
+                    risk_complaints = card_risk["risk_complaints"]
+                    risk_attempted = card_risk["risk_attempted"]
+                    new_risk = card_risk["risk"]
                     
-                    def trickiness_risk_score_new(trickiness_score):
-                        # Используем фиксированные значения для расчета сложности
-                        too_easy = 0.9
-                        optimal_low = 0.65
-                        multiple_low = 0.4
-                        
-                        if trickiness_score > too_easy:
-                            normalized = min(1.0, (trickiness_score - too_easy) / 0.1)
-                            return 0.26 + normalized * 0.09
-                        elif trickiness_score >= optimal_low:
-                            normalized = (trickiness_score - optimal_low) / (too_easy - optimal_low)
-                            return 0.25 * (1 - normalized)
-                        elif trickiness_score >= multiple_low:
-                            normalized = (trickiness_score - multiple_low) / (optimal_low - multiple_low)
-                            return 0.50 - normalized * 0.24
-                        else:
-                            normalized = max(0, trickiness_score / multiple_low)
-                            return 1.0 - normalized * 0.49
-                    
-                    def complaint_risk_score_new(row):
-                        # Получаем абсолютное количество жалоб
-                        complaints_total = row.get("complaints_total", 0)
-                        
-                        if complaints_total > config["complaints"]["critical"]:
-                            excess = min(100, complaints_total - config["complaints"]["critical"])
-                            normalized = excess / 100
-                            return 0.76 + normalized * 0.24
-                        elif complaints_total >= config["complaints"]["high"]:
-                            normalized = (complaints_total - config["complaints"]["high"]) / (config["complaints"]["critical"] - config["complaints"]["high"])
-                            return 0.51 + normalized * 0.24
-                        elif complaints_total >= config["complaints"]["medium"]:
-                            normalized = (complaints_total - config["complaints"]["medium"]) / (config["complaints"]["high"] - config["complaints"]["medium"])
-                            return 0.26 + normalized * 0.24
-                        else:
-                            normalized = complaints_total / max(1, config["complaints"]["medium"])
-                            return normalized * 0.25
-                    
-                    def attempted_share_risk_score_new(attempted_share):
-                        if attempted_share > config["attempts"]["high"]:
-                            normalized = min(1.0, (attempted_share - config["attempts"]["high"]) / 0.05)
-                            return 0.10 * (1 - normalized)
-                        elif attempted_share >= config["attempts"]["normal_low"]:
-                            normalized = (attempted_share - config["attempts"]["normal_low"]) / (config["attempts"]["high"] - config["attempts"]["normal_low"])
-                            return 0.25 - normalized * 0.15
-                        elif attempted_share >= config["attempts"]["insufficient_low"]:
-                            normalized = (attempted_share - config["attempts"]["insufficient_low"]) / (config["attempts"]["normal_low"] - config["attempts"]["insufficient_low"])
-                            return 0.50 - normalized * 0.24
-                        else:
-                            normalized = max(0, attempted_share / config["attempts"]["insufficient_low"])
-                            return 1.0 - normalized * 0.49
-                    
-                    # Рассчитываем компоненты риска
-                    risk_discr = discrimination_risk_score_new(selected_card["discrimination_avg"])
-                    risk_success = success_rate_risk_score_new(selected_card["success_rate"])
-                    risk_complaints = complaint_risk_score_new(card_dict)
-                    risk_attempted = attempted_share_risk_score_new(selected_card["attempted_share"])
-                    
-                    # Определяем максимальный риск
-                    max_risk = max(risk_discr, risk_success, risk_complaints, risk_attempted)
-                    
-                    # Рассчитываем взвешенное среднее
+                    # Промежуточные значения формулы для пояснения расчета
+                    max_risk = max(risk_discr, risk_success, risk_trickiness, risk_complaints, risk_attempted)
                     weighted_avg_risk = (
-                        config["weights"]["discrimination"] * risk_discr +
-                        config["weights"]["success_rate"] * risk_success +
-                        config["weights"]["complaint_rate"] * risk_complaints +
-                        config["weights"]["attempted"] * risk_attempted
+                        kernel.w_discrimination * risk_discr +
+                        kernel.w_success * risk_success +
+                        kernel.w_trickiness * risk_trickiness +
+                        kernel.w_complaints * risk_complaints +
+                        kernel.w_attempted * risk_attempted
                     )
-                    
-                    # Определяем минимальный порог риска на основе максимального риска
-                    if max_risk > config["risk_thresholds"]["critical"]:
-                        min_threshold = config["risk_thresholds"]["min_for_critical"]
-                    elif max_risk > config["risk_thresholds"]["high"]:
-                        min_threshold = config["risk_thresholds"]["min_for_high"]
+                    if kernel.use_min_threshold and max_risk > kernel.risk_critical:
+                        min_threshold = kernel.min_for_critical
+                    elif kernel.use_min_threshold and max_risk > kernel.risk_high:
+                        min_threshold = kernel.min_for_high
                     else:
                         min_threshold = 0
-                    
-                    # Применяем комбинированную формулу
-                    combined_risk = config["risk_thresholds"]["alpha_weight_avg"] * weighted_avg_risk + (1 - config["risk_thresholds"]["alpha_weight_avg"]) * max_risk
+                    combined_risk = kernel.alpha * weighted_avg_risk + (1 - kernel.alpha) * max_risk
                     raw_risk = max(weighted_avg_risk, combined_risk, min_threshold)
-                    
-                    # Корректировка на статистическую значимость
-                    confidence_factor = min(selected_card["total_attempts"] / config["stats"]["significance_threshold"], 1.0)
-                    new_risk = raw_risk * confidence_factor + config["stats"]["neutral_risk_value"] * (1 - confidence_factor)
+                    confidence_factor = min(selected_card["total_attempts"] / kernel.significance_threshold, 1.0)
                     
                     # Отображаем результаты расчета
                     st.markdown(f"#### Риск по метрикам:")
@@ -1773,6 +1762,7 @@ def page_admin(df: pd.DataFrame):
                     risks = {
                         "Дискриминативность": risk_discr,
                         "Успешность": risk_success,
+                        "Метрика 'трики'": risk_trickiness,
                         "Количество жалоб": risk_complaints,
                         "Доля пытавшихся": risk_attempted
                     }
@@ -1807,10 +1797,11 @@ def page_admin(df: pd.DataFrame):
                         "Метрика": list(risks.keys()),
                         "Риск": list(risks.values()),
                         "Вес": [
-                            config["weights"]["discrimination"],
-                            config["weights"]["success_rate"],
-                            config["weights"]["complaint_rate"],
-                            config["weights"]["attempted"]
+                            kernel.w_discrimination,
+                            kernel.w_success,
+                            kernel.w_trickiness,
+                            kernel.w_complaints,
+                            kernel.w_attempted
                         ]
                     })
                     
@@ -2324,6 +2315,9 @@ def page_admin(df: pd.DataFrame):
         if st.button("💾 Сохранить конфигурацию", type="primary"):
             # Сохраняем конфигурацию с использованием функции из core_config
             if save_config(config):
+                # Кэш риска привязан к версии конфигурации, поэтому st.cache_data не очищаем:
+                # достаточно сбросить общие наборы данных, чтобы страницы получили новый риск
+                data_service.get_data_service().invalidate()
                 st.success("Конфигурация успешно сохранена и будет применяться к расчетам риска!")
             else:
                 st.error("Ошибка при сохранении конфигурации.")
@@ -2331,4 +2325,18 @@ def page_admin(df: pd.DataFrame):
     with col2:
         # Отображаем структуру конфигурации
         if st.checkbox("Показать JSON конфигурации"):
-            st.code(json.dumps(config, indent=4, ensure_ascii=False), language="json")
\ No newline at end of file
+            st.code(json.dumps(config, indent=4, ensure_ascii=False), language="json")
+    
+    # Статистика пула соединений с БД - помогает подобрать DB_POOL_SIZE / DB_MAX_OVERFLOW
+    with st.expander("🔌 Пул соединений с БД", expanded=False):
+        pool_stats = core.get_pool_stats()
+        pool_cols = st.columns(4)
+        pool_cols[0].metric("Размер пула", pool_stats["pool_size"])
+        pool_cols[1].metric("Занято соединений", pool_stats["checked_out"])
+        pool_cols[2].metric("Среднее ожидание, мс", f"{pool_stats.get('avg_wait_ms', 0.0):.1f}")
+        pool_cols[3].metric("Таймауты", pool_stats.get("timeouts", 0))
+        st.json(pool_stats)
+    
+    # Профиль перезапусков app.py - какая фаза и какой участок страницы дороже всего
+    with st.expander("⏱️ Профиль перезапусков", expanded=False):
+        display_rerun_profiles()
@@ -233,13 +233,15 @@ def display_risk_components(card_data):
     # Получаем параметры из конфигурации
     config = core.get_config()
     
-    # Рассчитываем риски отдельных метрик
-    card_dict = card_data.to_dict()
-    risk_discr = core.discrimination_risk_score(card_data["discrimination_avg"])
-    risk_success = core.success_rate_risk_score(card_data["success_rate"])
-    risk_trickiness = core.trickiness_risk_score(card_dict)
-    risk_complaints = core.complaint_risk_score(card_dict)
-    risk_attempted = core.attempted_share_risk_score(card_data["attempted_share"])
+    # Рассчитываем риски отдельных метрик одним проходом
+    card_risks = core.calculate_risk_batch(
+        pd.DataFrame([card_data]).infer_objects(), columns=core.RISK_COMPONENTS
+    ).iloc[0]
+    risk_discr = card_risks["risk_discrimination"]
+    risk_success = card_risks["risk_success"]
+    risk_trickiness = card_risks["risk_trickiness"]
+    risk_complaints = card_risks["risk_complaints"]
+    risk_attempted = card_risks["risk_attempted"]
     
     # Определяем максимальный риск
     max_risk = max(risk_discr, risk_success, risk_trickiness, risk_complaints, risk_attempted)
@@ -1011,12 +1013,19 @@ def page_cards(df: pd.DataFrame, eng):
     # Получаем Series с данными карточки
     card_data = card_data.iloc[0]
     
+    # Тексты жалоб не входят в общий набор данных - подгружаем их для выбранной карточки
+    if "complaints_text" not in card_data:
+        texts = core.get_card_texts(eng, [int(card_data["card_id"])])
+        card_data["complaints_text"] = texts.get(int(card_data["card_id"]), {}).get("complaints_text")
+    
     # Добавляем метрику разницы между success_rate и first_try_success_rate
     card_data["success_diff"] = card_data["success_rate"] - card_data["first_try_success_rate"]
     
     # Проверяем, есть ли поле trickiness_level, если нет - вычисляем
     if "trickiness_level" not in card_data:
-        card_data["trickiness_level"] = core.get_trickiness_level(card_data)
+        card_data["trickiness_level"] = core.calculate_risk_batch(
+            pd.DataFrame([card_data]).infer_objects(), columns=["trickiness_level"]
+        )["trickiness_level"].iloc[0]
     
     # Получаем card_order из базы данных
     card_order = get_card_order(int(card_data["card_id"]), eng)
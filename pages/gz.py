@@ -65,7 +65,7 @@ def page_gz(df: pd.DataFrame, create_link_fn=None):
     
     # Проверяем наличие колонки trickiness_level
     if "trickiness_level" not in df_gz.columns:
-        df_gz["trickiness_level"] = df_gz.apply(core.get_trickiness_level, axis=1)
+        df_gz["trickiness_level"] = core.calculate_risk_batch(df_gz, columns=["trickiness_level"])["trickiness_level"]
         
     # Добавляем разницу между общей успешностью и успехом с первой попытки
     df_gz["success_diff"] = df_gz["success_rate"] - df_gz["first_try_success_rate"]
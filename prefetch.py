@@ -0,0 +1,174 @@
+# prefetch.py
+"""
+Упреждающая загрузка следующего уровня навигации.
+
+Навигация строго иерархическая (обзор → программа → модуль → урок → ГЗ →
+карточка), и пользователь почти всегда переходит в один из дочерних
+элементов текущей страницы. После отрисовки уровня Prefetcher в фоне
+прогревает кэш для нескольких наиболее вероятных дочерних уровней: сначала
+по истории переходов, затем по риску. Задачи выполняются на ограниченном
+пуле потоков, поэтому прогрев не конкурирует с основными запросами.
+"""
+
+import os
+import logging
+import threading
+import concurrent.futures
+from collections import Counter
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+import pandas as pd
+import streamlit as st
+
+# Сколько дочерних уровней прогревать после каждой страницы
+PREFETCH_TOP_N = int(os.getenv("PREFETCH_TOP_N", "3"))
+
+# Размер пула потоков прогрева
+PREFETCH_WORKERS = int(os.getenv("PREFETCH_WORKERS", "2"))
+
+# Максимальное количество задач в очереди; лишние задачи отбрасываются
+PREFETCH_MAX_PENDING = int(os.getenv("PREFETCH_MAX_PENDING", "16"))
+
+# Отключение прогрева переменной окружения
+PREFETCH_DISABLED = os.getenv("PREFETCH_DISABLED", "0") == "1"
+
+# Порядок параметров фильтрации в иерархии
+PARAM_ORDER = ["program", "module", "lesson", "gz", "card_id"]
+
+# Уровень → (дочерний уровень, набор данных с дочерними элементами, колонка имени)
+CHILD_LEVELS = {
+    "overview": ("program", "programs", "program"),
+    "program": ("module", "modules", "module"),
+    "module": ("lesson", "lessons", "lesson"),
+    "lesson": ("gz", "gz_list", "gz"),
+    "gz": ("card", "cards", "card_id"),
+}
+
+# Колонки риска в наборах данных (агрегаты и карточки)
+RISK_COLUMNS = ["avg_risk", "risk"]
+
+
+def child_candidates(level: str, params: Dict[str, Any], data: Dict[str, Any],
+                     clicks: Optional[Counter] = None, top_n: int = PREFETCH_TOP_N) -> List[Dict[str, Any]]:
+    """
+    Возвращает наиболее вероятные дочерние уровни для текущей страницы.
+
+    Кандидаты ранжируются по числу прошлых переходов, затем по риску.
+
+    Args:
+        level: Текущий уровень навигации
+        params: Текущие параметры фильтрации (program, module, lesson, gz)
+        data: Данные текущего уровня (результат load_all_data_for_level)
+        clicks: Счетчик переходов {(уровень, параметры): количество}
+        top_n: Количество кандидатов
+
+    Returns:
+        list: Словари {"level": ..., "program": ..., ...} для дочерних уровней
+    """
+    if level not in CHILD_LEVELS or top_n <= 0:
+        return []
+    child_level, dataset, column = CHILD_LEVELS[level]
+    frame = data.get(dataset)
+    if not isinstance(frame, pd.DataFrame) or frame.empty or column not in frame.columns:
+        return []
+
+    # Дочерние элементы должны относиться к текущему элементу (наборы данных могут быть шире)
+    depth = PARAM_ORDER.index(column)
+    for name in PARAM_ORDER[:depth]:
+        if params.get(name) and name in frame.columns:
+            frame = frame[frame[name] == params[name]]
+
+    risk_column = next((col for col in RISK_COLUMNS if col in frame.columns), None)
+    ranking = pd.DataFrame({"name": frame[column].to_numpy()})
+    ranking["risk"] = frame[risk_column].to_numpy(dtype=float) if risk_column else 0.0
+    ranking = ranking.dropna(subset=["name"]).groupby("name", observed=True, sort=False)["risk"].max().reset_index()
+
+    base = {name: params.get(name) for name in PARAM_ORDER[:depth]}
+    if clicks:
+        ranking["clicks"] = [
+            clicks.get(visit_key(child_level, {**base, column: name}), 0) for name in ranking["name"]
+        ]
+    else:
+        ranking["clicks"] = 0
+    ranking = ranking.sort_values(["clicks", "risk"], ascending=False, na_position="last").head(top_n)
+
+    candidates = []
+    for name in ranking["name"]:
+        if column == "card_id":
+            name = str(int(name))
+        candidates.append({"level": child_level, **base, column: name})
+    return candidates
+
+
+def visit_key(level: str, params: Dict[str, Any]) -> Hashable:
+    """Ключ уровня навигации для истории переходов."""
+    return (level,) + tuple(params.get(name) for name in PARAM_ORDER)
+
+
+class Prefetcher:
+    """Ограниченный пул потоков для фонового прогрева дочерних уровней."""
+
+    def __init__(self, max_workers: int = PREFETCH_WORKERS, max_pending: int = PREFETCH_MAX_PENDING):
+        self.max_pending = max_pending
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="prefetch"
+        )
+        self._lock = threading.Lock()
+        self._inflight = set()
+        self._clicks: Counter = Counter()
+        self._stats = Counter()
+
+    def record_visit(self, level: str, params: Dict[str, Any]) -> None:
+        """Запоминает переход на уровень (используется при ранжировании)."""
+        with self._lock:
+            self._clicks[visit_key(level, params)] += 1
+
+    def clicks(self) -> Counter:
+        """Копия счетчика переходов."""
+        with self._lock:
+            return Counter(self._clicks)
+
+    def submit(self, key: Hashable, warm: Callable[[], Any]) -> bool:
+        """
+        Ставит прогрев в очередь, если он еще не выполняется и очередь не переполнена.
+
+        Args:
+            key: Ключ прогреваемого набора данных
+            warm: Функция, загружающая данные в кэш
+
+        Returns:
+            bool: True, если задача поставлена в очередь
+        """
+        with self._lock:
+            if key in self._inflight:
+                return False
+            if len(self._inflight) >= self.max_pending:
+                self._stats["dropped"] += 1
+                return False
+            self._inflight.add(key)
+            self._stats["submitted"] += 1
+        self._executor.submit(self._run, key, warm)
+        return True
+
+    def _run(self, key: Hashable, warm: Callable[[], Any]) -> None:
+        try:
+            warm()
+            outcome = "completed"
+        except Exception as e:
+            # Ошибка прогрева не должна влиять на пользователя: страница загрузит данные сама
+            logging.warning(f"Не удалось прогреть {key}: {str(e)}")
+            outcome = "failed"
+        with self._lock:
+            self._inflight.discard(key)
+            self._stats[outcome] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Сводка по прогреву для отладки и админки."""
+        with self._lock:
+            return {"inflight": len(self._inflight), **self._stats}
+
+
+@st.cache_resource
+def get_prefetcher() -> Prefetcher:
+    """Возвращает единственный на процесс экземпляр Prefetcher."""
+    return Prefetcher()
@@ -0,0 +1,492 @@
+# rerun_profiler.py
+"""
+Профилирование перезапусков app.py.
+
+Любое действие пользователя перезапускает app.py целиком: CSS, проверка
+авторизации, история навигации, load_app_data, сайдбар и функция страницы.
+Профилировщик включается переменной окружения APP_PROFILE=1 (для всех
+сессий) или параметром URL profile=1 (для своей сессии; только для
+администратора или при APP_PROFILE_URL=1) и записывает:
+- фазы скрипта — mark("имя") закрывает предыдущую фазу и открывает новую,
+  поэтому код верхнего уровня не нужно оборачивать в блоки;
+- вложенные участки — with section("имя"): ... и декоратор profiled();
+- построение фигур plotly.express, вывод st.plotly_chart/st.dataframe и
+  основные операции DataFrame — через обертки, которые устанавливаются при
+  первом профилируемом перезапуске и для остальных сессий стоят одной
+  проверки thread-local; участок записывается, только если профиль потока
+  начат в той же сессии.
+
+Профиль (RerunProfile) живет в thread-local потока скрипта; в
+st.session_state хранятся только словари: снимок текущего профиля на
+последней фазе (по нему прерванный перезапуск сохраняется при старте
+следующего) и завершенные профили для водопада в админке. Профиль также
+дописывается строкой в JSONL-файл трасс за день в PROFILE_TRACE_DIR (файл
+больше PROFILE_TRACE_MAX_BYTES переименовывается), чтобы сравнивать
+перезапуски между версиями кода.
+Участки в фоновых потоках (пулы загрузчиков) не учитываются: время их
+ожидания попадает в участок, который их ждал.
+"""
+
+import os
+import json
+import time
+import uuid
+import sys
+import inspect
+import logging
+import functools
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# Профилирование всех перезапусков переменной окружения
+PROFILE_ENABLED = os.getenv("APP_PROFILE", "0") == "1"
+
+# Параметр URL, включающий профилирование для сессии
+PROFILE_PARAM = "profile"
+
+# Параметр URL действует для всех пользователей (по умолчанию — только для администратора)
+PROFILE_URL_ENABLED = os.getenv("APP_PROFILE_URL", "0") == "1"
+
+# Каталог JSONL-трасс (по файлу на день)
+PROFILE_TRACE_DIR = os.getenv("APP_PROFILE_DIR", os.path.join(".cache", "profiles"))
+
+# Размер трассы за день, после которого она переименовывается в rerun-<день>.1.jsonl
+PROFILE_TRACE_MAX_BYTES = int(os.getenv("APP_PROFILE_MAX_BYTES", str(50 * 1024 * 1024)))
+
+# Сколько последних профилей хранить в сессии
+PROFILE_HISTORY = int(os.getenv("APP_PROFILE_HISTORY", "20"))
+
+# Максимальное количество участков в одном профиле (остальные только считаются)
+PROFILE_MAX_SPANS = int(os.getenv("APP_PROFILE_MAX_SPANS", "5000"))
+
+# Ключи session_state
+SESSION_PROFILES_KEY = "rerun_profiles"
+SESSION_ACTIVE_KEY = "rerun_profile_active"
+SESSION_ENABLED_KEY = "rerun_profile_enabled"
+
+# Автоматически профилируемые функции: (модуль, имена, вид участка)
+PLOTLY_FUNCTIONS = [
+    "bar", "line", "scatter", "histogram", "pie", "box", "violin", "area",
+    "scatter_polar", "line_polar", "bar_polar", "density_heatmap", "imshow",
+    "treemap", "sunburst", "funnel",
+]
+STREAMLIT_FUNCTIONS = ["plotly_chart", "dataframe", "data_editor", "table"]
+DATAFRAME_METHODS = [
+    "merge", "join", "sort_values", "pivot_table", "apply", "query",
+    "drop_duplicates", "describe", "to_csv",
+]
+GROUPBY_METHODS = ["agg", "aggregate", "apply", "mean", "sum", "size", "count", "median"]
+
+# Подразделы страниц: функции пакета components, вызываемые из pages и components
+SECTION_PACKAGE = "components"
+SECTION_CALLERS = ("pages", "components")
+
+
+class Span:
+    """
+    Участок перезапуска.
+
+    Attributes:
+        name: Имя участка
+        kind: Вид: phase, section, plotly, render, dataframe
+        start_ms: Начало относительно старта перезапуска
+        duration_ms: Длительность (None, пока участок не закрыт)
+        depth: Вложенность (фазы — 0)
+        parent: Индекс родительского участка или None
+    """
+
+    __slots__ = ("name", "kind", "start_ms", "duration_ms", "depth", "parent")
+
+    def __init__(self, name: str, kind: str, start_ms: float, depth: int, parent: Optional[int]):
+        self.name = name
+        self.kind = kind
+        self.start_ms = start_ms
+        self.duration_ms: Optional[float] = None
+        self.depth = depth
+        self.parent = parent
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class RerunProfile:
+    """Участки одного перезапуска app.py."""
+
+    def __init__(self, page: Optional[str] = None, params: Optional[Dict[str, Any]] = None,
+                 session_id: Optional[str] = None):
+        self.run_id = uuid.uuid4().hex[:12]
+        self.session_id = session_id
+        self.started_at = time.time()
+        self.page = page
+        self.params = dict(params or {})
+        self.spans: List[Span] = []
+        self.status = "running"
+        self.total_ms: Optional[float] = None
+        self._origin = time.perf_counter()
+        self._stack: List[int] = []
+        self._phase: Optional[int] = None
+        self.dropped = 0
+
+    def now_ms(self) -> float:
+        return (time.perf_counter() - self._origin) * 1000
+
+    def open(self, name: str, kind: str) -> int:
+        if len(self.spans) >= PROFILE_MAX_SPANS:
+            self.dropped += 1
+            return -1
+        parent = self._stack[-1] if self._stack else self._phase
+        depth = 0 if parent is None else self.spans[parent].depth + 1
+        self.spans.append(Span(name, kind, self.now_ms(), depth, parent))
+        index = len(self.spans) - 1
+        self._stack.append(index)
+        return index
+
+    def close(self, index: int) -> None:
+        if index < 0:
+            return
+        span = self.spans[index]
+        span.duration_ms = self.now_ms() - span.start_ms
+        if self._stack and self._stack[-1] == index:
+            self._stack.pop()
+
+    def inside(self, kind: str) -> bool:
+        """Открыт ли участок этого вида (вложенные вызовы pandas не записываются повторно)."""
+        return any(self.spans[index].kind == kind for index in self._stack)
+
+    def mark(self, name: str) -> None:
+        """Закрывает текущую фазу и открывает новую."""
+        self._close_phase()
+        self.spans.append(Span(name, "phase", self.now_ms(), 0, None))
+        self._phase = len(self.spans) - 1
+
+    def _close_phase(self, end_ms: Optional[float] = None) -> None:
+        if self._phase is not None:
+            span = self.spans[self._phase]
+            span.duration_ms = (self.now_ms() if end_ms is None else end_ms) - span.start_ms
+            self._phase = None
+
+    def finish(self) -> None:
+        """Закрывает незакрытые участки и фиксирует длительность перезапуска."""
+        end_ms = self.now_ms()
+        for index in reversed(self._stack):
+            if self.spans[index].duration_ms is None:
+                self.spans[index].duration_ms = end_ms - self.spans[index].start_ms
+        self._stack = []
+        self._close_phase(end_ms)
+        self.total_ms = end_ms
+        self.status = "completed"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "run_id": self.run_id,
+            "started_at": self.started_at,
+            "page": self.page,
+            "params": self.params,
+            "status": self.status,
+            "total_ms": self.total_ms,
+            "dropped_spans": self.dropped,
+            "spans": [span.to_dict() for span in self.spans],
+        }
+
+
+# Активный профиль потока скрипта сессии
+_local = threading.local()
+
+
+def _session_id() -> Optional[str]:
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return ctx.session_id if ctx is not None else None
+
+
+def active() -> Optional[RerunProfile]:
+    """Профиль текущего перезапуска или None, если профилирование выключено."""
+    profile = getattr(_local, "profile", None)
+    # Профиль действует только в своей сессии, даже если поток выполняет скрипт другой
+    if profile is None or profile.session_id != _session_id():
+        return None
+    return profile
+
+
+def _interrupted(record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Снимок прерванного перезапуска (st.stop, st.rerun) как завершенный профиль.
+
+    Концом перезапуска считается конец последнего записанного участка.
+    """
+    spans = [dict(span) for span in record.get("spans", [])]
+    end_ms = max([span["start_ms"] + (span["duration_ms"] or 0.0) for span in spans] or [0.0])
+    for span in spans:
+        if span["duration_ms"] is None:
+            span["duration_ms"] = end_ms - span["start_ms"]
+    return {**record, "spans": spans, "status": "interrupted", "total_ms": end_ms}
+
+
+def is_requested(params) -> bool:
+    """
+    Включено ли профилирование для этого перезапуска.
+
+    Параметр URL запоминается в сессии: навигация заменяет параметры URL, а
+    профилирование должно продолжаться до profile=0. Параметр учитывается
+    только для администратора (или для всех при APP_PROFILE_URL=1).
+    """
+    if PROFILE_ENABLED:
+        return True
+    if not (PROFILE_URL_ENABLED or st.session_state.get("role") == "admin"):
+        return False
+    value = params.get(PROFILE_PARAM)
+    if value is not None:
+        st.session_state[SESSION_ENABLED_KEY] = str(value) in ("1", "true")
+    return st.session_state.get(SESSION_ENABLED_KEY, False)
+
+
+def start(params, page: Optional[str] = None) -> Optional[RerunProfile]:
+    """
+    Начинает профиль перезапуска, если профилирование включено.
+
+    Прерванный предыдущий перезапуск сессии сохраняется со статусом
+    interrupted.
+
+    Args:
+        params: Параметры URL (st.query_params)
+        page: Страница (если уже известна)
+
+    Returns:
+        RerunProfile или None
+    """
+    previous = st.session_state.pop(SESSION_ACTIVE_KEY, None)
+    if previous is not None:
+        _store(_interrupted(previous))
+
+    if not is_requested(params):
+        _local.profile = None
+        return None
+
+    install_hooks()
+    profile = RerunProfile(page, {key: params.get(key) for key in params}, _session_id())
+    _local.profile = profile
+    st.session_state[SESSION_ACTIVE_KEY] = profile.to_dict()
+    return profile
+
+
+def mark(name: str) -> None:
+    """Начинает фазу перезапуска (закрывая предыдущую) и сохраняет снимок профиля в сессии."""
+    profile = active()
+    if profile is not None:
+        profile.mark(name)
+        st.session_state[SESSION_ACTIVE_KEY] = profile.to_dict()
+
+
+def set_page(page: str) -> None:
+    """Запоминает страницу перезапуска (становится известна после разбора URL)."""
+    profile = active()
+    if profile is not None:
+        profile.page = page
+
+
+@contextmanager
+def section(name: str, kind: str = "section"):
+    """Участок внутри текущей фазы."""
+    profile = active()
+    if profile is None:
+        yield
+        return
+    index = profile.open(name, kind)
+    try:
+        yield
+    finally:
+        profile.close(index)
+
+
+def profiled(name: Optional[str] = None, kind: str = "section"):
+    """Декоратор: вызов функции записывается участком (по умолчанию с именем функции)."""
+    def decorator(func):
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profile = active()
+            if profile is None or (kind == "dataframe" and profile.inside(kind)):
+                return func(*args, **kwargs)
+            index = profile.open(label, kind)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profile.close(index)
+        wrapper.__profiled__ = True
+        return wrapper
+    return decorator
+
+
+def finish() -> Optional[RerunProfile]:
+    """Завершает профиль перезапуска, сохраняет его в сессии и в JSONL-трассу."""
+    profile = active()
+    if profile is None:
+        return None
+    _local.profile = None
+    st.session_state.pop(SESSION_ACTIVE_KEY, None)
+    profile.finish()
+    _store(profile.to_dict())
+    return profile
+
+
+def _store(record: Dict[str, Any]) -> None:
+    history = st.session_state.setdefault(SESSION_PROFILES_KEY, [])
+    history.append(record)
+    del history[:-PROFILE_HISTORY]
+    try:
+        write_trace(record)
+    except OSError as e:
+        logging.warning(f"Не удалось записать трассу перезапуска: {str(e)}")
+
+
+# ------------------ Обертки библиотек ------------------ #
+
+_hooks_lock = threading.Lock()
+_hooks_installed = False
+
+
+def _wrap(owner, attr: str, label: str, kind: str) -> None:
+    func = getattr(owner, attr, None)
+    if func is None or getattr(func, "__profiled__", False):
+        return
+    setattr(owner, attr, profiled(label, kind)(func))
+
+
+def _wrap_sections() -> None:
+    """
+    Оборачивает функции components.* (графики, метрики, таблицы страниц).
+
+    Страницы импортируют их по имени, поэтому обертка ставится и в модуле
+    функции, и во всех модулях pages/components, где она импортирована.
+    """
+    for module_name, module in list(sys.modules.items()):
+        if module is None or module_name.split(".")[0] not in SECTION_CALLERS:
+            continue
+        for attr, func in list(vars(module).items()):
+            func_module = getattr(func, "__module__", None) or ""
+            if (inspect.isfunction(func) and func_module.split(".")[0] == SECTION_PACKAGE
+                    and not attr.startswith("_")):
+                _wrap(module, attr, f"{func_module.split('.')[-1]}.{attr}", "section")
+
+
+def install_hooks() -> None:
+    """
+    Оборачивает построение фигур plotly.express, вывод таблиц и графиков
+    Streamlit, операции DataFrame и функции components.*. Выполняется один
+    раз на процесс.
+    """
+    global _hooks_installed
+    with _hooks_lock:
+        if _hooks_installed:
+            return
+        import plotly.express as px
+        from pandas.core.groupby import DataFrameGroupBy, SeriesGroupBy
+        from streamlit.delta_generator import DeltaGenerator
+
+        for name in PLOTLY_FUNCTIONS:
+            _wrap(px, name, f"px.{name}", "plotly")
+        for name in STREAMLIT_FUNCTIONS:
+            # st.<функция> привязана к главному контейнеру при импорте, контейнеры — методы класса
+            _wrap(st, name, f"st.{name}", "render")
+            _wrap(DeltaGenerator, name, f"st.{name}", "render")
+        for name in DATAFRAME_METHODS:
+            _wrap(pd.DataFrame, name, f"DataFrame.{name}", "dataframe")
+        for name in GROUPBY_METHODS:
+            _wrap(DataFrameGroupBy, name, f"groupby.{name}", "dataframe")
+            _wrap(SeriesGroupBy, name, f"groupby.{name}", "dataframe")
+        _wrap_sections()
+        _hooks_installed = True
+
+
+# ------------------ Трассы ------------------ #
+
+def trace_path(day: Optional[str] = None, directory: str = PROFILE_TRACE_DIR) -> str:
+    """Путь к JSONL-трассе за день (YYYYMMDD, по умолчанию сегодня)."""
+    return os.path.join(directory, f"rerun-{day or time.strftime('%Y%m%d')}.jsonl")
+
+
+def write_trace(record: Dict[str, Any], directory: str = PROFILE_TRACE_DIR,
+                max_bytes: int = PROFILE_TRACE_MAX_BYTES) -> None:
+    """
+    Дописывает профиль строкой в трассу за день.
+
+    Трасса больше max_bytes переименовывается в rerun-<день>.1.jsonl (прежний
+    такой файл заменяется), поэтому за день хранится не больше двух файлов.
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = trace_path(directory=directory)
+    try:
+        if max_bytes > 0 and os.path.getsize(path) >= max_bytes:
+            os.replace(path, f"{path[:-len('.jsonl')]}.1.jsonl")
+    except FileNotFoundError:
+        pass
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+
+
+def trace_files(directory: str = PROFILE_TRACE_DIR) -> List[str]:
+    """Файлы трасс, новые первыми."""
+    if not os.path.isdir(directory):
+        return []
+    names = [name for name in os.listdir(directory) if name.startswith("rerun-") and name.endswith(".jsonl")]
+    return [os.path.join(directory, name) for name in sorted(names, reverse=True)]
+
+
+def read_traces(path: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Профили из JSONL-трассы (последние limit); поврежденные строки пропускаются."""
+    records = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+    return records[-limit:] if limit else records
+
+
+def waterfall_frame(record: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Участки профиля для водопада: по строке на участок в порядке начала.
+
+    Returns:
+        DataFrame: label (с отступом по вложенности), name, kind, start_ms, duration_ms, depth
+    """
+    frame = pd.DataFrame(record.get("spans", []), columns=list(Span.__slots__))
+    if frame.empty:
+        return frame.assign(label=[])
+    frame["duration_ms"] = frame["duration_ms"].fillna(0.0)
+    frame["label"] = ["  " * depth + name for name, depth in zip(frame["name"], frame["depth"])]
+    return frame
+
+
+def phase_summary(records: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Сводка по фазам и участкам для сравнения перезапусков.
+
+    Args:
+        records: Профили (например, read_traces)
+
+    Returns:
+        DataFrame: page, kind, name, runs, median_ms, p90_ms, max_ms (по убыванию медианы)
+    """
+    rows = [
+        (record.get("page"), span["kind"], span["name"], span["duration_ms"] or 0.0)
+        for record in records
+        for span in record.get("spans", [])
+    ]
+    frame = pd.DataFrame(rows, columns=["page", "kind", "name", "duration_ms"])
+    if frame.empty:
+        return pd.DataFrame(columns=["page", "kind", "name", "runs", "median_ms", "p90_ms", "max_ms"])
+    grouped = frame.groupby(["page", "kind", "name"], dropna=False)["duration_ms"]
+    summary = pd.DataFrame({
+        "runs": grouped.size(),
+        "median_ms": grouped.median(),
+        "p90_ms": grouped.quantile(0.9),
+        "max_ms": grouped.max(),
+    }).reset_index()
+    return summary.sort_values("median_ms", ascending=False, ignore_index=True)
@@ -0,0 +1,635 @@
+# risk_kernel.py
+"""
+Скомпилированное ядро расчета риска.
+
+RiskKernel строится один раз из снимка конфигурации: все пороги и веса
+сохраняются как готовые float-константы, поэтому при расчете не нужно
+обращаться к get_config() и проверять время изменения файла. Компоненты
+риска считаются по непрерывным float64-массивам: каждая ветка кусочной
+функции вычисляется только для своих строк (маски), а не для всего массива,
+как в np.select. Ядро пересобирается только при смене версии конфигурации.
+
+Для очень больших наборов (исторические снапшоты, what-if сценарии на
+миллионах строк) есть построчный однопроходный вариант всего расчета,
+который компилируется Numba и выполняется параллельно на всех ядрах. Numba —
+необязательная зависимость (pip install numba, в requirements.txt не входит);
+если она не установлена, используется NumPy-вариант. Эквивалентность всех
+вариантов исходным функциям core.calculate_*_risk проверяет
+check_equivalence() (python risk_kernel.py).
+"""
+
+import os
+import sys
+import math
+import threading
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from core_config import get_config, get_config_version
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba не установлена — используем NumPy-вариант
+    njit = None
+    prange = range
+
+# Использование Numba: "auto" — для наборов от RISK_NUMBA_MIN_ROWS строк, "1" — всегда, "0" — никогда
+RISK_NUMBA = os.getenv("RISK_NUMBA", "auto")
+RISK_NUMBA_MIN_ROWS = int(os.getenv("RISK_NUMBA_MIN_ROWS", "50000"))
+
+# Компоненты риска в порядке, в котором они участвуют во взвешивании
+RISK_COMPONENTS = [
+    "risk_discrimination",
+    "risk_success",
+    "risk_trickiness",
+    "risk_complaints",
+    "risk_attempted",
+]
+
+# Все колонки, которые умеет рассчитывать ядро
+KERNEL_COLUMNS = ["trickiness_level"] + RISK_COMPONENTS + ["risk"]
+
+# Входные колонки ядра
+INPUT_COLUMNS = [
+    "success_rate",
+    "first_try_success_rate",
+    "discrimination_avg",
+    "complaints_total",
+    "attempted_share",
+    "total_attempts",
+]
+
+# Значения риска для уровней "подлости" 0-3
+TRICKINESS_RISK = np.array([0.0, 0.3, 0.6, 0.9])
+
+
+def _as_float(df: pd.DataFrame, column: str) -> np.ndarray:
+    """Колонка DataFrame как непрерывный float64-массив."""
+    return np.ascontiguousarray(pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=np.float64))
+
+
+class RiskKernel:
+    """
+    Ядро расчета риска с константами, зафиксированными из конфигурации.
+
+    Attributes:
+        version: Версия конфигурации, из которой построено ядро
+        params: Все константы ядра в виде float64-массива (порядок PARAM_NAMES)
+    """
+
+    PARAM_NAMES = [
+        "discr_good", "discr_medium",
+        "success_boring", "success_optimal_high", "success_optimal_low", "success_suboptimal_low",
+        "complaints_critical", "complaints_high", "complaints_medium",
+        "attempts_high", "attempts_normal_low", "attempts_insufficient_low",
+        "tricky_min_success", "tricky_max_first_try", "tricky_min_difference",
+        "tricky_high_success", "tricky_medium_success", "tricky_low_first_try", "tricky_medium_first_try",
+        "w_discrimination", "w_success", "w_trickiness", "w_complaints", "w_attempted",
+        "risk_critical", "risk_high", "min_for_critical", "min_for_high", "alpha",
+        "use_min_threshold", "significance_threshold", "neutral_risk",
+    ]
+
+    def __init__(self, config: Dict, version: Optional[str] = None):
+        tricky = config.get("tricky_cards", {})
+        basic = tricky.get("basic", {})
+        zones = tricky.get("zones", {})
+        thresholds = config["risk_thresholds"]
+
+        values = {
+            "discr_good": config["discrimination"]["good"],
+            "discr_medium": config["discrimination"]["medium"],
+            "success_boring": config["success_rate"]["boring"],
+            "success_optimal_high": config["success_rate"]["optimal_high"],
+            "success_optimal_low": config["success_rate"]["optimal_low"],
+            "success_suboptimal_low": config["success_rate"]["suboptimal_low"],
+            "complaints_critical": config["complaints"]["critical"],
+            "complaints_high": config["complaints"]["high"],
+            "complaints_medium": config["complaints"]["medium"],
+            "attempts_high": config["attempts"]["high"],
+            "attempts_normal_low": config["attempts"]["normal_low"],
+            "attempts_insufficient_low": config["attempts"]["insufficient_low"],
+            "tricky_min_success": basic.get("min_success_rate", 0.70),
+            "tricky_max_first_try": basic.get("max_first_try_rate", 0.60),
+            "tricky_min_difference": basic.get("min_difference", 0.20),
+            "tricky_high_success": zones.get("high_success_threshold", 0.90),
+            "tricky_medium_success": zones.get("medium_success_threshold", 0.80),
+            "tricky_low_first_try": zones.get("low_first_try_threshold", 0.40),
+            "tricky_medium_first_try": zones.get("medium_first_try_threshold", 0.50),
+            "w_discrimination": config["weights"]["discrimination"],
+            "w_success": config["weights"]["success_rate"],
+            "w_trickiness": config["weights"].get("trickiness", 0.15),
+            "w_complaints": config["weights"]["complaint_rate"],
+            "w_attempted": config["weights"]["attempted"],
+            "risk_critical": thresholds["critical"],
+            "risk_high": thresholds["high"],
+            "min_for_critical": thresholds["min_for_critical"],
+            "min_for_high": thresholds["min_for_high"],
+            "alpha": thresholds["alpha_weight_avg"],
+            "use_min_threshold": 1.0 if thresholds.get("use_min_threshold", True) else 0.0,
+            "significance_threshold": config["stats"]["significance_threshold"],
+            "neutral_risk": config["stats"]["neutral_risk_value"],
+        }
+        for name in self.PARAM_NAMES:
+            setattr(self, name, float(values[name]))
+        self.params = np.array([values[name] for name in self.PARAM_NAMES], dtype=np.float64)
+        self.version = version
+
+    # ------------------ Компоненты риска ------------------ #
+
+    def discrimination(self, x: np.ndarray) -> np.ndarray:
+        """Риск дискриминативности (0-1)."""
+        good, medium = self.discr_good, self.discr_medium
+        # Низкая дискриминативность (значение по умолчанию, в т.ч. для NaN)
+        out = 1.0 - np.maximum(0.0, x / medium) * 0.49
+        mask = x >= medium
+        out[mask] = 0.50 - (x[mask] - medium) / (good - medium) * 0.24
+        mask = x >= good
+        out[mask] = np.maximum(0.0, 0.25 * (1.0 - np.minimum(1.0, (x[mask] - good) / 0.4)))
+        return out
+
+    def success(self, x: np.ndarray) -> np.ndarray:
+        """Риск доли верных ответов (0-1)."""
+        boring, optimal_high = self.success_boring, self.success_optimal_high
+        optimal_low, suboptimal_low = self.success_optimal_low, self.success_suboptimal_low
+        # Фрустрирующая задача (значение по умолчанию)
+        out = 1.0 - np.maximum(0.0, x / suboptimal_low) * 0.49
+        mask = x >= suboptimal_low
+        out[mask] = 0.50 - (x[mask] - suboptimal_low) / (optimal_low - suboptimal_low) * 0.24
+        mask = x >= optimal_low
+        out[mask] = 0.25 * (1.0 - (x[mask] - optimal_low) / (optimal_high - optimal_low))
+        mask = x > boring
+        out[mask] = 0.30 + np.minimum(1.0, (x[mask] - boring) / 0.05) * 0.10
+        return out
+
+    def complaints(self, x: np.ndarray) -> np.ndarray:
+        """Риск по количеству жалоб (0-1). Пропуски считаются нулем жалоб."""
+        critical, high, medium = self.complaints_critical, self.complaints_high, self.complaints_medium
+        x = np.where(np.isnan(x), 0.0, x)
+        out = x / max(1.0, medium) * 0.25
+        mask = x >= medium
+        out[mask] = 0.26 + (x[mask] - medium) / (high - medium) * 0.24
+        mask = x >= high
+        out[mask] = 0.51 + (x[mask] - high) / (critical - high) * 0.24
+        mask = x > critical
+        out[mask] = 0.76 + np.minimum(100.0, x[mask] - critical) / 100.0 * 0.24
+        return out
+
+    def attempted(self, x: np.ndarray) -> np.ndarray:
+        """Риск доли пытавшихся решить (0-1)."""
+        high, normal_low, insufficient_low = self.attempts_high, self.attempts_normal_low, self.attempts_insufficient_low
+        out = 1.0 - np.maximum(0.0, x / insufficient_low) * 0.49
+        mask = x >= insufficient_low
+        out[mask] = 0.50 - (x[mask] - insufficient_low) / (normal_low - insufficient_low) * 0.24
+        mask = x >= normal_low
+        out[mask] = 0.25 - (x[mask] - normal_low) / (high - normal_low) * 0.15
+        mask = x > high
+        out[mask] = 0.10 * (1.0 - np.minimum(1.0, (x[mask] - high) / 0.05))
+        return out
+
+    def trickiness_level(self, success_rate: np.ndarray, first_try: np.ndarray) -> np.ndarray:
+        """Уровень "подлости" карточки (0 - нет, 1 - низкий, 2 - средний, 3 - высокий)."""
+        is_tricky = (
+            (success_rate >= self.tricky_min_success)
+            & (first_try <= self.tricky_max_first_try)
+            & (success_rate - first_try >= self.tricky_min_difference)
+        )
+        level = is_tricky.astype(np.int64)
+        level[is_tricky & (success_rate >= self.tricky_medium_success) & (first_try <= self.tricky_medium_first_try)] = 2
+        level[is_tricky & (success_rate >= self.tricky_high_success) & (first_try <= self.tricky_low_first_try)] = 3
+        return level
+
+    def combine(self, components, total_attempts: np.ndarray) -> np.ndarray:
+        """
+        Сводит компоненты риска в итоговый риск.
+
+        Args:
+            components: Массивы риска в порядке RISK_COMPONENTS
+            total_attempts: Массив количества попыток
+
+        Returns:
+            ndarray: Итоговый риск от 0 до 1
+        """
+        risk_discr, risk_success, risk_trickiness, risk_complaints, risk_attempted = components
+
+        max_risk = np.maximum(risk_discr, risk_success)
+        np.maximum(max_risk, risk_trickiness, out=max_risk)
+        np.maximum(max_risk, risk_complaints, out=max_risk)
+        np.maximum(max_risk, risk_attempted, out=max_risk)
+
+        weighted = self.w_discrimination * risk_discr
+        weighted += self.w_success * risk_success
+        weighted += self.w_trickiness * risk_trickiness
+        weighted += self.w_complaints * risk_complaints
+        weighted += self.w_attempted * risk_attempted
+
+        # Комбинированная формула: max(взвешенное, alpha * взвешенное + (1 - alpha) * максимум)
+        raw = self.alpha * weighted + (1.0 - self.alpha) * max_risk
+        np.maximum(raw, weighted, out=raw)
+        if self.use_min_threshold:
+            min_threshold = np.where(
+                max_risk > self.risk_critical,
+                self.min_for_critical,
+                np.where(max_risk > self.risk_high, self.min_for_high, 0.0),
+            )
+            np.maximum(raw, min_threshold, out=raw)
+
+        # Корректировка на статистическую значимость
+        confidence = np.minimum(total_attempts / self.significance_threshold, 1.0)
+        return raw * confidence + self.neutral_risk * (1.0 - confidence)
+
+    # ------------------ Расчет по DataFrame ------------------ #
+
+    @staticmethod
+    def use_compiled(n_rows: int) -> bool:
+        """Нужно ли использовать Numba-вариант для набора из n_rows строк."""
+        if not numba_available() or RISK_NUMBA == "0":
+            return False
+        return RISK_NUMBA == "1" or n_rows >= RISK_NUMBA_MIN_ROWS
+
+    def evaluate(self, df: pd.DataFrame, columns: Optional[Iterable[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        Рассчитывает запрошенные колонки риска за один проход.
+
+        Args:
+            df: DataFrame с данными карточек
+            columns: Нужные колонки из KERNEL_COLUMNS (по умолчанию все)
+
+        Returns:
+            dict: {колонка: массив}
+        """
+        columns = KERNEL_COLUMNS if columns is None else list(columns)
+        unknown = set(columns) - set(KERNEL_COLUMNS)
+        if unknown:
+            raise ValueError(f"Неизвестные колонки риска: {sorted(unknown)}")
+
+        need = set(columns)
+        if "risk" in need and self.use_compiled(len(df)):
+            # Полный расчет одним параллельным проходом
+            arrays = {name: _as_float(df, name) for name in INPUT_COLUMNS}
+            result = risk_rows(self.params, arrays)
+            return {name: result[name] for name in columns}
+        if "risk" in need:
+            need.update(RISK_COMPONENTS)
+
+        result = {}
+        if need & {"trickiness_level", "risk_trickiness"}:
+            result["trickiness_level"] = self.trickiness_level(
+                _as_float(df, "success_rate"), _as_float(df, "first_try_success_rate")
+            )
+        if "risk_trickiness" in need:
+            result["risk_trickiness"] = TRICKINESS_RISK[result["trickiness_level"]]
+        if "risk_discrimination" in need:
+            result["risk_discrimination"] = self.discrimination(_as_float(df, "discrimination_avg"))
+        if "risk_success" in need:
+            result["risk_success"] = self.success(_as_float(df, "success_rate"))
+        if "risk_complaints" in need:
+            result["risk_complaints"] = self.complaints(_as_float(df, "complaints_total"))
+        if "risk_attempted" in need:
+            result["risk_attempted"] = self.attempted(_as_float(df, "attempted_share"))
+        if "risk" in need:
+            result["risk"] = self.combine(
+                [result[name] for name in RISK_COMPONENTS], _as_float(df, "total_attempts")
+            )
+        return {name: result[name] for name in columns}
+
+
+# ------------------ Однопроходный построчный расчет ------------------ #
+#
+# Функция написана на подмножестве Python, которое компилирует Numba.
+# Сравнения вместо min/max нужны, чтобы NaN распространялся так же, как в
+# np.maximum/np.minimum NumPy-варианта.
+
+def _risk_rows(params, success_rate, first_try, discrimination, complaints, attempted, total_attempts,
+               out_level, out_discr, out_success, out_trickiness, out_complaints, out_attempted, out_risk):
+    (discr_good, discr_medium,
+     success_boring, success_optimal_high, success_optimal_low, success_suboptimal_low,
+     complaints_critical, complaints_high, complaints_medium,
+     attempts_high, attempts_normal_low, attempts_insufficient_low,
+     tricky_min_success, tricky_max_first_try, tricky_min_difference,
+     tricky_high_success, tricky_medium_success, tricky_low_first_try, tricky_medium_first_try,
+     w_discrimination, w_success, w_trickiness, w_complaints, w_attempted,
+     risk_critical, risk_high, min_for_critical, min_for_high, alpha,
+     use_min_threshold, significance_threshold, neutral_risk) = (
+        params[0], params[1], params[2], params[3], params[4], params[5], params[6], params[7],
+        params[8], params[9], params[10], params[11], params[12], params[13], params[14], params[15],
+        params[16], params[17], params[18], params[19], params[20], params[21], params[22], params[23],
+        params[24], params[25], params[26], params[27], params[28], params[29], params[30], params[31])
+
+    medium_denominator = complaints_medium if complaints_medium > 1.0 else 1.0
+
+    for i in prange(success_rate.shape[0]):
+        # Дискриминативность
+        x = discrimination[i]
+        if x >= discr_good:
+            v = (x - discr_good) / 0.4
+            if v > 1.0:
+                v = 1.0
+            r_discr = 0.25 * (1.0 - v)
+            if r_discr < 0.0:
+                r_discr = 0.0
+        elif x >= discr_medium:
+            r_discr = 0.50 - (x - discr_medium) / (discr_good - discr_medium) * 0.24
+        else:
+            v = x / discr_medium
+            if v < 0.0:
+                v = 0.0
+            r_discr = 1.0 - v * 0.49
+
+        # Доля верных ответов
+        x = success_rate[i]
+        if x > success_boring:
+            v = (x - success_boring) / 0.05
+            if v > 1.0:
+                v = 1.0
+            r_success = 0.30 + v * 0.10
+        elif x >= success_optimal_low:
+            r_success = 0.25 * (1.0 - (x - success_optimal_low) / (success_optimal_high - success_optimal_low))
+        elif x >= success_suboptimal_low:
+            r_success = 0.50 - (x - success_suboptimal_low) / (success_optimal_low - success_suboptimal_low) * 0.24
+        else:
+            v = x / success_suboptimal_low
+            if v < 0.0:
+                v = 0.0
+            r_success = 1.0 - v * 0.49
+
+        # Уровень "подлости"
+        s = success_rate[i]
+        f = first_try[i]
+        level = 0
+        r_trickiness = 0.0
+        if s >= tricky_min_success and f <= tricky_max_first_try and s - f >= tricky_min_difference:
+            if s >= tricky_high_success and f <= tricky_low_first_try:
+                level = 3
+                r_trickiness = 0.9
+            elif s >= tricky_medium_success and f <= tricky_medium_first_try:
+                level = 2
+                r_trickiness = 0.6
+            else:
+                level = 1
+                r_trickiness = 0.3
+
+        # Жалобы (пропуск считается нулем жалоб)
+        x = complaints[i]
+        if math.isnan(x):
+            x = 0.0
+        if x > complaints_critical:
+            v = x - complaints_critical
+            if v > 100.0:
+                v = 100.0
+            r_complaints = 0.76 + v / 100.0 * 0.24
+        elif x >= complaints_high:
+            r_complaints = 0.51 + (x - complaints_high) / (complaints_critical - complaints_high) * 0.24
+        elif x >= complaints_medium:
+            r_complaints = 0.26 + (x - complaints_medium) / (complaints_high - complaints_medium) * 0.24
+        else:
+            r_complaints = x / medium_denominator * 0.25
+
+        # Доля пытавшихся решить
+        x = attempted[i]
+        if x > attempts_high:
+            v = (x - attempts_high) / 0.05
+            if v > 1.0:
+                v = 1.0
+            r_attempted = 0.10 * (1.0 - v)
+        elif x >= attempts_normal_low:
+            r_attempted = 0.25 - (x - attempts_normal_low) / (attempts_high - attempts_normal_low) * 0.15
+        elif x >= attempts_insufficient_low:
+            r_attempted = 0.50 - (x - attempts_insufficient_low) / (attempts_normal_low - attempts_insufficient_low) * 0.24
+        else:
+            v = x / attempts_insufficient_low
+            if v < 0.0:
+                v = 0.0
+            r_attempted = 1.0 - v * 0.49
+
+        # Итоговый риск
+        weighted = (w_discrimination * r_discr + w_success * r_success + w_trickiness * r_trickiness
+                    + w_complaints * r_complaints + w_attempted * r_attempted)
+        max_risk = r_discr
+        if r_success > max_risk:
+            max_risk = r_success
+        if r_trickiness > max_risk:
+            max_risk = r_trickiness
+        if r_complaints > max_risk:
+            max_risk = r_complaints
+        if r_attempted > max_risk:
+            max_risk = r_attempted
+        if math.isnan(weighted):
+            max_risk = weighted
+
+        raw = alpha * weighted + (1.0 - alpha) * max_risk
+        if weighted > raw:
+            raw = weighted
+        if use_min_threshold != 0.0:
+            if max_risk > risk_critical:
+                threshold = min_for_critical
+            elif max_risk > risk_high:
+                threshold = min_for_high
+            else:
+                threshold = 0.0
+            if threshold > raw:
+                raw = threshold
+
+        confidence = total_attempts[i] / significance_threshold
+        if confidence > 1.0:
+            confidence = 1.0
+
+        out_level[i] = level
+        out_discr[i] = r_discr
+        out_success[i] = r_success
+        out_trickiness[i] = r_trickiness
+        out_complaints[i] = r_complaints
+        out_attempted[i] = r_attempted
+        out_risk[i] = raw * confidence + neutral_risk * (1.0 - confidence)
+
+
+# error_model="numpy": деление на ноль дает inf/nan, как в NumPy, а не исключение
+_risk_rows_jit = njit(parallel=True, cache=True, error_model="numpy")(_risk_rows) if njit is not None else None
+
+
+def numba_available() -> bool:
+    """Возвращает True, если доступен скомпилированный Numba-вариант."""
+    return _risk_rows_jit is not None
+
+
+def risk_rows(params: np.ndarray, arrays: Dict[str, np.ndarray], compiled: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Однопроходный построчный расчет всех колонок риска.
+
+    Args:
+        params: Константы ядра (RiskKernel.params)
+        arrays: Непрерывные float64-массивы INPUT_COLUMNS
+        compiled: Использовать Numba, если она доступна; иначе выполняется
+            исходная Python-функция (медленно, только для проверок)
+
+    Returns:
+        dict: {колонка: массив} для всех KERNEL_COLUMNS
+    """
+    n = len(arrays["success_rate"])
+    out = {"trickiness_level": np.empty(n, dtype=np.int64)}
+    for name in RISK_COMPONENTS + ["risk"]:
+        out[name] = np.empty(n, dtype=np.float64)
+    func = _risk_rows_jit if compiled and _risk_rows_jit is not None else _risk_rows
+    func(
+        params,
+        *(arrays[name] for name in INPUT_COLUMNS),
+        out["trickiness_level"], out["risk_discrimination"], out["risk_success"], out["risk_trickiness"],
+        out["risk_complaints"], out["risk_attempted"], out["risk"],
+    )
+    return out
+
+
+# Ядро для текущей конфигурации (пересобирается при смене версии)
+_kernel_lock = threading.Lock()
+_kernel: Optional[RiskKernel] = None
+
+
+def get_kernel() -> RiskKernel:
+    """
+    Возвращает ядро для текущей версии конфигурации.
+
+    Returns:
+        RiskKernel
+    """
+    global _kernel
+    version = get_config_version()
+    kernel = _kernel
+    if kernel is not None and kernel.version == version:
+        return kernel
+    with _kernel_lock:
+        if _kernel is None or _kernel.version != version:
+            _kernel = RiskKernel(get_config(), version)
+        return _kernel
+
+
+# ------------------ Проверка эквивалентности ------------------ #
+
+def _equivalence_data(n: int, seed: int) -> pd.DataFrame:
+    """Случайные данные карточек с пропусками и значениями точно на порогах."""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "success_rate": rng.random(n),
+        "first_try_success_rate": rng.random(n),
+        "discrimination_avg": rng.random(n) * 0.7 - 0.05,
+        "complaints_total": rng.integers(0, 200, n).astype(float),
+        "attempted_share": rng.random(n),
+        "total_attempts": rng.integers(0, 400, n).astype(float),
+    })
+    # Трики-карточки: высокий общий успех и низкий успех с первой попытки
+    df.loc[::5, "first_try_success_rate"] = df.loc[::5, "success_rate"] * 0.4
+    # Значения на границах интервалов
+    config = get_config()
+    edges = [config["discrimination"]["good"], config["discrimination"]["medium"]]
+    df.loc[1::97, "discrimination_avg"] = rng.choice(edges, len(df.loc[1::97]))
+    edges = [config["success_rate"][key] for key in ("boring", "optimal_low", "suboptimal_low")]
+    df.loc[2::89, "success_rate"] = rng.choice(edges, len(df.loc[2::89]))
+    edges = [config["complaints"][key] for key in ("critical", "high", "medium")]
+    df.loc[3::83, "complaints_total"] = rng.choice(edges, len(df.loc[3::83]))
+    # Пропуски
+    for offset, column in enumerate(INPUT_COLUMNS):
+        df.loc[offset::101, column] = np.nan
+    return df
+
+
+def _reference_risk(components, total_attempts: np.ndarray, config: Dict) -> np.ndarray:
+    """
+    Итоговый риск по исходной формуле core.calculate_risk_score (до RiskKernel).
+
+    Повторяет формулу отдельно от RiskKernel.combine, чтобы check_equivalence
+    проверял и шаг сведения компонентов, а не сравнивал ядро с самим собой.
+    """
+    weights = config["weights"]
+    thresholds = config["risk_thresholds"]
+    risk_discr, risk_success, risk_trickiness, risk_complaints, risk_attempted = components
+
+    max_risk = np.maximum.reduce([risk_discr, risk_success, risk_trickiness, risk_complaints, risk_attempted])
+    weighted_avg_risk = (
+        weights["discrimination"] * risk_discr +
+        weights["success_rate"] * risk_success +
+        weights.get("trickiness", 0.15) * risk_trickiness +
+        weights["complaint_rate"] * risk_complaints +
+        weights["attempted"] * risk_attempted
+    )
+    if thresholds.get("use_min_threshold", True):
+        min_threshold = np.where(
+            max_risk > thresholds["critical"],
+            thresholds["min_for_critical"],
+            np.where(max_risk > thresholds["high"], thresholds["min_for_high"], 0)
+        )
+    else:
+        min_threshold = np.zeros_like(weighted_avg_risk)
+
+    alpha = thresholds["alpha_weight_avg"]
+    combined_risk = alpha * weighted_avg_risk + (1 - alpha) * max_risk
+    raw_risk = np.maximum(np.maximum(weighted_avg_risk, combined_risk), min_threshold)
+
+    confidence_factor = np.minimum(total_attempts / config["stats"]["significance_threshold"], 1.0)
+    return raw_risk * confidence_factor + config["stats"]["neutral_risk_value"] * (1 - confidence_factor)
+
+
+def check_equivalence(n: int = 100000, seed: int = 0, atol: float = 1e-9) -> Dict[str, float]:
+    """
+    Сравнивает NumPy- и построчный (Numba) варианты ядра с исходными функциями core.
+
+    Построчный вариант без Numba выполняется как обычный Python на части строк.
+
+    Args:
+        n: Количество случайных строк
+        seed: Зерно генератора
+        atol: Допустимое абсолютное расхождение
+
+    Returns:
+        dict: Максимальное расхождение по каждой колонке и варианту
+
+    Raises:
+        AssertionError: Если расхождение больше atol или не совпадают пропуски
+    """
+    import core  # Импорт здесь: core сам импортирует этот модуль
+
+    df = _equivalence_data(n, seed)
+    reference = {
+        "trickiness_level": np.asarray(core.calculate_trickiness_level(df), dtype=np.float64),
+        "risk_discrimination": np.asarray(core.calculate_discrimination_risk(df), dtype=np.float64),
+        "risk_success": np.asarray(core.calculate_success_rate_risk(df), dtype=np.float64),
+        "risk_trickiness": np.asarray(core.calculate_trickiness_risk(df), dtype=np.float64),
+        "risk_complaints": np.asarray(core.calculate_complaint_risk(df), dtype=np.float64),
+        "risk_attempted": np.asarray(core.calculate_attempted_share_risk(df), dtype=np.float64),
+    }
+    reference["risk"] = np.asarray(_reference_risk(
+        [reference[name] for name in RISK_COMPONENTS], df["total_attempts"].to_numpy(dtype=np.float64), get_config()
+    ), dtype=np.float64)
+
+    kernel = RiskKernel(get_config(), get_config_version())
+    arrays = {name: _as_float(df, name) for name in INPUT_COLUMNS}
+    variants = {"numpy": (kernel.evaluate(df), slice(None))}
+    if numba_available():
+        variants["numba"] = (risk_rows(kernel.params, arrays), slice(None))
+    # Исходная Python-версия построчного расчета — на первых строках (она медленная)
+    rows = slice(0, min(n, 20000))
+    variants["rows"] = (risk_rows(kernel.params, {k: v[rows] for k, v in arrays.items()}, compiled=False), rows)
+
+    report = {}
+    for variant, (result, part) in variants.items():
+        for name in KERNEL_COLUMNS:
+            expected = reference[name][part]
+            actual = np.asarray(result[name], dtype=np.float64)
+            assert np.array_equal(np.isnan(expected), np.isnan(actual)), f"{variant}.{name}: не совпадают пропуски"
+            valid = ~np.isnan(expected)
+            diff = float(np.max(np.abs(expected[valid] - actual[valid]), initial=0.0))
+            assert diff <= atol, f"{variant}.{name}: расхождение {diff}"
+            report[f"{variant}.{name}"] = diff
+    return report
+
+
+if __name__ == "__main__":
+    # Запуск проверки: python risk_kernel.py [количество строк]
+    rows_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    print(f"Numba: {'доступна' if numba_available() else 'не установлена'}")
+    try:
+        for key, value in check_equivalence(rows_count).items():
+            print(f"{key}: max |diff| = {value:.3e}")
+    except AssertionError as e:
+        print(f"Ошибка эквивалентности: {e}")
+        sys.exit(1)
+    print("Все варианты эквивалентны исходным функциям")
@@ -0,0 +1,298 @@
+# risk_sql.py
+"""
+Формула риска в виде функции Postgres, сгенерированной из конфигурации.
+
+Чтобы кэш риска и средний риск по уровням считались внутри БД за одно
+обновление (без выгрузки всех карточек в pandas и записи риска обратно),
+optimize_db создает PL/pgSQL-функцию card_risk(...). Ее текст генерируется
+из RiskKernel для текущей конфигурации: пороги и веса подставляются
+константами, ветки повторяют построчный вариант ядра (risk_kernel._risk_rows).
+В комментарии к функции хранится хэш ее текста, поэтому после изменения
+конфигурации функция пересоздается при следующем обновлении.
+
+NULL (и NaN) во входных колонках обрабатываются как NaN в ядре: пропуск
+жалоб считается нулем, пропуск доли верных ответов, дискриминативности,
+доли пытавшихся или количества попыток дает NULL-риск.
+
+Совпадение с core.calculate_risk_score проверяет check_parity()
+(python risk_sql.py).
+"""
+
+import sys
+import hashlib
+from typing import Dict, Optional
+
+import numpy as np
+from sqlalchemy import text
+
+import db_bulk
+from core_config import get_config
+from risk_kernel import INPUT_COLUMNS, RiskKernel, _equivalence_data
+
+# Имя функции риска в БД
+RISK_FUNCTION = "card_risk"
+
+# Аргументы функции в порядке INPUT_COLUMNS
+RISK_FUNCTION_ARGS = [
+    "p_success_rate",
+    "p_first_try",
+    "p_discrimination",
+    "p_complaints",
+    "p_attempted",
+    "p_total_attempts",
+]
+
+RISK_FUNCTION_SIGNATURE = f"{RISK_FUNCTION}({', '.join(['float8'] * len(RISK_FUNCTION_ARGS))})"
+
+# Константы ядра, которые подставляются в функцию
+_CONSTANTS = [name for name in RiskKernel.PARAM_NAMES if name != "use_min_threshold"]
+
+_BODY = """
+DECLARE
+{constants}
+    s float8 := NULLIF(p_success_rate, 'NaN');
+    f float8 := NULLIF(p_first_try, 'NaN');
+    x_discr float8 := NULLIF(p_discrimination, 'NaN');
+    x_complaints float8 := COALESCE(NULLIF(p_complaints, 'NaN'), 0.0);
+    x_attempted float8 := NULLIF(p_attempted, 'NaN');
+    x_total float8 := NULLIF(p_total_attempts, 'NaN');
+    r_discr float8;
+    r_success float8;
+    r_trickiness float8 := 0.0;
+    r_complaints float8;
+    r_attempted float8;
+    weighted float8;
+    max_risk float8;
+    raw float8;
+    confidence float8;
+BEGIN
+    -- Пропуск в этих метриках дает пропуск риска (как NaN в ядре)
+    IF s IS NULL OR x_discr IS NULL OR x_attempted IS NULL OR x_total IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    -- Дискриминативность
+    IF x_discr >= discr_good THEN
+        r_discr := GREATEST(0.0, 0.25 * (1.0 - LEAST(1.0, (x_discr - discr_good) / 0.4)));
+    ELSIF x_discr >= discr_medium THEN
+        r_discr := 0.50 - (x_discr - discr_medium) / (discr_good - discr_medium) * 0.24;
+    ELSE
+        r_discr := 1.0 - GREATEST(0.0, x_discr / discr_medium) * 0.49;
+    END IF;
+
+    -- Доля верных ответов
+    IF s > success_boring THEN
+        r_success := 0.30 + LEAST(1.0, (s - success_boring) / 0.05) * 0.10;
+    ELSIF s >= success_optimal_low THEN
+        r_success := 0.25 * (1.0 - (s - success_optimal_low) / (success_optimal_high - success_optimal_low));
+    ELSIF s >= success_suboptimal_low THEN
+        r_success := 0.50 - (s - success_suboptimal_low) / (success_optimal_low - success_suboptimal_low) * 0.24;
+    ELSE
+        r_success := 1.0 - GREATEST(0.0, s / success_suboptimal_low) * 0.49;
+    END IF;
+
+    -- Уровень "подлости" (пропуск успеха с первой попытки — не трики-карточка)
+    IF s >= tricky_min_success AND f <= tricky_max_first_try AND s - f >= tricky_min_difference THEN
+        IF s >= tricky_high_success AND f <= tricky_low_first_try THEN
+            r_trickiness := 0.9;
+        ELSIF s >= tricky_medium_success AND f <= tricky_medium_first_try THEN
+            r_trickiness := 0.6;
+        ELSE
+            r_trickiness := 0.3;
+        END IF;
+    END IF;
+
+    -- Жалобы
+    IF x_complaints > complaints_critical THEN
+        r_complaints := 0.76 + LEAST(100.0, x_complaints - complaints_critical) / 100.0 * 0.24;
+    ELSIF x_complaints >= complaints_high THEN
+        r_complaints := 0.51 + (x_complaints - complaints_high) / (complaints_critical - complaints_high) * 0.24;
+    ELSIF x_complaints >= complaints_medium THEN
+        r_complaints := 0.26 + (x_complaints - complaints_medium) / (complaints_high - complaints_medium) * 0.24;
+    ELSE
+        r_complaints := x_complaints / complaints_medium_denominator * 0.25;
+    END IF;
+
+    -- Доля пытавшихся решить
+    IF x_attempted > attempts_high THEN
+        r_attempted := 0.10 * (1.0 - LEAST(1.0, (x_attempted - attempts_high) / 0.05));
+    ELSIF x_attempted >= attempts_normal_low THEN
+        r_attempted := 0.25 - (x_attempted - attempts_normal_low) / (attempts_high - attempts_normal_low) * 0.15;
+    ELSIF x_attempted >= attempts_insufficient_low THEN
+        r_attempted := 0.50 - (x_attempted - attempts_insufficient_low)
+            / (attempts_normal_low - attempts_insufficient_low) * 0.24;
+    ELSE
+        r_attempted := 1.0 - GREATEST(0.0, x_attempted / attempts_insufficient_low) * 0.49;
+    END IF;
+
+    -- Итоговый риск: max(взвешенное, alpha * взвешенное + (1 - alpha) * максимум)
+    weighted := w_discrimination * r_discr + w_success * r_success + w_trickiness * r_trickiness
+        + w_complaints * r_complaints + w_attempted * r_attempted;
+    max_risk := GREATEST(r_discr, r_success, r_trickiness, r_complaints, r_attempted);
+    raw := GREATEST(alpha * weighted + (1.0 - alpha) * max_risk, weighted);
+{min_threshold}
+    -- Корректировка на статистическую значимость
+    confidence := LEAST(x_total / significance_threshold, 1.0);
+    RETURN raw * confidence + neutral_risk * (1.0 - confidence);
+END
+"""
+
+_MIN_THRESHOLD = """
+    -- Минимальный риск при критической или высокой компоненте
+    IF max_risk > risk_critical THEN
+        raw := GREATEST(raw, min_for_critical);
+    ELSIF max_risk > risk_high THEN
+        raw := GREATEST(raw, min_for_high);
+    ELSE
+        raw := GREATEST(raw, 0.0);
+    END IF;
+"""
+
+
+def _literal(value: float) -> str:
+    """float64 как литерал float8 (repr восстанавливает значение точно)."""
+    return f"'{float(value)!r}'::float8"
+
+
+def risk_function_sql(config: Optional[Dict] = None, name: str = RISK_FUNCTION) -> str:
+    """
+    Генерирует CREATE OR REPLACE FUNCTION для формулы риска.
+
+    Args:
+        config: Конфигурация риска (по умолчанию текущая)
+        name: Имя функции (можно со схемой, например pg_temp.card_risk)
+
+    Returns:
+        str: SQL создания функции
+    """
+    kernel = RiskKernel(get_config() if config is None else config)
+    constants = {name_: getattr(kernel, name_) for name_ in _CONSTANTS}
+    constants["complaints_medium_denominator"] = max(1.0, kernel.complaints_medium)
+    declarations = "\n".join(
+        f"    {constant} CONSTANT float8 := {_literal(value)};" for constant, value in constants.items()
+    )
+    body = _BODY.format(
+        constants=declarations,
+        min_threshold=_MIN_THRESHOLD if kernel.use_min_threshold else "",
+    )
+    arguments = ", ".join(f"{argument} float8" for argument in RISK_FUNCTION_ARGS)
+    return (
+        f"CREATE OR REPLACE FUNCTION {name}({arguments})\n"
+        f"RETURNS float8 LANGUAGE plpgsql IMMUTABLE PARALLEL SAFE AS $risk${body}$risk$;"
+    )
+
+
+def risk_call_sql(alias: Optional[str] = None, name: str = RISK_FUNCTION) -> str:
+    """
+    Вызов функции риска по колонкам карточек (INPUT_COLUMNS) для SELECT.
+
+    Args:
+        alias: Псевдоним таблицы с колонками карточек
+        name: Имя функции
+
+    Returns:
+        str: Например, "card_risk(c.success_rate::float8, ...)"
+    """
+    prefix = f"{alias}." if alias else ""
+    return f"{name}({', '.join(f'{prefix}{column}::float8' for column in INPUT_COLUMNS)})"
+
+
+def _sql_hash(sql: str) -> str:
+    return hashlib.sha1(sql.encode("utf-8")).hexdigest()[:16]
+
+
+def risk_function_version(config: Optional[Dict] = None) -> str:
+    """Хэш текста функции риска для конфигурации (по умолчанию текущей)."""
+    return _sql_hash(risk_function_sql(config))
+
+
+def installed_version(conn) -> Optional[str]:
+    """Хэш текста установленной функции риска (из ее комментария) или None."""
+    return conn.execute(
+        text("SELECT obj_description(to_regprocedure(:signature), 'pg_proc')"),
+        {"signature": RISK_FUNCTION_SIGNATURE},
+    ).scalar()
+
+
+def ensure_risk_function(conn, config: Optional[Dict] = None) -> bool:
+    """
+    Создает или обновляет функцию риска, если она не соответствует конфигурации.
+
+    CREATE OR REPLACE сохраняет OID функции, поэтому представления, которые
+    ее вызывают, после обновления сразу используют новую формулу.
+
+    Args:
+        conn: SQLAlchemy Connection
+        config: Конфигурация риска (по умолчанию текущая)
+
+    Returns:
+        bool: True, если функция была (пере)создана
+    """
+    sql = risk_function_sql(config)
+    version = _sql_hash(sql)
+    if installed_version(conn) == version:
+        return False
+    # exec_driver_sql: в теле функции есть ":=", которые text() принял бы за параметры
+    conn.exec_driver_sql(sql)
+    conn.exec_driver_sql(f"COMMENT ON FUNCTION {RISK_FUNCTION_SIGNATURE} IS '{version}';")
+    return True
+
+
+# ------------------ Проверка совпадения с core ------------------ #
+
+def check_parity(engine=None, n: int = 20000, seed: int = 0, atol: float = 1e-9) -> Dict[str, float]:
+    """
+    Сравнивает функцию риска в Postgres с core.calculate_risk_score.
+
+    Случайные данные (с пропусками и значениями на порогах) загружаются во
+    временную таблицу, функция для текущей конфигурации создается во
+    временной схеме, поэтому проверка не меняет объекты БД.
+
+    Args:
+        engine: SQLAlchemy engine (по умолчанию общий engine приложения)
+        n: Количество случайных строк
+        seed: Зерно генератора
+        atol: Допустимое абсолютное расхождение
+
+    Returns:
+        dict: Количество строк и максимальное расхождение
+
+    Raises:
+        AssertionError: Если расхождение больше atol или не совпадают пропуски
+    """
+    import core  # Импорт здесь: core импортирует streamlit и создает engine
+
+    engine = engine or core.get_engine()
+    df = _equivalence_data(n, seed)
+    expected = np.asarray(core.calculate_risk_score(df), dtype=np.float64)
+
+    data = df[INPUT_COLUMNS].copy()
+    data.insert(0, "row_id", np.arange(n))
+    with engine.begin() as conn:
+        conn.exec_driver_sql(risk_function_sql(name=f"pg_temp.{RISK_FUNCTION}"))
+        columns = ", ".join(f"{column} float8" for column in INPUT_COLUMNS)
+        conn.exec_driver_sql(f"CREATE TEMP TABLE risk_parity (row_id int, {columns}) ON COMMIT DROP;")
+        db_bulk.copy_frame(conn, data, "risk_parity")
+        rows = conn.exec_driver_sql(
+            f"SELECT row_id, {risk_call_sql(name=f'pg_temp.{RISK_FUNCTION}')} FROM risk_parity ORDER BY row_id"
+        ).fetchall()
+
+    actual = np.array([np.nan if risk is None else risk for _, risk in rows], dtype=np.float64)
+    assert len(actual) == n, f"получено {len(actual)} строк из {n}"
+    assert np.array_equal(np.isnan(expected), np.isnan(actual)), "не совпадают пропуски"
+    valid = ~np.isnan(expected)
+    diff = float(np.max(np.abs(expected[valid] - actual[valid]), initial=0.0))
+    assert diff <= atol, f"расхождение {diff}"
+    return {"rows": n, "max_diff": diff}
+
+
+if __name__ == "__main__":
+    # Запуск проверки: python risk_sql.py [количество строк]
+    rows_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    try:
+        report = check_parity(n=rows_count)
+    except AssertionError as e:
+        print(f"Расхождение SQL-функции риска с core: {e}")
+        sys.exit(1)
+    print(f"Строк: {report['rows']}, max |diff| = {report['max_diff']:.3e}")
+    print("SQL-функция риска совпадает с core.calculate_risk_score")
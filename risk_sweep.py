@@ -0,0 +1,446 @@
+# risk_sweep.py
+"""
+Перебор конфигураций риска (grid / random search) на всем наборе карточек.
+
+Веса и пороги комбинирования (weights, risk_thresholds, stats) влияют только
+на последний шаг расчета — сведение компонентов в итоговый риск. Поэтому
+конфигурации с одинаковыми порогами метрик группируются: компоненты риска
+считаются один раз на группу, а итоговый риск для сотен конфигураций сразу
+получается одним broadcast-проходом NumPy по матрице (конфигурации × карточки).
+Матрица обрабатывается блоками ограниченного размера, а блоки распределяются
+по пулу процессов, поэтому перебор тысяч конфигураций не упирается в память
+и использует все ядра.
+
+Для каждой конфигурации возвращаются распределение карточек по категориям
+риска, средний риск, число карточек, сменивших категорию, и стабильность
+ранжирования: тау Кендалла и доля совпадения top-K карточек относительно
+базовой конфигурации. Совпадение broadcast-расчета с RiskKernel проверяет
+check_sweep() (python risk_sweep.py).
+"""
+
+import os
+import sys
+import copy
+import itertools
+import concurrent.futures
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from core_config import get_config
+from risk_kernel import INPUT_COLUMNS, RISK_COMPONENTS, RiskKernel, _as_float
+from what_if import CATEGORY_NAMES, categorize
+
+# Размер блока матрицы (конфигурации × карточки) в элементах
+SWEEP_CHUNK_ELEMENTS = int(os.getenv("RISK_SWEEP_CHUNK_ELEMENTS", "2000000"))
+
+# Количество процессов (по умолчанию — число ядер)
+SWEEP_WORKERS = int(os.getenv("RISK_SWEEP_WORKERS", "0")) or (os.cpu_count() or 1)
+
+# Количество карточек с наибольшим риском для оценки стабильности ранжирования
+SWEEP_TOP_K = 100
+
+# Ключи весов, которые нормализуются к сумме 1
+WEIGHT_KEYS = ["discrimination", "success_rate", "trickiness", "complaint_rate", "attempted"]
+
+# Константы ядра, которые используются только при сведении компонентов
+_COMBINE_START = RiskKernel.PARAM_NAMES.index("w_discrimination")
+_P = {name: i for i, name in enumerate(RiskKernel.PARAM_NAMES)}
+_WEIGHT_PARAMS = ["w_discrimination", "w_success", "w_trickiness", "w_complaints", "w_attempted"]
+
+
+# ------------------ Генерация конфигураций ------------------ #
+
+def _set_path(config: Dict, path: str, value: Any) -> None:
+    """Устанавливает значение по пути вида "weights.discrimination"."""
+    *sections, key = path.split(".")
+    node = config
+    for section in sections:
+        node = node.setdefault(section, {})
+    node[key] = value
+
+
+def normalize_weights(config: Dict) -> Dict:
+    """Приводит сумму весов метрик к 1 (на месте). Возвращает config."""
+    weights = config["weights"]
+    total = sum(float(weights.get(key, 0.0)) for key in WEIGHT_KEYS)
+    if total > 0:
+        for key in WEIGHT_KEYS:
+            weights[key] = float(weights.get(key, 0.0)) / total
+    return config
+
+
+def grid_configs(grid: Dict[str, Sequence[Any]], base: Optional[Dict] = None,
+                 normalize: bool = True) -> List[Dict]:
+    """
+    Все комбинации значений параметров (декартово произведение).
+
+    Args:
+        grid: {путь параметра: список значений}, например
+            {"weights.discrimination": [0.1, 0.2], "risk_thresholds.alpha_weight_avg": [0.5, 0.7]}
+        base: Исходная конфигурация (по умолчанию текущая)
+        normalize: Нормализовать веса к сумме 1
+
+    Returns:
+        list: Конфигурации
+    """
+    base = get_config() if base is None else base
+    paths = list(grid)
+    configs = []
+    for values in itertools.product(*(grid[path] for path in paths)):
+        config = copy.deepcopy(base)
+        for path, value in zip(paths, values):
+            _set_path(config, path, value)
+        configs.append(normalize_weights(config) if normalize else config)
+    return configs
+
+
+def random_configs(space: Dict[str, Tuple[float, float]], n: int, base: Optional[Dict] = None,
+                   seed: int = 0, normalize: bool = True) -> List[Dict]:
+    """
+    Случайная выборка конфигураций (равномерно в заданных диапазонах).
+
+    Args:
+        space: {путь параметра: (минимум, максимум)}
+        n: Количество конфигураций
+        base: Исходная конфигурация (по умолчанию текущая)
+        seed: Зерно генератора
+        normalize: Нормализовать веса к сумме 1
+
+    Returns:
+        list: Конфигурации
+    """
+    base = get_config() if base is None else base
+    rng = np.random.default_rng(seed)
+    samples = {path: rng.uniform(low, high, n) for path, (low, high) in space.items()}
+    configs = []
+    for i in range(n):
+        config = copy.deepcopy(base)
+        for path, values in samples.items():
+            _set_path(config, path, float(values[i]))
+        configs.append(normalize_weights(config) if normalize else config)
+    return configs
+
+
+def _flatten(config: Dict, prefix: str = "") -> Dict[str, Any]:
+    flat = {}
+    for key, value in config.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{path}."))
+        else:
+            flat[path] = value
+    return flat
+
+
+# ------------------ Broadcast-расчет ------------------ #
+
+def component_matrix(kernel: RiskKernel, frame: pd.DataFrame) -> np.ndarray:
+    """Компоненты риска в виде матрицы (len(RISK_COMPONENTS) × карточки)."""
+    result = kernel.evaluate(frame, RISK_COMPONENTS)
+    return np.stack([result[name] for name in RISK_COMPONENTS])
+
+
+def combine_many(components: np.ndarray, total_attempts: np.ndarray, params: np.ndarray) -> np.ndarray:
+    """
+    Итоговый риск для нескольких конфигураций одним broadcast-проходом.
+
+    Повторяет RiskKernel.combine, где каждая константа — столбец (конфигурации × 1).
+
+    Args:
+        components: Матрица компонентов (RISK_COMPONENTS × карточки)
+        total_attempts: Массив количества попыток
+        params: Константы ядер (конфигурации × PARAM_NAMES)
+
+    Returns:
+        ndarray: Риск (конфигурации × карточки)
+    """
+    def column(name):
+        return params[:, _P[name], None]
+
+    max_risk = components[0].copy()
+    for component in components[1:]:
+        np.maximum(max_risk, component, out=max_risk)
+
+    weighted = column(_WEIGHT_PARAMS[0]) * components[0]
+    for name, component in zip(_WEIGHT_PARAMS[1:], components[1:]):
+        weighted += column(name) * component
+
+    alpha = column("alpha")
+    raw = alpha * weighted
+    raw += (1.0 - alpha) * max_risk
+    np.maximum(raw, weighted, out=raw)
+
+    # Минимальный порог — только для конфигураций, где он включен
+    rows = np.flatnonzero(params[:, _P["use_min_threshold"]] > 0)
+    if len(rows):
+        selected = params[rows]
+        min_threshold = np.where(
+            max_risk > selected[:, _P["risk_critical"], None],
+            selected[:, _P["min_for_critical"], None],
+            np.where(max_risk > selected[:, _P["risk_high"], None], selected[:, _P["min_for_high"], None], 0.0),
+        )
+        raw[rows] = np.maximum(raw[rows], min_threshold)
+
+    confidence = np.minimum(total_attempts / column("significance_threshold"), 1.0)
+    raw *= confidence
+    raw += column("neutral_risk") * (1.0 - confidence)
+    return raw
+
+
+def kendall_tau(baseline: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """
+    Тау Кендалла (tau-b, с учетом совпадающих значений) между базовым рядом и каждым рядом-кандидатом.
+
+    Args:
+        baseline: Базовые значения (k)
+        candidates: Значения кандидатов (конфигурации × k)
+
+    Returns:
+        ndarray: Тау для каждой конфигурации (NaN, если все значения совпадают)
+    """
+    left, right = np.triu_indices(len(baseline), 1)
+    base_sign = np.sign(baseline[left] - baseline[right])
+    cand_sign = np.nan_to_num(np.sign(candidates[:, left] - candidates[:, right]))
+    concordance = cand_sign @ base_sign
+    denominator = np.sqrt(np.count_nonzero(base_sign) * np.count_nonzero(cand_sign, axis=1).astype(np.float64))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(denominator > 0, concordance / denominator, np.nan)
+
+
+def _top_rows(risk: np.ndarray, k: int) -> np.ndarray:
+    """Индексы k карточек с наибольшим риском по каждой строке (NaN — в конце)."""
+    ranked = np.where(np.isnan(risk), -np.inf, risk)
+    return np.argpartition(-ranked, k - 1, axis=-1)[..., :k]
+
+
+class _Baseline:
+    """Базовые значения для сравнения: категории и top-K карточек."""
+
+    def __init__(self, risk: np.ndarray, top_k: int):
+        self.categories = np.where(np.isnan(risk), -1, categorize(risk))
+        self.top_k = max(1, min(top_k, len(risk)))
+        top = _top_rows(risk, self.top_k)
+        self.top = top[np.argsort(-np.nan_to_num(risk[top], nan=-np.inf), kind="stable")]
+        self.top_risk = risk[self.top]
+
+
+def summarize(risk: np.ndarray, baseline: _Baseline) -> Dict[str, np.ndarray]:
+    """
+    Сводка по каждой конфигурации блока.
+
+    Args:
+        risk: Риск (конфигурации × карточки)
+        baseline: Базовые значения
+
+    Returns:
+        dict: {метрика: массив по конфигурациям}
+    """
+    n_configs, n_cards = risk.shape
+    n_categories = len(CATEGORY_NAMES)
+    nan = np.isnan(risk)
+    categories = np.where(nan, n_categories, categorize(risk))
+    # Счетчики категорий для всех строк одним bincount со сдвигом на номер строки
+    offsets = np.arange(n_configs)[:, None] * (n_categories + 1)
+    counts = np.bincount((categories + offsets).ravel(), minlength=n_configs * (n_categories + 1))
+    counts = counts.reshape(n_configs, n_categories + 1)[:, :n_categories]
+
+    summary = {name: counts[:, i] for i, name in enumerate(CATEGORY_NAMES)}
+    with np.errstate(invalid="ignore"):
+        summary["mean_risk"] = np.nanmean(np.where(nan, np.nan, risk), axis=1) if n_cards else np.full(n_configs, np.nan)
+    baseline_categories = np.where(baseline.categories < 0, n_categories, baseline.categories)
+    summary["changed"] = np.count_nonzero(categories != baseline_categories, axis=1)
+    summary["kendall_tau"] = kendall_tau(baseline.top_risk, risk[:, baseline.top])
+    top = _top_rows(risk, baseline.top_k)
+    summary["top_overlap"] = np.isin(top, baseline.top).sum(axis=1) / baseline.top_k
+    return summary
+
+
+# ------------------ Выполнение блоков ------------------ #
+
+# Состояние процесса-исполнителя (заполняется в _init_worker)
+_worker: Dict[str, Any] = {}
+
+
+def _init_worker(frame: pd.DataFrame, baseline: _Baseline) -> None:
+    _worker.clear()
+    _worker.update(frame=frame, baseline=baseline, signature=None, components=None)
+
+
+def _run_block(component_config: Dict, params: np.ndarray) -> Dict[str, np.ndarray]:
+    """Сводка для блока конфигураций с общими порогами метрик."""
+    frame = _worker["frame"]
+    signature = tuple(params[0, :_COMBINE_START])
+    # Блоки одной группы обычно идут подряд — компоненты считаются один раз
+    if _worker["signature"] != signature:
+        _worker["components"] = component_matrix(RiskKernel(component_config), frame)
+        _worker["signature"] = signature
+    total_attempts = frame["total_attempts"].to_numpy()
+    chunk_rows = max(1, SWEEP_CHUNK_ELEMENTS // max(1, len(frame)))
+    parts = []
+    for start in range(0, len(params), chunk_rows):
+        risk = combine_many(_worker["components"], total_attempts, params[start:start + chunk_rows])
+        parts.append(summarize(risk, _worker["baseline"]))
+    return {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+
+
+def _blocks(configs: List[Dict], params: np.ndarray, block_rows: int) -> List[Tuple[Dict, np.ndarray, np.ndarray]]:
+    """Разбивает конфигурации на блоки с одинаковыми порогами метрик."""
+    groups: Dict[tuple, List[int]] = {}
+    for i, row in enumerate(params):
+        groups.setdefault(tuple(row[:_COMBINE_START]), []).append(i)
+    blocks = []
+    for rows in groups.values():
+        for start in range(0, len(rows), block_rows):
+            index = np.asarray(rows[start:start + block_rows])
+            blocks.append((configs[index[0]], params[index], index))
+    return blocks
+
+
+def sweep(df: pd.DataFrame, configs: List[Dict], baseline_config: Optional[Dict] = None,
+          top_k: int = SWEEP_TOP_K, workers: Optional[int] = None) -> pd.DataFrame:
+    """
+    Оценивает набор конфигураций на всех карточках.
+
+    Args:
+        df: DataFrame с карточками (колонки INPUT_COLUMNS)
+        configs: Конфигурации (grid_configs / random_configs)
+        baseline_config: Базовая конфигурация для сравнения (по умолчанию текущая)
+        top_k: Количество карточек с наибольшим риском для оценки стабильности ранжирования
+        workers: Количество процессов; 1 — выполнить в текущем процессе
+
+    Returns:
+        DataFrame: По строке на конфигурацию — изменяемые параметры, количество
+        карточек по категориям риска, mean_risk, changed (сменили категорию
+        относительно базовой), kendall_tau и top_overlap для top-K базовой конфигурации
+    """
+    columns = CATEGORY_NAMES + ["mean_risk", "changed", "kendall_tau", "top_overlap"]
+    if not configs:
+        # Пустая сетка или выборка — пустой отчет с теми же колонками
+        integer = set(CATEGORY_NAMES + ["changed"])
+        return pd.DataFrame({
+            name: pd.Series(dtype=np.int64 if name in integer else np.float64) for name in columns
+        })
+
+    frame = pd.DataFrame({name: _as_float(df, name) for name in INPUT_COLUMNS}, copy=False)
+    baseline_config = get_config() if baseline_config is None else baseline_config
+    baseline = _Baseline(RiskKernel(baseline_config).evaluate(frame, ["risk"])["risk"], top_k)
+
+    params = np.array([RiskKernel(config).params for config in configs]).reshape(len(configs), -1)
+    workers = SWEEP_WORKERS if workers is None else workers
+    # Блоки делятся так, чтобы каждому процессу досталось несколько блоков
+    block_rows = max(1, min(1024, -(-len(configs) // max(1, workers * 4))))
+    blocks = _blocks(configs, params, block_rows)
+
+    result = {name: np.empty(len(configs), dtype=np.float64) for name in columns}
+    if workers <= 1 or len(blocks) <= 1:
+        _init_worker(frame, baseline)
+        outputs = [_run_block(config, block) for config, block, _ in blocks]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(workers, len(blocks)), initializer=_init_worker, initargs=(frame, baseline)
+        ) as executor:
+            outputs = list(executor.map(_run_block, [b[0] for b in blocks], [b[1] for b in blocks]))
+    for (_, _, index), output in zip(blocks, outputs):
+        for name in columns:
+            result[name][index] = output[name]
+
+    # Параметры, которые отличаются между конфигурациями
+    flat = pd.DataFrame([_flatten(config) for config in configs])
+    varying = [column for column in flat.columns if flat[column].astype(str).nunique() > 1]
+    report = flat[varying].reset_index(drop=True)
+    for name in columns:
+        report[name] = result[name]
+    for name in CATEGORY_NAMES + ["changed"]:
+        report[name] = report[name].astype(np.int64)
+    return report
+
+
+# ------------------ Проверка ------------------ #
+
+def check_sweep(n: int = 20000, configs_count: int = 200, seed: int = 0, atol: float = 1e-9) -> Dict[str, float]:
+    """
+    Сравнивает broadcast-расчет и сводки с расчетом RiskKernel по каждой конфигурации.
+
+    Args:
+        n: Количество случайных карточек
+        configs_count: Количество случайных конфигураций
+        seed: Зерно генератора
+        atol: Допустимое абсолютное расхождение риска
+
+    Returns:
+        dict: Максимальные расхождения
+
+    Raises:
+        AssertionError: Если результаты не совпадают
+    """
+    from risk_kernel import _equivalence_data
+
+    df = _equivalence_data(n, seed)
+    frame = pd.DataFrame({name: _as_float(df, name) for name in INPUT_COLUMNS})
+    space = {
+        "weights.discrimination": (0.05, 0.5),
+        "weights.trickiness": (0.0, 0.5),
+        "risk_thresholds.alpha_weight_avg": (0.0, 1.0),
+        "risk_thresholds.critical": (0.6, 0.9),
+        "stats.significance_threshold": (20, 300),
+    }
+    configs = random_configs(space, configs_count, seed=seed)
+    # Часть конфигураций с другими порогами метрик — отдельные группы
+    for config in configs[::50]:
+        config["discrimination"]["good"] = 0.3
+    for config in configs[1::2]:
+        config["risk_thresholds"]["use_min_threshold"] = not config["risk_thresholds"].get("use_min_threshold", True)
+
+    baseline = _Baseline(RiskKernel(get_config()).evaluate(frame, ["risk"])["risk"], SWEEP_TOP_K)
+    reference = np.array([RiskKernel(config).evaluate(frame, ["risk"])["risk"] for config in configs])
+
+    report = {"risk": 0.0}
+    for config, block, index in _blocks(configs, np.array([RiskKernel(c).params for c in configs]), 64):
+        actual = combine_many(component_matrix(RiskKernel(config), frame), frame["total_attempts"].to_numpy(), block)
+        expected = reference[index]
+        assert np.array_equal(np.isnan(expected), np.isnan(actual)), "не совпадают пропуски"
+        report["risk"] = max(report["risk"], float(np.nanmax(np.abs(expected - actual))))
+    assert report["risk"] <= atol, f"расхождение риска {report['risk']}"
+
+    # Тау Кендалла против прямого подсчета пар
+    sample = reference[:5, baseline.top[:30]]
+    base = baseline.top_risk[:30]
+    for row, tau in zip(sample, kendall_tau(base, sample)):
+        concordant = discordant = ties_base = ties_row = 0
+        for i in range(len(base)):
+            for j in range(i + 1, len(base)):
+                a, b = base[i] - base[j], row[i] - row[j]
+                ties_base += a == 0
+                ties_row += b == 0
+                if a * b > 0:
+                    concordant += 1
+                elif a * b < 0:
+                    discordant += 1
+        pairs = len(base) * (len(base) - 1) // 2
+        expected_tau = (concordant - discordant) / np.sqrt((pairs - ties_base) * (pairs - ties_row))
+        assert abs(expected_tau - tau) <= 1e-12, f"тау Кендалла {tau} != {expected_tau}"
+
+    # Параллельный и последовательный варианты дают одинаковые сводки
+    sequential = sweep(df, configs, workers=1)
+    parallel = sweep(df, configs, workers=2)
+    pd.testing.assert_frame_equal(sequential, parallel)
+    counts = sequential[CATEGORY_NAMES].to_numpy()
+    expected_counts = np.array([np.bincount(categorize(r[~np.isnan(r)]), minlength=len(CATEGORY_NAMES)) for r in reference])
+    assert np.array_equal(counts, expected_counts), "не совпадают количества по категориям"
+    report["configs"] = float(len(configs))
+    return report
+
+
+if __name__ == "__main__":
+    # Запуск проверки: python risk_sweep.py [количество карточек] [количество конфигураций]
+    cards = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    configs_total = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    try:
+        for key, value in check_sweep(cards, configs_total).items():
+            print(f"{key}: {value:.3e}")
+    except AssertionError as e:
+        print(f"Ошибка перебора конфигураций: {e}")
+        sys.exit(1)
+    print("Перебор конфигураций совпадает с RiskKernel")
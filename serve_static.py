@@ -5,11 +5,45 @@
 """
 
 import os
-import json
 import base64
+import threading
 import streamlit as st
 import streamlit.components.v1 as components
 
+from navigation_data import LEGACY_NAME, load_navigation_artifact
+
+# Закодированные JSON-файлы: путь -> (mtime_ns, размер, data URI)
+_encoded_lock = threading.Lock()
+_encoded_cache = {}
+
+def _json_data_uri(path):
+    """
+    data: URI с содержимым JSON-файла; кодируется заново только при изменении файла
+    
+    Для navigation_data.json берется закодированная форма текущего артефакта
+    навигации (navigation_data.load_navigation_artifact).
+    """
+    if os.path.basename(path) == LEGACY_NAME:
+        # Артефакт кэшируется по манифесту, а не по navigation_data.json: файл
+        # переписывается отдельно от манифеста и мог бы закрепить в кэше старую версию
+        artifact = load_navigation_artifact(os.path.dirname(path) or ".")
+        if artifact is not None:
+            return artifact.data_uri
+    
+    stat = os.stat(path)
+    with _encoded_lock:
+        cached = _encoded_cache.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    
+    # Файл уже содержит JSON: кодируется как есть, без разбора и повторной сериализации
+    with open(path, 'rb') as f:
+        data_uri = "data:application/json;base64," + base64.b64encode(f.read()).decode('ascii')
+    
+    with _encoded_lock:
+        _encoded_cache[path] = (stat.st_mtime_ns, stat.st_size, data_uri)
+    return data_uri
+
 def serve_json(path, key=None):
     """
     Сервирует JSON-файл для доступа из HTML-компонента
@@ -24,20 +58,15 @@ def serve_json(path, key=None):
     if not os.path.exists(path):
         return None
     
-    # Загружаем JSON-файл
-    with open(path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
     # Создаем HTML-компонент, который будет обслуживать JSON
     # Через data URI
-    json_str = json.dumps(data)
-    json_b64 = base64.b64encode(json_str.encode('utf-8')).decode('utf-8')
+    json_url = _json_data_uri(path)
     
     html = f"""
     <div id="json-server" style="display:none;">
         <script>
             // Создаем URL для JSON
-            const jsonUrl = "data:application/json;base64,{json_b64}";
+            const jsonUrl = "{json_url}";
             
             // Функция для получения JSON по запросу
             async function getNavigationData() {{
@@ -60,7 +89,7 @@ def serve_json(path, key=None):
     components.html(html, height=0)
     
     # Возвращаем URL для доступа к JSON
-    return f"data:application/json;base64,{json_b64}"
+    return json_url
 
 def create_navigation_html(json_url, height=800):
     """
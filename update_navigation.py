@@ -2,42 +2,53 @@
 """
 Скрипт для принудительного обновления файла навигации
 Запускается отдельно от Streamlit для обновления данных
+
+С флагом --daemon работает как небольшой демон: пересобирает навигацию
+только при смене версии данных (navigation_regenerator.NavigationRegenerator).
 """
 
 import os
 import sys
-import json
 
-# Добавляем путь к родительской директории для импорта модулей
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Добавляем путь к директории скрипта для импорта модулей
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from core import get_engine, load_data, risk_score
-from navigation_data import prepare_navigation_json
+from core import get_engine
+from navigation_data import NAVIGATION_DIR
+from navigation_regenerator import NavigationRegenerator, regenerate
 
 def update_navigation():
     """Обновляет файл навигации с использованием текущих данных"""
     print("Обновление данных навигации...")
     
-    # Путь к JSON файлу
-    json_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 
-                           "..", "components", "navigation_data.json")
-    
-    # Создаем директорию, если она не существует
-    os.makedirs(os.path.dirname(json_path), exist_ok=True)
+    # Каталог артефактов навигации (тот же, что читает приложение)
+    directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), NAVIGATION_DIR)
     
     # Получаем соединение с БД
     engine = get_engine()
     
-    # Загружаем данные
-    data = load_data(engine)
-    # Вычисляем риск для каждой карточки
-    data["risk"] = data.apply(risk_score, axis=1)
+    # Риск считается пакетно, файл заменяется атомарно и только при изменении содержимого
+    result = regenerate(engine, directory)
     
-    # Создаем JSON-файл с навигацией
-    navigation = prepare_navigation_json(data, json_path)
+    print(f"Обновление завершено. Версия {result['version']} в {directory}")
+    print(f"JSON содержит {result['programs']} программ, {result['cards']} карточек "
+          f"({result['duration_ms']:.0f} мс)")
+
+def run_daemon():
+    """Пересобирает навигацию при каждой смене версии данных до остановки процесса"""
+    import logging
+    import threading
     
-    print(f"Обновление завершено. Файл сохранен: {json_path}")
-    print(f"JSON содержит {len(navigation['programs'])} программ")
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), NAVIGATION_DIR)
+    regenerator = NavigationRegenerator(get_engine(), directory).start()
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        regenerator.stop()
 
 if __name__ == "__main__":
-    update_navigation()
\ No newline at end of file
+    if "--daemon" in sys.argv:
+        run_daemon()
+    else:
+        update_navigation()
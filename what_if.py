@@ -0,0 +1,214 @@
+# what_if.py
+"""
+Движок what-if анализа конфигурации риска.
+
+Страница настроек позволяет менять пороги и веса, и администратору нужно
+сразу видеть, как изменится риск всех карточек. WhatIfEngine один раз
+извлекает входные колонки карточек в непрерывные float64-массивы и для
+любой конфигурации-кандидата пересчитывает риск векторизованно через
+risk_kernel.RiskKernel (миллисекунды на ~14 тыс. карточек). Результат
+содержит новое распределение, количество карточек по категориям риска,
+матрицу переходов между категориями и карточки с наибольшим изменением риска
+относительно текущей конфигурации.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from core_config import get_config, get_config_version
+from risk_kernel import INPUT_COLUMNS, RISK_COMPONENTS, RiskKernel, _as_float
+
+# Категории риска: (название, верхняя граница включительно)
+RISK_CATEGORIES = [
+    ("Низкий риск (0-0.25)", 0.25),
+    ("Умеренный риск (0.26-0.50)", 0.50),
+    ("Высокий риск (0.51-0.75)", 0.75),
+    ("Критический риск (0.76-1.0)", np.inf),
+]
+
+CATEGORY_NAMES = [name for name, _ in RISK_CATEGORIES]
+
+# Границы категорий для np.searchsorted (риск <= границы попадает в категорию)
+_CATEGORY_BOUNDS = np.array([bound for _, bound in RISK_CATEGORIES[:-1]])
+
+
+def categorize(risk: np.ndarray) -> np.ndarray:
+    """
+    Возвращает номер категории риска (0 - низкий ... 3 - критический) для каждого значения.
+
+    Args:
+        risk: Массив значений риска
+
+    Returns:
+        ndarray: Номера категорий
+    """
+    return np.searchsorted(_CATEGORY_BOUNDS, np.asarray(risk, dtype=np.float64), side="left")
+
+
+def category_counts(risk: np.ndarray) -> np.ndarray:
+    """Количество карточек в каждой категории риска (NaN не учитываются)."""
+    risk = np.asarray(risk, dtype=np.float64)
+    return np.bincount(categorize(risk[~np.isnan(risk)]), minlength=len(RISK_CATEGORIES))
+
+
+class WhatIfResult:
+    """
+    Результат what-if расчета для одной конфигурации-кандидата.
+
+    Attributes:
+        risk: Новый риск для каждой карточки
+        baseline: Риск при текущей конфигурации
+        components: Компоненты нового риска {колонка: массив}
+        counts: DataFrame с количеством карточек по категориям (текущее/новое/изменение)
+        transitions: DataFrame-матрица переходов между категориями (строки - было, колонки - стало)
+        top_movers: Карточки с наибольшим изменением риска
+    """
+
+    def __init__(self, engine: "WhatIfEngine", risk: np.ndarray, components: Dict[str, np.ndarray], top_n: int):
+        self.risk = risk
+        self.baseline = engine.baseline
+        self.components = components
+        self.delta = risk - engine.baseline
+
+        old_counts = category_counts(engine.baseline)
+        new_counts = category_counts(risk)
+        self.counts = pd.DataFrame({
+            "Категория": CATEGORY_NAMES,
+            "Текущая конфигурация": old_counts,
+            "Новая конфигурация": new_counts,
+            "Изменение": new_counts - old_counts,
+        })
+
+        valid = ~(np.isnan(risk) | np.isnan(engine.baseline))
+        n_categories = len(RISK_CATEGORIES)
+        flat = categorize(engine.baseline[valid]) * n_categories + categorize(risk[valid])
+        matrix = np.bincount(flat, minlength=n_categories * n_categories).reshape(n_categories, n_categories)
+        self.transitions = pd.DataFrame(matrix, index=CATEGORY_NAMES, columns=CATEGORY_NAMES)
+
+        self.top_movers = self._top_movers(engine, top_n)
+
+    def _top_movers(self, engine: "WhatIfEngine", top_n: int) -> pd.DataFrame:
+        abs_delta = np.abs(np.nan_to_num(self.delta, nan=0.0))
+        top_n = min(top_n, len(abs_delta))
+        if top_n == 0:
+            return pd.DataFrame(columns=["card_id", "Текущий риск", "Новый риск", "Изменение"])
+        # argpartition вместо полной сортировки: нужны только top_n строк
+        rows = np.argpartition(-abs_delta, top_n - 1)[:top_n]
+        rows = rows[np.argsort(-abs_delta[rows], kind="stable")]
+        movers = pd.DataFrame({
+            "card_id": engine.card_ids[rows],
+            "Текущий риск": engine.baseline[rows],
+            "Новый риск": self.risk[rows],
+            "Изменение": self.delta[rows],
+        })
+        for column in engine.extra_columns:
+            movers.insert(1, column, engine.extra[column][rows])
+        return movers
+
+    @property
+    def changed(self) -> int:
+        """Количество карточек, сменивших категорию риска."""
+        return int(self.transitions.to_numpy().sum() - np.trace(self.transitions.to_numpy()))
+
+
+class WhatIfEngine:
+    """
+    Пересчет риска карточек для произвольных конфигураций.
+
+    Входные массивы извлекаются один раз при создании, поэтому каждый
+    расчет — это только проход ядра риска по готовым массивам.
+    """
+
+    def __init__(self, df: pd.DataFrame, baseline_config: Optional[Dict] = None,
+                 extra_columns=("program", "card_type")):
+        # Непрерывные float64-колонки: ядро читает их без преобразований
+        self.frame = pd.DataFrame({name: _as_float(df, name) for name in INPUT_COLUMNS}, copy=False)
+        self.card_ids = df["card_id"].to_numpy() if "card_id" in df.columns else np.arange(len(df))
+        self.extra_columns = [column for column in extra_columns if column in df.columns]
+        self.extra = {column: df[column].astype(object).to_numpy() for column in self.extra_columns}
+        self.baseline_config = get_config() if baseline_config is None else baseline_config
+        self.baseline = self.score(self.baseline_config)["risk"]
+
+    def __len__(self) -> int:
+        return len(self.card_ids)
+
+    def score(self, config: Dict) -> Dict[str, np.ndarray]:
+        """
+        Рассчитывает риск и его компоненты для конфигурации.
+
+        Args:
+            config: Конфигурация риска
+
+        Returns:
+            dict: {колонка: массив} для trickiness_level, компонентов и risk
+        """
+        return RiskKernel(config).evaluate(self.frame)
+
+    def run(self, config: Dict, top_n: int = 20) -> WhatIfResult:
+        """
+        Пересчитывает риск всех карточек для конфигурации-кандидата.
+
+        Args:
+            config: Конфигурация-кандидат
+            top_n: Количество карточек с наибольшим изменением риска в результате
+
+        Returns:
+            WhatIfResult
+        """
+        scored = self.score(config)
+        components = {name: scored[name] for name in ["trickiness_level"] + RISK_COMPONENTS}
+        return WhatIfResult(self, scored["risk"], components, top_n)
+
+
+def component_curve(config: Dict, component: str, x) -> np.ndarray:
+    """
+    Значения риска одной метрики на сетке x — для графиков на странице настроек.
+
+    Args:
+        config: Конфигурация риска
+        component: "discrimination", "success", "complaints" или "attempted"
+        x: Значения метрики
+
+    Returns:
+        ndarray: Риск для каждого значения x
+    """
+    kernel = RiskKernel(config)
+    return getattr(kernel, component)(np.ascontiguousarray(x, dtype=np.float64))
+
+
+# Движки по версии данных и конфигурации (данные в памяти общие для всех сессий)
+_engines_lock = threading.Lock()
+_engines: "OrderedDict[Tuple[str, int, str], WhatIfEngine]" = OrderedDict()
+MAX_ENGINES = 2
+
+
+def engine_for(df: pd.DataFrame, data_version: Optional[str] = None) -> WhatIfEngine:
+    """
+    Возвращает движок для набора карточек, переиспользуя уже созданный.
+
+    Args:
+        df: DataFrame с карточками
+        data_version: Версия данных (например, core.get_data_version(df));
+            без версии движок создается заново
+
+    Returns:
+        WhatIfEngine
+    """
+    if data_version is None:
+        return WhatIfEngine(df)
+    key = (data_version, len(df), get_config_version())
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is not None:
+            _engines.move_to_end(key)
+            return engine
+    engine = WhatIfEngine(df)
+    with _engines_lock:
+        _engines[key] = engine
+        while len(_engines) > MAX_ENGINES:
+            _engines.popitem(last=False)
+    return engine